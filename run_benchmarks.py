@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Benchmark entry point for the Soccer Coach Sideline Timekeeper.
+
+Plays synthetic games on a virtual clock and prints latency percentiles for
+every timer and analytics call, e.g.::
+
+    python run_benchmarks.py --games 1000 --roster 18 --field-size 9
+"""
+import argparse
+import sys
+import os
+
+# Add the src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.services.game_simulator import GameSimulator, SimulationConfig
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the fast-forward game simulator.")
+    parser.add_argument("--games", type=int, default=100, help="games to simulate")
+    parser.add_argument("--roster", type=int, default=14, help="players per squad")
+    parser.add_argument("--field-size", type=int, default=11, help="players on the field")
+    parser.add_argument("--minutes", type=int, default=60, help="regulation game length")
+    parser.add_argument("--periods", type=int, default=2, help="regulation periods")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument("--no-memory", action="store_true", help="skip peak memory tracing")
+    args = parser.parse_args()
+
+    config = SimulationConfig(
+        games=args.games,
+        roster_size=args.roster,
+        field_size=args.field_size,
+        game_length_minutes=args.minutes,
+        period_count=args.periods,
+        seed=args.seed,
+        track_memory=not args.no_memory,
+    )
+    print(GameSimulator(config).run().format_table())
+
+
+if __name__ == "__main__":
+    main()
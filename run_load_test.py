@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Load test entry point for the Soccer Coach Sideline Timekeeper web API.
+
+Emulates reader and writer tablets against an in-process app and prints
+throughput, latency percentiles and error rates per endpoint, e.g.::
+
+    python run_load_test.py --readers 20 --writers 3 --duration 30
+"""
+import argparse
+import sys
+import os
+
+# Add the src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.ui.load_test import LoadTestConfig, SidelineLoadTest
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load test the sideline web API.")
+    parser.add_argument("--readers", type=int, default=8, help="tablets polling /api/state")
+    parser.add_argument("--writers", type=int, default=2, help="tablets issuing writes")
+    parser.add_argument("--duration", type=float, default=10.0, help="run length in seconds")
+    parser.add_argument("--poll-interval", type=float, default=1.0, help="seconds between polls")
+    parser.add_argument("--write-interval", type=float, default=0.5, help="seconds between writes")
+    parser.add_argument("--roster", type=int, default=16, help="players in the squad")
+    parser.add_argument("--field-size", type=int, default=11, help="players on the field")
+    parser.add_argument("--storage-dir", default=None, help="keep journals in this directory")
+    parser.add_argument("--verbose", action="store_true", help="show the app's debug output")
+    args = parser.parse_args()
+
+    config = LoadTestConfig(
+        readers=args.readers,
+        writers=args.writers,
+        duration_seconds=args.duration,
+        poll_interval_seconds=args.poll_interval,
+        write_interval_seconds=args.write_interval,
+        roster_size=args.roster,
+        field_size=args.field_size,
+        storage_dir=args.storage_dir,
+        quiet=not args.verbose,
+    )
+    print(SidelineLoadTest(config).run().format_table())
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,10 @@
 """
 Main entry point for the Soccer Coach Sideline Timekeeper web application.
 
-This script launches the Flask-based web server.
+This script launches the web server: a pool of worker threads by default,
+or Flask's development server when SIDELINE_DEV_SERVER=1. SIDELINE_THREADS
+sets the pool size and SIDELINE_WORKERS the number of worker processes
+(more than one keeps games in the shared SQLite state store).
 """
 import sys
 import os
@@ -16,4 +19,9 @@ if __name__ == "__main__":
     # Run web app serving files from the project root
     project_root = os.path.dirname(__file__)
     port = int(os.environ.get("FLASK_RUN_PORT", 7122))
-    run_web_app(static_folder=project_root, port=port)
\ No newline at end of file
+    production = os.environ.get("SIDELINE_DEV_SERVER", "") != "1"
+    threads = int(os.environ.get("SIDELINE_THREADS", 16))
+    workers = int(os.environ.get("SIDELINE_WORKERS", 1))
+    run_web_app(
+        static_folder=project_root, port=port, production=production, threads=threads, workers=workers
+    )
\ No newline at end of file
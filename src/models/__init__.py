@@ -5,9 +5,16 @@ This package contains the core data models used throughout the application.
 """
 from .player import Player, ContactInfo, MedicalInfo, PlayerStats, GameAttendance
 from .game_state import GameState
-from .game_report import GameReport, PlayerTimeSummary
+from .stint_ledger import StintLedger
+from .roster_columns import RosterColumns
+from .game_timeline import GameTimeline
+from .command_log import CommandLog, CommandRecord, FieldChange
+from .positions import POSITION_TAXONOMY, PositionTaxonomy
+from .game_report import ColumnarReport, GameReport, PlayerStintSummary, PlayerTimeSummary
 
 __all__ = [
     "Player", "ContactInfo", "MedicalInfo", "PlayerStats", "GameAttendance",
-    "GameState", "GameReport", "PlayerTimeSummary"
+    "GameState", "GameReport", "PlayerStintSummary", "PlayerTimeSummary",
+    "StintLedger", "RosterColumns", "ColumnarReport", "GameTimeline",
+    "PositionTaxonomy", "POSITION_TAXONOMY", "CommandLog", "CommandRecord", "FieldChange"
 ]
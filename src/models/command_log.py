@@ -0,0 +1,262 @@
+"""
+Undo log model for the Soccer Coach Sideline Timekeeper application.
+
+Every undoable command is recorded as the list of fields it changed, each
+with its value before and after, instead of a copy of the whole game. Undo
+writes the old values back and redo writes the new ones, so both cost
+O(changed fields) regardless of roster size. The log is plain data and is
+saved with the game, so undo survives a reload.
+"""
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from .formation import Formation
+
+# Target of changes to the game itself; any other target is a player name
+GAME_TARGET = ""
+# Pseudo-field holding a player's latest stint as [start, end, period, position]
+STINT_FIELD = "stint"
+# Game fields holding a Formation, recorded as its dictionary
+FORMATION_FIELDS = ("current_formation", "starting_formation")
+
+DEFAULT_MAX_HISTORY = 50
+# Stack operations kept for journal mirroring (see CommandLog.ops_since)
+OPS_RETAINED = 64
+
+
+@dataclass(frozen=True)
+class FieldChange:
+    """One field of the game or of a player, before and after a command."""
+    target: str
+    field: str
+    old: Any
+    new: Any
+
+    def to_list(self) -> List[Any]:
+        """Convert to a compact list for JSON serialization."""
+        return [self.target, self.field, self.old, self.new]
+
+    @classmethod
+    def from_list(cls, data: List[Any]) -> 'FieldChange':
+        """Create from a list produced by :meth:`to_list`."""
+        target, field_name, old, new = data
+        return cls(target, field_name, old, new)
+
+
+@dataclass
+class CommandRecord:
+    """The changes made by one executed command."""
+    description: str
+    timestamp: float
+    changes: List[FieldChange] = field(default_factory=list)
+
+    def revert(self, game_state: Any) -> None:
+        """Write the old values back (undo)."""
+        self._write(game_state, reversed(self.changes), forward=False)
+
+    def apply(self, game_state: Any) -> None:
+        """Write the new values again (redo)."""
+        self._write(game_state, self.changes, forward=True)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "description": self.description,
+            "timestamp": self.timestamp,
+            "changes": [change.to_list() for change in self.changes],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CommandRecord':
+        """Create from dictionary for JSON deserialization."""
+        return cls(
+            description=data.get("description", ""),
+            timestamp=float(data.get("timestamp", 0.0)),
+            changes=[FieldChange.from_list(change) for change in data.get("changes", [])],
+        )
+
+    # ---------- Internal helpers ---------- #
+
+    def _write(self, game_state: Any, changes, forward: bool) -> None:
+        changes = list(changes)
+        # Check every target first so a stale record never half-applies
+        missing = {
+            change.target for change in changes
+            if change.target != GAME_TARGET and change.target not in game_state.roster
+        }
+        if missing:
+            raise KeyError(f"Players no longer in roster: {', '.join(sorted(missing))}")
+
+        for change in changes:
+            value, current = (change.new, change.old) if forward else (change.old, change.new)
+            if change.target == GAME_TARGET and change.field in FORMATION_FIELDS:
+                setattr(game_state, change.field, Formation.from_dict(value) if value else None)
+            elif change.target == GAME_TARGET:
+                setattr(game_state, change.field, _copy(value))
+            elif change.field == STINT_FIELD:
+                _write_stint(game_state.roster[change.target].stint_ledger, value, current)
+            else:
+                setattr(game_state.roster[change.target], change.field, _copy(value))
+        if any(change.target == GAME_TARGET for change in changes):
+            game_state.timeline.sync(game_state)
+
+
+class CommandLog:
+    """
+    Undo and redo stacks of command records.
+
+    The undo stack is a bounded deque, so recording a command and dropping
+    the oldest one past ``max_history`` are both O(1). Recording a new
+    command discards the redo stack.
+
+    Every operation bumps ``revision`` and is kept in a short operation log,
+    so a journal can mirror the stacks by replaying operations
+    (:meth:`ops_since`, :meth:`replay`) instead of copying them.
+    """
+
+    def __init__(self, max_history: int = DEFAULT_MAX_HISTORY):
+        self.max_history = max_history
+        self.undo_stack: Deque[CommandRecord] = deque(maxlen=max_history)
+        self.redo_stack: List[CommandRecord] = []
+        self.revision = 0
+        self._ops: Deque[Tuple[int, Dict[str, Any]]] = deque(maxlen=OPS_RETAINED)
+
+    def __len__(self) -> int:
+        return len(self.undo_stack) + len(self.redo_stack)
+
+    # ---------- Stack operations ---------- #
+
+    def push(self, record: CommandRecord) -> None:
+        """Record an executed command."""
+        self.undo_stack.append(record)
+        self.redo_stack.clear()
+        self._log_op({"op": "push", "record": record.to_dict()})
+
+    def pop_undo(self) -> Optional[CommandRecord]:
+        """Move the newest record to the redo stack and return it (None if empty)."""
+        if not self.undo_stack:
+            return None
+        record = self.undo_stack.pop()
+        self.redo_stack.append(record)
+        self._log_op({"op": "undo"})
+        return record
+
+    def pop_redo(self) -> Optional[CommandRecord]:
+        """Move the next redo record back to the undo stack and return it (None if empty)."""
+        if not self.redo_stack:
+            return None
+        record = self.redo_stack.pop()
+        self.undo_stack.append(record)
+        self._log_op({"op": "redo"})
+        return record
+
+    def discard_undo(self) -> None:
+        """Drop the newest record without moving it (it could not be undone)."""
+        if self.undo_stack:
+            self.undo_stack.pop()
+            self._log_op({"op": "discard_undo"})
+
+    def discard_redo(self) -> None:
+        """Drop the next redo record (it could not be redone)."""
+        if self.redo_stack:
+            self.redo_stack.pop()
+            self._log_op({"op": "discard_redo"})
+
+    def resize(self, max_history: int) -> None:
+        """Change the history bound, keeping the newest records."""
+        if max_history != self.max_history:
+            self.max_history = max_history
+            self.undo_stack = deque(self.undo_stack, maxlen=max_history)
+            self._log_op({"op": "resize", "max_history": max_history})
+
+    def clear(self) -> None:
+        """Drop all records."""
+        self.undo_stack.clear()
+        self.redo_stack.clear()
+        self._log_op({"op": "clear"})
+
+    # ---------- Mirroring ---------- #
+
+    def ops_since(self, revision: int) -> Optional[List[Dict[str, Any]]]:
+        """
+        Operations applied after ``revision``.
+
+        Returns:
+            The operations in order, or None if they are no longer retained
+            (the caller should copy the whole log instead)
+        """
+        if revision == self.revision:
+            return []
+        if revision > self.revision or not self._ops or self._ops[0][0] > revision + 1:
+            return None
+        return [op for op_revision, op in self._ops if op_revision > revision]
+
+    def replay(self, ops: List[Dict[str, Any]]) -> None:
+        """Apply operations produced by :meth:`ops_since` (or a ``load`` operation)."""
+        for op in ops:
+            kind = op.get("op")
+            if kind == "push":
+                self.push(CommandRecord.from_dict(op["record"]))
+            elif kind == "undo":
+                self.pop_undo()
+            elif kind == "redo":
+                self.pop_redo()
+            elif kind == "discard_undo":
+                self.discard_undo()
+            elif kind == "discard_redo":
+                self.discard_redo()
+            elif kind == "resize":
+                self.resize(int(op["max_history"]))
+            elif kind == "clear":
+                self.clear()
+            elif kind == "load":
+                loaded = CommandLog.from_dict(op.get("log"))
+                self.resize(loaded.max_history)
+                self.undo_stack.clear()
+                self.undo_stack.extend(loaded.undo_stack)
+                self.redo_stack = loaded.redo_stack
+                self._log_op(op)
+
+    # ---------- Serialization ---------- #
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "max_history": self.max_history,
+            "undo": [record.to_dict() for record in self.undo_stack],
+            "redo": [record.to_dict() for record in self.redo_stack],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> 'CommandLog':
+        """Create from dictionary for JSON deserialization."""
+        if not data:
+            return cls()
+        log = cls(int(data.get("max_history", DEFAULT_MAX_HISTORY)))
+        log.undo_stack.extend(CommandRecord.from_dict(record) for record in data.get("undo", []))
+        log.redo_stack.extend(CommandRecord.from_dict(record) for record in data.get("redo", []))
+        return log
+
+    # ---------- Internal helpers ---------- #
+
+    def _log_op(self, op: Dict[str, Any]) -> None:
+        self.revision += 1
+        self._ops.append((self.revision, op))
+
+
+def _copy(value: Any) -> Any:
+    return list(value) if isinstance(value, list) else value
+
+
+def _write_stint(ledger: Any, value: Optional[List[Any]], current: Optional[List[Any]]) -> None:
+    """Turn the ledger's latest stint from ``current`` into ``value``."""
+    if value is None:
+        ledger.drop_last()
+    elif current is None:
+        start, end, period, position = value
+        ledger.open(start, period, position)
+        if end is not None:
+            ledger.close(end)
+    else:
+        ledger.set_last_end(value[1])
@@ -7,6 +7,8 @@ from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 from enum import Enum
 
+from .positions import FAMILIES, POSITION_TAXONOMY
+
 
 class FormationType(Enum):
     """Standard soccer formation types."""
@@ -99,22 +101,12 @@ class Formation:
     
     def get_formation_shape(self) -> Tuple[int, int, int, int]:
         """Get formation shape as (GK, DEF, MID, FOR) tuple."""
-        gk_count = len([p for p in self.positions if p.position_code == Position.GOALKEEPER])
-        
-        # Count by general position category
-        def_positions = {Position.DEFENDER, Position.CENTER_BACK, Position.LEFT_BACK, 
-                        Position.RIGHT_BACK, Position.WING_BACK}
-        mid_positions = {Position.MIDFIELDER, Position.DEFENSIVE_MIDFIELDER, 
-                        Position.CENTRAL_MIDFIELDER, Position.ATTACKING_MIDFIELDER,
-                        Position.LEFT_MIDFIELDER, Position.RIGHT_MIDFIELDER}
-        for_positions = {Position.FORWARD, Position.LEFT_WINGER, Position.RIGHT_WINGER,
-                        Position.STRIKER, Position.CENTER_FORWARD}
-        
-        def_count = len([p for p in self.positions if p.position_code in def_positions])
-        mid_count = len([p for p in self.positions if p.position_code in mid_positions])
-        for_count = len([p for p in self.positions if p.position_code in for_positions])
-        
-        return (gk_count, def_count, mid_count, for_count)
+        counts = dict.fromkeys(FAMILIES, 0)
+        for position in self.positions:
+            family = POSITION_TAXONOMY.family_of(position.position_code.value)
+            if family is not None:
+                counts[family] += 1
+        return tuple(counts[family] for family in FAMILIES)
     
     def assign_player(self, position_index: int, player_name: str, player_number: int) -> None:
         """Assign a player to a specific position."""
@@ -1,7 +1,7 @@
 """Dataclasses representing analytics reports for the timekeeper app."""
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 
 
 @dataclass
@@ -23,6 +23,21 @@ class PlayerTimeSummary:
     fairness: str
 
 
+@dataclass
+class PlayerStintSummary:
+    """Stint history aggregates for a single player."""
+
+    name: str
+    stint_count: int
+    total_seconds: int
+    longest_stint_seconds: int
+    period_seconds: Dict[int, int] = field(default_factory=dict)
+    position_seconds: Dict[str, int] = field(default_factory=dict)
+    rest_count: int = 0
+    longest_rest_seconds: int = 0
+    average_rest_seconds: float = 0.0
+
+
 @dataclass
 class GameReport:
     """Snapshot of playing time distribution for the current game state."""
@@ -41,3 +56,25 @@ class GameReport:
     min_seconds: int = 0
     max_seconds: int = 0
     fairness_counts: Dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class ColumnarReport:
+    """Playing time distribution computed in batch over a columnar roster.
+
+    Per-player values are parallel sequences in roster order (NumPy arrays
+    when NumPy is available, :mod:`array` arrays otherwise). Fairness is
+    encoded as 0 (under), 1 (ok) or 2 (over).
+    """
+
+    generated_ts: float
+    target_seconds_per_player: int
+    names: List[str] = field(default_factory=list)
+    cumulative_seconds: Sequence[int] = field(default_factory=list)
+    delta_seconds: Sequence[int] = field(default_factory=list)
+    fairness_codes: Sequence[int] = field(default_factory=list)
+    average_seconds: float = 0.0
+    median_seconds: float = 0.0
+    min_seconds: int = 0
+    max_seconds: int = 0
+    fairness_counts: Dict[str, int] = field(default_factory=dict)
@@ -4,11 +4,15 @@ GameState model for the Soccer Coach Sideline Timekeeper application.
 This module contains the GameState dataclass which represents the complete
 state of a soccer game, including players, timing, and persistence methods.
 """
-from dataclasses import dataclass, field, asdict
-from typing import Dict, List, Optional
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set
 
 from .player import Player
 from .formation import Formation
+from .roster_columns import RosterColumns
+from .game_timeline import GameTimeline
+from .command_log import CommandLog
 from ..utils import DEFAULT_GAME_LENGTH_MIN, DEFAULT_PERIOD_COUNT
 
 
@@ -35,6 +39,9 @@ class GameState:
         current_formation: Active tactical formation for the game
         starting_formation: Initial formation set for the game
         opponent_notes: Scouting notes about the opponent team
+        state_version: Monotonic counter bumped on every mutation of the game
+        timeline: Run segments mapping wall-clock time onto the game clock
+        command_log: Undo/redo records of the commands applied to the game
     """
     roster: Dict[str, Player] = field(default_factory=dict)  # key by name (unique)
     # game timing
@@ -57,16 +64,36 @@ class GameState:
     opponent_notes: str = ""
     # field configuration
     field_size: int = 11  # Number of players on field (7, 9, 10, or 11)
+    # change tracking
+    state_version: int = 0
+    timeline: GameTimeline = field(default_factory=GameTimeline, compare=False, repr=False)
+    command_log: CommandLog = field(default_factory=CommandLog, compare=False, repr=False)
+    # columnar mirror of the roster for batch reports (see roster_columns())
+    # and the names of players whose playing time changed since its last sync
+    _roster_columns: Optional[RosterColumns] = field(
+        default=None, init=False, compare=False, repr=False
+    )
+    _roster_columns_dirty: Set[str] = field(
+        default_factory=set, init=False, compare=False, repr=False
+    )
+    # guards the lazy sync above when readers share the game lock
+    _roster_columns_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, compare=False, repr=False
+    )
 
-    def to_json(self) -> dict:
+    def to_json(self, include_players: bool = True) -> dict:
         """
         Convert GameState to JSON-serializable dictionary.
         
+        Args:
+            include_players: Whether to serialize the roster; callers that
+                write players themselves skip it to avoid a second pass
+        
         Returns:
             Dictionary representation suitable for JSON serialization
         """
         result = {
-            "players": {k: asdict(v) for k, v in self.roster.items()},
+            "players": {k: v.to_dict() for k, v in self.roster.items()} if include_players else {},
             "scheduled_start_ts": self.scheduled_start_ts,
             "game_start_ts": self.game_start_ts,
             "paused": self.paused,
@@ -82,6 +109,9 @@ class GameState:
             "period_start_ts": self.period_start_ts,
             "opponent_notes": self.opponent_notes,
             "field_size": self.field_size,
+            "state_version": self.state_version,
+            "timeline": self.timeline.to_dict(),
+            "command_log": self.command_log.to_dict(),
         }
         
         # Add formation data if present
@@ -105,8 +135,7 @@ class GameState:
         """
         gs = GameState()
         for name, pdata in data.get("players", {}).items():
-            p = Player(**{k: pdata.get(k) for k in Player.__dataclass_fields__.keys()})
-            gs.roster[name] = p
+            gs.roster[name] = Player.from_dict({"name": name, **pdata})
         gs.scheduled_start_ts = data.get("scheduled_start_ts")
         gs.game_start_ts = data.get("game_start_ts")
         gs.paused = data.get("paused", True)
@@ -141,6 +170,9 @@ class GameState:
         # Load formation data
         gs.opponent_notes = data.get("opponent_notes", "")
         gs.field_size = int(data.get("field_size", 11))  # Default to 11 for backward compatibility
+        gs.state_version = int(data.get("state_version", 0))
+        gs.timeline = GameTimeline.from_dict(data.get("timeline"))
+        gs.command_log = CommandLog.from_dict(data.get("command_log"))
         
         # Load formations if present
         if "current_formation" in data and data["current_formation"]:
@@ -182,6 +214,49 @@ class GameState:
         # Ensure timer fields are non-negative integers where applicable
         self.game_length_seconds = max(60, int(self.game_length_seconds or 0))
     
+    def roster_columns(self) -> RosterColumns:
+        """
+        Get the columnar view of the roster, synced with current player data.
+
+        The columns are built from every player only on first use and when
+        players join, leave or are replaced; otherwise just the players whose
+        playing time was written since the last call are rewritten. Players
+        report those writes themselves (see
+        :meth:`Player.watch_playing_time`), so no caller has to.
+
+        Returns:
+            The game's :class:`RosterColumns`, reused across calls
+        """
+        with self._roster_columns_lock:
+            columns = self._roster_columns
+            changes = self._roster_columns_dirty
+            if columns is None:
+                columns = self._roster_columns = RosterColumns()
+            roster = self.roster
+            if not columns.mirrors(roster):
+                changes.clear()
+                columns.sync(roster)
+                for player in roster.values():
+                    player.watch_playing_time(changes)
+            elif changes:
+                changed = []
+                # Pop one at a time so a write landing meanwhile is kept for next time
+                while changes:
+                    changed.append(changes.pop())
+                # Players that left the roster may still report writes
+                columns.update(roster, [name for name in changed if name in roster])
+            return columns
+
+    def bump_version(self) -> int:
+        """
+        Advance the state version after a mutation.
+        
+        Returns:
+            The new state version
+        """
+        self.state_version += 1
+        return self.state_version
+
     def is_active(self) -> bool:
         """
         Check if the game is currently active (started).
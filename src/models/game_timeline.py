@@ -0,0 +1,213 @@
+"""
+Game timeline model for the Soccer Coach Sideline Timekeeper application.
+
+The timeline records every stretch of running play as a segment mapping
+wall-clock time onto the game clock. Segments are appended in time order, so
+both columns stay sorted and either direction of the mapping is a binary
+search: "what game minute was wall time X" and "when did minute 37 happen".
+"""
+import math
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class GameTimeline:
+    """
+    Sorted run segments of one game.
+
+    Game time here is played time: the sum of ``period_elapsed`` plus the
+    running period, without manual adjustments or stoppage, which correct
+    the displayed clock rather than happen at a point in time. The clock
+    stands still between segments (pauses and breaks). An open segment has
+    ``NaN`` as its wall end.
+
+    The timeline is reconciled from the game state with :meth:`sync`, which
+    only needs the state itself, so it may run lazily after the change.
+    """
+
+    def __init__(self):
+        self.wall_starts = array("d")
+        self.wall_ends = array("d")
+        self.game_starts = array("q")
+        self.periods = array("h")
+
+    def __len__(self) -> int:
+        return len(self.wall_starts)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, GameTimeline):
+            return NotImplemented
+        return self.segments() == other.segments()
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the latest segment is still running."""
+        return bool(self.wall_ends) and math.isnan(self.wall_ends[-1])
+
+    # ---------- Recording ---------- #
+
+    def sync(self, game_state: Any) -> None:
+        """
+        Reconcile the segments with the game's timer fields.
+
+        Opens a segment when the clock runs from a new ``period_start_ts``
+        and closes the open one once its played seconds have been added to
+        ``period_elapsed``. A game that has not started has no segments.
+
+        Args:
+            game_state: Game state with the standard timer fields
+        """
+        if game_state.game_start_ts is None:
+            if len(self):
+                self.clear()
+            return
+
+        running = (
+            game_state.period_start_ts is not None
+            and not game_state.paused
+            and not game_state.halftime_started
+        )
+        if self.is_open and (not running or self.wall_starts[-1] != game_state.period_start_ts):
+            played = sum(game_state.period_elapsed) - self.game_starts[-1]
+            self.close(self.wall_starts[-1] + max(0, played))
+        if running and not self.is_open:
+            self.open(
+                game_state.period_start_ts,
+                sum(game_state.period_elapsed),
+                game_state.current_period_index,
+            )
+
+    def open(self, wall_ts: float, game_seconds: int, period_index: int) -> None:
+        """
+        Start a run segment; ignored if one is already running.
+
+        Segments already reaching past ``game_seconds`` (e.g. after an undo)
+        are trimmed so the game column stays sorted.
+
+        Args:
+            wall_ts: Wall-clock time the clock started running
+            game_seconds: Game clock reading at that time
+            period_index: Period being played
+        """
+        if self.is_open:
+            return
+        self._truncate(game_seconds)
+        self.wall_starts.append(wall_ts)
+        self.wall_ends.append(math.nan)
+        self.game_starts.append(int(game_seconds))
+        self.periods.append(period_index)
+
+    def close(self, wall_ts: float) -> None:
+        """End the running segment at ``wall_ts``."""
+        if self.is_open:
+            self.wall_ends[-1] = max(wall_ts, self.wall_starts[-1])
+
+    def clear(self) -> None:
+        """Drop every segment (the game was reset)."""
+        self.__init__()
+
+    # ---------- Queries ---------- #
+
+    def game_seconds_at(self, wall_ts: float) -> float:
+        """
+        Game clock reading at a wall-clock time.
+
+        Args:
+            wall_ts: Epoch timestamp
+
+        Returns:
+            Played seconds; frozen during pauses, 0 before kick-off
+        """
+        idx = bisect_right(self.wall_starts, wall_ts) - 1
+        if idx < 0:
+            return 0.0
+        end = self.wall_ends[idx]
+        if not math.isnan(end):
+            wall_ts = min(wall_ts, end)
+        return self.game_starts[idx] + (wall_ts - self.wall_starts[idx])
+
+    def wall_ts_at(self, game_seconds: float) -> Optional[float]:
+        """
+        Wall-clock time at which the game clock first showed a reading.
+
+        Args:
+            game_seconds: Played seconds
+
+        Returns:
+            Epoch timestamp (a projection while the reading lies ahead in
+            the running segment), or None when the clock never reaches it
+            without being restarted
+        """
+        if not len(self):
+            return None
+        idx = max(0, bisect_left(self.game_starts, game_seconds) - 1)
+        offset = max(0.0, game_seconds - self.game_starts[idx])
+        end = self.wall_ends[idx]
+        if not math.isnan(end) and self.wall_starts[idx] + offset > end:
+            return None
+        return self.wall_starts[idx] + offset
+
+    def period_at(self, wall_ts: float) -> Optional[int]:
+        """Period being played (or last played) at a wall-clock time."""
+        idx = bisect_right(self.wall_starts, wall_ts) - 1
+        return self.periods[idx] if idx >= 0 else None
+
+    def segments(self) -> List[Tuple[float, Optional[float], int, int]]:
+        """
+        List every segment.
+
+        Returns:
+            Tuples of (wall start, wall end or None while open, game start, period index)
+        """
+        return [
+            (
+                self.wall_starts[idx],
+                None if math.isnan(self.wall_ends[idx]) else self.wall_ends[idx],
+                self.game_starts[idx],
+                self.periods[idx],
+            )
+            for idx in range(len(self.wall_starts))
+        ]
+
+    # ---------- Serialization ---------- #
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a columnar dictionary for JSON serialization."""
+        return {
+            "wall_start": self.wall_starts.tolist(),
+            "wall_end": [None if math.isnan(end) else end for end in self.wall_ends],
+            "game_start": self.game_starts.tolist(),
+            "period": self.periods.tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> 'GameTimeline':
+        """Create from dictionary for JSON deserialization."""
+        timeline = cls()
+        if not data:
+            return timeline
+        ends = data.get("wall_end", [])
+        game_starts = data.get("game_start", [])
+        periods = data.get("period", [])
+        for idx, start in enumerate(data.get("wall_start", [])):
+            timeline.open(
+                start,
+                game_starts[idx] if idx < len(game_starts) else 0,
+                periods[idx] if idx < len(periods) else 0,
+            )
+            end = ends[idx] if idx < len(ends) else None
+            if end is not None:
+                timeline.close(end)
+        return timeline
+
+    # ---------- Internal helpers ---------- #
+
+    def _truncate(self, game_seconds: float) -> None:
+        while len(self) and self.game_starts[-1] >= game_seconds:
+            for column in (self.wall_starts, self.wall_ends, self.game_starts, self.periods):
+                column.pop()
+        if len(self):
+            reach = self.wall_starts[-1] + (game_seconds - self.game_starts[-1])
+            if math.isnan(self.wall_ends[-1]) or self.wall_ends[-1] > reach:
+                self.wall_ends[-1] = reach
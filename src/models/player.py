@@ -7,9 +7,15 @@ and enhanced player information.
 """
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set
 from enum import Enum
 
+from .stint_ledger import StintLedger
+
+
+# Fields mirrored by the roster's columnar view; writing one reports the player
+PLAYING_TIME_FIELDS = frozenset({"total_seconds", "on_field", "stint_start_ts"})
+
 
 class SkillLevel(Enum):
     """Skill level enumeration for position-specific ratings."""
@@ -203,6 +209,7 @@ class Player:
         statistics: Player performance statistics
         attendance_history: Game attendance records
         notes: Additional notes about the player
+        stint_ledger: History of every stint (start, end, period, position)
     """
     # Core fields - maintain exact compatibility
     name: str
@@ -223,17 +230,38 @@ class Player:
     statistics: PlayerStats = field(default_factory=PlayerStats)
     attendance_history: List[GameAttendance] = field(default_factory=list)
     notes: Optional[str] = None
+    stint_ledger: StintLedger = field(default_factory=StintLedger, compare=False, repr=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name in PLAYING_TIME_FIELDS:
+            changes = self.__dict__.get("_playing_time_changes")
+            if changes is not None:
+                changes.add(self.name)
+
+    def watch_playing_time(self, changes: Optional[Set[str]]) -> None:
+        """
+        Report this player's name whenever its total, stint start or on-field
+        flag is written, however the write happens.
+
+        Args:
+            changes: Set collecting the names of changed players (None stops
+                reporting)
+        """
+        object.__setattr__(self, "_playing_time_changes", changes)
 
-    def start_stint(self, now_ts: float) -> None:
+    def start_stint(self, now_ts: float, period_index: Optional[int] = None) -> None:
         """
         Start a new playing stint for this player.
         
         Args:
             now_ts: Current timestamp in epoch seconds
+            period_index: Period the stint starts in, if known
         """
         if not self.on_field:
             self.on_field = True
             self.stint_start_ts = now_ts
+            self.stint_ledger.open(now_ts, period_index, self.position)
 
     def end_stint(self, now_ts: float) -> None:
         """
@@ -244,6 +272,7 @@ class Player:
         """
         if self.on_field and self.stint_start_ts is not None:
             self.total_seconds += int(now_ts - self.stint_start_ts)
+        self.stint_ledger.close(now_ts)
         self.on_field = False
         self.position = None
         self.stint_start_ts = None
@@ -373,6 +402,7 @@ class Player:
             "statistics": self.statistics.to_dict(),
             "attendance_history": [a.to_dict() for a in self.attendance_history],
             "notes": self.notes,
+            "stints": self.stint_ledger.to_dict(),
         }
 
     @classmethod
@@ -421,4 +451,5 @@ class Player:
             statistics=PlayerStats.from_dict(data.get("statistics")),
             attendance_history=attendance_history,
             notes=data.get("notes"),
+            stint_ledger=StintLedger.from_dict(data.get("stints")),
         )
\ No newline at end of file
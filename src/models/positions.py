@@ -0,0 +1,167 @@
+"""
+Canonical position taxonomy for the Soccer Coach Sideline Timekeeper.
+
+Formations, the roster editor and the legacy defaults each grew their own
+position codes (DEF/MID/FOR, DF/MF/DM/AM, ST). The taxonomy interns every
+canonical code to a small integer, maps the other spellings onto it and
+precomputes the compatibility and affinity of every pair of positions, so
+matching a player's preferences against a slot is an integer lookup rather
+than string parsing.
+"""
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+# Role families; the generic family codes double as positions of their own
+FAMILIES: Tuple[str, ...] = ("GK", "DEF", "MID", "FOR")
+
+# Canonical code -> family
+CANONICAL_POSITIONS: Dict[str, str] = {
+    "GK": "GK",
+    "DEF": "DEF", "CB": "DEF", "LB": "DEF", "RB": "DEF", "WB": "DEF",
+    "MID": "MID", "CDM": "MID", "CM": "MID", "CAM": "MID", "LM": "MID", "RM": "MID",
+    "FOR": "FOR", "ST": "FOR", "CF": "FOR", "LW": "FOR", "RW": "FOR",
+}
+
+# Other spellings in use (roster editor, legacy defaults, full names)
+POSITION_ALIASES: Dict[str, str] = {
+    "GOALKEEPER": "GK", "KEEPER": "GK",
+    "DF": "DEF", "DEFENDER": "DEF",
+    "MF": "MID", "MIDFIELDER": "MID", "DM": "CDM", "AM": "CAM",
+    "FW": "FOR", "FORWARD": "FOR", "STRIKER": "ST",
+}
+
+# Specific positions that cover for each other, including across families
+POSITION_NEIGHBOURS: Tuple[Tuple[str, str], ...] = (
+    ("LB", "WB"), ("RB", "WB"),
+    ("CDM", "CM"), ("CM", "CAM"),
+    ("LM", "LW"), ("RM", "RW"),
+    ("ST", "CF"),
+)
+
+SAME_POSITION_AFFINITY = 1.0
+NEIGHBOUR_AFFINITY = 0.8  # family <-> member, or an explicit neighbour
+FAMILY_AFFINITY = 0.5     # two specific positions of one family
+COMPATIBLE_AFFINITY = NEIGHBOUR_AFFINITY
+
+PositionKey = Union[str, int]
+
+
+class PositionTaxonomy:
+    """
+    Interned position codes with precomputed pairwise relations.
+
+    Every canonical code gets an id in ``range(len(taxonomy))``; aliases
+    resolve to the id of their canonical code. Affinity (0.0-1.0) and
+    compatibility of all id pairs live in flat row-major tables, so the
+    lookups are O(1) once the codes are resolved. Lookups accept codes or ids;
+    codes are case-insensitive and unknown codes are only compatible with
+    themselves.
+    """
+
+    def __init__(
+        self,
+        positions: Dict[str, str] = CANONICAL_POSITIONS,
+        aliases: Dict[str, str] = POSITION_ALIASES,
+        neighbours: Iterable[Tuple[str, str]] = POSITION_NEIGHBOURS,
+    ):
+        """
+        Args:
+            positions: Canonical code -> family code (families are positions too)
+            aliases: Alternative spelling -> canonical code
+            neighbours: Pairs of specific positions that cover for each other
+        """
+        self.codes: List[str] = list(positions)
+        self._ids: Dict[str, int] = {code: idx for idx, code in enumerate(self.codes)}
+        for alias, code in aliases.items():
+            self._ids[alias] = self._ids[code]
+        self._family_ids: List[int] = [self._ids[positions[code]] for code in self.codes]
+
+        size = len(self.codes)
+        affinity = [0.0] * (size * size)
+        adjacent = {(self._ids[a], self._ids[b]) for a, b in neighbours}
+        adjacent |= {(b, a) for a, b in adjacent}
+        for a in range(size):
+            for b in range(size):
+                if a == b:
+                    value = SAME_POSITION_AFFINITY
+                elif (a, b) in adjacent or b == self._family_ids[a] or a == self._family_ids[b]:
+                    value = NEIGHBOUR_AFFINITY
+                elif self._family_ids[a] == self._family_ids[b]:
+                    value = FAMILY_AFFINITY
+                else:
+                    value = 0.0
+                affinity[a * size + b] = value
+        self._affinity = affinity
+        self._compatible = [value >= COMPATIBLE_AFFINITY for value in affinity]
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __contains__(self, code: object) -> bool:
+        return isinstance(code, str) and code.strip().upper() in self._ids
+
+    # ---------- Resolution ---------- #
+
+    def id_of(self, code: Optional[PositionKey]) -> Optional[int]:
+        """Interned id of a position code or alias (``None`` if unknown)."""
+        if isinstance(code, int):
+            return code if 0 <= code < len(self.codes) else None
+        if not code:
+            return None
+        return self._ids.get(code.strip().upper())
+
+    def ids_of(self, codes: Iterable[PositionKey]) -> List[int]:
+        """Ids of the known codes among ``codes``, in order."""
+        resolved = (self.id_of(code) for code in codes)
+        return [position_id for position_id in resolved if position_id is not None]
+
+    def canonical(self, code: Optional[PositionKey]) -> Optional[str]:
+        """Canonical spelling of a position code (``None`` if unknown)."""
+        position_id = self.id_of(code)
+        return None if position_id is None else self.codes[position_id]
+
+    def family_of(self, code: Optional[PositionKey]) -> Optional[str]:
+        """Role family (GK, DEF, MID or FOR) of a position (``None`` if unknown)."""
+        position_id = self.id_of(code)
+        return None if position_id is None else self.codes[self._family_ids[position_id]]
+
+    def is_goalkeeper(self, code: Optional[PositionKey]) -> bool:
+        return self.family_of(code) == "GK"
+
+    # ---------- Relations ---------- #
+
+    def affinity(self, preferred: PositionKey, assigned: PositionKey) -> float:
+        """
+        How well a player preferring one position fits another.
+
+        Returns:
+            1.0 for the same position, 0.8 between a family and its members
+            or between neighbours, 0.5 within a family and 0.0 otherwise
+        """
+        a, b = self.id_of(preferred), self.id_of(assigned)
+        if a is None or b is None:
+            return SAME_POSITION_AFFINITY if self._same_unknown(preferred, assigned) else 0.0
+        return self._affinity[a * len(self.codes) + b]
+
+    def compatible(self, preferred: PositionKey, assigned: PositionKey) -> bool:
+        """Whether a player preferring ``preferred`` can be played at ``assigned``."""
+        a, b = self.id_of(preferred), self.id_of(assigned)
+        if a is None or b is None:
+            return self._same_unknown(preferred, assigned)
+        return self._compatible[a * len(self.codes) + b]
+
+    def best_affinity(self, preferred: Sequence[PositionKey], assigned: PositionKey) -> float:
+        """Highest affinity of any preferred position for ``assigned`` (0.0 if none)."""
+        return max((self.affinity(code, assigned) for code in preferred), default=0.0)
+
+    def any_compatible(self, preferred: Sequence[PositionKey], assigned: PositionKey) -> bool:
+        """Whether any preferred position is compatible with ``assigned``."""
+        return any(self.compatible(code, assigned) for code in preferred)
+
+    # ---------- Internal helpers ---------- #
+
+    @staticmethod
+    def _same_unknown(a: PositionKey, b: PositionKey) -> bool:
+        return isinstance(a, str) and isinstance(b, str) and a.strip().upper() == b.strip().upper()
+
+
+POSITION_TAXONOMY = PositionTaxonomy()
@@ -0,0 +1,124 @@
+"""
+Columnar roster view for the Soccer Coach Sideline Timekeeper application.
+
+Reports over large squads spend most of their time on per-object attribute
+access. This view mirrors the roster as parallel typed arrays (totals,
+stint starts, on-field flags) that batch computations read directly. After
+the first full :meth:`~RosterColumns.sync`, :meth:`~RosterColumns.update`
+rewrites only the players a mutation touched.
+"""
+import math
+from array import array
+from operator import is_not
+from typing import Dict, Iterable, List
+
+from .player import Player
+
+
+class RosterColumns:
+    """
+    Parallel arrays mirroring a roster, one slot per player.
+
+    Slot order follows the roster's insertion order. ``stint_starts`` holds
+    ``NaN`` for players without a running stint.
+    """
+
+    def __init__(self):
+        self.names: List[str] = []
+        self.totals = array("q")
+        self.stint_starts = array("d")
+        self.on_field = array("b")
+        self.players: List[Player] = []
+        self._slots: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def slot(self, name: str) -> int:
+        """
+        Look up a player's slot.
+
+        Args:
+            name: Player name
+
+        Returns:
+            Index into the column arrays
+
+        Raises:
+            KeyError: If the player is not in the view
+        """
+        return self._slots[name]
+
+    def has(self, name: str) -> bool:
+        """Whether a player has a slot in the view."""
+        return name in self._slots
+
+    def mirrors(self, roster: Dict[str, Player]) -> bool:
+        """
+        Whether the slots hold exactly the roster's player objects, in order.
+
+        Compares identities only, so it is cheap even for large rosters; the
+        values in the slots may still be out of date.
+        """
+        return len(roster) == len(self.players) and not any(
+            map(is_not, roster.values(), self.players)
+        )
+
+    def sync(self, roster: Dict[str, Player]) -> "RosterColumns":
+        """
+        Bring the columns in line with the roster.
+
+        Values are rewritten in place; the arrays are only rebuilt when
+        players were added, removed or reordered.
+
+        Args:
+            roster: Players keyed by name
+
+        Returns:
+            This view, for chaining
+        """
+        if len(roster) != len(self.names) or any(
+            name != known for name, known in zip(roster, self.names)
+        ):
+            self._resize(roster)
+        self.players = list(roster.values())
+
+        totals, starts, on_field = self.totals, self.stint_starts, self.on_field
+        for idx, player in enumerate(roster.values()):
+            totals[idx] = player.total_seconds
+            running = player.on_field and player.stint_start_ts is not None
+            starts[idx] = player.stint_start_ts if running else math.nan
+            on_field[idx] = 1 if player.on_field else 0
+        return self
+
+    def update(self, roster: Dict[str, Player], names: Iterable[str]) -> "RosterColumns":
+        """
+        Rewrite the slots of some players in place.
+
+        Args:
+            roster: Players keyed by name
+            names: Players whose values changed; each must already have a
+                slot (use :meth:`sync` when players joined or left)
+
+        Returns:
+            This view, for chaining
+
+        Raises:
+            KeyError: If a player has no slot or is not in the roster
+        """
+        totals, starts, on_field = self.totals, self.stint_starts, self.on_field
+        for name in names:
+            idx, player = self._slots[name], roster[name]
+            totals[idx] = player.total_seconds
+            running = player.on_field and player.stint_start_ts is not None
+            starts[idx] = player.stint_start_ts if running else math.nan
+            on_field[idx] = 1 if player.on_field else 0
+        return self
+
+    def _resize(self, roster: Dict[str, Player]) -> None:
+        size = len(roster)
+        self.names = list(roster)
+        self._slots = {name: idx for idx, name in enumerate(self.names)}
+        self.totals = array("q", bytes(8 * size))
+        self.stint_starts = array("d", [math.nan]) * size
+        self.on_field = array("b", bytes(size))
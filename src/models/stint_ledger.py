@@ -0,0 +1,258 @@
+"""
+Stint ledger model for the Soccer Coach Sideline Timekeeper application.
+
+A player's stints are stored as parallel typed arrays (start, end, period,
+position) so the full history costs a few bytes per stint, while running
+aggregates answer per-period, per-position and rest questions in O(1).
+"""
+import math
+from array import array
+from typing import Any, Dict, List, Optional, Tuple
+
+# Period column value for stints started outside a known period
+NO_PERIOD = -1
+
+
+class StintLedger:
+    """
+    Columnar history of one player's stints with running aggregates.
+
+    Stints are attributed to the period and position they started in.
+    An open stint has ``NaN`` as its end; aggregates cover closed stints and
+    the query methods add the open stint on top when given the current time.
+    """
+
+    def __init__(self):
+        self.starts = array("d")
+        self.ends = array("d")
+        self.periods = array("h")
+        self.position_codes = array("H")
+        # Position code 0 means "no position"
+        self._positions: List[Optional[str]] = [None]
+        self._position_index: Dict[Optional[str], int] = {None: 0}
+
+        # Running aggregates over closed stints
+        self.closed_seconds = 0
+        self.longest_stint_seconds = 0
+        self.rest_count = 0
+        self.rest_seconds = 0
+        self.longest_rest_seconds = 0
+        self._period_seconds: Dict[int, int] = {}
+        self._position_seconds: Dict[Optional[str], int] = {}
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, StintLedger):
+            return NotImplemented
+        return self.stints() == other.stints()
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the latest stint is still running."""
+        return bool(self.ends) and math.isnan(self.ends[-1])
+
+    # ---------- Recording ---------- #
+
+    def open(self, start_ts: float, period_index: Optional[int] = None, position: Optional[str] = None) -> None:
+        """
+        Start a stint; ignored if one is already running.
+
+        Args:
+            start_ts: Stint start timestamp
+            period_index: Period the stint starts in
+            position: Field position played
+        """
+        if self.is_open:
+            return
+        # A stint resuming exactly where the last ended is a split, not a rest
+        if self.ends and start_ts != self.ends[-1]:
+            self._record_rest(start_ts - self.ends[-1])
+        self._append(start_ts, period_index, position)
+
+    def close(self, end_ts: float) -> int:
+        """
+        End the running stint.
+
+        Args:
+            end_ts: Stint end timestamp
+
+        Returns:
+            Length of the closed stint in seconds (0 if none was running)
+        """
+        if not self.is_open:
+            return 0
+        self.ends[-1] = end_ts
+        seconds = self._stint_seconds(len(self.ends) - 1, end_ts)
+
+        self.closed_seconds += seconds
+        self.longest_stint_seconds = max(self.longest_stint_seconds, seconds)
+        period = self.periods[-1]
+        self._period_seconds[period] = self._period_seconds.get(period, 0) + seconds
+        position = self._positions[self.position_codes[-1]]
+        self._position_seconds[position] = self._position_seconds.get(position, 0) + seconds
+        return seconds
+
+    def split(self, at_ts: float, period_index: Optional[int] = None, position: Optional[str] = None) -> None:
+        """
+        Close the running stint and continue it as a new one without a rest.
+
+        Used at period boundaries (and position changes) so time is attributed
+        to the right period; the player's total is unaffected.
+
+        Args:
+            at_ts: Split timestamp
+            period_index: Period of the continued stint
+            position: Position of the continued stint (defaults to the current one)
+        """
+        if not self.is_open:
+            return
+        if position is None:
+            position = self._positions[self.position_codes[-1]]
+        self.close(at_ts)
+        self._append(at_ts, period_index, position)
+
+    def drop_last(self) -> None:
+        """Remove the latest stint, e.g. when undoing the substitution that opened it."""
+        self._rebuild(self.stints()[:-1])
+
+    def set_last_end(self, end_ts: Optional[float]) -> None:
+        """
+        Close the latest stint at ``end_ts``, or reopen it if ``end_ts`` is None.
+
+        Used by undo and redo, which may rewrite a stint that is already closed.
+        """
+        stints = self.stints()
+        if stints:
+            start, _, period, position = stints[-1]
+            stints[-1] = (start, end_ts, period, position)
+            self._rebuild(stints)
+
+    # ---------- Queries ---------- #
+
+    def open_stint_seconds(self, now: float) -> int:
+        """Seconds of the running stint at ``now`` (0 if none is running)."""
+        if not self.is_open:
+            return 0
+        return self._stint_seconds(len(self.starts) - 1, now)
+
+    def total_seconds(self, now: Optional[float] = None) -> int:
+        """Seconds over all stints, including the running one when ``now`` is given."""
+        return self.closed_seconds + (self.open_stint_seconds(now) if now is not None else 0)
+
+    def longest_stint(self, now: Optional[float] = None) -> int:
+        """Longest continuous stint in seconds."""
+        running = self.open_stint_seconds(now) if now is not None else 0
+        return max(self.longest_stint_seconds, running)
+
+    def period_seconds(self, now: Optional[float] = None) -> Dict[int, int]:
+        """Seconds played per period index (``NO_PERIOD`` for unknown)."""
+        result = dict(self._period_seconds)
+        if now is not None and self.is_open:
+            period = self.periods[-1]
+            result[period] = result.get(period, 0) + self.open_stint_seconds(now)
+        return result
+
+    def position_seconds(self, now: Optional[float] = None) -> Dict[Optional[str], int]:
+        """Seconds played per position."""
+        result = dict(self._position_seconds)
+        if now is not None and self.is_open:
+            position = self._positions[self.position_codes[-1]]
+            result[position] = result.get(position, 0) + self.open_stint_seconds(now)
+        return result
+
+    def average_rest_seconds(self) -> float:
+        """Average time on the bench between two stints."""
+        return self.rest_seconds / self.rest_count if self.rest_count else 0.0
+
+    def last_stint(self) -> Optional[Tuple[float, Optional[float], Optional[int], Optional[str]]]:
+        """Latest stint in the :meth:`stints` format (None if there is none)."""
+        if not self.starts:
+            return None
+        end, period = self.ends[-1], self.periods[-1]
+        return (
+            self.starts[-1],
+            None if math.isnan(end) else end,
+            None if period == NO_PERIOD else period,
+            self._positions[self.position_codes[-1]],
+        )
+
+    def stints(self) -> List[Tuple[float, Optional[float], Optional[int], Optional[str]]]:
+        """
+        List every stint.
+
+        Returns:
+            Tuples of (start, end or None while open, period index or None, position)
+        """
+        return [
+            (
+                self.starts[idx],
+                None if math.isnan(self.ends[idx]) else self.ends[idx],
+                None if self.periods[idx] == NO_PERIOD else self.periods[idx],
+                self._positions[self.position_codes[idx]],
+            )
+            for idx in range(len(self.starts))
+        ]
+
+    # ---------- Serialization ---------- #
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a columnar dictionary for JSON serialization."""
+        return {
+            "start": self.starts.tolist(),
+            "end": [None if math.isnan(end) else end for end in self.ends],
+            "period": self.periods.tolist(),
+            "position": [self._positions[code] for code in self.position_codes],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> 'StintLedger':
+        """Create from dictionary for JSON deserialization, rebuilding aggregates."""
+        ledger = cls()
+        if not data:
+            return ledger
+        starts = data.get("start", [])
+        ends = data.get("end", [])
+        periods = data.get("period", [])
+        positions = data.get("position", [])
+        ledger._rebuild([
+            (
+                start,
+                ends[idx] if idx < len(ends) else None,
+                periods[idx] if idx < len(periods) and periods[idx] != NO_PERIOD else None,
+                positions[idx] if idx < len(positions) else None,
+            )
+            for idx, start in enumerate(starts)
+        ])
+        return ledger
+
+    # ---------- Internal helpers ---------- #
+
+    def _rebuild(self, stints: List[Tuple[float, Optional[float], Optional[int], Optional[str]]]) -> None:
+        """Replace every stint, recomputing the aggregates."""
+        self.__init__()
+        for start, end, period, position in stints:
+            self.open(start, period, position)
+            if end is not None:
+                self.close(end)
+
+    def _append(self, start_ts: float, period_index: Optional[int], position: Optional[str]) -> None:
+        code = self._position_index.get(position)
+        if code is None:
+            code = len(self._positions)
+            self._positions.append(position)
+            self._position_index[position] = code
+        self.starts.append(start_ts)
+        self.ends.append(math.nan)
+        self.periods.append(NO_PERIOD if period_index is None else period_index)
+        self.position_codes.append(code)
+
+    def _record_rest(self, seconds: float) -> None:
+        rest = max(0, int(seconds))
+        self.rest_count += 1
+        self.rest_seconds += rest
+        self.longest_rest_seconds = max(self.longest_rest_seconds, rest)
+
+    def _stint_seconds(self, idx: int, end_ts: float) -> int:
+        return max(0, int(end_ts - self.starts[idx]))
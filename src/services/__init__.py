@@ -4,7 +4,7 @@ Services package for the Soccer Coach Sideline Timekeeper.
 This package contains service classes that handle business logic.
 Includes factory for proper dependency injection following SOLID principles.
 """
-from .persistence_service import PersistenceService
+from .persistence_service import AutosaveEngine, PersistenceService
 from .timer_service import TimerService
 from .analytics_service import AnalyticsService, GameReportExporter
 from .player_service import (
@@ -12,10 +12,26 @@ from .player_service import (
     PlayerValidationError, StandardPositionProvider
 )
 from .service_factory import ServiceFactory
+from .game_registry import GameRegistry, GameNotFoundError
+from .event_journal import EventJournal, GameEvent, GameEventType
+from .season_archive import SeasonArchive
+from .game_simulator import GameSimulator, SimulationConfig
+from .assignment_service import AssignmentService, AssignmentResult, AssignmentWeights
+from .rotation_planner import RotationConfig, RotationPlan, RotationPlanner
+from .replan_worker import ReplanJob, ReplanStatus, ReplanWorkerPool
+from .event_scheduler import GameEventScheduler, ScheduledEvent, ScheduledEventKind
+from .state_store import GameStateStore, InMemoryStateStore, SQLiteStateStore, StaleStateError
+from .response_cache import ResponseCache
 
 __all__ = [
-    "PersistenceService", "TimerService", "AnalyticsService", 
+    "PersistenceService", "AutosaveEngine", "TimerService", "AnalyticsService", 
     "PlayerService", "PlayerValidator", "PlayerCSVHandler",
     "PlayerValidationError", "StandardPositionProvider",
-    "GameReportExporter", "ServiceFactory"
+    "GameReportExporter", "ServiceFactory", "GameRegistry", "GameNotFoundError",
+    "EventJournal", "GameEvent", "GameEventType", "SeasonArchive",
+    "GameSimulator", "SimulationConfig", "GameEventScheduler", "ScheduledEvent",
+    "ScheduledEventKind", "AssignmentService", "AssignmentResult", "AssignmentWeights",
+    "RotationPlanner", "RotationConfig", "RotationPlan", "ReplanWorkerPool", "ReplanJob",
+    "ReplanStatus", "GameStateStore", "InMemoryStateStore", "SQLiteStateStore", "StaleStateError",
+    "ResponseCache"
 ]
@@ -5,14 +5,29 @@ from __future__ import annotations
 import csv
 import datetime as dt
 import io
+import math
 import statistics
+from array import array
 from abc import ABC, abstractmethod
 from collections import Counter
 from datetime import datetime
 from typing import List, Optional, Protocol
 
-from ..models import GameReport, GameState, Player, PlayerTimeSummary
-from ..utils import now_ts
+from ..models import (
+    ColumnarReport,
+    GameReport,
+    GameState,
+    Player,
+    PlayerStintSummary,
+    PlayerTimeSummary,
+    RosterColumns,
+)
+from ..utils import Clock, now_ts
+
+try:  # NumPy is optional; batch reports fall back to the array module
+    import numpy as _np
+except ImportError:  # pragma: no cover - depends on the environment
+    _np = None
 
 
 class TimerServiceInterface(Protocol):
@@ -44,6 +59,94 @@ class ExportServiceInterface(Protocol):
 
 FAIRNESS_THRESHOLD_SECONDS = 120  # +/- 2 minutes regarded as notable variance
 FAIRNESS_ORDER = {"under": 0, "ok": 1, "over": 2}
+FAIRNESS_LABELS = ("under", "ok", "over")
+
+
+def compute_columnar_report(
+    columns: RosterColumns,
+    target_per_player: float,
+    now: float,
+) -> ColumnarReport:
+    """
+    Compute playing time distribution in batch over a columnar roster.
+
+    Matches :meth:`AnalyticsService.generate_game_report` value for value but
+    works on whole columns, using NumPy when it is installed.
+
+    Args:
+        columns: Roster view, already synced with the roster
+        target_per_player: Fair share of playing time per player in seconds
+        now: Reference timestamp for running stints
+
+    Returns:
+        A :class:`ColumnarReport` in roster order
+    """
+    report = ColumnarReport(
+        generated_ts=now,
+        target_seconds_per_player=int(round(target_per_player)) if len(columns) else 0,
+        names=list(columns.names),
+        fairness_counts={label: 0 for label in FAIRNESS_LABELS},
+    )
+    if not len(columns):
+        return report
+
+    if _np is not None:
+        cumulative, delta, fairness = _columns_numpy(columns, target_per_player, now)
+        report.average_seconds = float(cumulative.mean())
+        report.median_seconds = float(_np.median(cumulative))
+        report.min_seconds = int(cumulative.min())
+        report.max_seconds = int(cumulative.max())
+        counts = _np.bincount(fairness, minlength=len(FAIRNESS_LABELS)).tolist()
+    else:
+        cumulative, delta, fairness = _columns_array(columns, target_per_player, now)
+        ordered = sorted(cumulative)
+        middle = len(ordered) // 2
+        report.average_seconds = sum(ordered) / len(ordered)
+        report.median_seconds = float(
+            ordered[middle] if len(ordered) % 2 else (ordered[middle - 1] + ordered[middle]) / 2
+        )
+        report.min_seconds = ordered[0]
+        report.max_seconds = ordered[-1]
+        counts = [0] * len(FAIRNESS_LABELS)
+        for code in fairness:
+            counts[code] += 1
+
+    report.cumulative_seconds = cumulative
+    report.delta_seconds = delta
+    report.fairness_codes = fairness
+    report.fairness_counts = dict(zip(FAIRNESS_LABELS, counts))
+    return report
+
+
+def _columns_numpy(columns: RosterColumns, target_per_player: float, now: float):
+    totals = _np.frombuffer(columns.totals, dtype=_np.int64)
+    starts = _np.frombuffer(columns.stint_starts, dtype=_np.float64)
+    # Players without a running stint have NaN starts and contribute nothing
+    stint = _np.nan_to_num(_np.trunc(now - starts)).astype(_np.int64)
+    cumulative = totals + stint
+    # rint rounds half to even, like the built-in round()
+    delta = _np.rint(cumulative - target_per_player).astype(_np.int64)
+    fairness = _np.ones(len(columns), dtype=_np.int8)
+    fairness[delta <= -FAIRNESS_THRESHOLD_SECONDS] = FAIRNESS_ORDER["under"]
+    fairness[delta >= FAIRNESS_THRESHOLD_SECONDS] = FAIRNESS_ORDER["over"]
+    return cumulative, delta, fairness
+
+
+def _columns_array(columns: RosterColumns, target_per_player: float, now: float):
+    isnan = math.isnan
+    cumulative = array("q", [
+        total if isnan(start) else total + int(now - start)
+        for total, start in zip(columns.totals, columns.stint_starts)
+    ])
+    delta = array("q", [round(value - target_per_player) for value in cumulative])
+    under, over = -FAIRNESS_THRESHOLD_SECONDS, FAIRNESS_THRESHOLD_SECONDS
+    fairness = array("b", [
+        FAIRNESS_ORDER["under"] if value <= under
+        else FAIRNESS_ORDER["over"] if value >= over
+        else FAIRNESS_ORDER["ok"]
+        for value in delta
+    ])
+    return cumulative, delta, fairness
 
 
 class GameReportExporter:
@@ -83,10 +186,12 @@ class AnalyticsService:
         self,
         game_state: GameState,
         timer_service: Optional[TimerServiceInterface] = None,
-        export_service: Optional[ExportServiceInterface] = None
+        export_service: Optional[ExportServiceInterface] = None,
+        clock: Optional[Clock] = None,
     ) -> None:
         self.game_state = game_state
         self._timer_service = timer_service
+        self.clock = clock
         self.export_service = export_service or GameReportExporter()
 
     def set_timer_service(self, timer_service: TimerServiceInterface) -> None:
@@ -98,9 +203,12 @@ class AnalyticsService:
         if self._timer_service is None:
             # Import here to avoid circular dependency
             from .timer_service import TimerService
-            self._timer_service = TimerService(self.game_state)
+            self._timer_service = TimerService(self.game_state, clock=self.clock)
         return self._timer_service
 
+    def _now(self) -> float:
+        return self.clock.now() if self.clock is not None else now_ts()
+
     def generate_game_report(self) -> GameReport:
         """Build a :class:`GameReport` snapshot for the active game."""
 
@@ -119,7 +227,7 @@ class AnalyticsService:
         target_per_player = target_total / roster_size if roster_size else 0.0
         target_per_player_int = int(round(target_per_player)) if roster_size else 0
 
-        now = now_ts()
+        now = self._now()
         summaries: List[PlayerTimeSummary] = []
 
         for player in roster:
@@ -193,6 +301,68 @@ class AnalyticsService:
             fairness_counts=fairness_counts,
         )
 
+    def generate_columnar_report(self, now: Optional[float] = None) -> ColumnarReport:
+        """
+        Build the playing time distribution in batch over the columnar roster.
+
+        Produces the same figures as :meth:`generate_game_report` without a
+        summary object per player, for aggregating many games or large squads.
+
+        Args:
+            now: Reference timestamp for running stints (defaults to now)
+
+        Returns:
+            A :class:`ColumnarReport` in roster order
+        """
+        config = self._timer().get_timer_configuration()
+        target_total = max(
+            0,
+            int(config["game_length_seconds"])
+            + int(config["total_stoppage_seconds"])
+            + int(config["total_adjustment_seconds"]),
+        )
+        columns = self.game_state.roster_columns()
+        target_per_player = target_total / len(columns) if len(columns) else 0.0
+        return compute_columnar_report(
+            columns, target_per_player, self._now() if now is None else now
+        )
+
+    def generate_stint_report(self, now: Optional[float] = None) -> List[PlayerStintSummary]:
+        """Summarize every player's stint ledger.
+
+        Reads the ledgers' running aggregates, so the cost is independent of
+        how many stints each player has played.
+
+        Args:
+            now: Reference timestamp for running stints (defaults to now)
+
+        Returns:
+            One :class:`PlayerStintSummary` per player, ordered by name
+        """
+
+        now = self._now() if now is None else now
+        summaries: List[PlayerStintSummary] = []
+        for player in self.game_state.roster.values():
+            ledger = player.stint_ledger
+            summaries.append(
+                PlayerStintSummary(
+                    name=player.name,
+                    stint_count=len(ledger),
+                    total_seconds=ledger.total_seconds(now),
+                    longest_stint_seconds=ledger.longest_stint(now),
+                    period_seconds=ledger.period_seconds(now),
+                    position_seconds={
+                        position or "": seconds
+                        for position, seconds in ledger.position_seconds(now).items()
+                    },
+                    rest_count=ledger.rest_count,
+                    longest_rest_seconds=ledger.longest_rest_seconds,
+                    average_rest_seconds=ledger.average_rest_seconds(),
+                )
+            )
+        summaries.sort(key=lambda item: item.name)
+        return summaries
+
     def generate_report_csv(self, report: Optional[GameReport] = None) -> str:
         """Return a CSV document describing the current playing time report.
 
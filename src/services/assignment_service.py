@@ -0,0 +1,292 @@
+"""
+Position assignment engine for the Soccer Coach Sideline Timekeeper.
+
+Builds a slot-by-player cost matrix from skill ratings, preferred
+positions, fatigue and minutes played, and solves it optimally with the
+Hungarian algorithm. A full 11v11 formation against a 25-player squad
+solves in well under a millisecond.
+"""
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional, Sequence
+
+from ..models import POSITION_TAXONOMY, GameState, Player
+from ..models.formation import Formation
+from ..utils import Clock, now_ts
+
+# Skill rating assumed when none is recorded for the slot (see Player.get_skill_rating)
+DEFAULT_SKILL_RATING = 3
+MAX_SKILL_RATING = 5
+
+
+@dataclass
+class AssignmentWeights:
+    """
+    Cost weights of the assignment engine (lower total cost is better).
+
+    Attributes:
+        skill: Cost per skill point below the maximum rating
+        preference: Cost of a slot outside the player's preferred positions
+        family_preference: Cost of a slot related to a preferred position
+            (same family or a neighbouring position)
+        goalkeeper: Extra cost of an outfield player in goal
+        fatigue_per_minute: Cost per minute of the current stint
+        minutes_per_minute: Cost per minute played so far this game
+    """
+    skill: float = 2.0
+    preference: float = 6.0
+    family_preference: float = 2.0
+    goalkeeper: float = 25.0
+    fatigue_per_minute: float = 0.15
+    minutes_per_minute: float = 0.05
+
+
+@dataclass
+class SlotAssignment:
+    """One filled formation slot."""
+    slot_index: int
+    position: str
+    player_name: str
+    cost: float
+
+
+@dataclass
+class AssignmentResult:
+    """Optimal assignment of players to the slots of a formation."""
+    formation_name: str
+    assignments: List[SlotAssignment] = field(default_factory=list)
+    unfilled_slots: List[int] = field(default_factory=list)
+    bench: List[str] = field(default_factory=list)
+
+    @property
+    def total_cost(self) -> float:
+        return sum(assignment.cost for assignment in self.assignments)
+
+    def as_mapping(self) -> Dict[int, str]:
+        """Slot index -> player name, as taken by ``assign_players_to_formation``."""
+        return {assignment.slot_index: assignment.player_name for assignment in self.assignments}
+
+    def to_dict(self) -> Dict:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "formation_name": self.formation_name,
+            "assignments": [asdict(assignment) for assignment in self.assignments],
+            "unfilled_slots": list(self.unfilled_slots),
+            "bench": list(self.bench),
+            "total_cost": self.total_cost,
+        }
+
+
+def solve_assignment(cost: Sequence[Sequence[float]]) -> List[int]:
+    """
+    Minimum-cost assignment of rows to distinct columns (Hungarian algorithm).
+
+    Runs in O(n^2 m) for n rows and m columns.
+
+    Args:
+        cost: Rectangular cost matrix with no more rows than columns
+
+    Returns:
+        Column index assigned to each row
+
+    Raises:
+        ValueError: If there are more rows than columns
+    """
+    n = len(cost)
+    m = len(cost[0]) if n else 0
+    if n > m:
+        raise ValueError("Cost matrix needs at least as many columns as rows")
+
+    inf = float("inf")
+    # Row/column potentials and the row matched to each column (1-based, 0 = free)
+    u = [0.0] * (n + 1)
+    v = [0.0] * (m + 1)
+    match = [0] * (m + 1)
+    way = [0] * (m + 1)
+    for row in range(1, n + 1):
+        match[0] = row
+        col0 = 0
+        min_slack = [inf] * (m + 1)
+        used = [False] * (m + 1)
+        while True:
+            used[col0] = True
+            row0 = match[col0]
+            costs = cost[row0 - 1]
+            u_row0 = u[row0]
+            delta = inf
+            col1 = 0
+            for col in range(1, m + 1):
+                if not used[col]:
+                    slack = costs[col - 1] - u_row0 - v[col]
+                    if slack < min_slack[col]:
+                        min_slack[col] = slack
+                        way[col] = col0
+                    if min_slack[col] < delta:
+                        delta = min_slack[col]
+                        col1 = col
+            for col in range(m + 1):
+                if used[col]:
+                    u[match[col]] += delta
+                    v[col] -= delta
+                else:
+                    min_slack[col] -= delta
+            col0 = col1
+            if match[col0] == 0:
+                break
+        # Flip the augmenting path
+        while col0:
+            col1 = way[col0]
+            match[col0] = match[col1]
+            col0 = col1
+
+    result = [-1] * n
+    for col in range(1, m + 1):
+        if match[col]:
+            result[match[col] - 1] = col - 1
+    return result
+
+
+class AssignmentService:
+    """
+    Suggests the optimal lineup for a formation.
+
+    Every (slot, player) pair is priced by how well the player's skill and
+    preferred positions fit the slot, plus fatigue (length of the current
+    stint) and minutes already played, so tired and heavily used players
+    drift to the bench when the squad is larger than the formation.
+    """
+
+    def __init__(
+        self,
+        game_state: GameState,
+        weights: Optional[AssignmentWeights] = None,
+        clock: Optional[Clock] = None,
+    ):
+        """
+        Args:
+            game_state: Game whose roster is assigned
+            weights: Cost weights (defaults to :class:`AssignmentWeights`)
+            clock: Time source for fatigue and minutes; defaults to the wall clock
+        """
+        self.game_state = game_state
+        self.weights = weights or AssignmentWeights()
+        self.clock = clock
+
+    def _now(self) -> float:
+        return self.clock.now() if self.clock is not None else now_ts()
+
+    def slot_cost(self, player: Player, position_code: str, now: float) -> float:
+        """
+        Cost of playing a player in a slot.
+
+        Args:
+            player: Candidate player
+            position_code: Position code of the slot
+            now: Reference timestamp for fatigue and minutes
+
+        Returns:
+            Non-negative cost (lower is a better fit)
+        """
+        weights = self.weights
+        code = position_code.upper()
+        family = POSITION_TAXONOMY.family_of(code)
+
+        preferred = player.preferred_list()
+        affinity = POSITION_TAXONOMY.best_affinity(preferred, code)
+        if affinity >= 1.0:
+            cost = 0.0
+        elif affinity > 0.0:
+            cost = weights.family_preference
+        else:
+            cost = weights.preference
+        if family == "GK" and not any(POSITION_TAXONOMY.is_goalkeeper(pref) for pref in preferred):
+            cost += weights.goalkeeper
+
+        cost += (MAX_SKILL_RATING - self._skill_rating(player, code, family)) * weights.skill
+
+        stint_seconds = player.current_stint_seconds(now)
+        cost += stint_seconds / 60 * weights.fatigue_per_minute
+        cost += (player.total_seconds + stint_seconds) / 60 * weights.minutes_per_minute
+        return cost
+
+    def build_cost_matrix(
+        self, formation: Formation, players: Sequence[Player], now: float
+    ) -> List[List[float]]:
+        """
+        Price every slot of a formation against every player.
+
+        Returns:
+            One row per slot, one column per player
+        """
+        return [
+            [self.slot_cost(player, slot.position_code.value, now) for player in players]
+            for slot in formation.positions
+        ]
+
+    def solve(
+        self,
+        formation: Formation,
+        player_names: Optional[Sequence[str]] = None,
+        now: Optional[float] = None,
+    ) -> AssignmentResult:
+        """
+        Find the minimum-cost lineup for a formation.
+
+        Args:
+            formation: Formation whose slots are filled
+            player_names: Available players (defaults to the whole roster)
+            now: Reference timestamp (defaults to the service's clock)
+
+        Returns:
+            Slot assignments, any slots left empty and the remaining bench
+
+        Raises:
+            ValueError: If a named player is not in the roster
+        """
+        roster = self.game_state.roster
+        names = list(roster) if player_names is None else list(dict.fromkeys(player_names))
+        unknown = [name for name in names if name not in roster]
+        if unknown:
+            raise ValueError(f"Players not found in roster: {', '.join(unknown)}")
+
+        players = [roster[name] for name in names]
+        now = self._now() if now is None else now
+        cost = self.build_cost_matrix(formation, players, now)
+
+        # Solve with the smaller side as rows; a short squad leaves slots empty
+        slot_to_player: Dict[int, int] = {}
+        if len(formation.positions) <= len(players):
+            for slot, player_idx in enumerate(solve_assignment(cost)):
+                slot_to_player[slot] = player_idx
+        elif players:
+            transposed = [list(column) for column in zip(*cost)]
+            for player_idx, slot in enumerate(solve_assignment(transposed)):
+                slot_to_player[slot] = player_idx
+
+        result = AssignmentResult(formation_name=formation.name)
+        for slot, position in enumerate(formation.positions):
+            player_idx = slot_to_player.get(slot)
+            if player_idx is None:
+                result.unfilled_slots.append(slot)
+                continue
+            result.assignments.append(SlotAssignment(
+                slot_index=slot,
+                position=position.position_code.value,
+                player_name=names[player_idx],
+                cost=round(cost[slot][player_idx], 3),
+            ))
+        assigned = set(slot_to_player.values())
+        result.bench = [name for idx, name in enumerate(names) if idx not in assigned]
+        return result
+
+    # ---------- Internal helpers ---------- #
+
+    @staticmethod
+    def _skill_rating(player: Player, code: str, family: Optional[str]) -> int:
+        ratings = player.skill_ratings
+        if code in ratings:
+            return ratings[code]
+        # Fall back to a rating recorded under another code of the same family
+        for rated_code, rating in ratings.items():
+            if family is not None and POSITION_TAXONOMY.family_of(rated_code) == family:
+                return rating
+        return DEFAULT_SKILL_RATING
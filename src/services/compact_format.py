@@ -0,0 +1,94 @@
+"""
+Compact binary save format for the Soccer Coach Sideline Timekeeper application.
+
+Season archives hold hundreds of saved games, and indented JSON is both large
+and slow to parse. This format stores the same JSON-compatible document as a
+zlib-compressed ``marshal`` payload behind a fixed header::
+
+    magic (4s) | format version (B) | flags (B) | payload length (I) | CRC-32 (I)
+
+The header lets loaders tell compact files from JSON by their first bytes,
+and the checksum rejects torn or corrupted files before they are decoded.
+"""
+import marshal
+import struct
+import zlib
+from typing import Any
+
+COMPACT_MAGIC = b"SLTK"
+COMPACT_FORMAT_VERSION = 1
+COMPACT_EXTENSION = ".sltk"
+
+# marshal format 4 is stable across every supported Python 3 release
+_MARSHAL_VERSION = 4
+_FLAG_ZLIB = 0x01
+_HEADER = struct.Struct("<4sBBII")
+
+
+class CompactFormatError(ValueError):
+    """Raised when data is not a valid compact save."""
+    pass
+
+
+def is_compact(head: bytes) -> bool:
+    """
+    Check whether data starts with the compact format magic.
+
+    Args:
+        head: At least the first four bytes of a file
+
+    Returns:
+        True if the bytes belong to a compact save
+    """
+    return head[:len(COMPACT_MAGIC)] == COMPACT_MAGIC
+
+
+def encode_compact(data: Any, compress: bool = True) -> bytes:
+    """
+    Encode a JSON-compatible document in the compact format.
+
+    Args:
+        data: Document made of dicts, lists, strings, numbers, booleans and None
+        compress: Whether to zlib-compress the payload
+
+    Returns:
+        Encoded bytes including the header
+    """
+    payload = marshal.dumps(data, _MARSHAL_VERSION)
+    flags = 0
+    if compress:
+        payload = zlib.compress(payload, 6)
+        flags |= _FLAG_ZLIB
+    header = _HEADER.pack(
+        COMPACT_MAGIC, COMPACT_FORMAT_VERSION, flags, len(payload), zlib.crc32(payload)
+    )
+    return header + payload
+
+
+def decode_compact(blob: bytes) -> Any:
+    """
+    Decode a compact save.
+
+    Args:
+        blob: Bytes produced by :func:`encode_compact`
+
+    Returns:
+        The decoded document
+
+    Raises:
+        CompactFormatError: If the header, length or checksum is invalid
+    """
+    if len(blob) < _HEADER.size or not is_compact(blob):
+        raise CompactFormatError("Not a compact save file")
+
+    _, version, flags, length, checksum = _HEADER.unpack_from(blob)
+    if version > COMPACT_FORMAT_VERSION:
+        raise CompactFormatError(f"Unsupported compact format version: {version}")
+
+    payload = blob[_HEADER.size:]
+    if len(payload) != length or zlib.crc32(payload) != checksum:
+        raise CompactFormatError("Compact save is truncated or corrupted")
+
+    if flags & _FLAG_ZLIB:
+        payload = zlib.decompress(payload)
+    return marshal.loads(payload)
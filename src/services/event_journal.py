@@ -0,0 +1,470 @@
+"""
+Game event journal for the Soccer Coach Sideline Timekeeper application.
+
+Every mutation of a game is appended to a JSON-lines journal instead of
+rewriting the whole game file. Each event carries the event type plus an
+after-image of the timer fields and of only the players that changed, so an
+append costs O(changed entries) and replay is a plain assignment that cannot
+drift from the services that produced the change. Periodic snapshots compact
+the journal and bound how much a recovery has to replay; compacted segments
+are set aside rather than deleted so the full game history stays available.
+"""
+import glob
+import json
+import os
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ..models import GameState, Player
+from ..models.formation import Formation
+from ..utils import now_ts
+
+DEFAULT_FSYNC_BATCH_SIZE = 32
+DEFAULT_FSYNC_INTERVAL_SECONDS = 1.0
+DEFAULT_SNAPSHOT_INTERVAL = 500
+
+# Scalar and per-period game fields captured in full by every event
+TIMER_FIELDS = (
+    "scheduled_start_ts",
+    "game_start_ts",
+    "paused",
+    "halftime_started",
+    "halftime_end_ts",
+    "elapsed_adjustment",
+    "game_length_seconds",
+    "period_count",
+    "period_elapsed",
+    "period_adjustments",
+    "period_stoppage",
+    "current_period_index",
+    "period_start_ts",
+    "opponent_notes",
+    "field_size",
+)
+
+FORMATION_FIELDS = ("current_formation", "starting_formation")
+
+
+class GameEventType(Enum):
+    """Kinds of game events recorded in the journal."""
+    START = "start"
+    PAUSE = "pause"
+    HALFTIME = "halftime"
+    STOPPAGE = "stoppage"
+    ADJUSTMENT = "adjustment"
+    CONFIGURE = "configure"
+    SUBSTITUTION = "substitution"
+    FORMATION_CHANGE = "formation_change"
+    ROSTER = "roster"
+    LOAD = "load"
+    UNDO = "undo"
+    REDO = "redo"
+    BATCH = "batch"
+    UPDATE = "update"
+
+
+# Events that replace most of the game; a snapshot is cheaper than replaying them
+SNAPSHOT_EVENT_TYPES = frozenset({GameEventType.ROSTER, GameEventType.LOAD})
+
+
+@dataclass
+class GameEvent:
+    """A single journal entry with the after-image of what it changed."""
+    seq: int
+    event_type: GameEventType
+    version: int
+    timestamp: float = field(default_factory=now_ts)
+    timer: Dict[str, Any] = field(default_factory=dict)
+    players: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    removed_players: List[str] = field(default_factory=list)
+    formations: Dict[str, Optional[Dict[str, Any]]] = field(default_factory=dict)
+    commands: List[Dict[str, Any]] = field(default_factory=list)
+    data: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        result = {
+            "seq": self.seq,
+            "type": self.event_type.value,
+            "version": self.version,
+            "ts": self.timestamp,
+            "timer": self.timer,
+        }
+        # Optional sections are omitted to keep journal lines short
+        if self.players:
+            result["players"] = self.players
+        if self.removed_players:
+            result["removed_players"] = self.removed_players
+        if self.formations:
+            result["formations"] = self.formations
+        if self.commands:
+            result["commands"] = self.commands
+        if self.data:
+            result["data"] = self.data
+        return result
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'GameEvent':
+        """Create from dictionary for JSON deserialization."""
+        return cls(
+            seq=int(data["seq"]),
+            event_type=GameEventType(data["type"]),
+            version=int(data.get("version", 0)),
+            timestamp=data.get("ts", 0.0),
+            timer=data.get("timer", {}),
+            players=data.get("players", {}),
+            removed_players=data.get("removed_players", []),
+            formations=data.get("formations", {}),
+            commands=data.get("commands", []),
+            data=data.get("data", {}),
+        )
+
+
+def apply_event(game_state: GameState, event: GameEvent) -> None:
+    """
+    Apply a journal event to a game state in place.
+
+    Args:
+        game_state: Game state to update
+        event: Event whose after-image is applied
+    """
+    for name, value in event.timer.items():
+        setattr(game_state, name, list(value) if isinstance(value, list) else value)
+
+    for name in event.removed_players:
+        game_state.roster.pop(name, None)
+    for name, player_data in event.players.items():
+        game_state.roster[name] = Player.from_dict({"name": name, **player_data})
+
+    for name, formation_data in event.formations.items():
+        setattr(game_state, name, Formation.from_dict(formation_data) if formation_data else None)
+
+    if event.commands:
+        game_state.command_log.replay(event.commands)
+
+    game_state.state_version = event.version
+
+
+class EventJournal:
+    """
+    Append-only journal of game events with snapshot compaction.
+
+    Lines are flushed to the operating system on every append, so a crashed
+    server process loses nothing. ``fsync`` is batched by count and age, which
+    bounds what a power loss can take to the last unsynced batch.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        snapshot_path: Optional[str] = None,
+        fsync_batch_size: int = DEFAULT_FSYNC_BATCH_SIZE,
+        fsync_interval_seconds: float = DEFAULT_FSYNC_INTERVAL_SECONDS,
+        snapshot_interval: int = DEFAULT_SNAPSHOT_INTERVAL,
+    ):
+        """
+        Initialize the journal, resuming the sequence of an existing file.
+
+        Args:
+            path: Journal file path (JSON lines)
+            snapshot_path: Snapshot file path (defaults to ``<path>.snapshot``)
+            fsync_batch_size: Appends between forced fsyncs
+            fsync_interval_seconds: Maximum age of unsynced appends
+            snapshot_interval: Appends after which the journal is compacted
+        """
+        self.path = path
+        self.snapshot_path = snapshot_path or f"{path}.snapshot"
+        self.fsync_batch_size = max(1, fsync_batch_size)
+        self.fsync_interval_seconds = fsync_interval_seconds
+        self.snapshot_interval = max(1, snapshot_interval)
+        self._file = None
+        self._unsynced = 0
+        self._last_sync_ts = now_ts()
+        self._formation_ids: Dict[str, int] = {}
+        # Undo log last mirrored: (id of the log, its revision)
+        self._command_log_mark: Optional[Tuple[int, int]] = None
+
+        snapshot_seq = self._read_snapshot_seq()
+        self.seq, self.events_since_snapshot = self._scan_journal(snapshot_seq)
+
+    @classmethod
+    def for_game(cls, storage_dir: str, game_id: str, **kwargs: Any) -> 'EventJournal':
+        """
+        Create the journal for a game stored in a registry directory.
+
+        Args:
+            storage_dir: Directory holding the game files
+            game_id: Game identifier
+            **kwargs: Extra EventJournal options
+
+        Returns:
+            Journal writing ``<game_id>.events.jsonl`` and ``<game_id>.snapshot.json``
+        """
+        return cls(
+            os.path.join(storage_dir, f"{game_id}.events.jsonl"),
+            snapshot_path=os.path.join(storage_dir, f"{game_id}.snapshot.json"),
+            **kwargs,
+        )
+
+    @property
+    def has_data(self) -> bool:
+        """Whether a snapshot or any event has been written."""
+        return self.seq > 0 or os.path.exists(self.snapshot_path)
+
+    # ---------- Writing ---------- #
+
+    def record(
+        self,
+        game_state: GameState,
+        event_type: GameEventType,
+        players: Iterable[str] = (),
+        removed_players: Iterable[str] = (),
+        **data: Any,
+    ) -> GameEvent:
+        """
+        Append an event capturing the current after-image of a mutation.
+
+        Args:
+            game_state: Game state after the mutation
+            event_type: Kind of event
+            players: Names of players whose data changed
+            removed_players: Names of players removed from the roster
+            **data: Extra descriptive payload (e.g. substitution names)
+
+        Returns:
+            The appended event
+        """
+        roster = game_state.roster
+        event = GameEvent(
+            seq=self.seq + 1,
+            event_type=event_type,
+            version=game_state.state_version,
+            timer={name: self._copy_value(getattr(game_state, name)) for name in TIMER_FIELDS},
+            players={name: roster[name].to_dict() for name in players if name in roster},
+            removed_players=[name for name in removed_players if name not in roster],
+            formations=self._changed_formations(game_state, event_type),
+            commands=self._command_ops(game_state),
+            data=data,
+        )
+        self.append(event)
+
+        if (
+            event_type in SNAPSHOT_EVENT_TYPES
+            or self.events_since_snapshot >= self.snapshot_interval
+        ):
+            self.write_snapshot(game_state)
+        return event
+
+    def append(self, event: GameEvent) -> None:
+        """
+        Write one event line, fsyncing when the batch is full or old.
+
+        Args:
+            event: Event to append; its sequence number must be the next one
+        """
+        if self._file is None:
+            self._ensure_directory(self.path)
+            self._file = open(self.path, "a", encoding="utf-8")
+
+        self._file.write(json.dumps(event.to_dict(), separators=(",", ":")) + "\n")
+        self._file.flush()
+        self.seq = event.seq
+        self.events_since_snapshot += 1
+        self._unsynced += 1
+
+        if (
+            self._unsynced >= self.fsync_batch_size
+            or now_ts() - self._last_sync_ts >= self.fsync_interval_seconds
+        ):
+            self.sync()
+
+    def sync(self) -> None:
+        """Force every appended event to stable storage."""
+        if self._file is not None and self._unsynced:
+            os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._last_sync_ts = now_ts()
+
+    def write_snapshot(self, game_state: GameState) -> None:
+        """
+        Atomically write a full snapshot and start a new journal segment.
+
+        The snapshot is renamed into place before the journal is rotated to
+        ``<path>.<last seq>``, so a crash in between only leaves events that
+        recovery already skips.
+
+        Args:
+            game_state: Game state at the current sequence number
+        """
+        self._ensure_directory(self.snapshot_path)
+        temp_path = f"{self.snapshot_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"seq": self.seq, "state": game_state.to_json()}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.snapshot_path)
+
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if os.path.exists(self.path) and os.path.getsize(self.path):
+            os.replace(self.path, f"{self.path}.{self.seq:010d}")
+        self._unsynced = 0
+        self.events_since_snapshot = 0
+
+    def close(self) -> None:
+        """Sync and close the journal file."""
+        self.sync()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    # ---------- Reading ---------- #
+
+    def read_events(self, after_seq: int = 0) -> Iterator[GameEvent]:
+        """
+        Iterate over journal events newer than a sequence number.
+
+        Reading stops at the first torn or corrupt line, since later events
+        build on it.
+
+        Args:
+            after_seq: Sequence number already covered by the caller
+
+        Yields:
+            GameEvent instances in journal order
+        """
+        yield from self._read_file(self.path, after_seq)
+
+    def read_history(self) -> Iterator[GameEvent]:
+        """
+        Iterate over every event of the game, including compacted segments.
+
+        Yields:
+            GameEvent instances in journal order
+        """
+        for segment in sorted(glob.glob(glob.escape(self.path) + ".*")):
+            if segment[len(self.path) + 1:].isdigit():
+                yield from self._read_file(segment, 0)
+        yield from self._read_file(self.path, 0)
+
+    def load_snapshot(self) -> Optional[Tuple[int, GameState]]:
+        """
+        Load the latest snapshot.
+
+        Returns:
+            Tuple of (sequence number, game state), or None without a snapshot
+        """
+        if not os.path.exists(self.snapshot_path):
+            return None
+        with open(self.snapshot_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return int(data.get("seq", 0)), GameState.from_json(data.get("state", {}))
+
+    def recover(self) -> Optional[GameState]:
+        """
+        Rebuild the game state from the snapshot plus newer events.
+
+        Returns:
+            The recovered game state, or None if nothing was journaled
+        """
+        snapshot = self.load_snapshot()
+        if snapshot is None:
+            after_seq, game_state = 0, None
+        else:
+            after_seq, game_state = snapshot
+
+        for event in self.read_events(after_seq):
+            if game_state is None:
+                game_state = GameState()
+            apply_event(game_state, event)
+
+        if game_state is not None:
+            game_state.ensure_timer_lists()
+        return game_state
+
+    # ---------- Internal helpers ---------- #
+
+    @staticmethod
+    def _read_file(path: str, after_seq: int) -> Iterator[GameEvent]:
+        if not os.path.exists(path):
+            return
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    event = GameEvent.from_dict(json.loads(line))
+                except (ValueError, KeyError):
+                    return
+                if event.seq > after_seq:
+                    yield event
+
+    def _changed_formations(
+        self, game_state: GameState, event_type: GameEventType
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        # Formations are compared by identity; explicit formation events
+        # always carry them since positions may be edited in place
+        changed = {}
+        for name in FORMATION_FIELDS:
+            formation = getattr(game_state, name)
+            if (
+                event_type is GameEventType.FORMATION_CHANGE
+                or self._formation_ids.get(name) != id(formation)
+            ):
+                changed[name] = formation.to_dict() if formation else None
+                self._formation_ids[name] = id(formation)
+        return changed
+
+    def _command_ops(self, game_state: GameState) -> List[Dict[str, Any]]:
+        # Undo log operations since the last event; a replaced or unknown log is copied whole
+        log = game_state.command_log
+        ops = None
+        if self._command_log_mark is not None and self._command_log_mark[0] == id(log):
+            ops = log.ops_since(self._command_log_mark[1])
+        if ops is None:
+            ops = [{"op": "load", "log": log.to_dict()}]
+        self._command_log_mark = (id(log), log.revision)
+        return ops
+
+    def _read_snapshot_seq(self) -> int:
+        if not os.path.exists(self.snapshot_path):
+            return 0
+        try:
+            with open(self.snapshot_path, "r", encoding="utf-8") as f:
+                return int(json.load(f).get("seq", 0))
+        except (ValueError, OSError):
+            return 0
+
+    def _scan_journal(self, snapshot_seq: int) -> Tuple[int, int]:
+        """Find the last sequence number and drop a torn trailing line."""
+        if not os.path.exists(self.path):
+            return snapshot_seq, 0
+
+        seq, pending, valid_end = snapshot_seq, 0, 0
+        with open(self.path, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    line_seq = int(json.loads(line)["seq"])
+                except (ValueError, KeyError):
+                    break
+                valid_end += len(line)
+                if line_seq > snapshot_seq:
+                    seq = line_seq
+                    pending += 1
+
+        if valid_end < os.path.getsize(self.path):
+            with open(self.path, "r+b") as f:
+                f.truncate(valid_end)
+        return seq, pending
+
+    @staticmethod
+    def _copy_value(value: Any) -> Any:
+        return list(value) if isinstance(value, list) else value
+
+    @staticmethod
+    def _ensure_directory(path: str) -> None:
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory, exist_ok=True)
@@ -0,0 +1,314 @@
+"""
+Game event scheduler for the Soccer Coach Sideline Timekeeper application.
+
+Instead of polling ``should_suggest_halftime()`` and ``is_halftime_over()``
+every second, the scheduler keeps pending events in a heap keyed on the game
+clock and arms a single timer for the next one, so each event fires when it
+is due. Period ends and planned substitutions live on the game clock, which
+only advances while play is running; the end of a break is a wall-clock
+deadline.
+"""
+import heapq
+import itertools
+import threading
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional
+
+from ..models.formation import SubstitutionPlan
+from .timer_service import TimerService
+
+# Shortest re-arm delay, absorbing float rounding at a due boundary
+MIN_TIMER_DELAY_SECONDS = 0.01
+
+
+class ScheduledEventKind(Enum):
+    """Kinds of events the scheduler fires."""
+    PERIOD_END = "period_end"
+    BREAK_END = "break_end"
+    PLANNED_SUBSTITUTION = "planned_substitution"
+
+
+@dataclass(order=True)
+class ScheduledEvent:
+    """
+    A pending event.
+
+    ``deadline`` is in game-clock seconds, except for break ends where it is
+    an epoch timestamp.
+    """
+    deadline: float
+    seq: int
+    kind: ScheduledEventKind = field(compare=False)
+    data: Dict[str, Any] = field(default_factory=dict, compare=False)
+    cancelled: bool = field(default=False, compare=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {"kind": self.kind.value, "deadline": self.deadline, **self.data}
+
+
+class GameEventScheduler:
+    """
+    Priority queue of game-clock deadlines for one game.
+
+    Call :meth:`resync` after anything that moves the clock or its targets
+    (start, pause, resume, adjustments, stoppage, halftime). It re-keys the
+    period-end deadline and re-arms the timer, which stays disarmed while
+    play is paused. :meth:`poll` can also be driven by hand, e.g. from a
+    simulator or a UI refresh loop.
+    """
+
+    def __init__(
+        self,
+        timer_service: TimerService,
+        listener: Optional[Callable[[ScheduledEvent], None]] = None,
+        lock: Optional[threading.RLock] = None,
+    ):
+        """
+        Args:
+            timer_service: Timer of the game to watch
+            listener: Called with every fired event
+            lock: Game lock held while the timer thread polls
+        """
+        self.timer_service = timer_service
+        self._listeners: List[Callable[[ScheduledEvent], None]] = [listener] if listener else []
+        self._lock = lock or threading.RLock()
+        self._heap: List[ScheduledEvent] = []
+        self._seq = itertools.count()
+        self._period_end: Optional[ScheduledEvent] = None
+        self._period_end_fired_for: Optional[int] = None
+        self._break_end: Optional[ScheduledEvent] = None
+        self._timer: Optional[threading.Timer] = None
+        self._running = False
+
+    # ---------- Registration ---------- #
+
+    def add_listener(self, listener: Callable[[ScheduledEvent], None]) -> None:
+        """Register a callback for fired events."""
+        self._listeners.append(listener)
+
+    def schedule(self, kind: ScheduledEventKind, game_seconds: float, **data: Any) -> ScheduledEvent:
+        """
+        Schedule an event at a game-clock time.
+
+        Args:
+            kind: Event kind
+            game_seconds: Game clock reading at which the event is due
+            **data: Payload delivered with the event
+
+        Returns:
+            The scheduled event (pass it to :meth:`cancel` to drop it)
+        """
+        with self._lock:
+            event = ScheduledEvent(float(game_seconds), next(self._seq), kind, data)
+            heapq.heappush(self._heap, event)
+            self._arm()
+            return event
+
+    def schedule_plan(self, plan: SubstitutionPlan) -> List[ScheduledEvent]:
+        """
+        Schedule every substitution of a plan at its target minute.
+
+        Substitutions of a plan scheduled earlier are replaced.
+
+        Args:
+            plan: Substitution plan with (out, in, minute) entries
+
+        Returns:
+            The scheduled events
+        """
+        with self._lock:
+            self.cancel_plan(plan.name)
+            return [
+                self.schedule(
+                    ScheduledEventKind.PLANNED_SUBSTITUTION,
+                    int(minute) * 60,
+                    plan=plan.name,
+                    out_player=out_player,
+                    in_player=in_player,
+                    minute=int(minute),
+                )
+                for out_player, in_player, minute in plan.substitutions
+            ]
+
+    def cancel(self, event: ScheduledEvent) -> None:
+        """Drop a pending event; it is discarded lazily when it reaches the top."""
+        event.cancelled = True
+
+    def cancel_plan(self, plan_name: str) -> None:
+        """Drop every pending substitution of a plan."""
+        with self._lock:
+            for event in self._heap:
+                if event.data.get("plan") == plan_name:
+                    event.cancelled = True
+
+    def pending(self) -> List[ScheduledEvent]:
+        """Pending events in due order (break end first while in a break)."""
+        with self._lock:
+            events = sorted(event for event in self._heap if not event.cancelled)
+            if self._break_end is not None:
+                events.insert(0, self._break_end)
+            return events
+
+    # ---------- Clock tracking ---------- #
+
+    def resync(self) -> None:
+        """Re-key clock-dependent deadlines after the game clock changed."""
+        with self._lock:
+            gs = self.timer_service.game_state
+            if self._period_end is not None:
+                self._period_end.cancelled = True
+                self._period_end = None
+
+            index = gs.current_period_index
+            if (
+                gs.game_start_ts is not None
+                and not gs.halftime_started
+                and self._period_end_fired_for != index
+            ):
+                self._period_end = self.schedule(
+                    ScheduledEventKind.PERIOD_END,
+                    self._period_end_deadline(),
+                    period_index=index,
+                    final=index >= gs.period_count - 1,
+                )
+
+            if gs.halftime_started and gs.halftime_end_ts is not None:
+                if self._break_end is None or self._break_end.deadline != gs.halftime_end_ts:
+                    self._break_end = ScheduledEvent(
+                        gs.halftime_end_ts, next(self._seq), ScheduledEventKind.BREAK_END,
+                        {"period_index": index},
+                    )
+            else:
+                self._break_end = None
+            self._arm()
+
+    def game_clock(self, now: Optional[float] = None) -> float:
+        """
+        Current game-clock reading with sub-second precision.
+
+        Args:
+            now: Reference timestamp (defaults to the timer's clock)
+
+        Returns:
+            Elapsed game seconds as shown on the game clock
+        """
+        gs = self.timer_service.game_state
+        now = self.timer_service.now() if now is None else now
+        elapsed = self.timer_service.get_game_elapsed_seconds()
+        if self._clock_running():
+            running = now - gs.period_start_ts
+            return elapsed - int(running) + running
+        return float(elapsed)
+
+    # ---------- Firing ---------- #
+
+    def poll(self, now: Optional[float] = None) -> List[ScheduledEvent]:
+        """
+        Fire every event that is due.
+
+        Args:
+            now: Reference timestamp (defaults to the timer's clock)
+
+        Returns:
+            The fired events, in due order
+        """
+        with self._lock:
+            now = self.timer_service.now() if now is None else now
+            fired: List[ScheduledEvent] = []
+            if self._break_end is not None and now >= self._break_end.deadline:
+                fired.append(self._break_end)
+                self._break_end = None
+
+            game_now = self.timer_service.get_game_elapsed_seconds()
+            while self._heap and (self._heap[0].cancelled or self._heap[0].deadline <= game_now):
+                event = heapq.heappop(self._heap)
+                if event.cancelled:
+                    continue
+                if event is self._period_end:
+                    self._period_end = None
+                    self._period_end_fired_for = event.data["period_index"]
+                fired.append(event)
+
+            for event in fired:
+                for listener in self._listeners:
+                    listener(event)
+            self._arm(now)
+            return fired
+
+    def next_due_ts(self, now: Optional[float] = None) -> Optional[float]:
+        """
+        Wall-clock time at which the next event is due.
+
+        Args:
+            now: Reference timestamp (defaults to the timer's clock)
+
+        Returns:
+            Epoch timestamp, or None when nothing can become due (e.g. paused)
+        """
+        with self._lock:
+            while self._heap and self._heap[0].cancelled:
+                heapq.heappop(self._heap)
+            now = self.timer_service.now() if now is None else now
+            candidates = []
+            if self._break_end is not None:
+                candidates.append(self._break_end.deadline)
+            if self._heap and self._clock_running():
+                candidates.append(now + self._heap[0].deadline - self.game_clock(now))
+            return min(candidates) if candidates else None
+
+    # ---------- Background timer ---------- #
+
+    def start(self) -> None:
+        """Fire events from a background timer as they become due."""
+        with self._lock:
+            self._running = True
+            self._arm()
+
+    def stop(self) -> None:
+        """Disarm the background timer."""
+        with self._lock:
+            self._running = False
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+    def _arm(self, now: Optional[float] = None) -> None:
+        if not self._running:
+            return
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        now = self.timer_service.now() if now is None else now
+        due = self.next_due_ts(now)
+        if due is None:
+            return
+        self._timer = threading.Timer(max(MIN_TIMER_DELAY_SECONDS, due - now), self._on_timer)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _on_timer(self) -> None:
+        with self._lock:
+            if self._running:
+                self.poll()
+
+    # ---------- Internal helpers ---------- #
+
+    def _clock_running(self) -> bool:
+        gs = self.timer_service.game_state
+        return gs.period_start_ts is not None and not gs.paused
+
+    def _period_end_deadline(self) -> float:
+        """Game-clock reading at which the current period reaches its target."""
+        gs = self.timer_service.game_state
+        index = gs.current_period_index
+        config = self.timer_service.get_timer_configuration()
+        closed_before = sum(gs.period_elapsed[:index])
+        target = self.timer_service.get_period_target_seconds(index)
+        return (
+            closed_before
+            + target
+            + config["total_adjustment_seconds"]
+            + config["total_stoppage_seconds"]
+        )
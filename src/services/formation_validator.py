@@ -12,10 +12,15 @@ from dataclasses import dataclass
 from typing import Dict, List, Optional, Set, Tuple, Protocol
 from enum import Enum
 
-from ..models import Player
+from ..models import POSITION_TAXONOMY, Player
 from ..models.formation import Formation, FieldPosition, Position, FormationType
 
 
+def _has_jersey_number(number) -> bool:
+    """Whether a jersey number is set; rosters store numbers as strings."""
+    return str(number or "").strip() not in ("", "0")
+
+
 class ValidationResult:
     """Result of a validation operation with success status and error messages."""
     
@@ -151,16 +156,12 @@ class PlayerAssignmentValidator(ValidationRule):
         for pos in formation.positions:
             if pos.player_name and pos.player_name in self.roster:
                 player = self.roster[pos.player_name]
-                if player.preferred_positions:
-                    preferred_codes = [p.upper() for p in player.preferred_list()]
+                preferred_codes = player.preferred_list()
+                if preferred_codes:
                     pos_code = pos.position_code.value.upper()
                     
                     # Check if position matches any preferred position
-                    position_match = False
-                    for pref in preferred_codes:
-                        if pref == pos_code or self._positions_compatible(pref, pos_code):
-                            position_match = True
-                            break
+                    position_match = POSITION_TAXONOMY.any_compatible(preferred_codes, pos_code)
                     
                     if not position_match:
                         result.add_error(
@@ -169,35 +170,6 @@ class PlayerAssignmentValidator(ValidationRule):
                         )
         
         return result
-    
-    def _positions_compatible(self, preferred: str, assigned: str) -> bool:
-        """Check if preferred and assigned positions are compatible."""
-        # General position compatibility mapping
-        compatible_positions = {
-            "GK": ["GOALKEEPER"],
-            "GOALKEEPER": ["GK"],
-            "DEF": ["DEFENDER", "CB", "LB", "RB", "WB"],
-            "DEFENDER": ["DEF", "CB", "LB", "RB", "WB"],
-            "CB": ["DEFENDER", "DEF"],
-            "LB": ["DEFENDER", "DEF", "WB"],
-            "RB": ["DEFENDER", "DEF", "WB"],
-            "WB": ["LB", "RB", "DEFENDER", "DEF"],
-            "MID": ["MIDFIELDER", "CM", "CDM", "CAM", "LM", "RM"],
-            "MIDFIELDER": ["MID", "CM", "CDM", "CAM", "LM", "RM"],
-            "CM": ["MIDFIELDER", "MID", "CDM", "CAM"],
-            "CDM": ["MIDFIELDER", "MID", "CM"],
-            "CAM": ["MIDFIELDER", "MID", "CM"],
-            "LM": ["MIDFIELDER", "MID", "LW"],
-            "RM": ["MIDFIELDER", "MID", "RW"],
-            "FOR": ["FORWARD", "ST", "CF", "LW", "RW"],
-            "FORWARD": ["FOR", "ST", "CF", "LW", "RW"],
-            "ST": ["FORWARD", "FOR", "CF"],
-            "CF": ["FORWARD", "FOR", "ST"],
-            "LW": ["FOR", "FORWARD", "LM"],
-            "RW": ["FOR", "FORWARD", "RM"]
-        }
-        
-        return assigned in compatible_positions.get(preferred, [])
 
 
 class GameStateValidator(ValidationRule):
@@ -309,7 +281,7 @@ class FormationValidationService:
         
         # Check jersey number not already used
         for i, pos in enumerate(formation.positions):
-            if i != position_index and pos.player_number == player_number and player_number > 0:
+            if i != position_index and pos.player_number == player_number and _has_jersey_number(player_number):
                 result.add_error(f"Jersey number {player_number} is already assigned to position {i+1}")
         
         return result
@@ -4,17 +4,35 @@ Command pattern implementation for game actions.
 This module provides a command pattern implementation for undoable game actions,
 following Clean Code principles and supporting undo/redo functionality.
 """
+import copy
 from abc import ABC, abstractmethod
-from typing import List, Optional, Any, Dict
-from dataclasses import dataclass
-from datetime import datetime
+from typing import List, Optional, Any, Sequence
 
-from ..models import GameState, Player
-from ..utils import now_ts
+from ..models import CommandLog, CommandRecord, FieldChange, GameState
+from ..models.command_log import DEFAULT_MAX_HISTORY, GAME_TARGET, STINT_FIELD
+from ..models.formation import Formation
+from ..utils import Clock, VirtualClock, now_ts
 
 
 class Command(ABC):
-    """Abstract base class for all game commands - Command pattern."""
+    """
+    Abstract base class for all game commands - Command pattern.
+    
+    Commands change the game through :meth:`_set` and the stint helpers,
+    which record every touched field with its old and new value. Undo and
+    redo replay that record, so they cost O(changed fields) rather than a
+    copy of the roster.
+    """
+    
+    # Time source; None reads the wall clock via now_ts
+    clock: Optional[Clock] = None
+    game_state: GameState
+    # Changes made by the last execute(); None until the command ran
+    record: Optional[CommandRecord] = None
+    
+    def _now(self) -> float:
+        """Get the current timestamp from the command's clock."""
+        return self.clock.now() if self.clock is not None else now_ts()
     
     @abstractmethod
     def execute(self) -> bool:
@@ -26,61 +44,110 @@ class Command(ABC):
         """
         pass
     
-    @abstractmethod
     def undo(self) -> bool:
         """
-        Undo the command.
+        Undo the command by restoring the fields it changed.
         
         Returns:
             True if command undone successfully, False otherwise
         """
-        pass
+        if self.record is None:
+            return False
+        try:
+            self.record.revert(self.game_state)
+            return True
+        except KeyError:
+            return False
+    
+    def redo(self) -> bool:
+        """
+        Redo the command by re-applying the recorded changes.
+        
+        Returns:
+            True if command redone successfully, False otherwise
+        """
+        if self.record is None:
+            return False
+        try:
+            self.record.apply(self.game_state)
+            return True
+        except KeyError:
+            return False
     
     @property
     @abstractmethod
     def description(self) -> str:
         """Get human-readable description of the command."""
         pass
-
-
-@dataclass
-class GameSnapshot:
-    """Immutable snapshot of game state for undo functionality."""
-    timestamp: float
-    game_start_ts: Optional[float]
-    paused: bool
-    period_elapsed: List[int]
-    current_period_index: int
-    player_states: Dict[str, Dict[str, Any]]
-    
-    @classmethod
-    def from_game_state(cls, game_state: GameState) -> 'GameSnapshot':
-        """Create snapshot from current game state."""
-        player_states = {}
-        for name, player in game_state.roster.items():
-            player_states[name] = {
-                'on_field': player.on_field,
-                'position': player.position,
-                'total_seconds': player.total_seconds,
-                'stint_start_ts': player.stint_start_ts  # Fixed: was 'start_ts'
-            }
+    
+    # ---------- Change recording ---------- #
+    
+    def _begin(self, timestamp: float) -> None:
+        """Start a fresh record for this execution."""
+        self.record = CommandRecord(self.description, timestamp)
+    
+    def _rollback(self) -> None:
+        """Undo whatever a failed execution already changed."""
+        if self.record is not None:
+            self.record.revert(self.game_state)
+            self.record = None
+    
+    def _set(self, target: str, field_name: str, value: Any) -> None:
+        """
+        Set a field of the game (target ``GAME_TARGET``) or of a player and record it.
         
-        return cls(
-            timestamp=now_ts(),
-            game_start_ts=game_state.game_start_ts,
-            paused=game_state.paused,
-            period_elapsed=game_state.period_elapsed.copy(),
-            current_period_index=game_state.current_period_index,
-            player_states=player_states
+        Args:
+            target: ``GAME_TARGET`` or a player name
+            field_name: Attribute to set
+            value: New value; unchanged values are not recorded
+        """
+        obj = self.game_state if target == GAME_TARGET else self.game_state.roster[target]
+        old = getattr(obj, field_name)
+        if old == value:
+            return
+        self.record.changes.append(FieldChange(target, field_name, _recorded(old), _recorded(value)))
+        setattr(obj, field_name, value)
+    
+    def _start_stint(self, name: str, current_time: float, period_index: Optional[int]) -> None:
+        """Recorded equivalent of :meth:`Player.start_stint`."""
+        player = self.game_state.roster[name]
+        if player.on_field:
+            return
+        self._set(name, "on_field", True)
+        self._set(name, "stint_start_ts", current_time)
+        player.stint_ledger.open(current_time, period_index, player.position)
+        self.record.changes.append(
+            FieldChange(name, STINT_FIELD, None, list(player.stint_ledger.last_stint()))
         )
+    
+    def _end_stint(self, name: str, current_time: float) -> None:
+        """Recorded equivalent of :meth:`Player.end_stint`."""
+        player = self.game_state.roster[name]
+        if player.on_field and player.stint_start_ts is not None:
+            self._set(name, "total_seconds", player.total_seconds + int(current_time - player.stint_start_ts))
+        ledger = player.stint_ledger
+        if ledger.is_open:
+            before = list(ledger.last_stint())
+            ledger.close(current_time)
+            self.record.changes.append(FieldChange(name, STINT_FIELD, before, list(ledger.last_stint())))
+        self._set(name, "on_field", False)
+        self._set(name, "position", None)
+        self._set(name, "stint_start_ts", None)
+
+
+def _recorded(value: Any) -> Any:
+    """Plain-data copy of a field value for a change record."""
+    if isinstance(value, Formation):
+        return value.to_dict()
+    return copy.copy(value)
 
 
 class StartGameCommand(Command):
     """Command to start the game timer."""
     
-    def __init__(self, game_state: GameState):
+    def __init__(self, game_state: GameState, clock: Optional[Clock] = None):
         self.game_state = game_state
-        self._previous_state: Optional[GameSnapshot] = None
+        self.clock = clock
     
     def execute(self) -> bool:
         """Start the game timer."""
@@ -88,16 +155,18 @@ class StartGameCommand(Command):
             # Ensure timer lists are properly initialized before starting
             self.game_state.ensure_timer_lists()
             
-            self._previous_state = GameSnapshot.from_game_state(self.game_state)
+            current_time = self._now()
+            self._begin(current_time)
             
             if self.game_state.game_start_ts is None:
-                self.game_state.game_start_ts = now_ts()
-                self.game_state.current_period_index = 0
+                self._set(GAME_TARGET, "game_start_ts", current_time)
+                self._set(GAME_TARGET, "current_period_index", 0)
             
             if self.game_state.period_start_ts is None:
-                self.game_state.period_start_ts = now_ts()
+                self._set(GAME_TARGET, "period_start_ts", current_time)
             
-            self.game_state.paused = False
+            self._set(GAME_TARGET, "paused", False)
+            self.game_state.timeline.sync(self.game_state)
             return True
             
         except Exception as e:
@@ -105,21 +174,7 @@ class StartGameCommand(Command):
             print(f"ERROR in StartGameCommand.execute(): {e}")
             import traceback
             traceback.print_exc()
-            return False
-    
-    def undo(self) -> bool:
-        """Undo game start."""
-        if self._previous_state is None:
-            return False
-        
-        try:
-            self.game_state.game_start_ts = self._previous_state.game_start_ts
-            self.game_state.paused = self._previous_state.paused
-            self.game_state.period_elapsed = self._previous_state.period_elapsed.copy()
-            self.game_state.current_period_index = self._previous_state.current_period_index
-            return True
-            
-        except Exception:
+            self._rollback()
             return False
     
     @property
@@ -130,40 +185,29 @@ class StartGameCommand(Command):
 class PauseGameCommand(Command):
     """Command to pause the game timer."""
     
-    def __init__(self, game_state: GameState):
+    def __init__(self, game_state: GameState, clock: Optional[Clock] = None):
         self.game_state = game_state
-        self._previous_state: Optional[GameSnapshot] = None
+        self.clock = clock
     
     def execute(self) -> bool:
         """Pause the game timer."""
         try:
-            self._previous_state = GameSnapshot.from_game_state(self.game_state)
+            current_time = self._now()
+            self._begin(current_time)
             
             if self.game_state.period_start_ts is not None:
                 idx = self.game_state.current_period_index
-                elapsed = int(now_ts() - self.game_state.period_start_ts)
-                self.game_state.period_elapsed[idx] += elapsed
-                self.game_state.period_start_ts = None
+                period_elapsed = list(self.game_state.period_elapsed)
+                period_elapsed[idx] += int(current_time - self.game_state.period_start_ts)
+                self._set(GAME_TARGET, "period_elapsed", period_elapsed)
+                self._set(GAME_TARGET, "period_start_ts", None)
             
-            self.game_state.paused = True
-            return True
-            
-        except Exception:
-            return False
-    
-    def undo(self) -> bool:
-        """Undo game pause."""
-        if self._previous_state is None:
-            return False
-        
-        try:
-            self.game_state.paused = self._previous_state.paused
-            self.game_state.period_elapsed = self._previous_state.period_elapsed.copy()
-            if not self._previous_state.paused:
-                self.game_state.period_start_ts = now_ts()
+            self._set(GAME_TARGET, "paused", True)
+            self.game_state.timeline.sync(self.game_state)
             return True
             
         except Exception:
+            self._rollback()
             return False
     
     @property
@@ -174,14 +218,16 @@ class PauseGameCommand(Command):
 class SubstitutePlayerCommand(Command):
     """Command to substitute players."""
     
-    def __init__(self, game_state: GameState, player_out: str, player_in: str):
+    def __init__(
+        self, game_state: GameState, player_out: str, player_in: str, clock: Optional[Clock] = None
+    ):
         self.game_state = game_state
+        self.clock = clock
         self.player_out_name = player_out
         self.player_in_name = player_in
-        self._previous_state: Optional[GameSnapshot] = None
     
     def execute(self) -> bool:
-        """Execute player substitution."""
+        """Execute player substitution; the incoming player takes the vacated position."""
         try:
             if (self.player_out_name not in self.game_state.roster or
                 self.player_in_name not in self.game_state.roster):
@@ -193,78 +239,175 @@ class SubstitutePlayerCommand(Command):
             if not player_out.on_field or player_in.on_field:
                 return False  # Invalid substitution
             
-            self._previous_state = GameSnapshot.from_game_state(self.game_state)
+            current_time = self._now()
+            self._begin(current_time)
             
-            # Record time for outgoing player
-            current_time = now_ts()
-            if player_out.start_ts is not None:
-                player_out.total_seconds += int(current_time - player_out.start_ts)
-            
-            # Perform substitution
             position = player_out.position
-            player_out.on_field = False
-            player_out.position = ""
-            player_out.start_ts = None
-            
-            player_in.on_field = True
-            player_in.position = position
-            player_in.start_ts = current_time
-            
+            self._end_stint(self.player_out_name, current_time)
+            self._set(self.player_in_name, "position", position)
+            self._start_stint(self.player_in_name, current_time, self.game_state.current_period_index)
             return True
             
         except Exception:
+            self._rollback()
             return False
     
-    def undo(self) -> bool:
-        """Undo player substitution."""
-        if self._previous_state is None:
-            return False
-        
+    @property
+    def description(self) -> str:
+        return f"Substitute {self.player_out_name} → {self.player_in_name}"
+
+
+class AddStoppageCommand(Command):
+    """Command to add stoppage time to a period."""
+    
+    def __init__(
+        self, game_state: GameState, seconds: int, period_index: Optional[int] = None,
+        clock: Optional[Clock] = None
+    ):
+        self.game_state = game_state
+        self.clock = clock
+        self.seconds = int(seconds)
+        self.period_index = period_index
+    
+    def execute(self) -> bool:
+        """Add the stoppage, clamped like ``TimerService.add_stoppage_time``."""
         try:
-            # Restore player states
-            player_out = self.game_state.roster[self.player_out_name]
-            player_in = self.game_state.roster[self.player_in_name]
-            
-            out_state = self._previous_state.player_states[self.player_out_name]
-            in_state = self._previous_state.player_states[self.player_in_name]
-            
-            player_out.on_field = out_state['on_field']
-            player_out.position = out_state['position']
-            player_out.total_seconds = out_state['total_seconds']
-            player_out.start_ts = out_state['start_ts']
+            self.game_state.ensure_timer_lists()
+            self._begin(self._now())
+            idx = self.game_state.current_period_index if self.period_index is None else self.period_index
+            idx = max(0, min(idx, self.game_state.period_count - 1))
             
-            player_in.on_field = in_state['on_field']
-            player_in.position = in_state['position']
-            player_in.total_seconds = in_state['total_seconds']
-            player_in.start_ts = in_state['start_ts']
+            period_stoppage = list(self.game_state.period_stoppage)
+            period_stoppage[idx] = max(0, period_stoppage[idx] + self.seconds)
+            self._set(GAME_TARGET, "period_stoppage", period_stoppage)
+            return True
             
+        except Exception:
+            self._rollback()
+            return False
+    
+    @property
+    def description(self) -> str:
+        return f"Add {self.seconds}s Stoppage"
+
+
+class FormationChangeCommand(Command):
+    """Command to switch the active formation; on-field players take their slots' positions."""
+    
+    def __init__(self, game_state: GameState, formation: Formation, clock: Optional[Clock] = None):
+        self.game_state = game_state
+        self.clock = clock
+        self.formation = formation
+    
+    def execute(self) -> bool:
+        """Make the formation current and move assigned field players to their slots."""
+        try:
+            self._begin(self._now())
+            self._set(GAME_TARGET, "current_formation", self.formation)
+            roster = self.game_state.roster
+            for slot in self.formation.positions:
+                player = roster.get(slot.player_name) if slot.player_name else None
+                if player is not None and player.on_field:
+                    self._set(player.name, "position", slot.position_code.value)
             return True
             
         except Exception:
+            self._rollback()
             return False
     
     @property
     def description(self) -> str:
-        return f"Substitute {self.player_out_name} → {self.player_in_name}"
+        return f"Formation {self.formation.name}"
+
+
+class MacroCommand(Command):
+    """
+    Several commands applied as one: all at the same timestamp, all or none,
+    and undone with a single undo entry.
+    
+    Commands run in order against the state left by the previous ones, so a
+    batch may, for example, bring a player on and move them again. If one
+    fails, those already applied are rolled back.
+    """
+    
+    def __init__(
+        self, game_state: GameState, commands: Sequence[Command], clock: Optional[Clock] = None,
+        description: Optional[str] = None
+    ):
+        self.game_state = game_state
+        self.clock = clock
+        self.commands = list(commands)
+        self._description = description
+        # Index of the command that made the last execution fail
+        self.failed_index: Optional[int] = None
+    
+    def execute(self) -> bool:
+        """Execute every command at one shared timestamp, or none of them."""
+        current_time = self._now()
+        shared_clock = VirtualClock(current_time)
+        self.failed_index = None
+        applied: List[Command] = []
+        for idx, command in enumerate(self.commands):
+            command.clock = shared_clock
+            if not command.execute():
+                for done in reversed(applied):
+                    done.undo()
+                self.failed_index = idx
+                self.record = None
+                return False
+            applied.append(command)
+        
+        self._begin(current_time)
+        for command in applied:
+            self.record.changes.extend(command.record.changes)
+        return True
+    
+    @property
+    def failed_command(self) -> Optional[Command]:
+        """The command that made the last execution fail, if any."""
+        return None if self.failed_index is None else self.commands[self.failed_index]
+    
+    @property
+    def description(self) -> str:
+        if self._description:
+            return self._description
+        return "Batch: " + "; ".join(command.description for command in self.commands)
 
 
 class GameCommandManager:
     """
     Manager for executing and tracking game commands with undo/redo support.
     
-    Follows Command pattern and provides clean interface for game actions.
+    History lives in the bound game's :class:`CommandLog` as change records,
+    so it is bounded in O(1) per command and is saved and reloaded with the
+    game. Undo and redo replay the records rather than the commands.
     """
     
-    def __init__(self, max_history: int = 50):
+    def __init__(self, max_history: int = DEFAULT_MAX_HISTORY, game_state: Optional[GameState] = None):
         """
         Initialize command manager.
         
         Args:
             max_history: Maximum number of commands to keep in history
+            game_state: Game whose history is managed (defaults to the game
+                of the first executed command)
         """
         self.max_history = max_history
-        self._command_history: List[Command] = []
-        self._current_index = -1
+        self.game_state: Optional[GameState] = None
+        self._log = CommandLog(max_history)
+        if game_state is not None:
+            self.bind(game_state)
+    
+    def bind(self, game_state: GameState) -> None:
+        """
+        Manage the history of another game (e.g. after a load).
+        
+        Args:
+            game_state: Game whose command log is used from now on
+        """
+        self.game_state = game_state
+        self._log = game_state.command_log
+        self._log.resize(self.max_history)
     
     def execute_command(self, command: Command) -> bool:
         """
@@ -278,18 +421,10 @@ class GameCommandManager:
         """
         success = command.execute()
         
-        if success:
-            # Remove any commands after current index (for redo functionality)
-            self._command_history = self._command_history[:self._current_index + 1]
-            
-            # Add new command
-            self._command_history.append(command)
-            self._current_index += 1
-            
-            # Trim history if too long
-            if len(self._command_history) > self.max_history:
-                self._command_history.pop(0)
-                self._current_index -= 1
+        if success and command.record is not None:
+            if self.game_state is not command.game_state:
+                self.bind(command.game_state)
+            self._log.push(command.record)
         
         return success
     
@@ -303,13 +438,14 @@ class GameCommandManager:
         if not self.can_undo():
             return False
         
-        command = self._command_history[self._current_index]
-        success = command.undo()
-        
-        if success:
-            self._current_index -= 1
-        
-        return success
+        try:
+            self._log.undo_stack[-1].revert(self.game_state)
+        except KeyError:
+            # A player it touched was removed from the roster
+            self._log.discard_undo()
+            return False
+        self._log.pop_undo()
+        return True
     
     def redo(self) -> bool:
         """
@@ -321,27 +457,29 @@ class GameCommandManager:
         if not self.can_redo():
             return False
         
-        command = self._command_history[self._current_index + 1]
-        success = command.execute()
-        
-        if success:
-            self._current_index += 1
-        
-        return success
+        try:
+            self._log.redo_stack[-1].apply(self.game_state)
+        except KeyError:
+            self._log.discard_redo()
+            return False
+        self._log.pop_redo()
+        return True
     
     def can_undo(self) -> bool:
         """Check if undo is available."""
-        return self._current_index >= 0
+        return self.game_state is not None and bool(self._log.undo_stack)
     
     def can_redo(self) -> bool:
         """Check if redo is available."""
-        return self._current_index < len(self._command_history) - 1
+        return self.game_state is not None and bool(self._log.redo_stack)
     
     def get_command_history(self) -> List[str]:
-        """Get history of command descriptions."""
-        return [cmd.description for cmd in self._command_history]
+        """Get history of command descriptions, oldest first, including redoable ones."""
+        return (
+            [record.description for record in self._log.undo_stack]
+            + [record.description for record in reversed(self._log.redo_stack)]
+        )
     
     def clear_history(self) -> None:
         """Clear command history."""
-        self._command_history.clear()
-        self._current_index = -1
\ No newline at end of file
+        self._log.clear()
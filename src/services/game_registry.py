@@ -0,0 +1,370 @@
+"""
+Game registry for the Soccer Coach Sideline Timekeeper application.
+
+This module tracks many concurrent games in one process. Each game is keyed by
+a game id and owns its own session object and lock, so requests for different
+fields never share state. Games that sit idle are written to disk and dropped
+from memory, then transparently reloaded on their next access. With a shared
+state store, games live in the store instead and any worker process can load
+them.
+"""
+import os
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Generic, List, Optional, TypeVar
+
+from ..models import GameState
+from ..utils import now_ts
+from .persistence_service import PersistenceService
+from .state_store import GameStateStore
+
+DEFAULT_GAME_ID = "default"
+DEFAULT_IDLE_TIMEOUT_SECONDS = 30 * 60
+DEFAULT_SWEEP_INTERVAL_SECONDS = 60
+
+_GAME_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
+SessionT = TypeVar("SessionT")
+
+
+class GameNotFoundError(KeyError):
+    """Raised when a game id is unknown and creation was not requested."""
+    pass
+
+
+def is_valid_game_id(game_id: str) -> bool:
+    """
+    Check whether a game id is safe to use as a registry key and file name.
+
+    Args:
+        game_id: Candidate game identifier
+
+    Returns:
+        True if the id only uses letters, digits, dashes and underscores
+    """
+    return bool(game_id) and bool(_GAME_ID_PATTERN.match(game_id))
+
+
+@dataclass
+class GameEntry(Generic[SessionT]):
+    """A resident game: its session object, lock and access bookkeeping."""
+    game_id: str
+    session: SessionT
+    lock: threading.RLock = field(default_factory=threading.RLock)
+    created_ts: float = field(default_factory=now_ts)
+    last_access_ts: float = field(default_factory=now_ts)
+
+    def touch(self) -> None:
+        """Record that the game was just used."""
+        self.last_access_ts = now_ts()
+
+
+class GameRegistry(Generic[SessionT]):
+    """
+    Registry of live games keyed by game id.
+
+    Sessions are created through an injected factory so the registry stays
+    independent of the UI layer. A session only needs to expose a
+    ``game_state`` attribute holding the :class:`GameState` to persist; an
+    optional ``close()`` method is called when the game leaves memory, an
+    optional ``now()`` method gives the game clock time evicted games are
+    saved at, and an optional ``lock`` attribute is used as the game lock.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[str, Optional[GameState]], SessionT],
+        storage_dir: Optional[str] = None,
+        idle_timeout_seconds: float = DEFAULT_IDLE_TIMEOUT_SECONDS,
+        sweep_interval_seconds: float = DEFAULT_SWEEP_INTERVAL_SECONDS,
+        state_loader: Optional[Callable[[str], Optional[GameState]]] = None,
+        store: Optional[GameStateStore] = None,
+    ):
+        """
+        Initialize the registry.
+
+        Args:
+            session_factory: Callable building a session from a game id and an
+                optional previously persisted game state
+            storage_dir: Directory where evicted games are stored; eviction is
+                disabled when omitted
+            idle_timeout_seconds: Idle time after which a stopped game is evicted
+            sweep_interval_seconds: Minimum time between opportunistic sweeps
+            state_loader: Callable restoring a stored game by id; defaults to
+                the shared store, or to reading the evicted JSON file
+            store: Shared state store holding every game; evicting a game
+                then only drops it from memory
+        """
+        self._session_factory = session_factory
+        self.storage_dir = storage_dir
+        self.idle_timeout_seconds = idle_timeout_seconds
+        self.sweep_interval_seconds = sweep_interval_seconds
+        self.store = store if store is not None and store.shared else None
+        self._state_loader = state_loader or (self.store.load if self.store else self._load_from_disk)
+        self._entries: Dict[str, GameEntry[SessionT]] = {}
+        # Games detached from memory whose eviction is still saving them
+        self._evicting: Dict[str, GameEntry[SessionT]] = {}
+        self._lock = threading.Lock()
+        self._last_sweep_ts = now_ts()
+
+    # ---------- Lookup ---------- #
+
+    def get(self, game_id: str = DEFAULT_GAME_ID, create: bool = True) -> GameEntry[SessionT]:
+        """
+        Return the entry for a game, loading or creating it when needed.
+
+        Args:
+            game_id: Game identifier
+            create: Whether to create a fresh game when none exists
+
+        Returns:
+            The resident game entry
+
+        Raises:
+            ValueError: If the game id is malformed
+            GameNotFoundError: If the game does not exist and create is False
+        """
+        if not is_valid_game_id(game_id):
+            raise ValueError(f"Invalid game id: {game_id!r}")
+
+        self._maybe_sweep()
+
+        while True:
+            with self._lock:
+                entry = self._entries.get(game_id)
+                evicting = self._evicting.get(game_id) if entry is None else None
+                if evicting is None:
+                    if entry is None:
+                        stored_state = self._state_loader(game_id)
+                        if stored_state is None and not create:
+                            raise GameNotFoundError(game_id)
+                        session = self._session_factory(game_id, stored_state)
+                        # Sessions doing background work bring the lock they share with requests
+                        lock = getattr(session, "lock", None) or threading.RLock()
+                        entry = GameEntry(game_id, session, lock=lock)
+                        self._entries[game_id] = entry
+                    entry.touch()
+                    return entry
+            # The game is being written out; load it again once that is done
+            with evicting.lock:
+                pass
+
+    def exists(self, game_id: str) -> bool:
+        """Check whether a game is resident or stored on disk."""
+        if not is_valid_game_id(game_id):
+            return False
+        with self._lock:
+            if game_id in self._entries or game_id in self._evicting:
+                return True
+        if self.store is not None and self.store.version(game_id) is not None:
+            return True
+        return bool(self._stored_files(game_id))
+
+    def list_games(self) -> List[Dict[str, object]]:
+        """
+        List resident and evicted games.
+
+        Returns:
+            List of dictionaries with game id, residency and activity data
+        """
+        with self._lock:
+            games = {
+                game_id: {
+                    "game_id": game_id,
+                    "resident": True,
+                    "last_access_ts": entry.last_access_ts,
+                    "active": entry.session.game_state.is_active(),
+                }
+                for game_id, entry in self._entries.items()
+            }
+
+        if self.storage_dir and os.path.isdir(self.storage_dir):
+            for filename in os.listdir(self.storage_dir):
+                # Every "<game_id>.*" file (saved game, journal, snapshot) belongs to the game
+                game_id = filename.split(".", 1)[0]
+                if "." not in filename or not is_valid_game_id(game_id):
+                    continue
+                mtime = os.path.getmtime(os.path.join(self.storage_dir, filename))
+                stored = games.get(game_id)
+                if stored is None:
+                    games[game_id] = {
+                        "game_id": game_id,
+                        "resident": False,
+                        "last_access_ts": mtime,
+                        "active": False,
+                    }
+                elif not stored["resident"]:
+                    stored["last_access_ts"] = max(stored["last_access_ts"], mtime)
+
+        if self.store is not None:
+            for stored_game in self.store.list_games():
+                if stored_game["game_id"] not in games:
+                    games[stored_game["game_id"]] = {
+                        "game_id": stored_game["game_id"],
+                        "resident": False,
+                        "last_access_ts": stored_game["updated_ts"],
+                        "active": stored_game["active"],
+                    }
+
+        return sorted(games.values(), key=lambda item: item["game_id"])
+
+    def remove(self, game_id: str) -> bool:
+        """
+        Remove a game from memory and from disk.
+
+        Args:
+            game_id: Game identifier
+
+        Returns:
+            True if anything was removed
+        """
+        if not is_valid_game_id(game_id):
+            return False
+
+        with self._lock:
+            entry = self._entries.pop(game_id, None)
+            evicting = self._evicting.get(game_id)
+        if entry is not None:
+            # Requests already working on the game finish before it is closed
+            with entry.lock:
+                self._close_session(entry.session)
+        elif evicting is not None:
+            # Let the eviction finish writing the game so its file goes too
+            with evicting.lock:
+                pass
+
+        stored_files = self._stored_files(game_id)
+        for path in stored_files:
+            os.remove(path)
+        in_store = self.store is not None and self.store.delete(game_id)
+        return entry is not None or bool(stored_files) or in_store
+
+    # ---------- Eviction ---------- #
+
+    def evict(self, game_id: str) -> bool:
+        """
+        Persist a resident game to disk and drop it from memory.
+
+        The game is skipped if another thread currently holds its lock.
+
+        Args:
+            game_id: Game identifier
+
+        Returns:
+            True if the game was evicted
+        """
+        return self._evict(game_id)
+
+    def evict_idle(self, now: Optional[float] = None) -> List[str]:
+        """
+        Evict every stopped game that has been idle past the timeout.
+
+        Running games stay resident because their clock is still live.
+
+        Args:
+            now: Reference timestamp (defaults to the current time)
+
+        Returns:
+            Ids of the games that were evicted
+        """
+        if not self.storage_dir and self.store is None:
+            return []
+
+        now = now if now is not None else now_ts()
+        with self._lock:
+            candidates = [
+                game_id
+                for game_id, entry in self._entries.items()
+                if now - entry.last_access_ts >= self.idle_timeout_seconds
+                and self._is_stopped(entry.session.game_state)
+            ]
+
+        idle_before = now - self.idle_timeout_seconds
+        return [
+            game_id for game_id in candidates
+            if self._evict(game_id, idle_before=idle_before)
+        ]
+
+    def game_path(self, game_id: str) -> Optional[str]:
+        """Return the on-disk location of a game, or None without storage."""
+        if not self.storage_dir:
+            return None
+        return os.path.join(self.storage_dir, f"{game_id}.json")
+
+    # ---------- Internal helpers ---------- #
+
+    def _maybe_sweep(self) -> None:
+        now = now_ts()
+        if now - self._last_sweep_ts < self.sweep_interval_seconds:
+            return
+        self._last_sweep_ts = now
+        self.evict_idle(now)
+
+    def _evict(self, game_id: str, idle_before: Optional[float] = None) -> bool:
+        if not self.storage_dir and self.store is None:
+            return False
+
+        with self._lock:
+            entry = self._entries.get(game_id)
+            if entry is None:
+                return False
+            # A request may have touched the game since the idle scan
+            if idle_before is not None and entry.last_access_ts > idle_before:
+                return False
+            if not entry.lock.acquire(blocking=False):
+                return False
+            # Detach the game, then write it out without holding up other games
+            del self._entries[game_id]
+            self._evicting[game_id] = entry
+
+        saved = False
+        try:
+            # The shared store already holds every saved change
+            if self.store is None:
+                PersistenceService.save_game_to_file(
+                    entry.session.game_state,
+                    self.game_path(game_id),
+                    current_time=self._session_time(entry.session),
+                )
+            saved = True
+            self._close_session(entry.session)
+        finally:
+            with self._lock:
+                del self._evicting[game_id]
+                if not saved:
+                    # Keep the game resident rather than lose unsaved changes
+                    self._entries[game_id] = entry
+            entry.lock.release()
+        return True
+
+    def _stored_files(self, game_id: str) -> List[str]:
+        if not self.storage_dir or not os.path.isdir(self.storage_dir):
+            return []
+        prefix = f"{game_id}."
+        return [
+            os.path.join(self.storage_dir, filename)
+            for filename in os.listdir(self.storage_dir)
+            if filename.startswith(prefix)
+        ]
+
+    def _load_from_disk(self, game_id: str) -> Optional[GameState]:
+        path = self.game_path(game_id)
+        if path is None or not os.path.exists(path):
+            return None
+        return PersistenceService.load_game_from_file(path)
+
+    @staticmethod
+    def _session_time(session: SessionT) -> Optional[float]:
+        now = getattr(session, "now", None)
+        return now() if callable(now) else None
+
+    @staticmethod
+    def _close_session(session: SessionT) -> None:
+        close = getattr(session, "close", None)
+        if callable(close):
+            close()
+
+    @staticmethod
+    def _is_stopped(game_state: GameState) -> bool:
+        return game_state.paused or game_state.game_start_ts is None
@@ -0,0 +1,273 @@
+"""
+Fast-forward game simulator for the Soccer Coach Sideline Timekeeper.
+
+Drives the timer and analytics services through synthetic matches on a
+virtual clock, so a full league day runs in seconds. Every service call is
+timed on the real clock and summarized as latency percentiles, making
+regressions in the hot paths show up as numbers.
+"""
+import random
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, TypeVar
+
+from ..models import GameState, Player
+from ..utils import HALFTIME_PAUSE_MIN, VirtualClock
+from .analytics_service import AnalyticsService
+from .timer_service import TimerService
+
+T = TypeVar("T")
+
+# Virtual start of the first simulated game (2024-01-01 00:00 UTC)
+SIMULATION_EPOCH_TS = 1_704_067_200.0
+
+
+@dataclass
+class SimulationConfig:
+    """
+    Shape of the simulated workload.
+
+    Attributes:
+        games: Number of games to play back to back
+        roster_size: Players per squad
+        field_size: Players on the field at once
+        game_length_minutes: Regulation game length
+        period_count: Number of regulation periods
+        tick_seconds: Simulated seconds between display refreshes
+        substitution_interval_seconds: Simulated seconds between substitution windows
+        subs_per_window: Players swapped in each window
+        report_interval_seconds: Simulated seconds between analytics reports
+        max_stoppage_seconds: Upper bound of random stoppage per period
+        seed: Random seed, so runs are reproducible
+        track_memory: Whether to trace peak memory (slows the run down)
+    """
+    games: int = 100
+    roster_size: int = 14
+    field_size: int = 11
+    game_length_minutes: int = 60
+    period_count: int = 2
+    tick_seconds: int = 1
+    substitution_interval_seconds: int = 300
+    subs_per_window: int = 3
+    report_interval_seconds: int = 60
+    max_stoppage_seconds: int = 120
+    seed: int = 0
+    track_memory: bool = True
+
+
+@dataclass
+class LatencyStats:
+    """Latency summary of one service operation, in seconds."""
+    count: int
+    mean: float
+    p50: float
+    p95: float
+    p99: float
+    max: float
+
+
+class LatencyRecorder:
+    """Collects per-operation call durations measured on the real clock."""
+
+    def __init__(self):
+        self._samples: Dict[str, List[float]] = {}
+
+    def measure(self, operation: str, func: Callable[..., T], *args, **kwargs) -> T:
+        """
+        Call a function and record how long it took.
+
+        Args:
+            operation: Name the sample is filed under
+            func: Callable to time
+
+        Returns:
+            Whatever the callable returned
+        """
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        self._samples.setdefault(operation, []).append(time.perf_counter() - start)
+        return result
+
+    def summary(self) -> Dict[str, LatencyStats]:
+        """Summarize every operation, ordered by name."""
+        return {name: summarize_latencies(samples) for name, samples in sorted(self._samples.items())}
+
+
+def summarize_latencies(samples: List[float]) -> LatencyStats:
+    """
+    Summarize durations with nearest-rank percentiles.
+
+    Args:
+        samples: Durations in seconds (at least one)
+
+    Returns:
+        The latency summary
+    """
+    ordered = sorted(samples)
+    last = len(ordered) - 1
+
+    def rank(percent: float) -> float:
+        return ordered[min(last, int(percent / 100 * len(ordered)))]
+
+    return LatencyStats(
+        count=len(ordered),
+        mean=sum(ordered) / len(ordered),
+        p50=rank(50),
+        p95=rank(95),
+        p99=rank(99),
+        max=ordered[-1],
+    )
+
+
+@dataclass
+class SimulationReport:
+    """Outcome of a simulation run."""
+    config: SimulationConfig
+    games: int
+    simulated_seconds: int
+    wall_seconds: float
+    operations: Dict[str, LatencyStats] = field(default_factory=dict)
+    peak_memory_bytes: Optional[int] = None
+
+    def format_table(self) -> str:
+        """Render the latency table as plain text."""
+        lines = [
+            f"games={self.games} roster={self.config.roster_size} field={self.config.field_size} "
+            f"simulated={self.simulated_seconds / 3600:.1f}h wall={self.wall_seconds:.2f}s",
+            f"{'operation':<22}{'calls':>9}{'mean us':>10}{'p50 us':>10}"
+            f"{'p95 us':>10}{'p99 us':>10}{'max us':>10}",
+        ]
+        for name, stats in self.operations.items():
+            lines.append(
+                f"{name:<22}{stats.count:>9}{stats.mean * 1e6:>10.1f}{stats.p50 * 1e6:>10.1f}"
+                f"{stats.p95 * 1e6:>10.1f}{stats.p99 * 1e6:>10.1f}{stats.max * 1e6:>10.1f}"
+            )
+        if self.peak_memory_bytes is not None:
+            lines.append(f"peak memory: {self.peak_memory_bytes / 1024:.1f} KiB")
+        return "\n".join(lines)
+
+
+class GameSimulator:
+    """
+    Plays synthetic games through the timer and analytics services.
+
+    Each game starts with the first ``field_size`` players on the field, then
+    runs every period tick by tick: display refreshes poll the timer,
+    substitution windows swap the most-played field players for the
+    least-played bench players, random stoppage is added, and reports are
+    generated at a fixed cadence and at full time.
+    """
+
+    def __init__(self, config: Optional[SimulationConfig] = None):
+        self.config = config or SimulationConfig()
+        if self.config.field_size > self.config.roster_size:
+            raise ValueError("Field size cannot exceed roster size")
+        self.recorder = LatencyRecorder()
+        self._random = random.Random(self.config.seed)
+
+    def run(self) -> SimulationReport:
+        """
+        Play every configured game.
+
+        Returns:
+            Latency percentiles per operation and, if traced, peak memory
+        """
+        config = self.config
+        if config.track_memory:
+            tracemalloc.start()
+        started = time.perf_counter()
+        simulated = 0
+        try:
+            for game_index in range(config.games):
+                clock = VirtualClock(SIMULATION_EPOCH_TS + game_index * 86_400)
+                self.play_game(clock)
+                simulated += int(clock.now() - SIMULATION_EPOCH_TS - game_index * 86_400)
+            peak = tracemalloc.get_traced_memory()[1] if config.track_memory else None
+        finally:
+            if config.track_memory:
+                tracemalloc.stop()
+
+        return SimulationReport(
+            config=config,
+            games=config.games,
+            simulated_seconds=simulated,
+            wall_seconds=time.perf_counter() - started,
+            operations=self.recorder.summary(),
+            peak_memory_bytes=peak,
+        )
+
+    def play_game(self, clock: VirtualClock) -> GameState:
+        """
+        Play one full game on the given clock.
+
+        Args:
+            clock: Virtual clock positioned at kick-off
+
+        Returns:
+            The final game state
+        """
+        config = self.config
+        measure = self.recorder.measure
+        state = self._build_state()
+        timer = TimerService(state, clock=clock)
+        analytics = AnalyticsService(state, timer, clock=clock)
+        timer.configure_game(
+            game_length_minutes=config.game_length_minutes, period_count=config.period_count
+        )
+
+        for slot, player in enumerate(list(state.roster.values())[: config.field_size]):
+            player.position = f"P{slot + 1}"
+            player.start_stint(clock.now(), period_index=0)
+        measure("start_game", timer.start_game)
+
+        period_lengths = timer.get_timer_configuration()["period_lengths"]
+        for period_index, period_seconds in enumerate(period_lengths):
+            if period_index:
+                measure("start_halftime", timer.start_halftime)
+                clock.advance(int(HALFTIME_PAUSE_MIN * 60))
+                measure("end_halftime", timer.end_halftime)
+
+            stoppage = self._random.randint(0, config.max_stoppage_seconds)
+            stoppage_at = self._random.randrange(0, period_seconds, config.tick_seconds)
+            for second in range(0, period_seconds + stoppage, config.tick_seconds):
+                if second == stoppage_at and stoppage:
+                    measure("add_stoppage_time", timer.add_stoppage_time, stoppage)
+                if second and second % config.substitution_interval_seconds == 0:
+                    measure("substitution", self._substitute, state, period_index, clock.now())
+                if second and second % config.report_interval_seconds == 0:
+                    measure("game_report", analytics.generate_game_report)
+                clock.advance(config.tick_seconds)
+                measure("elapsed_seconds", timer.get_game_elapsed_seconds)
+                measure("remaining_seconds", timer.get_remaining_seconds)
+
+        measure("pause_game", timer.pause_game)
+        end_ts = clock.now()
+        for player in state.roster.values():
+            if player.on_field:
+                player.end_stint(end_ts)
+        measure("final_report", analytics.generate_game_report)
+        measure("columnar_report", analytics.generate_columnar_report)
+        measure("stint_report", analytics.generate_stint_report)
+        return state
+
+    def _build_state(self) -> GameState:
+        roster = {
+            f"Player {idx:02d}": Player(name=f"Player {idx:02d}", number=str(idx + 1))
+            for idx in range(self.config.roster_size)
+        }
+        state = GameState(roster=roster, field_size=self.config.field_size)
+        state.ensure_timer_lists()
+        return state
+
+    def _substitute(self, state: GameState, period_index: int, now: float) -> None:
+        def played(player: Player) -> float:
+            return player.total_seconds + player.current_stint_seconds(now) + self._random.random()
+
+        on_field = sorted((p for p in state.roster.values() if p.on_field), key=played, reverse=True)
+        bench = sorted((p for p in state.roster.values() if not p.on_field), key=played)
+        for player_out, player_in in zip(on_field, bench[: self.config.subs_per_window]):
+            position = player_out.position
+            player_out.end_stint(now)
+            player_in.position = position
+            player_in.start_stint(now, period_index)
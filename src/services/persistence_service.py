@@ -1,14 +1,29 @@
 """
 Persistence service for the Soccer Coach Sideline Timekeeper application.
 
-This module handles saving and loading game state to/from JSON files.
+This module handles saving and loading game state to/from JSON files, and
+the background autosave engine that keeps a bounded ring of crash-safe saves.
 """
 import json
 import os
-from typing import Optional
+import tempfile
+import threading
+import time
+from contextlib import nullcontext
+from typing import Any, Callable, ContextManager, Dict, List, Optional
 
 from ..models import GameState
-from ..utils import now_ts
+from ..utils import Clock, now_ts
+from .compact_format import COMPACT_EXTENSION, decode_compact, encode_compact, is_compact
+
+DEFAULT_AUTOSAVE_DIR = "autosave"
+DEFAULT_AUTOSAVE_INTERVAL_SECONDS = 30.0
+DEFAULT_AUTOSAVE_GENERATIONS = 5
+AUTOSAVE_PREFIX = "game_autosave"
+SAVE_INDEX_FILENAME = "save_index.json"
+
+# Serializes read-modify-write cycles of save index files
+_index_lock = threading.Lock()
 
 
 class PersistenceService:
@@ -17,39 +32,56 @@ class PersistenceService:
     
     This service handles the complexities of saving live game state,
     including capturing current stint data without ending active stints.
+    Every file is written to a temporary sibling, fsynced and renamed into
+    place, so a crash mid-save never leaves a truncated game behind.
     """
 
     @staticmethod
-    def save_game_to_file(game_state: GameState, file_path: str) -> None:
+    def save_game_to_file(
+        game_state: GameState,
+        file_path: str,
+        compact: Optional[bool] = None,
+        current_time: Optional[float] = None,
+    ) -> None:
         """
-        Save game state to a JSON file.
+        Save game state to a JSON or compact binary file.
         
         Args:
             game_state: The game state to save
             file_path: Path where to save the file
+            compact: Whether to use the compact binary format; by default it
+                is used for paths ending in ``.sltk``
+            current_time: Game clock time the running stints are counted up
+                to (defaults to the current time)
             
         Raises:
             IOError: If file cannot be written
             OSError: If path is invalid
         """
+        if compact is None:
+            compact = file_path.endswith(COMPACT_EXTENSION)
+
         # Create snapshot that captures current live totals without ending stints
-        snapshot = PersistenceService._create_snapshot_for_save(game_state)
-        
-        # Ensure directory exists
-        directory = os.path.dirname(file_path)
-        if directory and not os.path.exists(directory):
-            os.makedirs(directory)
-            
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(snapshot, f, indent=2)
+        snapshot = PersistenceService._create_snapshot_for_save(game_state, current_time)
+        if compact:
+            PersistenceService._write_bytes_atomically(file_path, encode_compact(snapshot))
+        else:
+            PersistenceService._write_json_atomically(file_path, snapshot, indent=2)
+
+        # Keep an existing save index in the target directory accurate
+        directory = os.path.dirname(file_path) or "."
+        if os.path.exists(os.path.join(directory, SAVE_INDEX_FILENAME)):
+            PersistenceService._record_in_index(directory, os.path.basename(file_path))
 
     @staticmethod
     def load_game_from_file(file_path: str) -> GameState:
         """
-        Load game state from a JSON file.
+        Load game state from a JSON or compact binary file.
+        
+        The format is detected from the file contents, not its name.
         
         Args:
-            file_path: Path to the JSON file to load
+            file_path: Path to the file to load
             
         Returns:
             GameState instance loaded from file
@@ -57,18 +89,76 @@ class PersistenceService:
         Raises:
             FileNotFoundError: If file doesn't exist
             json.JSONDecodeError: If file contains invalid JSON
-            ValueError: If JSON structure is invalid
+            ValueError: If the file structure is invalid
         """
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"Game file not found: {file_path}")
             
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        return GameState.from_json(PersistenceService.read_document(file_path))
+
+    @staticmethod
+    def read_document(file_path: str) -> Any:
+        """
+        Read a JSON or compact binary document, detecting the format.
+        
+        Args:
+            file_path: Path to the file to read
             
+        Returns:
+            The decoded document
+        """
+        with open(file_path, "rb") as f:
+            blob = f.read()
+        if is_compact(blob):
+            return decode_compact(blob)
+        return json.loads(blob.decode("utf-8"))
+
+    @staticmethod
+    def serialize_game_state(game_state: GameState, current_time: Optional[float] = None) -> dict:
+        """
+        Serialize game state in a single pass, folding live stints into totals.
+        
+        Each player is converted exactly once; on-field players get the
+        seconds of their running stint added to ``total_seconds`` and their
+        stint start moved forward by the same amount, so the stint keeps
+        running after a load without being counted twice.
+        
+        Args:
+            game_state: Game state to serialize (left unmodified)
+            current_time: Reference timestamp (defaults to the current time)
+            
+        Returns:
+            Dictionary suitable for JSON serialization
+        """
+        current_time = now_ts() if current_time is None else current_time
+        result = game_state.to_json(include_players=False)
+        players = result["players"]
+        
+        for name, player in game_state.roster.items():
+            data = player.to_dict()
+            stint_seconds = player.current_stint_seconds(current_time)
+            if stint_seconds:
+                data["total_seconds"] = player.total_seconds + stint_seconds
+                data["stint_start_ts"] = player.stint_start_ts + stint_seconds
+            players[name] = data
+            
+        return result
+
+    @staticmethod
+    def deserialize_game_state(data: dict) -> GameState:
+        """
+        Create a game state from data produced by :meth:`serialize_game_state`.
+        
+        Args:
+            data: Serialized game state
+            
+        Returns:
+            New GameState instance
+        """
         return GameState.from_json(data)
 
     @staticmethod
-    def _create_snapshot_for_save(game_state: GameState) -> dict:
+    def _create_snapshot_for_save(game_state: GameState, current_time: Optional[float] = None) -> dict:
         """
         Create a snapshot of game state suitable for saving.
         
@@ -77,42 +167,39 @@ class PersistenceService:
         
         Args:
             game_state: Current game state
+            current_time: Reference timestamp (defaults to the current time)
             
         Returns:
             Dictionary suitable for JSON serialization
         """
-        # Create a copy to avoid modifying the original
-        temp = GameState.from_json(game_state.to_json())
-        current_time = now_ts()
-        
-        # Add current stint seconds to total without ending stints
-        for player in temp.roster.values():
-            if player.on_field and player.stint_start_ts is not None:
-                player.total_seconds += player.current_stint_seconds(current_time)
-                # Keep stint_start_ts for live tracking after load
-                
-        return temp.to_json()
+        return PersistenceService.serialize_game_state(game_state, current_time)
 
     @staticmethod
-    def auto_save(game_state: GameState, auto_save_dir: str = "autosave") -> Optional[str]:
+    def auto_save(
+        game_state: GameState,
+        auto_save_dir: str = DEFAULT_AUTOSAVE_DIR,
+        generations: int = DEFAULT_AUTOSAVE_GENERATIONS,
+        current_time: Optional[float] = None,
+    ) -> Optional[str]:
         """
-        Automatically save game state with timestamp.
+        Automatically save game state into the next autosave generation.
+        
+        Autosaves rotate through a fixed ring of files, overwriting the
+        oldest generation, and are recorded in the directory's save index.
         
         Args:
             game_state: Game state to save
             auto_save_dir: Directory for auto-save files
+            generations: Number of autosave files kept in the ring
+            current_time: Game clock time the running stints are counted up
+                to (defaults to the current time)
             
         Returns:
             Path to saved file, or None if save failed
         """
         try:
-            import datetime
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"game_autosave_{timestamp}.json"
-            file_path = os.path.join(auto_save_dir, filename)
-            
-            PersistenceService.save_game_to_file(game_state, file_path)
-            return file_path
+            snapshot = PersistenceService._create_snapshot_for_save(game_state, current_time)
+            return PersistenceService._write_generation(snapshot, auto_save_dir, generations)
         except Exception:
             # Auto-save should not crash the application
             return None
@@ -122,6 +209,9 @@ class PersistenceService:
         """
         Get list of recent save files.
         
+        Directories with a save index are answered from the index alone;
+        others fall back to scanning the directory.
+        
         Args:
             save_dir: Directory to search for save files
             limit: Maximum number of files to return
@@ -129,13 +219,17 @@ class PersistenceService:
         Returns:
             List of tuples (filename, modification_time) sorted by newest first
         """
+        index = PersistenceService._read_index(save_dir)
+        if index is not None:
+            return [(entry["filename"], entry["saved_ts"]) for entry in index["saves"][:limit]]
+
         if not os.path.exists(save_dir):
             return []
             
         try:
             json_files = []
             for filename in os.listdir(save_dir):
-                if filename.endswith('.json'):
+                if filename.endswith(('.json', COMPACT_EXTENSION)) and filename != SAVE_INDEX_FILENAME:
                     file_path = os.path.join(save_dir, filename)
                     if os.path.isfile(file_path):
                         mtime = os.path.getmtime(file_path)
@@ -145,4 +239,226 @@ class PersistenceService:
             json_files.sort(key=lambda x: x[1], reverse=True)
             return json_files[:limit]
         except OSError:
-            return []
\ No newline at end of file
+            return []
+
+    # ---------- Atomic writes and save index ---------- #
+
+    @staticmethod
+    def _write_json_atomically(file_path: str, data: Any, indent: Optional[int] = None) -> None:
+        """Write JSON atomically (see :meth:`_write_bytes_atomically`)."""
+        PersistenceService._write_bytes_atomically(
+            file_path, json.dumps(data, indent=indent).encode("utf-8")
+        )
+
+    @staticmethod
+    def _write_bytes_atomically(file_path: str, data: bytes) -> None:
+        """Write bytes to a temporary sibling, fsync them and rename over the target."""
+        directory = os.path.dirname(file_path) or "."
+        os.makedirs(directory, exist_ok=True)
+
+        fd, temp_path = tempfile.mkstemp(
+            dir=directory, prefix=f".{os.path.basename(file_path)}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, file_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        # Persist the rename itself; not every platform can fsync a directory
+        try:
+            dir_fd = os.open(directory, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(dir_fd)
+        except OSError:
+            pass
+        finally:
+            os.close(dir_fd)
+
+    @staticmethod
+    def _read_index(save_dir: str) -> Optional[Dict[str, Any]]:
+        index_path = os.path.join(save_dir, SAVE_INDEX_FILENAME)
+        if not os.path.exists(index_path):
+            return None
+        try:
+            with open(index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return None
+        index.setdefault("next_generation", 0)
+        index.setdefault("saves", [])
+        return index
+
+    @staticmethod
+    def _record_in_index(
+        save_dir: str, filename: str, next_generation: Optional[int] = None
+    ) -> None:
+        """Move a file to the front of the save index (newest first)."""
+        with _index_lock:
+            index = PersistenceService._read_index(save_dir) or {"next_generation": 0, "saves": []}
+            saves: List[Dict[str, Any]] = [
+                entry for entry in index["saves"] if entry["filename"] != filename
+            ]
+            saves.insert(0, {"filename": filename, "saved_ts": now_ts()})
+            index["saves"] = saves
+            if next_generation is not None:
+                index["next_generation"] = next_generation
+            PersistenceService._write_json_atomically(
+                os.path.join(save_dir, SAVE_INDEX_FILENAME), index
+            )
+
+    @staticmethod
+    def _write_generation(snapshot: dict, save_dir: str, generations: int) -> str:
+        """Write a snapshot over the oldest slot of the autosave ring."""
+        generations = max(1, generations)
+        index = PersistenceService._read_index(save_dir)
+        generation = index["next_generation"] if index else 0
+
+        filename = f"{AUTOSAVE_PREFIX}_{generation % generations}.json"
+        file_path = os.path.join(save_dir, filename)
+        PersistenceService._write_json_atomically(file_path, snapshot, indent=2)
+        PersistenceService._record_in_index(save_dir, filename, next_generation=generation + 1)
+        return file_path
+
+
+class AutosaveEngine:
+    """
+    Background autosave that coalesces bursts of changes.
+
+    Callers signal changes with :meth:`request_save`; a worker thread writes
+    at most one autosave generation per interval, however many requests
+    arrived in between.
+    """
+
+    def __init__(
+        self,
+        state_provider: Callable[[], GameState],
+        save_dir: str = DEFAULT_AUTOSAVE_DIR,
+        interval_seconds: float = DEFAULT_AUTOSAVE_INTERVAL_SECONDS,
+        generations: int = DEFAULT_AUTOSAVE_GENERATIONS,
+        state_lock: Optional[ContextManager] = None,
+        clock: Optional[Clock] = None,
+    ):
+        """
+        Initialize the autosave engine.
+
+        Args:
+            state_provider: Callable returning the game state to save (the
+                state object may be replaced, e.g. by loading a game)
+            save_dir: Directory holding the autosave ring and index
+            interval_seconds: Minimum time between two writes
+            generations: Number of autosave files kept in the ring
+            state_lock: Optional lock held while the snapshot is taken
+            clock: Game clock the running stints are counted up to; defaults
+                to the wall clock via ``now_ts``
+        """
+        self._state_provider = state_provider
+        self.save_dir = save_dir
+        self.interval_seconds = interval_seconds
+        self.generations = generations
+        self._state_lock = state_lock
+        self.clock = clock
+        self._condition = threading.Condition()
+        self._save_lock = threading.Lock()
+        self._dirty = False
+        self._stopping = False
+        self._last_save_monotonic: Optional[float] = None
+        self._thread: Optional[threading.Thread] = None
+        self.save_count = 0
+        self.last_saved_path: Optional[str] = None
+        self.last_error: Optional[Exception] = None
+
+    def start(self) -> None:
+        """Start the background writer thread."""
+        with self._condition:
+            if self._thread is not None:
+                return
+            self._stopping = False
+            self._thread = threading.Thread(
+                target=self._run, name="autosave", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self, flush: bool = True) -> None:
+        """
+        Stop the writer thread.
+
+        Args:
+            flush: Whether to write pending changes before returning
+        """
+        with self._condition:
+            thread, self._thread = self._thread, None
+            self._stopping = True
+            self._condition.notify_all()
+        if thread is not None:
+            thread.join()
+        if flush:
+            self.flush()
+
+    def request_save(self) -> None:
+        """Mark the game as changed; the worker saves it when the interval allows."""
+        with self._condition:
+            self._dirty = True
+            self._condition.notify_all()
+
+    def flush(self) -> Optional[str]:
+        """
+        Write pending changes immediately, ignoring the interval.
+
+        Returns:
+            Path of the written file, or None if nothing was pending or the save failed
+        """
+        return self._save()
+
+    # ---------- Internal helpers ---------- #
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._dirty or self._stopping)
+                if self._stopping:
+                    return
+                if self._last_save_monotonic is not None:
+                    delay = self._last_save_monotonic + self.interval_seconds - time.monotonic()
+                    if delay > 0:
+                        # Let the burst accumulate; stop() flushes on its own
+                        if self._condition.wait_for(lambda: self._stopping, delay):
+                            return
+            self._save()
+
+    def _save(self) -> Optional[str]:
+        with self._save_lock:
+            with self._condition:
+                if not self._dirty:
+                    return None
+                self._dirty = False
+
+            try:
+                with self._state_lock or nullcontext():
+                    current_time = self.clock.now() if self.clock is not None else None
+                    snapshot = PersistenceService._create_snapshot_for_save(
+                        self._state_provider(), current_time
+                    )
+                path = PersistenceService._write_generation(
+                    snapshot, self.save_dir, self.generations
+                )
+            except Exception as e:
+                # Autosave must not crash the application; retry on the next cycle
+                self.last_error = e
+                with self._condition:
+                    self._dirty = True
+                return None
+            finally:
+                self._last_save_monotonic = time.monotonic()
+
+            self.save_count += 1
+            self.last_saved_path = path
+            self.last_error = None
+            return path
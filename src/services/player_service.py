@@ -15,6 +15,8 @@ from src.models.player import (
     Player, ContactInfo, MedicalInfo, PlayerStats, 
     GameAttendance, SkillLevel, DisciplinaryAction
 )
+from src.models.positions import POSITION_TAXONOMY
+from src.services.compact_format import COMPACT_EXTENSION, decode_compact, encode_compact, is_compact
 from src.services.persistence_service import PersistenceService
 
 
@@ -490,12 +492,13 @@ class PlayerService:
             List of (position, score) tuples sorted by recommendation score (higher is better)
         """
         recommendations = []
+        canonical_preferred = {POSITION_TAXONOMY.canonical(code) or code for code in player.preferred_list()}
         
         for position in available_positions:
             score = 0
             
-            # Preference bonus (highest priority)
-            if position in player.preferred_list():
+            # Preference bonus (highest priority); DF and DEF name the same position
+            if (POSITION_TAXONOMY.canonical(position) or position) in canonical_preferred:
                 score += 50
             
             # Skill rating bonus
@@ -504,11 +507,12 @@ class PlayerService:
             
             # Experience bonus (based on statistics)
             if player.statistics.games_played > 0:
-                if position == "GK" and player.statistics.saves > 0:
+                family = POSITION_TAXONOMY.family_of(position)
+                if family == "GK" and player.statistics.saves > 0:
                     score += 20
-                elif position in ["ST", "CF", "LW", "RW"] and player.statistics.goals > 0:
+                elif family == "FOR" and player.statistics.goals > 0:
                     score += 15
-                elif position in ["MF", "AM", "CM"] and player.statistics.assists > 0:
+                elif family == "MID" and player.statistics.assists > 0:
                     score += 15
             
             recommendations.append((position, score))
@@ -593,13 +597,15 @@ class PlayerService:
         # Basic email validation
         return "@" in email and "." in email.split("@")[-1] and len(email) >= 5
     
-    def export_player_data(self, players: List[Player], filename: str) -> None:
+    def export_player_data(self, players: List[Player], filename: str, compact: Optional[bool] = None) -> None:
         """
-        Export player data to JSON file.
+        Export player data to JSON or compact binary file.
         
         Args:
             players: List of Player instances to export
             filename: Output filename
+            compact: Whether to use the compact binary format; by default it
+                is used for filenames ending in ``.sltk``
         """
         data = {
             "exported_at": datetime.now().isoformat(),
@@ -607,12 +613,19 @@ class PlayerService:
             "players": [player.to_dict() for player in players]
         }
         
+        if compact is None:
+            compact = filename.endswith(COMPACT_EXTENSION)
+        if compact:
+            with open(filename, 'wb') as f:
+                f.write(encode_compact(data))
+            return
+        
         with open(filename, 'w', encoding='utf-8') as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
     
     def import_player_data(self, filename: str) -> List[Player]:
         """
-        Import player data from JSON file.
+        Import player data from JSON or compact binary file.
         
         Args:
             filename: Input filename
@@ -628,8 +641,9 @@ class PlayerService:
         if not os.path.exists(filename):
             raise FileNotFoundError(f"Import file not found: {filename}")
         
-        with open(filename, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(filename, 'rb') as f:
+            blob = f.read()
+        data = decode_compact(blob) if is_compact(blob) else json.loads(blob.decode('utf-8'))
         
         if "players" not in data:
             raise ValueError("Invalid import file format: missing 'players' field")
@@ -0,0 +1,272 @@
+"""
+Background rotation re-planning for the Soccer Coach Sideline Timekeeper.
+
+Rotation planning is CPU-bound, so it runs in a process pool instead of a
+request thread. Requests are debounced per game: a burst of substitutions
+produces one re-plan, launched once the game has been quiet for a moment.
+A newer request supersedes older ones; superseded jobs are cancelled if
+they have not started and their results are dropped if they have.
+
+Worker processes are started with the ``forkserver`` method (``spawn``
+where it is missing): the pool lives inside a multithreaded web server,
+and forking such a process copies locks other threads may be holding.
+"""
+import concurrent.futures
+import itertools
+import multiprocessing
+import threading
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..models import GameState
+from ..utils import VirtualClock, now_ts
+from .rotation_planner import RotationConfig, RotationPlanner
+from .timer_service import TimerService
+
+DEFAULT_DEBOUNCE_SECONDS = 0.5
+DEFAULT_MAX_WORKERS = 2
+# Start methods that never fork the (multithreaded) server process itself
+SAFE_START_METHODS = ("forkserver", "spawn")
+
+
+class ReplanStatus(Enum):
+    """Lifecycle of a re-plan job."""
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    SUPERSEDED = "superseded"
+
+
+@dataclass
+class ReplanJob:
+    """A re-plan request and, once finished, its outcome."""
+    job_id: int
+    key: str
+    name: str
+    requested_at: float = field(default_factory=now_ts)
+    status: ReplanStatus = ReplanStatus.PENDING
+    finished_at: Optional[float] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "job_id": self.job_id,
+            "name": self.name,
+            "status": self.status.value,
+            "requested_at": self.requested_at,
+            "finished_at": self.finished_at,
+            "result": self.result,
+            "error": self.error,
+        }
+
+
+def plan_rotation_snapshot(
+    state_data: Dict[str, Any],
+    name: str,
+    config: Optional[RotationConfig],
+    player_names: Optional[List[str]],
+    now: float,
+) -> Dict[str, Any]:
+    """
+    Plan a rotation from a serialized game (runs inside a worker process).
+
+    Args:
+        state_data: Game state as produced by ``GameState.to_json()``
+        name: Name of the generated plan
+        config: Planner constraints
+        player_names: Available players (defaults to the whole roster)
+        now: Timestamp the snapshot was taken at
+
+    Returns:
+        ``RotationPlan.to_dict()`` of the plan
+    """
+    game_state = GameState.from_json(state_data)
+    # Pin the worker's clock to the snapshot so planning time does not count as play
+    clock = VirtualClock(now)
+    timer_service = TimerService(game_state, clock=clock)
+    planner = RotationPlanner(game_state, timer_service, config, clock=clock)
+    return planner.plan(name, player_names).to_dict()
+
+
+class ReplanWorkerPool:
+    """
+    Debounced, cancellable re-plan jobs on a process pool.
+
+    Call :meth:`start` while the server starts up so the pool exists before
+    requests arrive; otherwise it is created on the first launch. Jobs are
+    keyed by game. :meth:`submit` never blocks: it records the
+    request and (re)arms the game's debounce timer. Finished jobs are kept
+    as the game's latest result and handed to the job's callback from a
+    pool thread; callbacks must take their own locks.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        debounce_seconds: float = DEFAULT_DEBOUNCE_SECONDS,
+        use_processes: bool = True,
+    ):
+        """
+        Args:
+            max_workers: Concurrent planning jobs across all games
+            debounce_seconds: Quiet time before a game's request is launched
+            use_processes: Whether to plan in worker processes (threads
+                otherwise, e.g. where processes cannot be spawned)
+        """
+        self.max_workers = max_workers
+        self.debounce_seconds = debounce_seconds
+        self.use_processes = use_processes
+        self._executor: Optional[concurrent.futures.Executor] = None
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._pending: Dict[str, Tuple[ReplanJob, threading.Timer, tuple, Optional[Callable]]] = {}
+        self._running: Dict[str, Tuple[ReplanJob, concurrent.futures.Future]] = {}
+        self._latest: Dict[str, ReplanJob] = {}
+
+    def submit(
+        self,
+        key: str,
+        state_data: Dict[str, Any],
+        name: str,
+        config: Optional[RotationConfig] = None,
+        player_names: Optional[List[str]] = None,
+        *,
+        now: float,
+        callback: Optional[Callable[[ReplanJob], None]] = None,
+    ) -> ReplanJob:
+        """
+        Request a re-plan for a game, superseding its earlier requests.
+
+        Args:
+            key: Game the request belongs to
+            state_data: Snapshot from ``GameState.to_json()``
+            name: Name of the generated plan
+            config: Planner constraints
+            player_names: Available players (defaults to the whole roster)
+            now: Game clock time the snapshot was taken at (e.g. the game's
+                ``TimerService.now()``); running stints are counted up to it
+            callback: Called with the job once it is done or failed
+
+        Returns:
+            The pending job
+        """
+        args = (state_data, name, config, player_names, now)
+        with self._lock:
+            job = ReplanJob(next(self._ids), key, name)
+            previous = self._pending.pop(key, None)
+            if previous is not None:
+                previous[0].status = ReplanStatus.SUPERSEDED
+                previous[1].cancel()
+            timer = threading.Timer(self.debounce_seconds, self._launch, args=(key, job.job_id))
+            timer.daemon = True
+            self._pending[key] = (job, timer, args, callback)
+            timer.start()
+            return job
+
+    def start(self) -> None:
+        """Create the worker pool now instead of on the first launch."""
+        with self._lock:
+            self._get_executor()
+
+    def latest(self, key: str) -> Optional[ReplanJob]:
+        """Newest job of a game: pending, running or finished."""
+        with self._lock:
+            if key in self._pending:
+                return self._pending[key][0]
+            if key in self._running:
+                return self._running[key][0]
+            return self._latest.get(key)
+
+    def cancel(self, key: str) -> None:
+        """Drop a game's pending and running jobs (e.g. the game was closed)."""
+        with self._lock:
+            pending = self._pending.pop(key, None)
+            if pending is not None:
+                pending[0].status = ReplanStatus.SUPERSEDED
+                pending[1].cancel()
+            running = self._running.pop(key, None)
+            if running is not None:
+                running[0].status = ReplanStatus.SUPERSEDED
+                running[1].cancel()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Cancel pending jobs and stop the workers."""
+        with self._lock:
+            for key in list(self._pending):
+                job, timer, _, _ = self._pending.pop(key)
+                job.status = ReplanStatus.SUPERSEDED
+                timer.cancel()
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    # ---------- Internal helpers ---------- #
+
+    def _launch(self, key: str, job_id: int) -> None:
+        with self._lock:
+            pending = self._pending.get(key)
+            if pending is None or pending[0].job_id != job_id:
+                return
+            job, _, args, callback = self._pending.pop(key)
+            superseded = self._running.pop(key, None)
+            if superseded is not None:
+                superseded[0].status = ReplanStatus.SUPERSEDED
+                superseded[1].cancel()
+            job.status = ReplanStatus.RUNNING
+            future = self._get_executor().submit(plan_rotation_snapshot, *args)
+            self._running[key] = (job, future)
+        future.add_done_callback(lambda done: self._finish(key, job, done, callback))
+
+    def _finish(
+        self,
+        key: str,
+        job: ReplanJob,
+        future: concurrent.futures.Future,
+        callback: Optional[Callable[[ReplanJob], None]],
+    ) -> None:
+        with self._lock:
+            if self._running.get(key, (None,))[0] is job:
+                del self._running[key]
+            if job.status is ReplanStatus.SUPERSEDED or future.cancelled():
+                job.status = ReplanStatus.SUPERSEDED
+                return
+            try:
+                job.result = future.result()
+                job.status = ReplanStatus.DONE
+            except Exception as e:
+                job.error = str(e)
+                job.status = ReplanStatus.FAILED
+            job.finished_at = now_ts()
+            self._latest[key] = job
+        if callback is not None:
+            callback(job)
+
+    def _get_executor(self) -> concurrent.futures.Executor:
+        """Pool to plan on, created on first use; the caller holds the lock."""
+        if self._executor is None:
+            if self.use_processes:
+                try:
+                    self._executor = concurrent.futures.ProcessPoolExecutor(
+                        self.max_workers, mp_context=_process_context()
+                    )
+                except (OSError, NotImplementedError):
+                    # No process support here (e.g. missing semaphores); plan in threads
+                    self.use_processes = False
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    self.max_workers, thread_name_prefix="replan"
+                )
+        return self._executor
+
+
+def _process_context() -> multiprocessing.context.BaseContext:
+    """Multiprocessing context whose workers are not forked from this process."""
+    available = multiprocessing.get_all_start_methods()
+    for method in SAFE_START_METHODS:
+        if method in available:
+            return multiprocessing.get_context(method)
+    raise NotImplementedError("no start method that avoids forking is available")
@@ -0,0 +1,169 @@
+"""
+Encoded response cache for the Soccer Coach Sideline Timekeeper web API.
+
+Every tablet on the sideline polls the same few endpoints, and between two
+state versions they all get the same answer. The cache keeps that answer as
+encoded JSON bytes, keyed by game, endpoint, request variant and state
+version, so a poll that finds it only copies bytes. Values that move with
+the running clock are encoded separately per request (they are a handful of
+numbers) and spliced in with :func:`join_objects`.
+
+One cache is shared by every game the server hosts and evicts the least
+recently used responses once it holds ``max_entries`` responses or
+``max_bytes`` bytes. Old versions are never served again, so they simply age
+out. ``orjson`` is used for encoding when it is installed.
+"""
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+try:  # orjson is optional; the standard library encoder is the fallback
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    _orjson = None
+
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+CacheKey = Tuple[Hashable, str, Hashable, int]
+
+
+def encode_json(payload: Any) -> bytes:
+    """
+    Encode a payload as compact UTF-8 JSON.
+
+    Args:
+        payload: JSON-serializable value
+
+    Returns:
+        The encoded bytes
+    """
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(payload, option=_orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # Values orjson refuses (e.g. integers past 64 bits) take the slow path
+            pass
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def join_objects(*encoded: bytes) -> bytes:
+    """
+    Merge encoded JSON objects into one without decoding them.
+
+    The objects must not share keys.
+
+    Args:
+        *encoded: Encoded JSON objects
+
+    Returns:
+        One encoded object holding the members of all of them
+    """
+    members = [body.strip()[1:-1].strip() for body in encoded]
+    return b"{" + b",".join(member for member in members if member) + b"}"
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU cache of encoded JSON responses.
+
+    A miss builds and encodes the payload outside the cache lock, so a slow
+    build for one game never holds up hits for another. Two threads missing
+    the same key both build it; the bytes are identical either way.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Args:
+            max_entries: Most responses kept across all games
+            max_bytes: Most encoded bytes kept across all games
+        """
+        if max_entries < 1 or max_bytes < 1:
+            raise ValueError("max_entries and max_bytes must be positive")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[CacheKey, bytes]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(
+        self,
+        game: Hashable,
+        endpoint: str,
+        version: int,
+        build: Callable[[], Any],
+        variant: Hashable = None,
+    ) -> bytes:
+        """
+        Get an encoded response, building it on a miss.
+
+        Args:
+            game: Identity of the game instance the response describes
+            endpoint: Endpoint (or section of one) being cached
+            version: State version the response reflects
+            build: Returns the payload to encode on a miss
+            variant: Anything else the payload depends on (query arguments,
+                the running clock's second)
+
+        Returns:
+            The encoded payload
+        """
+        key = (game, endpoint, variant, version)
+        with self._lock:
+            body = self._entries.get(key)
+            if body is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return body
+            self.misses += 1
+
+        body = encode_json(build())
+        with self._lock:
+            if key not in self._entries and len(body) <= self.max_bytes:
+                self._entries[key] = body
+                self._size += len(body)
+                self._evict()
+        return body
+
+    def invalidate(self, game: Hashable) -> int:
+        """
+        Drop every response of one game.
+
+        Returns:
+            Number of responses dropped
+        """
+        with self._lock:
+            keys = [key for key in self._entries if key[0] == game]
+            for key in keys:
+                self._size -= len(self._entries.pop(key))
+            return len(keys)
+
+    def clear(self) -> None:
+        """Drop every response."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Entry count, encoded size and hit/miss counters."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    # ---------- Internal helpers ---------- #
+
+    def _evict(self) -> None:
+        """Drop least recently used responses until within bounds; the caller holds the lock."""
+        while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+            _, body = self._entries.popitem(last=False)
+            self._size -= len(body)
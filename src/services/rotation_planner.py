@@ -0,0 +1,417 @@
+"""
+Equal-playing-time rotation planner for the Soccer Coach Sideline Timekeeper.
+
+Splits the rest of the game into segments at a limited number of
+substitution windows (period breaks first), picks a lineup for every
+segment and turns the lineup changes into a :class:`SubstitutionPlan`.
+A greedy pass gives each segment to the players with the fewest projected
+minutes; a local search then swaps players between field and bench within
+a time budget to minimize the variance of everyone's minutes.
+"""
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+from ..models import POSITION_TAXONOMY, GameState
+from ..models.formation import SubstitutionPlan
+from ..utils import Clock
+from .assignment_service import AssignmentService, solve_assignment
+from .timer_service import TimerService
+
+# Windows closer than this to a break or the end of the game are dropped
+MIN_WINDOW_GAP_SECONDS = 60
+
+
+@dataclass
+class RotationConfig:
+    """
+    Constraints and search settings of the planner.
+
+    Attributes:
+        max_windows: Most substitution windows in the rest of the game
+            (period breaks count as windows)
+        goalkeeper_changes_at_breaks_only: Whether the keeper may only
+            change at period breaks
+        change_penalty: Objective cost of one substitution, in squared
+            minutes, so ties between equal-variance plans favour fewer changes
+        time_budget_seconds: Wall-clock budget of the local search
+        max_iterations: Upper bound on local-search moves
+        seed: Random seed of the local search
+    """
+    max_windows: int = 6
+    goalkeeper_changes_at_breaks_only: bool = True
+    change_penalty: float = 0.05
+    time_budget_seconds: float = 0.05
+    max_iterations: int = 50_000
+    seed: int = 0
+
+
+@dataclass
+class _Lineup:
+    """Players on the field during one segment."""
+    goalkeeper: Optional[str]
+    outfield: FrozenSet[str]
+
+    @property
+    def players(self) -> FrozenSet[str]:
+        return self.outfield | {self.goalkeeper} if self.goalkeeper else self.outfield
+
+
+@dataclass
+class RotationPlan:
+    """Planner output: the substitution plan and the minutes it leads to."""
+    plan: SubstitutionPlan
+    starters: List[str]
+    windows: List[int]
+    projected_seconds: Dict[str, int] = field(default_factory=dict)
+    iterations: int = 0
+
+    @property
+    def minutes_spread(self) -> float:
+        """Gap between the most and least projected minutes."""
+        if not self.projected_seconds:
+            return 0.0
+        values = self.projected_seconds.values()
+        return (max(values) - min(values)) / 60
+
+    def to_dict(self) -> Dict:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "plan": self.plan.to_dict(),
+            "starters": list(self.starters),
+            "windows": list(self.windows),
+            "projected_minutes": {
+                name: round(seconds / 60, 1) for name, seconds in self.projected_seconds.items()
+            },
+            "minutes_spread": round(self.minutes_spread, 1),
+            "iterations": self.iterations,
+        }
+
+
+class RotationPlanner:
+    """
+    Plans substitutions for near-equal minutes across the squad.
+
+    The period structure comes from the timer service and minutes played
+    so far from each player's totals and running stint, so calling
+    :meth:`plan` mid-game re-plans the rest of the game from the actual
+    stint data. The current lineup stays on until the first window.
+    """
+
+    def __init__(
+        self,
+        game_state: GameState,
+        timer_service: TimerService,
+        config: Optional[RotationConfig] = None,
+        clock: Optional[Clock] = None,
+    ):
+        """
+        Args:
+            game_state: Game whose roster is rotated
+            timer_service: Timer providing period structure and game time
+            config: Planner constraints (defaults to :class:`RotationConfig`)
+            clock: Time source; defaults to the timer's clock
+        """
+        self.game_state = game_state
+        self.timer_service = timer_service
+        self.config = config or RotationConfig()
+        self.clock = clock
+
+    def _now(self) -> float:
+        return self.clock.now() if self.clock is not None else self.timer_service.now()
+
+    def plan(
+        self,
+        name: str = "Rotation Plan",
+        player_names: Optional[Sequence[str]] = None,
+        now: Optional[float] = None,
+    ) -> RotationPlan:
+        """
+        Plan the rest of the game.
+
+        Args:
+            name: Name of the generated substitution plan
+            player_names: Available players (defaults to the whole roster)
+            now: Reference timestamp (defaults to the planner's clock)
+
+        Returns:
+            The plan with starters, window minutes and projected minutes
+
+        Raises:
+            ValueError: If a named player is not in the roster
+        """
+        roster = self.game_state.roster
+        names = list(roster) if player_names is None else list(dict.fromkeys(player_names))
+        unknown = [player for player in names if player not in roster]
+        if unknown:
+            raise ValueError(f"Players not found in roster: {', '.join(unknown)}")
+
+        now = self._now() if now is None else now
+        start = 0
+        if self.game_state.game_start_ts is not None:
+            start = int(self.timer_service.game_seconds_at(now))
+        end = self.game_state.game_length_seconds
+        breaks = self._break_seconds()
+        windows = self._window_seconds(start, end, breaks)
+        bounds = [start] + windows + [end]
+        lengths = [max(0, bounds[idx + 1] - bounds[idx]) for idx in range(len(bounds) - 1)]
+
+        base = {
+            player: roster[player].total_seconds + roster[player].current_stint_seconds(now)
+            for player in names
+        }
+        keepers = self._goalkeepers(names)
+        gk_free = [True] + [
+            (not self.config.goalkeeper_changes_at_breaks_only) or window in breaks
+            for window in windows
+        ]
+        current = self._current_lineup(names)
+        field_size = min(self.game_state.field_size, len(names))
+
+        search = _RotationSearch(names, base, lengths, keepers, gk_free, field_size, current, self.config)
+        lineups, iterations = search.run()
+
+        substitutions = self._substitutions(lineups, windows, now)
+        plan = SubstitutionPlan(name=name, substitutions=substitutions, formation_changes=[])
+        plan.notes = (
+            f"Equal-time rotation: {len(windows)} windows, "
+            f"planned from minute {start // 60}"
+        )
+        projected = search.projected(lineups)
+        return RotationPlan(
+            plan=plan,
+            starters=sorted(lineups[0].players) if lineups else [],
+            windows=[window // 60 for window in windows],
+            projected_seconds={player: int(seconds) for player, seconds in projected.items()},
+            iterations=iterations,
+        )
+
+    # ---------- Internal helpers ---------- #
+
+    def _break_seconds(self) -> List[int]:
+        lengths = self.timer_service.get_timer_configuration()["period_lengths"]
+        breaks, total = [], 0
+        for length in lengths[:-1]:
+            total += length
+            breaks.append(int(round(total / 60)) * 60)
+        return breaks
+
+    def _window_seconds(self, start: int, end: int, breaks: List[int]) -> List[int]:
+        """Pick window times: remaining breaks first, the rest spread evenly."""
+        max_windows = max(0, self.config.max_windows)
+        upcoming = [ts for ts in breaks if start < ts < end]
+        if len(upcoming) >= max_windows:
+            step = len(upcoming) / max_windows if max_windows else 0
+            return [upcoming[int(idx * step)] for idx in range(max_windows)]
+
+        # Spread the extra windows over the intervals between breaks, by length
+        anchors = [start] + upcoming + [end]
+        intervals = [anchors[idx + 1] - anchors[idx] for idx in range(len(anchors) - 1)]
+        extra = max_windows - len(upcoming)
+        total = sum(intervals) or 1
+        shares = [extra * length / total for length in intervals]
+        counts = [int(share) for share in shares]
+        by_remainder = sorted(range(len(shares)), key=lambda idx: shares[idx] - counts[idx], reverse=True)
+        for idx in by_remainder[: extra - sum(counts)]:
+            counts[idx] += 1
+
+        windows = set(upcoming)
+        for idx, count in enumerate(counts):
+            for k in range(1, count + 1):
+                ts = int(round((anchors[idx] + intervals[idx] * k / (count + 1)) / 60)) * 60
+                if all(abs(ts - anchor) >= MIN_WINDOW_GAP_SECONDS for anchor in anchors):
+                    windows.add(ts)
+        return sorted(windows)
+
+    def _goalkeepers(self, names: List[str]) -> List[str]:
+        roster = self.game_state.roster
+        keepers = [
+            player for player in names
+            if any(POSITION_TAXONOMY.is_goalkeeper(code) for code in roster[player].preferred_list())
+        ]
+        return keepers or list(names)
+
+    def _current_lineup(self, names: List[str]) -> Optional[_Lineup]:
+        roster = self.game_state.roster
+        on_field = [player for player in names if roster[player].on_field]
+        if not on_field:
+            return None
+        goalkeeper = next(
+            (
+                player for player in on_field
+                if POSITION_TAXONOMY.is_goalkeeper(roster[player].position)
+            ),
+            None,
+        )
+        return _Lineup(goalkeeper, frozenset(p for p in on_field if p != goalkeeper))
+
+    def _substitutions(
+        self, lineups: List[_Lineup], windows: List[int], now: float
+    ) -> List[Tuple[str, str, int]]:
+        """Turn lineup changes into (out, in, minute), pairing by position fit."""
+        roster = self.game_state.roster
+        pricer = AssignmentService(self.game_state)
+        positions: Dict[str, str] = {
+            player: roster[player].position
+            or next(iter(roster[player].preferred_list()), "")
+            for player in roster
+        }
+        if lineups and lineups[0].goalkeeper:
+            positions[lineups[0].goalkeeper] = "GK"
+
+        substitutions = []
+        for idx, window in enumerate(windows, start=1):
+            before, after = lineups[idx - 1], lineups[idx]
+            outs = sorted(before.players - after.players)
+            ins = sorted(after.players - before.players)
+            if after.goalkeeper:
+                positions[after.goalkeeper] = "GK"
+            cost = [
+                [
+                    0.0 if player_in == after.goalkeeper and positions[player_out] == "GK"
+                    else pricer.slot_cost(roster[player_in], positions[player_out] or "", now)
+                    for player_in in ins
+                ]
+                for player_out in outs
+            ]
+            for out_idx, in_idx in enumerate(solve_assignment(cost) if outs else []):
+                player_out, player_in = outs[out_idx], ins[in_idx]
+                if player_in != after.goalkeeper:
+                    positions[player_in] = positions[player_out]
+                substitutions.append((player_out, player_in, window // 60))
+        return substitutions
+
+
+class _RotationSearch:
+    """Greedy construction plus local search over per-segment lineups."""
+
+    def __init__(
+        self,
+        names: List[str],
+        base: Dict[str, int],
+        lengths: List[int],
+        keepers: List[str],
+        gk_free: List[bool],
+        field_size: int,
+        current: Optional[_Lineup],
+        config: RotationConfig,
+    ):
+        self.names = names
+        self.base = base
+        self.lengths = lengths
+        self.keepers = keepers
+        self.gk_free = gk_free
+        self.field_size = field_size
+        self.current = current
+        self.config = config
+        self.random = random.Random(config.seed)
+
+    def run(self) -> Tuple[List[_Lineup], int]:
+        if not self.lengths or not self.names:
+            return [], 0
+        lineups = self._greedy()
+        return self._improve(lineups)
+
+    def projected(self, lineups: List[_Lineup]) -> Dict[str, float]:
+        minutes = dict(self.base)
+        for lineup, length in zip(lineups, self.lengths):
+            for player in lineup.players:
+                minutes[player] += length
+        return minutes
+
+    def objective(self, lineups: List[_Lineup]) -> float:
+        values = [seconds / 60 for seconds in self.projected(lineups).values()]
+        mean = sum(values) / len(values)
+        variance = sum((value - mean) ** 2 for value in values) / len(values)
+        changes = sum(
+            len(lineups[idx].players - lineups[idx - 1].players) for idx in range(1, len(lineups))
+        )
+        return variance + self.config.change_penalty * changes
+
+    # ---------- Construction ---------- #
+
+    def _greedy(self) -> List[_Lineup]:
+        minutes = dict(self.base)
+        lineups: List[_Lineup] = []
+        for idx, length in enumerate(self.lengths):
+            if idx == 0 and self.current is not None:
+                lineup = self.current
+            else:
+                previous = lineups[-1] if lineups else None
+                lineup = self._pick(minutes, previous, self.gk_free[idx])
+            lineups.append(lineup)
+            for player in lineup.players:
+                minutes[player] += length
+        return lineups
+
+    def _pick(self, minutes: Dict[str, float], previous: Optional[_Lineup], gk_free: bool) -> _Lineup:
+        staying = previous.players if previous else frozenset()
+
+        def freshness(player: str) -> Tuple[float, int]:
+            # Fewest minutes first; on a tie, keep whoever is already on
+            return (minutes[player], 0 if player in staying else 1)
+
+        if previous is not None and (not gk_free or previous.goalkeeper is None):
+            goalkeeper = previous.goalkeeper
+        else:
+            goalkeeper = min(self.keepers, key=freshness)
+        outfield_size = self.field_size - (1 if goalkeeper else 0)
+        outfield = sorted((p for p in self.names if p != goalkeeper), key=freshness)[:outfield_size]
+        return _Lineup(goalkeeper, frozenset(outfield))
+
+    # ---------- Local search ---------- #
+
+    def _improve(self, lineups: List[_Lineup]) -> Tuple[List[_Lineup], int]:
+        fixed_first = self.current is not None
+        movable = [idx for idx in range(len(lineups)) if not (idx == 0 and fixed_first)]
+        if not movable:
+            return lineups, 0
+
+        best = self.objective(lineups)
+        deadline = time.perf_counter() + self.config.time_budget_seconds
+        iterations = 0
+        while iterations < self.config.max_iterations and time.perf_counter() < deadline:
+            iterations += 1
+            idx = self.random.choice(movable)
+            if self.gk_free[idx] and len(self.keepers) > 1 and self.random.random() < 0.2:
+                candidate = self._swap_goalkeeper(lineups, idx)
+            else:
+                candidate = self._swap_outfield(lineups, idx)
+            if candidate is None:
+                continue
+            score = self.objective(candidate)
+            # Sideways moves are taken too, e.g. a keeper swap that only pays
+            # off once the old keeper is rotated out
+            if score <= best + 1e-9:
+                lineups, best = candidate, score
+        return lineups, iterations
+
+    def _swap_outfield(self, lineups: List[_Lineup], idx: int) -> Optional[List[_Lineup]]:
+        lineup = lineups[idx]
+        bench = [p for p in self.names if p not in lineup.players]
+        if not bench or not lineup.outfield:
+            return None
+        player_out = self.random.choice(sorted(lineup.outfield))
+        player_in = self.random.choice(bench)
+        candidate = list(lineups)
+        candidate[idx] = _Lineup(lineup.goalkeeper, lineup.outfield - {player_out} | {player_in})
+        return candidate
+
+    def _swap_goalkeeper(self, lineups: List[_Lineup], idx: int) -> Optional[List[_Lineup]]:
+        """Give the goal to another keeper for the whole block starting at ``idx``."""
+        current = lineups[idx].goalkeeper
+        choices = [keeper for keeper in self.keepers if keeper != current]
+        if current is None or not choices:
+            return None
+        keeper = self.random.choice(choices)
+        candidate = list(lineups)
+        block = idx
+        while block < len(lineups) and (block == idx or not self.gk_free[block]):
+            lineup = candidate[block]
+            outfield = lineup.outfield
+            if keeper in outfield:
+                outfield = outfield - {keeper} | {current}
+            candidate[block] = _Lineup(keeper, outfield)
+            block += 1
+        return candidate
@@ -0,0 +1,432 @@
+"""
+Season archive for the Soccer Coach Sideline Timekeeper application.
+
+Finished games accumulate in a single SQLite database so season questions
+("minutes per player over the last 10 games") are indexed queries instead of
+loading every saved game file.
+
+An archived game is identified by its game key (e.g. the registry game id,
+which stays the same for every match played on that field) and the time the
+match started, so re-archiving a match replaces it while a second match on
+the same field and day is kept alongside the first.
+"""
+import json
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import date, datetime, time
+from typing import Any, Dict, Iterable, List, Optional
+
+from ..models import GameState
+from ..utils import now_ts
+from .event_journal import GameEvent
+
+SCHEMA_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    game_key TEXT NOT NULL,
+    started_ts REAL NOT NULL,
+    played_on TEXT NOT NULL,
+    opponent TEXT NOT NULL DEFAULT '',
+    field_size INTEGER NOT NULL,
+    period_count INTEGER NOT NULL,
+    game_length_seconds INTEGER NOT NULL,
+    archived_ts REAL NOT NULL,
+    UNIQUE (game_key, started_ts)
+);
+CREATE TABLE IF NOT EXISTS periods (
+    game_id INTEGER NOT NULL REFERENCES games(id) ON DELETE CASCADE,
+    period_index INTEGER NOT NULL,
+    elapsed_seconds INTEGER NOT NULL,
+    adjustment_seconds INTEGER NOT NULL,
+    stoppage_seconds INTEGER NOT NULL,
+    PRIMARY KEY (game_id, period_index)
+);
+CREATE TABLE IF NOT EXISTS appearances (
+    game_id INTEGER NOT NULL REFERENCES games(id) ON DELETE CASCADE,
+    player TEXT NOT NULL,
+    number TEXT,
+    total_seconds INTEGER NOT NULL,
+    PRIMARY KEY (game_id, player)
+);
+CREATE TABLE IF NOT EXISTS stints (
+    id INTEGER PRIMARY KEY,
+    game_id INTEGER NOT NULL REFERENCES games(id) ON DELETE CASCADE,
+    player TEXT NOT NULL,
+    position TEXT,
+    period_index INTEGER,
+    start_ts REAL NOT NULL,
+    end_ts REAL NOT NULL,
+    seconds INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS events (
+    game_id INTEGER NOT NULL REFERENCES games(id) ON DELETE CASCADE,
+    seq INTEGER NOT NULL,
+    event_type TEXT NOT NULL,
+    ts REAL NOT NULL,
+    version INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (game_id, seq)
+);
+CREATE INDEX IF NOT EXISTS idx_games_played_on ON games (played_on);
+CREATE INDEX IF NOT EXISTS idx_games_opponent ON games (opponent);
+CREATE INDEX IF NOT EXISTS idx_appearances_player ON appearances (player, game_id);
+CREATE INDEX IF NOT EXISTS idx_stints_player ON stints (player, game_id);
+"""
+
+# Version 1 keyed games by (game_key, played_on); its games count as started
+# at local midnight of their date. The table is rebuilt with foreign keys off
+# so the rows referencing it are kept.
+_MIGRATE_FROM_V1 = """
+CREATE TABLE games_v2 (
+    id INTEGER PRIMARY KEY,
+    game_key TEXT NOT NULL,
+    started_ts REAL NOT NULL,
+    played_on TEXT NOT NULL,
+    opponent TEXT NOT NULL DEFAULT '',
+    field_size INTEGER NOT NULL,
+    period_count INTEGER NOT NULL,
+    game_length_seconds INTEGER NOT NULL,
+    archived_ts REAL NOT NULL,
+    UNIQUE (game_key, started_ts)
+);
+INSERT INTO games_v2
+    SELECT id, game_key, CAST(strftime('%s', played_on, 'utc') AS REAL), played_on, opponent,
+           field_size, period_count, game_length_seconds, archived_ts
+    FROM games;
+DROP TABLE games;
+ALTER TABLE games_v2 RENAME TO games;
+"""
+
+
+@dataclass
+class StintRecord:
+    """One continuous spell on the field."""
+    player: str
+    start_ts: float
+    end_ts: float
+    position: Optional[str] = None
+    period_index: Optional[int] = None
+
+    @property
+    def seconds(self) -> int:
+        """Length of the stint in whole seconds."""
+        return max(0, int(self.end_ts - self.start_ts))
+
+
+def stints_from_events(events: Iterable[GameEvent], end_ts: Optional[float] = None) -> List[StintRecord]:
+    """
+    Rebuild stint history from journal events.
+
+    A stint opens when a player's after-image shows a new ``stint_start_ts``
+    while on the field and closes at the first event that takes them off.
+
+    Args:
+        events: Journal events in order
+        end_ts: Timestamp closing stints still open after the last event
+
+    Returns:
+        Stints ordered by start time
+    """
+    open_stints: Dict[str, StintRecord] = {}
+    stints: List[StintRecord] = []
+
+    for event in events:
+        period_index = event.timer.get("current_period_index")
+        for name, player in event.players.items():
+            current = open_stints.get(name)
+            start_ts = player.get("stint_start_ts")
+            on_field = player.get("on_field") and start_ts is not None
+
+            if current is not None and (not on_field or start_ts != current.start_ts):
+                current.end_ts = event.timestamp
+                stints.append(open_stints.pop(name))
+                current = None
+            if on_field and current is None:
+                open_stints[name] = StintRecord(
+                    player=name,
+                    start_ts=start_ts,
+                    end_ts=start_ts,
+                    position=player.get("position"),
+                    period_index=period_index,
+                )
+        for name in event.removed_players:
+            current = open_stints.pop(name, None)
+            if current is not None:
+                current.end_ts = event.timestamp
+                stints.append(current)
+
+    close_ts = end_ts if end_ts is not None else now_ts()
+    for current in open_stints.values():
+        current.end_ts = close_ts
+        stints.append(current)
+    return sorted(stints, key=lambda stint: (stint.start_ts, stint.player))
+
+
+def stints_from_ledgers(game_state: GameState, end_ts: Optional[float] = None) -> List[StintRecord]:
+    """
+    Collect stint history from the players' stint ledgers.
+
+    Args:
+        game_state: Game state whose roster carries the ledgers
+        end_ts: Timestamp closing stints that are still running
+
+    Returns:
+        Stints ordered by start time
+    """
+    close_ts = end_ts if end_ts is not None else now_ts()
+    stints = [
+        StintRecord(
+            player=name,
+            start_ts=start,
+            end_ts=end if end is not None else close_ts,
+            position=position,
+            period_index=period,
+        )
+        for name, player in game_state.roster.items()
+        for start, end, period, position in player.stint_ledger.stints()
+    ]
+    return sorted(stints, key=lambda stint: (stint.start_ts, stint.player))
+
+
+class SeasonArchive:
+    """
+    SQLite-backed store of finished games.
+
+    One connection is shared by all threads and serialized with a lock;
+    archive writes happen once per game, so contention is negligible.
+    """
+
+    def __init__(self, db_path: str = ":memory:"):
+        """
+        Open (and create if needed) the archive database.
+
+        Args:
+            db_path: SQLite database path, or ``:memory:``
+        """
+        if db_path != ":memory:":
+            directory = os.path.dirname(db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version == 1:
+            self._conn.executescript(f"BEGIN; {_MIGRATE_FROM_V1} COMMIT;")
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    # ---------- Ingestion ---------- #
+
+    def ingest_game(
+        self,
+        game_state: GameState,
+        game_key: str,
+        played_on: Optional[date] = None,
+        opponent: str = "",
+        events: Iterable[GameEvent] = (),
+        stints: Optional[Iterable[StintRecord]] = None,
+        current_time: Optional[float] = None,
+    ) -> int:
+        """
+        Store a finished game, replacing an earlier ingest of the same match.
+
+        A match is identified by ``game_key`` and the game's start time;
+        games that never started are identified by their date instead.
+
+        Args:
+            game_state: Game state at full time
+            game_key: Identifier of the game (e.g. the registry game id)
+            played_on: Match date (defaults to the game's start date)
+            opponent: Opponent name
+            events: Journal events of the game
+            stints: Stint history; taken from the players' stint ledgers when
+                omitted, or derived from ``events`` for games without ledgers
+            current_time: Timestamp closing running stints (defaults to now)
+
+        Returns:
+            Archive row id of the game
+        """
+        current_time = now_ts() if current_time is None else current_time
+        events = list(events)
+        if stints is None:
+            if any(len(player.stint_ledger) for player in game_state.roster.values()):
+                stints = stints_from_ledgers(game_state, end_ts=current_time)
+            else:
+                stints = stints_from_events(events, end_ts=current_time)
+        if played_on is None:
+            start_ts = game_state.game_start_ts or current_time
+            played_on = datetime.fromtimestamp(start_ts).date()
+        started_ts = game_state.game_start_ts
+        if started_ts is None:
+            started_ts = datetime.combine(played_on, time()).timestamp()
+
+        game_state.ensure_timer_lists()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM games WHERE game_key = ? AND started_ts = ?",
+                (game_key, started_ts),
+            )
+            cursor = self._conn.execute(
+                "INSERT INTO games (game_key, started_ts, played_on, opponent, field_size, period_count,"
+                " game_length_seconds, archived_ts) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    game_key,
+                    started_ts,
+                    played_on.isoformat(),
+                    opponent,
+                    game_state.field_size,
+                    game_state.period_count,
+                    game_state.game_length_seconds,
+                    current_time,
+                ),
+            )
+            game_id = cursor.lastrowid
+
+            self._conn.executemany(
+                "INSERT INTO periods VALUES (?, ?, ?, ?, ?)",
+                [
+                    (
+                        game_id,
+                        idx,
+                        game_state.period_elapsed[idx],
+                        game_state.period_adjustments[idx],
+                        game_state.period_stoppage[idx],
+                    )
+                    for idx in range(game_state.period_count)
+                ],
+            )
+            self._conn.executemany(
+                "INSERT INTO appearances VALUES (?, ?, ?, ?)",
+                [
+                    (
+                        game_id,
+                        name,
+                        player.number,
+                        player.total_seconds + player.current_stint_seconds(current_time),
+                    )
+                    for name, player in game_state.roster.items()
+                ],
+            )
+            self._conn.executemany(
+                "INSERT INTO stints (game_id, player, position, period_index, start_ts, end_ts, seconds)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (game_id, s.player, s.position, s.period_index, s.start_ts, s.end_ts, s.seconds)
+                    for s in stints
+                ],
+            )
+            self._conn.executemany(
+                "INSERT INTO events VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        game_id,
+                        event.seq,
+                        event.event_type.value,
+                        event.timestamp,
+                        event.version,
+                        json.dumps(event.data),
+                    )
+                    for event in events
+                ],
+            )
+        return game_id
+
+    # ---------- Queries ---------- #
+
+    def list_games(self, limit: Optional[int] = None, opponent: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        List archived games, newest first.
+
+        Args:
+            limit: Maximum number of games to return
+            opponent: Only games against this opponent
+
+        Returns:
+            List of game dictionaries
+        """
+        sql = "SELECT * FROM games"
+        params: List[Any] = []
+        if opponent is not None:
+            sql += " WHERE opponent = ?"
+            params.append(opponent)
+        sql += " ORDER BY played_on DESC, started_ts DESC, id DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return self._query(sql, params)
+
+    def minutes_per_player(self, last_games: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Total playing time per player over the most recent games.
+
+        Args:
+            last_games: Number of most recent games to include (all when omitted)
+
+        Returns:
+            List of dictionaries with player, games, seconds and minutes,
+            sorted by most minutes first
+        """
+        sql = (
+            "SELECT a.player AS player, COUNT(*) AS games, SUM(a.total_seconds) AS seconds"
+            " FROM appearances a"
+            " JOIN (SELECT id FROM games ORDER BY played_on DESC, started_ts DESC, id DESC LIMIT ?) recent"
+            " ON recent.id = a.game_id"
+            " GROUP BY a.player ORDER BY seconds DESC, a.player"
+        )
+        rows = self._query(sql, [last_games if last_games is not None else -1])
+        for row in rows:
+            row["minutes"] = round(row["seconds"] / 60, 1)
+        return rows
+
+    def player_history(self, player: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Per-game playing time and stint count for one player, newest first.
+
+        Args:
+            player: Player name
+            limit: Maximum number of games to return
+
+        Returns:
+            List of dictionaries with game details, seconds and stints
+        """
+        sql = (
+            "SELECT g.id AS game_id, g.game_key AS game_key, g.played_on AS played_on,"
+            " g.opponent AS opponent, a.total_seconds AS seconds,"
+            " (SELECT COUNT(*) FROM stints s WHERE s.game_id = g.id AND s.player = a.player) AS stints"
+            " FROM appearances a JOIN games g ON g.id = a.game_id"
+            " WHERE a.player = ? ORDER BY g.played_on DESC, g.started_ts DESC, g.id DESC LIMIT ?"
+        )
+        return self._query(sql, [player, limit if limit is not None else -1])
+
+    def stints_for_game(self, game_id: int) -> List[Dict[str, Any]]:
+        """
+        Stints recorded for an archived game.
+
+        Args:
+            game_id: Archive row id of the game
+
+        Returns:
+            List of stint dictionaries ordered by start time
+        """
+        return self._query(
+            "SELECT player, position, period_index, start_ts, end_ts, seconds"
+            " FROM stints WHERE game_id = ? ORDER BY start_ts, player",
+            [game_id],
+        )
+
+    def _query(self, sql: str, params: Iterable[Any]) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(sql, list(params))]
@@ -6,9 +6,11 @@ with their dependencies injected, following the Dependency Inversion Principle.
 """
 from typing import Optional
 from ..models import GameState
+from ..utils import Clock
 from .persistence_service import PersistenceService
 from .timer_service import TimerService
 from .analytics_service import AnalyticsService, GameReportExporter
+from .assignment_service import AssignmentService
 from .player_service import (
     PlayerService, PlayerValidator, PlayerCSVHandler, 
     StandardPositionProvider
@@ -27,8 +29,14 @@ class ServiceFactory:
     - DIP: Depends on abstractions, creates concrete implementations
     """
     
-    def __init__(self):
-        """Initialize factory with default configurations."""
+    def __init__(self, clock: Optional[Clock] = None):
+        """
+        Initialize factory with default configurations.
+        
+        Args:
+            clock: Time source injected into time-aware services
+        """
+        self.clock = clock
         self._persistence_service: Optional[PersistenceService] = None
         self._position_provider: Optional[StandardPositionProvider] = None
         self._export_service: Optional[GameReportExporter] = None
@@ -74,7 +82,7 @@ class ServiceFactory:
         Returns:
             Configured TimerService instance
         """
-        return TimerService(game_state)
+        return TimerService(game_state, clock=self.clock)
     
     def create_analytics_service(
         self,
@@ -96,9 +104,22 @@ class ServiceFactory:
         return AnalyticsService(
             game_state=game_state,
             timer_service=timer_service,
-            export_service=export_service
+            export_service=export_service,
+            clock=self.clock
         )
     
+    def create_assignment_service(self, game_state: GameState) -> AssignmentService:
+        """
+        Create AssignmentService instance.
+        
+        Args:
+            game_state: Game state whose roster is assigned
+            
+        Returns:
+            Configured AssignmentService instance
+        """
+        return AssignmentService(game_state, clock=self.clock)
+    
     def create_complete_service_suite(self, game_state: GameState) -> dict:
         """
         Create a complete suite of services with proper dependencies.
@@ -117,6 +138,7 @@ class ServiceFactory:
             'timer': timer_service,
             'analytics': analytics_service,
             'player': player_service,
+            'assignment': self.create_assignment_service(game_state),
             'persistence': self._get_persistence_service()
         }
     
@@ -0,0 +1,149 @@
+"""
+State change notifications for the Soccer Coach Sideline Timekeeper application.
+
+Push channels (Server-Sent Events and long-poll) block on a per-game
+:class:`StateNotifier` until the state version moves past what the client has
+already seen, instead of re-fetching the full state every second. Each open
+push channel occupies a server thread, so :class:`PushClientLimit` bounds
+how many may be open at once.
+"""
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+from ..utils import now_ts
+
+
+@dataclass
+class StateEvent:
+    """A state change published to waiting clients."""
+    version: int
+    cause: str
+    timestamp: float = field(default_factory=now_ts)
+    data: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "version": self.version,
+            "cause": self.cause,
+            "timestamp": self.timestamp,
+            "data": self.data,
+        }
+
+
+class StateNotifier:
+    """
+    Fan out state change events to any number of waiting threads.
+
+    Only the latest event is kept: a client that falls behind is told the
+    newest version and fetches the delta itself, so memory use is constant.
+    Once the game leaves memory the notifier is closed, which releases every
+    waiter so push channels can end and reconnect to the reloaded game.
+    """
+
+    def __init__(self, version: int = 0):
+        self._condition = threading.Condition()
+        self._latest = StateEvent(version=version, cause="initial")
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        """Whether the game behind this notifier has left memory."""
+        with self._condition:
+            return self._closed
+
+    def close(self) -> None:
+        """Wake every waiter for good; later waits return immediately."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    @property
+    def latest(self) -> StateEvent:
+        """Most recently published event."""
+        with self._condition:
+            return self._latest
+
+    def publish(self, version: int, cause: str, **data: Any) -> StateEvent:
+        """
+        Publish a new state version and wake every waiter.
+
+        Args:
+            version: New state version
+            cause: Short name of what changed (usually the API endpoint)
+            **data: Extra event payload
+
+        Returns:
+            The published event
+        """
+        event = StateEvent(version=version, cause=cause, data=data)
+        with self._condition:
+            self._latest = event
+            self._condition.notify_all()
+        return event
+
+    def wait_for_change(self, known_version: int, timeout: Optional[float]) -> Optional[StateEvent]:
+        """
+        Block until the state version differs from the caller's version.
+
+        Args:
+            known_version: Version the caller already has
+            timeout: Maximum seconds to wait (None waits forever)
+
+        Returns:
+            The latest event, or None if nothing changed before the timeout
+            or the notifier was closed
+        """
+        with self._condition:
+            self._condition.wait_for(
+                lambda: self._latest.version != known_version or self._closed, timeout
+            )
+            return self._latest if self._latest.version != known_version else None
+
+
+class PushClientLimit:
+    """
+    Bound on the push channels (streams and long-polls) open at once.
+
+    A push channel holds its server thread for as long as it is open. Keeping
+    the bound below the server's thread count leaves threads free for
+    ordinary requests; clients past the bound are turned away and retry.
+    """
+
+    def __init__(self, limit: Optional[int] = None):
+        """
+        Args:
+            limit: Most push channels open at once (None for no bound)
+        """
+        if limit is not None and limit < 0:
+            raise ValueError("limit must not be negative")
+        self.limit = limit
+        self._lock = threading.Lock()
+        self._active = 0
+
+    @property
+    def active(self) -> int:
+        """Number of push channels currently open."""
+        with self._lock:
+            return self._active
+
+    def try_acquire(self) -> bool:
+        """
+        Claim a slot for a new push channel without waiting.
+
+        Returns:
+            True if the channel may open; pair with :meth:`release`
+        """
+        with self._lock:
+            if self.limit is not None and self._active >= self.limit:
+                return False
+            self._active += 1
+            return True
+
+    def release(self) -> None:
+        """Free the slot of a closed push channel."""
+        with self._lock:
+            if self._active == 0:
+                raise RuntimeError("release() without a matching try_acquire()")
+            self._active -= 1
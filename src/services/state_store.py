@@ -0,0 +1,383 @@
+"""
+Game state stores for the Soccer Coach Sideline Timekeeper application.
+
+A store is where a game lives between requests. The in-memory store keeps
+the single-process behaviour: the live objects are the only copy, which is
+all the desktop app and a one-worker server need.
+
+The SQLite store lets several worker processes serve the same games. Each
+game is one row (game-level fields as JSON plus its roster order) and each
+player is one row of their own, tagged with the game version that last wrote
+it. A save rewrites the game row and only the players that changed, and it
+only succeeds if the stored version is still the one the worker last saw
+(optimistic concurrency); otherwise :class:`StaleStateError` tells the worker
+to reload. A worker that falls behind loads just the player rows written
+since its own version. The database runs in WAL mode, so readers in one
+process never block a writer in another.
+"""
+import json
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Protocol
+
+from ..models import GameState, Player
+from ..utils import now_ts
+
+SCHEMA_VERSION = 1
+# Seconds a writer waits for another process's write transaction to finish
+DEFAULT_BUSY_TIMEOUT_SECONDS = 5.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    game_id TEXT PRIMARY KEY,
+    version INTEGER NOT NULL,
+    updated_ts REAL NOT NULL,
+    active INTEGER NOT NULL,
+    roster TEXT NOT NULL,
+    state TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS players (
+    game_id TEXT NOT NULL REFERENCES games(game_id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (game_id, name)
+);
+CREATE INDEX IF NOT EXISTS idx_players_version ON players (game_id, version);
+"""
+
+
+class StaleStateError(Exception):
+    """Raised when another worker saved a game after the caller last loaded it."""
+
+    def __init__(self, game_id: str, expected_version: Optional[int], stored_version: Optional[int]):
+        self.game_id = game_id
+        self.expected_version = expected_version
+        self.stored_version = stored_version
+        super().__init__(
+            f"Game {game_id!r} is at version {stored_version}, not {expected_version}; reload and retry"
+        )
+
+
+class GameStateStore(Protocol):
+    """Where games are kept between requests."""
+
+    # Whether other processes may change games behind the caller's back
+    shared: bool
+
+    def version(self, game_id: str) -> Optional[int]:
+        """Stored version of a game (None if it is not stored)."""
+        ...
+
+    def load(self, game_id: str, base: Optional[GameState] = None) -> Optional[GameState]:
+        """Load a stored game, reusing unchanged players of ``base``."""
+        ...
+
+    def save(
+        self,
+        game_id: str,
+        game_state: GameState,
+        expected_version: Optional[int],
+        players: Optional[Iterable[str]] = None,
+        removed_players: Iterable[str] = (),
+    ) -> None:
+        """Store a game if it is still at ``expected_version``."""
+        ...
+
+    def delete(self, game_id: str) -> bool:
+        """Delete a stored game."""
+        ...
+
+    def list_games(self) -> List[Dict[str, Any]]:
+        """List stored games."""
+        ...
+
+    def close(self) -> None:
+        """Release the store's resources."""
+        ...
+
+
+class InMemoryStateStore:
+    """
+    Process-local store: the live game objects are the only copy.
+
+    Nothing is written and nothing can go stale, so a single-user desktop
+    or a one-process server pays no storage cost per request.
+    """
+
+    shared = False
+
+    def version(self, game_id: str) -> Optional[int]:
+        return None
+
+    def load(self, game_id: str, base: Optional[GameState] = None) -> Optional[GameState]:
+        return None
+
+    def save(
+        self,
+        game_id: str,
+        game_state: GameState,
+        expected_version: Optional[int],
+        players: Optional[Iterable[str]] = None,
+        removed_players: Iterable[str] = (),
+    ) -> None:
+        pass
+
+    def delete(self, game_id: str) -> bool:
+        return False
+
+    def list_games(self) -> List[Dict[str, Any]]:
+        return []
+
+    def close(self) -> None:
+        pass
+
+
+class SQLiteStateStore:
+    """
+    Games shared between worker processes through one SQLite database.
+
+    Every thread gets its own connection, so reads from different request
+    threads run concurrently under WAL. Writes take the database's write
+    lock for the length of one save.
+    """
+
+    shared = True
+
+    def __init__(self, db_path: str, busy_timeout_seconds: float = DEFAULT_BUSY_TIMEOUT_SECONDS):
+        """
+        Open (and create if needed) the state database.
+
+        Args:
+            db_path: SQLite database file; WAL needs a real file, so
+                ``:memory:`` is rejected
+            busy_timeout_seconds: How long a write waits for another
+                process's write to finish
+        """
+        if db_path == ":memory:":
+            raise ValueError("SQLiteStateStore needs a database file that workers can share")
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.db_path = db_path
+        self.busy_timeout_seconds = busy_timeout_seconds
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+
+        conn = self._connection()
+        # WAL is a property of the database file; setting it once persists it
+        conn.execute("PRAGMA journal_mode = WAL")
+        with self._transaction(conn, write=True):
+            for statement in _SCHEMA.split(";"):
+                if statement.strip():
+                    conn.execute(statement)
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    @property
+    def journal_mode(self) -> str:
+        """SQLite journal mode of the database (``wal`` once opened)."""
+        return self._connection().execute("PRAGMA journal_mode").fetchone()[0]
+
+    def close(self) -> None:
+        """Close every connection opened by this store."""
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
+
+    # ---------- Reads ---------- #
+
+    def version(self, game_id: str) -> Optional[int]:
+        """
+        Stored version of a game.
+
+        Args:
+            game_id: Game identifier
+
+        Returns:
+            The version, or None if the game is not stored
+        """
+        row = self._connection().execute(
+            "SELECT version FROM games WHERE game_id = ?", (game_id,)
+        ).fetchone()
+        return None if row is None else row[0]
+
+    def load(self, game_id: str, base: Optional[GameState] = None) -> Optional[GameState]:
+        """
+        Load a stored game.
+
+        Args:
+            game_id: Game identifier
+            base: The caller's copy of the game, unchanged since it was saved
+                or loaded at ``base.state_version``; only players written
+                after that version are read, the rest are taken from it
+
+        Returns:
+            The stored game, or None if it is not stored
+        """
+        since = base.state_version if base is not None else -1
+        conn = self._connection()
+        with self._transaction(conn):
+            row = conn.execute(
+                "SELECT version, roster, state FROM games WHERE game_id = ?", (game_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            player_rows = conn.execute(
+                "SELECT name, data FROM players WHERE game_id = ? AND version > ?", (game_id, since)
+            ).fetchall()
+
+        version, roster_json, state_json = row
+        changed = dict(player_rows)
+        names = json.loads(roster_json)
+        if base is not None and any(name not in changed and name not in base.roster for name in names):
+            # The base is older than the caller claims; read every player
+            return self.load(game_id)
+
+        game_state = GameState.from_json(json.loads(state_json))
+        game_state.roster = {
+            name: (
+                Player.from_dict({"name": name, **json.loads(changed[name])})
+                if name in changed else base.roster[name]
+            )
+            for name in names
+        }
+        game_state.state_version = version
+        return game_state
+
+    def list_games(self) -> List[Dict[str, Any]]:
+        """
+        List stored games.
+
+        Returns:
+            Dictionaries with game id, version, last update and activity
+        """
+        rows = self._connection().execute(
+            "SELECT game_id, version, updated_ts, active FROM games ORDER BY game_id"
+        ).fetchall()
+        return [
+            {"game_id": game_id, "version": version, "updated_ts": updated_ts, "active": bool(active)}
+            for game_id, version, updated_ts, active in rows
+        ]
+
+    # ---------- Writes ---------- #
+
+    def save(
+        self,
+        game_id: str,
+        game_state: GameState,
+        expected_version: Optional[int],
+        players: Optional[Iterable[str]] = None,
+        removed_players: Iterable[str] = (),
+    ) -> None:
+        """
+        Store a game at its current ``state_version``.
+
+        Args:
+            game_id: Game identifier
+            game_state: Game to store
+            expected_version: Stored version the caller's copy is based on
+                (None for a game the caller believes is not stored yet)
+            players: Players changed since ``expected_version``; every
+                player is rewritten when omitted
+            removed_players: Players dropped from the roster since then
+
+        Raises:
+            StaleStateError: If the stored version is not ``expected_version``
+        """
+        version = game_state.state_version
+        state = game_state.to_json(include_players=False)
+        state.pop("players", None)
+        roster = game_state.roster
+        names = list(roster) if players is None else [name for name in players if name in roster]
+        game_row = (
+            version,
+            now_ts(),
+            int(game_state.is_active()),
+            json.dumps(list(roster), separators=(",", ":")),
+            json.dumps(state, separators=(",", ":")),
+        )
+
+        conn = self._connection()
+        with self._transaction(conn, write=True):
+            if expected_version is None:
+                try:
+                    conn.execute("INSERT INTO games VALUES (?, ?, ?, ?, ?, ?)", (game_id, *game_row))
+                except sqlite3.IntegrityError:
+                    raise StaleStateError(game_id, expected_version, self.version(game_id)) from None
+            else:
+                cursor = conn.execute(
+                    "UPDATE games SET version = ?, updated_ts = ?, active = ?, roster = ?, state = ?"
+                    " WHERE game_id = ? AND version = ?",
+                    (*game_row, game_id, expected_version),
+                )
+                if cursor.rowcount == 0:
+                    raise StaleStateError(game_id, expected_version, self.version(game_id))
+
+            if players is None:
+                conn.execute("DELETE FROM players WHERE game_id = ?", (game_id,))
+            else:
+                conn.executemany(
+                    "DELETE FROM players WHERE game_id = ? AND name = ?",
+                    [(game_id, name) for name in removed_players if name not in roster],
+                )
+            conn.executemany(
+                "INSERT OR REPLACE INTO players VALUES (?, ?, ?, ?)",
+                [
+                    (game_id, name, version, json.dumps(roster[name].to_dict(), separators=(",", ":")))
+                    for name in names
+                ],
+            )
+
+    def delete(self, game_id: str) -> bool:
+        """
+        Delete a stored game and its players.
+
+        Returns:
+            True if the game was stored
+        """
+        conn = self._connection()
+        with self._transaction(conn, write=True):
+            conn.execute("DELETE FROM players WHERE game_id = ?", (game_id,))
+            return conn.execute("DELETE FROM games WHERE game_id = ?", (game_id,)).rowcount > 0
+
+    # ---------- Internal helpers ---------- #
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # Autocommit mode; transactions are opened explicitly below. Only
+            # this thread uses the connection, but close() may run elsewhere.
+            conn = sqlite3.connect(
+                self.db_path,
+                timeout=self.busy_timeout_seconds,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.execute("PRAGMA foreign_keys = ON")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    @contextmanager
+    def _transaction(self, conn: sqlite3.Connection, write: bool = False) -> Iterator[None]:
+        """
+        Run a block in one transaction.
+
+        Write transactions take the write lock up front (``BEGIN IMMEDIATE``)
+        so the version check and the update cannot interleave with another
+        process; read transactions see one consistent snapshot.
+        """
+        conn.execute("BEGIN IMMEDIATE" if write else "BEGIN")
+        try:
+            yield
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
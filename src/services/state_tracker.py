@@ -0,0 +1,146 @@
+"""
+State change tracking for the Soccer Coach Sideline Timekeeper application.
+
+Polling clients send back the last state version they saw. This module
+remembers at which version each player and period last changed, so the server
+can answer with only the entries that differ instead of the whole game.
+"""
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from ..models import GameState, Player
+
+
+@dataclass
+class StateDelta:
+    """Entries that changed after a given state version."""
+    since_version: int
+    version: int
+    players: List[str] = field(default_factory=list)
+    removed_players: List[str] = field(default_factory=list)
+    periods: List[int] = field(default_factory=list)
+
+
+class StateChangeTracker:
+    """
+    Record per-player and per-period change versions for a game.
+
+    Call :meth:`record` after every state version bump. Comparing compact
+    signatures costs O(roster) per mutation, which keeps polls, far more
+    frequent than mutations, free of any diffing work.
+    """
+
+    def __init__(self, game_state: Optional[GameState] = None):
+        self.base_version = 0
+        self._player_signatures: Dict[str, Tuple] = {}
+        self._player_versions: Dict[str, int] = {}
+        self._removed_players: Dict[str, int] = {}
+        self._period_signatures: List[Tuple] = []
+        self._period_versions: List[int] = []
+        if game_state is not None:
+            self.reset(game_state)
+
+    def reset(self, game_state: GameState) -> None:
+        """
+        Forget history and take the current state as the diff baseline.
+
+        Args:
+            game_state: Game state providing the baseline
+        """
+        version = game_state.state_version
+        self.base_version = version
+        self._player_signatures = {
+            name: self._player_signature(player) for name, player in game_state.roster.items()
+        }
+        self._player_versions = {name: version for name in game_state.roster}
+        self._removed_players = {}
+        self._period_signatures = self._period_signature_list(game_state)
+        self._period_versions = [version] * len(self._period_signatures)
+
+    def record(self, game_state: GameState) -> None:
+        """
+        Record which entries changed at the game's current version.
+
+        Args:
+            game_state: Game state after the mutation
+        """
+        version = game_state.state_version
+        roster = game_state.roster
+
+        for name, player in roster.items():
+            signature = self._player_signature(player)
+            if self._player_signatures.get(name) != signature:
+                self._player_signatures[name] = signature
+                self._player_versions[name] = version
+                self._removed_players.pop(name, None)
+
+        for name in [name for name in self._player_signatures if name not in roster]:
+            del self._player_signatures[name]
+            del self._player_versions[name]
+            self._removed_players[name] = version
+
+        periods = self._period_signature_list(game_state)
+        if len(periods) != len(self._period_signatures):
+            self._period_versions = [version] * len(periods)
+        else:
+            for idx, signature in enumerate(periods):
+                if signature != self._period_signatures[idx]:
+                    self._period_versions[idx] = version
+        self._period_signatures = periods
+
+    def changes_since(self, since_version: int, version: int) -> Optional[StateDelta]:
+        """
+        Describe what changed after a client's last seen version.
+
+        Args:
+            since_version: Version the client already has
+            version: Current state version
+
+        Returns:
+            A StateDelta, or None if the client's version predates the
+            tracked history and a full payload is required
+        """
+        if since_version < self.base_version or since_version > version:
+            return None
+
+        return StateDelta(
+            since_version=since_version,
+            version=version,
+            players=[
+                name for name, changed in self._player_versions.items()
+                if changed > since_version
+            ],
+            removed_players=[
+                name for name, removed in self._removed_players.items()
+                if removed > since_version
+            ],
+            periods=[
+                idx for idx, changed in enumerate(self._period_versions)
+                if changed > since_version
+            ],
+        )
+
+    @staticmethod
+    def _player_signature(player: Player) -> Tuple:
+        return (
+            player.number,
+            player.preferred,
+            player.total_seconds,
+            player.on_field,
+            player.position,
+            player.stint_start_ts,
+            len(player.stint_ledger),
+        )
+
+    @staticmethod
+    def _period_signature_list(game_state: GameState) -> List[Tuple]:
+        count = game_state.period_count
+        return [
+            (
+                game_state.period_elapsed[idx] if idx < len(game_state.period_elapsed) else 0,
+                game_state.period_adjustments[idx] if idx < len(game_state.period_adjustments) else 0,
+                game_state.period_stoppage[idx] if idx < len(game_state.period_stoppage) else 0,
+                idx == game_state.current_period_index,
+            )
+            for idx in range(count)
+        ]
@@ -3,15 +3,17 @@
 from __future__ import annotations
 
 import json
-import random
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
-from ..models import GameState, Player
+from ..models import POSITION_TAXONOMY, GameState, Player
 from ..models.formation import (
     Formation, FormationTemplates, FormationType, FieldPosition, Position,
     SubstitutionPlan, OpponentNotes
 )
+from .replan_worker import ReplanJob, ReplanWorkerPool
+from .rotation_planner import RotationConfig, RotationPlan, RotationPlanner
+from .timer_service import TimerService
 
 
 class StrategyService:
@@ -137,14 +139,9 @@ class StrategyService:
         for player in available_players:
             preferred = player.preferred_list()
             for pos in preferred:
-                if pos.upper() in ["GK", "GOALKEEPER"]:
-                    position_counts["GK"] = position_counts.get("GK", 0) + 1
-                elif pos.upper() in ["DEF", "DEFENDER", "CB", "LB", "RB"]:
-                    position_counts["DEF"] = position_counts.get("DEF", 0) + 1
-                elif pos.upper() in ["MID", "MIDFIELDER", "CM", "CDM", "CAM", "LM", "RM"]:
-                    position_counts["MID"] = position_counts.get("MID", 0) + 1
-                elif pos.upper() in ["FOR", "FORWARD", "ST", "LW", "RW", "CF"]:
-                    position_counts["FOR"] = position_counts.get("FOR", 0) + 1
+                family = POSITION_TAXONOMY.family_of(pos)
+                if family is not None:
+                    position_counts[family] = position_counts.get(family, 0) + 1
         
         # Suggest formation based on player distribution
         def_count = position_counts.get("DEF", 0)
@@ -191,7 +188,7 @@ class StrategyService:
                     suitable_replacements = []
                     for bench_player in bench_players:
                         preferred = bench_player.preferred_list()
-                        if any(pos.upper() in position.position_code.value.upper() for pos in preferred):
+                        if POSITION_TAXONOMY.any_compatible(preferred, position.position_code.value):
                             suitable_replacements.append(bench_player)
                     
                     if suitable_replacements:
@@ -262,10 +259,16 @@ class StrategyService:
                 break
             
             # Find a player to substitute (prioritize those who have played most)
-            field_players = [pos for pos in formation.positions if pos.player_name and pos.position_code != Position.GOALKEEPER]
+            substituted = {out_player for out_player, _, _ in substitutions}
+            field_players = [pos for pos in formation.positions if pos.player_name and pos.position_code != Position.GOALKEEPER
+                             and pos.player_name not in substituted]
             if field_players:
-                # Simple rotation: substitute a random field player
-                target_position = random.choice(field_players)
+                # Substitute the field player with the most playing time
+                roster = self.game_state.roster
+                target_position = max(
+                    field_players,
+                    key=lambda pos: roster[pos.player_name].total_seconds if pos.player_name in roster else 0
+                )
                 if target_position.player_name:
                     substitutions.append((
                         target_position.player_name,
@@ -277,6 +280,69 @@ class StrategyService:
         plan_name = f"Auto Plan - {formation.name}"
         return self.create_substitution_plan(plan_name, substitutions, formation_changes)
     
+    def generate_rotation_plan(self, timer_service: TimerService, name: str = "Rotation Plan",
+                               config: Optional[RotationConfig] = None,
+                               player_names: Optional[List[str]] = None) -> RotationPlan:
+        """
+        Plan equal-time substitutions for the rest of the game and store the plan.
+        
+        Args:
+            timer_service: Timer of the game (period structure and game time)
+            name: Name to store the plan under (replaces a plan of that name)
+            config: Planner constraints
+            player_names: Available players (defaults to the whole roster)
+            
+        Returns:
+            The rotation plan, whose ``plan`` is stored like any other
+        """
+        rotation = RotationPlanner(self.game_state, timer_service, config).plan(name, player_names)
+        self._substitution_plans[name] = rotation.plan
+        self._save_data()
+        return rotation
+    
+    def request_rotation_replan(self, pool: ReplanWorkerPool, key: str, timer_service: TimerService,
+                                name: str = "Rotation Plan", config: Optional[RotationConfig] = None,
+                                player_names: Optional[List[str]] = None,
+                                callback: Optional[Callable[[ReplanJob], None]] = None) -> ReplanJob:
+        """
+        Re-plan the rotation in the background from a snapshot of the game.
+        
+        Returns immediately; pass the finished job's result to
+        :meth:`adopt_rotation_plan` to store the plan.
+        
+        Args:
+            pool: Worker pool running the planner
+            key: Game the request belongs to (earlier requests are superseded)
+            timer_service: Timer of the game, read for the snapshot time
+            name: Name of the generated plan
+            config: Planner constraints
+            player_names: Available players (defaults to the whole roster)
+            callback: Called from a pool thread with the finished job
+            
+        Returns:
+            The pending job
+        """
+        return pool.submit(
+            key, self.game_state.to_json(), name, config, player_names,
+            now=timer_service.now(), callback=callback
+        )
+    
+    def adopt_rotation_plan(self, rotation: Dict) -> SubstitutionPlan:
+        """
+        Store a rotation plan produced in the background.
+        
+        Args:
+            rotation: ``RotationPlan.to_dict()`` of a finished re-plan
+            
+        Returns:
+            The stored substitution plan
+        """
+        plan = SubstitutionPlan.from_dict(rotation["plan"])
+        plan.substitutions = [tuple(substitution) for substitution in plan.substitutions]
+        self._substitution_plans[plan.name] = plan
+        self._save_data()
+        return plan
+    
     # ---------- Opponent Scouting ---------- #
     
     def create_opponent_notes(self, opponent_name: str) -> OpponentNotes:
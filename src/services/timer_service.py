@@ -1,10 +1,12 @@
 """Timer service for the Soccer Coach Sideline Timekeeper application."""
 
+import threading
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple, Protocol
 
 from ..models import GameState
-from ..utils import now_ts, HALFTIME_PAUSE_MIN
+from ..utils import Clock, now_ts, HALFTIME_PAUSE_MIN
 
 
 class GameTimerInterface(Protocol):
@@ -56,6 +58,20 @@ class GameConfigurationInterface(Protocol):
         ...
 
 
+@dataclass
+class _DerivedTimes:
+    """Timer values derived from configuration and closed periods."""
+    key: tuple
+    period_elapsed: List[int]
+    period_adjustments: List[int]
+    period_stoppage: List[int]
+    period_lengths: List[int]
+    period_targets: List[int]
+    closed_elapsed: int
+    total_adjustment: int
+    total_stoppage: int
+
+
 class TimerService:
     """
     Comprehensive timer service implementing multiple focused interfaces.
@@ -66,8 +82,17 @@ class TimerService:
     - GameConfigurationInterface: Configuration management
     """
 
-    def __init__(self, game_state: GameState):
+    def __init__(self, game_state: GameState, clock: Optional[Clock] = None):
+        """
+        Args:
+            game_state: Game state to manage
+            clock: Time source; defaults to the wall clock via ``now_ts``
+        """
         self.game_state = game_state
+        self.clock = clock
+        self._derived_cache: Optional[_DerivedTimes] = None
+        # Readers sharing the game lock may refresh the cache concurrently
+        self._derived_lock = threading.Lock()
         self.game_state.ensure_timer_lists()
 
         # Backfill legacy states that only tracked a game start timestamp
@@ -75,11 +100,74 @@ class TimerService:
             self.game_state.game_start_ts is not None
             and sum(self.game_state.period_elapsed) == 0
         ):
-            elapsed = max(0, int(now_ts() - self.game_state.game_start_ts))
+            elapsed = max(0, int(self._now() - self.game_state.game_start_ts))
             index = min(self.game_state.current_period_index, self.game_state.period_count - 1)
             self.game_state.period_elapsed[index] = elapsed
             if not self.game_state.paused and not self.game_state.halftime_started:
-                self.game_state.period_start_ts = now_ts()
+                self.game_state.period_start_ts = self._now()
+
+    def now(self) -> float:
+        """Return the current timestamp from the service's clock."""
+
+        return self._now()
+
+    def _now(self) -> float:
+        return self.clock.now() if self.clock is not None else now_ts()
+
+    def _derived(self) -> _DerivedTimes:
+        """
+        Get derived timer values, recomputing them only after a change.
+
+        The cache is keyed on configuration, period index and pause state.
+        The per-period lists are compared by value as well, since callers
+        outside this service edit them in place.
+        """
+        gs = self.game_state
+        cache = self._derived_cache
+        if (
+            cache is not None
+            and cache.key == self._derived_key()
+            and cache.period_elapsed == gs.period_elapsed
+            and cache.period_adjustments == gs.period_adjustments
+            and cache.period_stoppage == gs.period_stoppage
+        ):
+            return cache
+        with self._derived_lock:
+            return self._refresh_derived()
+
+    def _refresh_derived(self) -> _DerivedTimes:
+        gs = self.game_state
+        gs.ensure_timer_lists()
+        # The same transitions that invalidate the cache open and close run segments
+        gs.timeline.sync(gs)
+        lengths = self._get_period_lengths()
+        self._derived_cache = _DerivedTimes(
+            key=self._derived_key(),
+            period_elapsed=list(gs.period_elapsed),
+            period_adjustments=list(gs.period_adjustments),
+            period_stoppage=list(gs.period_stoppage),
+            period_lengths=lengths,
+            period_targets=[
+                length + adj + stop
+                for length, adj, stop in zip(lengths, gs.period_adjustments, gs.period_stoppage)
+            ],
+            closed_elapsed=sum(gs.period_elapsed),
+            total_adjustment=sum(gs.period_adjustments),
+            total_stoppage=sum(gs.period_stoppage),
+        )
+        return self._derived_cache
+
+    def _derived_key(self) -> tuple:
+        gs = self.game_state
+        return (
+            gs.game_length_seconds,
+            gs.period_count,
+            gs.current_period_index,
+            gs.paused,
+            gs.halftime_started,
+            gs.period_start_ts,
+            gs.game_start_ts,
+        )
 
     # ------------------------------------------------------------------
     # Configuration helpers
@@ -135,7 +223,7 @@ class TimerService:
         """Start or resume the game timer."""
 
         self.game_state.ensure_timer_lists()
-        now = now_ts()
+        now = self._now()
 
         if self.game_state.game_start_ts is None:
             self.game_state.game_start_ts = now
@@ -146,16 +234,18 @@ class TimerService:
             self.game_state.period_start_ts = now
 
         self.game_state.paused = False
+        self.game_state.timeline.sync(self.game_state)
 
     def pause_game(self) -> None:
         """Pause the game timer and record elapsed time for the active period."""
 
         if self.game_state.period_start_ts is not None:
             idx = self.game_state.current_period_index
-            self.game_state.period_elapsed[idx] += int(now_ts() - self.game_state.period_start_ts)
+            self.game_state.period_elapsed[idx] += int(self._now() - self.game_state.period_start_ts)
             self.game_state.period_start_ts = None
 
         self.game_state.paused = True
+        self.game_state.timeline.sync(self.game_state)
 
     def resume_game(self) -> None:
         """Resume the game after a pause without resetting the period."""
@@ -166,7 +256,8 @@ class TimerService:
 
         self.game_state.paused = False
         if self.game_state.period_start_ts is None:
-            self.game_state.period_start_ts = now_ts()
+            self.game_state.period_start_ts = self._now()
+        self.game_state.timeline.sync(self.game_state)
 
     def reset_game(self) -> None:
         """Reset all timer state while keeping the roster intact."""
@@ -182,6 +273,7 @@ class TimerService:
         self.game_state.period_elapsed = [0] * self.game_state.period_count
         self.game_state.period_adjustments = [0] * self.game_state.period_count
         self.game_state.period_stoppage = [0] * self.game_state.period_count
+        self.game_state.timeline.clear()
 
     def start_halftime(self) -> None:
         """Begin an interval break (halftime/quarter break)."""
@@ -191,13 +283,14 @@ class TimerService:
 
         if self.game_state.period_start_ts is not None:
             idx = self.game_state.current_period_index
-            self.game_state.period_elapsed[idx] += int(now_ts() - self.game_state.period_start_ts)
+            self.game_state.period_elapsed[idx] += int(self._now() - self.game_state.period_start_ts)
             self.game_state.period_start_ts = None
 
-        current_time = now_ts()
+        current_time = self._now()
         self.game_state.halftime_started = True
         self.game_state.halftime_end_ts = current_time + int(HALFTIME_PAUSE_MIN * 60)
         self.game_state.paused = True
+        self.game_state.timeline.sync(self.game_state)
 
     def end_halftime(self) -> None:
         """End the break period and start the next period if available."""
@@ -212,9 +305,17 @@ class TimerService:
             self.game_state.current_period_index += 1
 
         self.game_state.paused = False
-        self.game_state.period_start_ts = now_ts()
+        self.game_state.period_start_ts = self._now()
+
+        # Attribute the rest of every running stint to the new period
+        for player in self.game_state.roster.values():
+            if player.on_field:
+                player.stint_ledger.split(
+                    self.game_state.period_start_ts, self.game_state.current_period_index
+                )
         if self.game_state.game_start_ts is None:
             self.game_state.game_start_ts = self.game_state.period_start_ts
+        self.game_state.timeline.sync(self.game_state)
 
     # ------------------------------------------------------------------
     # Adjustment APIs
@@ -272,25 +373,22 @@ class TimerService:
     def get_timer_configuration(self) -> Dict[str, object]:
         """Return the current timer configuration for display purposes."""
 
-        self.game_state.ensure_timer_lists()
+        derived = self._derived()
         return {
             "game_length_seconds": self.game_state.game_length_seconds,
             "game_length_minutes": self.game_state.game_length_seconds // 60,
             "period_count": self.game_state.period_count,
-            "period_lengths": self._get_period_lengths(),
-            "total_stoppage_seconds": self._get_total_stoppage_seconds(),
-            "total_adjustment_seconds": sum(
-                self.game_state.period_adjustments[: self.game_state.period_count]
-            ),
+            "period_lengths": list(derived.period_lengths),
+            "total_stoppage_seconds": derived.total_stoppage,
+            "total_adjustment_seconds": derived.total_adjustment,
         }
 
     def get_period_summaries(self) -> List[Dict[str, int]]:
         """Return elapsed/adjustment data for each period."""
 
-        self.game_state.ensure_timer_lists()
         summaries: List[Dict[str, int]] = []
-        period_lengths = self._get_period_lengths()
-        now = now_ts()
+        period_lengths = self._derived().period_lengths
+        now = self._now()
 
         for idx in range(self.game_state.period_count):
             running = 0
@@ -320,11 +418,9 @@ class TimerService:
         if self.game_state.game_start_ts is None:
             return 0
 
-        self.game_state.ensure_timer_lists()
+        derived = self._derived()
         base_elapsed = self._get_base_elapsed_seconds()
-        adjustments = sum(self.game_state.period_adjustments[: self.game_state.period_count])
-        stoppage = self._get_total_stoppage_seconds()
-        return max(0, base_elapsed + adjustments + stoppage)
+        return max(0, base_elapsed + derived.total_adjustment + derived.total_stoppage)
 
     def get_remaining_seconds(self) -> int:
         """Get remaining game time including configured stoppage."""
@@ -332,9 +428,8 @@ class TimerService:
         if self.game_state.game_start_ts is None:
             return self.game_state.game_length_seconds
 
-        self.game_state.ensure_timer_lists()
         total_elapsed = self.get_game_elapsed_seconds()
-        target = self.game_state.game_length_seconds + self._get_total_stoppage_seconds()
+        target = self.game_state.game_length_seconds + self._derived().total_stoppage
         return max(0, target - total_elapsed)
 
     def is_game_over(self) -> bool:
@@ -351,7 +446,7 @@ class TimerService:
     def should_suggest_halftime(self) -> bool:
         """Determine whether a period break should be suggested."""
 
-        self.game_state.ensure_timer_lists()
+        self._derived()
         if self.game_state.halftime_started:
             return False
 
@@ -359,7 +454,7 @@ class TimerService:
             return False
 
         elapsed = self._get_current_period_elapsed_seconds(include_running=True)
-        target = self._get_period_target_seconds(self.game_state.current_period_index)
+        target = self.get_period_target_seconds(self.game_state.current_period_index)
         return elapsed >= target
 
     def get_halftime_remaining_seconds(self) -> Optional[int]:
@@ -368,7 +463,7 @@ class TimerService:
         if not self.game_state.halftime_started or self.game_state.halftime_end_ts is None:
             return None
 
-        remaining = int(self.game_state.halftime_end_ts - now_ts())
+        remaining = int(self.game_state.halftime_end_ts - self._now())
         return max(0, remaining)
 
     def is_halftime_over(self) -> bool:
@@ -377,6 +472,23 @@ class TimerService:
         remaining = self.get_halftime_remaining_seconds()
         return remaining is not None and remaining == 0
 
+    def get_period_target_seconds(self, period_index: int) -> int:
+        """Return a period's length including its adjustments and stoppage."""
+
+        return self._derived().period_targets[period_index]
+
+    def game_seconds_at(self, wall_ts: float) -> float:
+        """Return the played game seconds at a wall-clock timestamp."""
+
+        self._derived()
+        return self.game_state.timeline.game_seconds_at(wall_ts)
+
+    def wall_time_at(self, game_seconds: float) -> Optional[float]:
+        """Return the wall-clock timestamp at which the game clock reached ``game_seconds``."""
+
+        self._derived()
+        return self.game_state.timeline.wall_ts_at(game_seconds)
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
@@ -387,19 +499,15 @@ class TimerService:
             lengths[idx] += 1
         return lengths
 
-    def _get_total_stoppage_seconds(self) -> int:
-        return sum(self.game_state.period_stoppage[: self.game_state.period_count])
-
     def _get_base_elapsed_seconds(self) -> int:
-        self.game_state.ensure_timer_lists()
-        total = sum(self.game_state.period_elapsed[: self.game_state.period_count])
+        total = self._derived().closed_elapsed
         if (
             self.game_state.period_start_ts is not None
             and not self.game_state.paused
         ):
-            total += int(now_ts() - self.game_state.period_start_ts)
+            total += int(self._now() - self.game_state.period_start_ts)
         elif total == 0 and self.game_state.game_start_ts is not None:
-            total = max(0, int(now_ts() - self.game_state.game_start_ts))
+            total = max(0, int(self._now() - self.game_state.game_start_ts))
         return total
 
     def _get_current_period_elapsed_seconds(self, *, include_running: bool) -> int:
@@ -410,12 +518,5 @@ class TimerService:
             and self.game_state.period_start_ts is not None
             and not self.game_state.paused
         ):
-            elapsed += int(now_ts() - self.game_state.period_start_ts)
+            elapsed += int(self._now() - self.game_state.period_start_ts)
         return elapsed
-
-    def _get_period_target_seconds(self, period_index: int) -> int:
-        self.game_state.ensure_timer_lists()
-        lengths = self._get_period_lengths()
-        adj = self.game_state.period_adjustments[period_index]
-        stop = self.game_state.period_stoppage[period_index]
-        return lengths[period_index] + adj + stop
\ No newline at end of file
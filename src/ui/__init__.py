@@ -6,5 +6,12 @@ Tkinter desktop app and Flask web server.
 """
 from .tkinter_app import create_tkinter_app, run_tkinter_app, SidelineApp
 from .web_app import create_app, run_web_app
+from .wsgi_server import (
+    PooledWSGIServer, create_production_server, push_client_limit, serve_production, serve_workers
+)
 
-__all__ = ["create_tkinter_app", "run_tkinter_app", "SidelineApp", "create_app", "run_web_app"]
\ No newline at end of file
+__all__ = [
+    "create_tkinter_app", "run_tkinter_app", "SidelineApp", "create_app", "run_web_app",
+    "PooledWSGIServer", "create_production_server", "push_client_limit", "serve_production",
+    "serve_workers",
+]
\ No newline at end of file
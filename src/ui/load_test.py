@@ -0,0 +1,283 @@
+"""
+HTTP load test for the Soccer Coach Sideline Timekeeper web API.
+
+Emulates a sideline full of tablets against an in-process app: reader
+tablets poll ``/api/state`` while writer tablets make substitutions, toggle
+the timer, add stoppage and assign the formation. Every request goes
+through the Flask test client, so the full routing, locking, journaling and
+serialization stack is measured without opening a socket.
+"""
+import contextlib
+import io
+import os
+import random
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from ..models.formation import FormationType
+from ..services.game_simulator import LatencyStats, summarize_latencies
+from .web_app import create_app, create_game_registry
+
+# Formation template exercised for each supported field size
+FIELD_SIZE_TEMPLATES = {
+    11: FormationType.F_4_4_2,
+    10: FormationType.F_3_3_3,
+    9: FormationType.F_3_2_3,
+}
+LOAD_TEST_FORMATION = "Load Test"
+
+
+@dataclass
+class LoadTestConfig:
+    """
+    Shape of the simulated sideline.
+
+    Attributes:
+        readers: Tablets polling the game state
+        writers: Tablets issuing game writes
+        duration_seconds: Wall-clock length of the run
+        poll_interval_seconds: Pause between state polls (0 polls flat out)
+        write_interval_seconds: Pause between writes (0 writes flat out)
+        roster_size: Players in the squad
+        field_size: Players on the field
+        storage_dir: Directory for journals and formations (a temporary
+            directory by default)
+        seed: Random seed for the write mix
+        quiet: Whether to swallow the app's debug output during the run
+    """
+    readers: int = 8
+    writers: int = 2
+    duration_seconds: float = 10.0
+    poll_interval_seconds: float = 1.0
+    write_interval_seconds: float = 0.5
+    roster_size: int = 16
+    field_size: int = 11
+    storage_dir: Optional[str] = None
+    seed: int = 0
+    quiet: bool = True
+
+
+@dataclass
+class EndpointStats:
+    """Outcome of all requests made to one endpoint."""
+    requests: int
+    errors: int
+    latency: LatencyStats
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.requests if self.requests else 0.0
+
+
+@dataclass
+class LoadTestReport:
+    """Outcome of a load test run."""
+    config: LoadTestConfig
+    wall_seconds: float
+    endpoints: Dict[str, EndpointStats] = field(default_factory=dict)
+
+    @property
+    def total_requests(self) -> int:
+        return sum(stats.requests for stats in self.endpoints.values())
+
+    @property
+    def throughput(self) -> float:
+        """Requests completed per second of wall time."""
+        return self.total_requests / self.wall_seconds if self.wall_seconds else 0.0
+
+    def format_table(self) -> str:
+        """Render the per-endpoint table as plain text."""
+        lines = [
+            f"readers={self.config.readers} writers={self.config.writers} "
+            f"requests={self.total_requests} wall={self.wall_seconds:.2f}s "
+            f"throughput={self.throughput:.1f} req/s",
+            f"{'endpoint':<34}{'reqs':>7}{'err %':>7}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}",
+        ]
+        for name, stats in self.endpoints.items():
+            lines.append(
+                f"{name:<34}{stats.requests:>7}{stats.error_rate * 100:>7.1f}"
+                f"{stats.latency.p50 * 1e3:>9.2f}{stats.latency.p95 * 1e3:>9.2f}"
+                f"{stats.latency.p99 * 1e3:>9.2f}"
+            )
+        return "\n".join(lines)
+
+
+class SidelineLoadTest:
+    """
+    Runs reader and writer tablets against one in-process game.
+
+    Writers share a lineup tracker so the substitutions they send are always
+    legal; any error status in the report therefore points at the server.
+    """
+
+    def __init__(self, config: Optional[LoadTestConfig] = None):
+        self.config = config or LoadTestConfig()
+        if self.config.field_size > self.config.roster_size:
+            raise ValueError("Field size cannot exceed roster size")
+        self._samples: Dict[str, List[Tuple[float, bool]]] = {}
+        self._samples_lock = threading.Lock()
+        self._lineup_lock = threading.Lock()
+        self._random = random.Random(self.config.seed)
+        self._on_field: List[str] = []
+        self._bench: List[str] = []
+        self._paused = False
+        self._formation: Optional[str] = None
+
+    def run(self) -> LoadTestReport:
+        """
+        Set up a game, run every tablet until the deadline and summarize.
+
+        Returns:
+            Throughput, latency percentiles and error rates per endpoint
+        """
+        with self._environment() as storage_dir:
+            app = create_app(registry=create_game_registry(storage_dir))
+            self._set_up_game(app)
+            self._samples.clear()
+
+            deadline = time.perf_counter() + self.config.duration_seconds
+            threads = [
+                threading.Thread(target=self._reader, args=(app, deadline), daemon=True)
+                for _ in range(self.config.readers)
+            ] + [
+                threading.Thread(target=self._writer, args=(app, deadline, idx), daemon=True)
+                for idx in range(self.config.writers)
+            ]
+            started = time.perf_counter()
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            wall_seconds = time.perf_counter() - started
+
+        endpoints = {
+            name: EndpointStats(
+                requests=len(samples),
+                errors=sum(1 for _, failed in samples if failed),
+                latency=summarize_latencies([seconds for seconds, _ in samples]),
+            )
+            for name, samples in sorted(self._samples.items())
+        }
+        return LoadTestReport(config=self.config, wall_seconds=wall_seconds, endpoints=endpoints)
+
+    # ---------- Tablets ---------- #
+
+    def _reader(self, app, deadline: float) -> None:
+        client = app.test_client()
+        while time.perf_counter() < deadline:
+            self._request(client, "GET", "/api/state")
+            self._pause(self.config.poll_interval_seconds, deadline)
+
+    def _writer(self, app, deadline: float, index: int) -> None:
+        client = app.test_client()
+        rng = random.Random(self.config.seed + index + 1)
+        while time.perf_counter() < deadline:
+            roll = rng.random()
+            if roll < 0.5:
+                self._substitute(client, rng)
+            elif roll < 0.7:
+                self._toggle_timer(client)
+            elif roll < 0.8:
+                self._request(client, "POST", "/api/timer/stoppage", json={"seconds": 5})
+            elif self._formation:
+                self._assign_formation(client)
+            self._pause(self.config.write_interval_seconds, deadline)
+
+    def _substitute(self, client, rng: random.Random) -> None:
+        with self._lineup_lock:
+            out_name = rng.choice(self._on_field)
+            in_name = rng.choice(self._bench)
+            status = self._request(
+                client, "POST", "/api/substitution", json={"out_name": out_name, "in_name": in_name}
+            )
+            if status < 400:
+                self._on_field[self._on_field.index(out_name)] = in_name
+                self._bench[self._bench.index(in_name)] = out_name
+
+    def _toggle_timer(self, client) -> None:
+        with self._lineup_lock:
+            path = "/api/timer/start" if self._paused else "/api/timer/pause"
+            if self._request(client, "POST", path, json={}) < 400:
+                self._paused = not self._paused
+
+    def _assign_formation(self, client) -> None:
+        with self._lineup_lock:
+            assignments = {str(idx): name for idx, name in enumerate(self._on_field)}
+        self._request(
+            client,
+            "POST",
+            f"/api/formations/{self._formation}/assign",
+            label="POST /api/formations/<name>/assign",
+            json={"assignments": assignments},
+        )
+
+    # ---------- Helpers ---------- #
+
+    def _set_up_game(self, app) -> None:
+        config = self.config
+        client = app.test_client()
+        names = [f"Player {idx:02d}" for idx in range(config.roster_size)]
+        client.post("/api/roster", json={
+            "players": [{"name": name, "number": str(idx + 1)} for idx, name in enumerate(names)],
+            "field_size": config.field_size,
+        })
+
+        # The API has no lineup endpoint; seed the starters on the session
+        # under the game lock, as a versioned and journalled change
+        entry = app.extensions["game_registry"].get("default")
+        session = entry.session
+        self._on_field = names[: config.field_size]
+        self._bench = names[config.field_size:]
+        with entry.lock:
+            now = session.now()
+            for slot, name in enumerate(self._on_field):
+                session.game_state.roster[name].position = f"P{slot + 1}"
+                session.game_state.roster[name].start_stint(now)
+            session.mark_changed("load_test_seed", self._on_field)
+
+        template = FIELD_SIZE_TEMPLATES.get(config.field_size)
+        if template is not None:
+            response = client.post(
+                "/api/formations/from-template",
+                json={"template_type": template.value, "name": LOAD_TEST_FORMATION},
+            )
+            if response.status_code < 400:
+                self._formation = LOAD_TEST_FORMATION
+        client.post("/api/timer/start", json={})
+
+    def _request(self, client, method: str, path: str, label: Optional[str] = None, **kwargs) -> int:
+        start = time.perf_counter()
+        try:
+            status = client.open(path, method=method, **kwargs).status_code
+        except Exception:
+            status = 599
+        elapsed = time.perf_counter() - start
+        with self._samples_lock:
+            self._samples.setdefault(label or f"{method} {path}", []).append((elapsed, status >= 400))
+        return status
+
+    @staticmethod
+    def _pause(interval: float, deadline: float) -> None:
+        if interval > 0:
+            time.sleep(max(0.0, min(interval, deadline - time.perf_counter())))
+
+    @contextlib.contextmanager
+    def _environment(self) -> Iterator[str]:
+        """
+        Provide the storage directory and run inside it.
+
+        Strategy data is written to the working directory, so the run moves
+        there to keep the project's ``formations.json`` untouched.
+        """
+        with contextlib.ExitStack() as stack:
+            storage_dir = self.config.storage_dir or stack.enter_context(tempfile.TemporaryDirectory())
+            os.makedirs(storage_dir, exist_ok=True)
+            previous_cwd = os.getcwd()
+            os.chdir(storage_dir)
+            stack.callback(os.chdir, previous_cwd)
+            if self.config.quiet:
+                stack.enter_context(contextlib.redirect_stdout(io.StringIO()))
+            yield storage_dir
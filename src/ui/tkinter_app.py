@@ -11,12 +11,12 @@ from datetime import date, datetime
 
 from ..models import GameState, Player, ContactInfo, MedicalInfo, PlayerStats
 from ..models.formation import Formation, FormationType, FieldPosition, Position
-from ..services import AnalyticsService, PersistenceService, TimerService
+from ..services import AnalyticsService, AutosaveEngine, PersistenceService, TimerService
 from ..services.player_service import PlayerService, PlayerValidationError
 from ..services.strategy_service import StrategyService
 from ..utils import (
     fmt_mmss,
-    now_ts,
+    LIVE_CLOCK,
     APP_TITLE,
     POSITIONS,
     POS_SHORT_TO_FULL,
@@ -63,12 +63,18 @@ class SidelineApp(tk.Tk):
         self.title(APP_TITLE)
         self.geometry("1120x680")
         self.state = GameState()
-        self.timer_service = TimerService(self.state)
-        self.analytics_service = AnalyticsService(self.state, self.timer_service)
+        # Monotonic so a device clock change mid-game cannot skew timers
+        self.clock = LIVE_CLOCK
+        self.timer_service = TimerService(self.state, clock=self.clock)
+        self.analytics_service = AnalyticsService(self.state, self.timer_service, clock=self.clock)
         self.player_service = PlayerService()
         self.strategy_service = StrategyService(self.state)
         self.sub_queue: List[Tuple[str, str]] = []  # (out_name, in_name) queued
         self.after_timer = None
+        self.current_frame_name: Optional[str] = None
+        self.autosave = AutosaveEngine(lambda: self.state, clock=self.clock)
+        self.autosave.start()
+        self.protocol("WM_DELETE_WINDOW", self.quit_app)
 
         self._build_menu()
         self._build_routes()
@@ -82,7 +88,7 @@ class SidelineApp(tk.Tk):
         filem.add_command(label="Save Game…", command=self.save_game)
         filem.add_command(label="Load Game…", command=self.load_game)
         filem.add_separator()
-        filem.add_command(label="Quit", command=self.destroy)
+        filem.add_command(label="Quit", command=self.quit_app)
         mbar.add_cascade(label="File", menu=filem)
 
         playerm = tk.Menu(mbar, tearoff=0)
@@ -164,6 +170,7 @@ class SidelineApp(tk.Tk):
 
     def _show_frame(self, frame_name: str):
         frame = self.frames[frame_name]
+        self.current_frame_name = frame_name
         frame.tkraise()
         if hasattr(frame, "on_show"):
             frame.on_show()
@@ -176,12 +183,17 @@ class SidelineApp(tk.Tk):
 
     def _apply_new_roster(self, players: List[Player]):
         self.state = GameState(roster={p.name: p for p in players})
-        self.timer_service = TimerService(self.state)
-        self.analytics_service = AnalyticsService(self.state, self.timer_service)
+        self.timer_service = TimerService(self.state, clock=self.clock)
+        self.analytics_service = AnalyticsService(self.state, self.timer_service, clock=self.clock)
         self.strategy_service = StrategyService(self.state)
         self.sub_queue.clear()
         self.show_home()
 
+    def quit_app(self):
+        """Write any pending autosave, then close the window."""
+        self.autosave.stop(flush=True)
+        self.destroy()
+
     def save_game(self):
         path = filedialog.asksaveasfilename(
             defaultextension=".json",
@@ -192,7 +204,7 @@ class SidelineApp(tk.Tk):
             return
         
         try:
-            PersistenceService.save_game_to_file(self.state, path)
+            PersistenceService.save_game_to_file(self.state, path, current_time=self.clock.now())
             messagebox.showinfo(APP_TITLE, "Game saved.")
         except Exception as e:
             messagebox.showerror(APP_TITLE, f"Failed to save: {e}")
@@ -207,8 +219,8 @@ class SidelineApp(tk.Tk):
         
         try:
             self.state = PersistenceService.load_game_from_file(path)
-            self.timer_service = TimerService(self.state)
-            self.analytics_service = AnalyticsService(self.state, self.timer_service)
+            self.timer_service = TimerService(self.state, clock=self.clock)
+            self.analytics_service = AnalyticsService(self.state, self.timer_service, clock=self.clock)
             self.strategy_service = StrategyService(self.state)
             self.sub_queue.clear()
             self.show_home()
@@ -302,7 +314,7 @@ class SidelineApp(tk.Tk):
         if not self.sub_queue:
             return
 
-        current_time = now_ts()
+        current_time = self.clock.now()
         for out_name, in_name in self.sub_queue:
             p_out = self.state.roster.get(out_name)
             p_in = self.state.roster.get(in_name)
@@ -325,7 +337,7 @@ class SidelineApp(tk.Tk):
             else:
                 # Off-field to on-field replacement
                 p_in.position = out_pos
-                p_in.start_stint(current_time)
+                p_in.start_stint(current_time, self.state.current_period_index)
 
         self.clear_queue()
         self.refresh_tables()
@@ -483,8 +495,13 @@ class SidelineApp(tk.Tk):
         self.after_timer = self.after(1000, self._auto_refresh_tick)  # 1 second
 
     def _auto_refresh_tick(self):
-        """Auto-refresh callback."""
-        self.refresh_tables()
+        """Auto-refresh callback - only the visible view shows the running clock."""
+        frame = self.frames.get(self.current_frame_name) if self.current_frame_name else None
+        if frame is not None and hasattr(frame, "refresh"):
+            frame.refresh()
+        if self.state.is_active():
+            # Coalesced by the engine into at most one write per interval
+            self.autosave.request_save()
         self.start_auto_refresh()  # Schedule next refresh
 
 
@@ -911,7 +928,7 @@ class HomeView(ttk.Frame):
         for item in self.tree.get_children():
             self.tree.delete(item)
             
-        current_time = now_ts()
+        current_time = self.controller.clock.now()
         for player in self.controller.state.roster.values():
             total_time = player.total_seconds + player.current_stint_seconds(current_time)
             status = "ON FIELD" if player.on_field else "BENCH"
@@ -1145,7 +1162,7 @@ class GameView(ttk.Frame):
             self.sub_label.config(text="No substitutions queued")
         
         # Update player tables
-        current_time = now_ts()
+        current_time = self.controller.clock.now()
         
         # Clear existing items
         for item in self.field_tree.get_children():
@@ -6,10 +6,16 @@ and provides JSON API endpoints for the enhanced timer and analytics features.
 """
 import os
 import json
-from typing import Dict, Any, Optional, List
+import itertools
+import time
+from typing import Dict, Any, Iterable, Optional, List, Tuple
 from datetime import date
 
-from flask import Flask, send_from_directory, jsonify, request
+from flask import (
+    Blueprint, Flask, Response, current_app, g, has_app_context, has_request_context,
+    jsonify, request, send_from_directory,
+)
+from werkzeug.local import LocalProxy
 
 from ..models import GameState, Player, ContactInfo, MedicalInfo, PlayerStats, GameAttendance
 from ..models.formation import Formation, FormationType, FieldPosition, Position
@@ -17,7 +23,25 @@ from ..services import AnalyticsService, PersistenceService, TimerService
 from ..services.player_service import PlayerService, PlayerValidationError
 from ..services.strategy_service import StrategyService
 from ..services.formation_validator import FormationValidationService, LineupEdgeCaseHandler
-from ..utils import fmt_mmss, now_ts
+from ..services.event_journal import EventJournal, GameEventType
+from ..services.event_scheduler import GameEventScheduler, ScheduledEvent
+from ..services.game_commands import (
+    AddStoppageCommand, Command, FormationChangeCommand, MacroCommand, PauseGameCommand,
+    StartGameCommand, SubstitutePlayerCommand,
+)
+from ..services.replan_worker import ReplanJob, ReplanStatus, ReplanWorkerPool
+from ..services.response_cache import ResponseCache, encode_json, join_objects
+from ..services.rotation_planner import RotationConfig
+from ..services.game_registry import DEFAULT_GAME_ID, GameNotFoundError, GameRegistry, is_valid_game_id
+from ..services.season_archive import SeasonArchive
+from ..services.state_notifier import PushClientLimit, StateNotifier
+from ..services.state_store import GameStateStore, InMemoryStateStore, SQLiteStateStore, StaleStateError
+from ..services.state_tracker import StateChangeTracker
+from ..utils import LIVE_CLOCK, Clock, ReaderWriterLock, fmt_mmss
+from .wsgi_server import DEFAULT_SERVER_THREADS, push_client_limit, serve_production, serve_workers
+
+# Identities of game instances in the response cache; a game id can be reused
+_CACHE_KEYS = itertools.count(1)
 
 
 class WebAppState:
@@ -27,58 +51,588 @@ class WebAppState:
     Uses dependency injection and service factory following SOLID principles.
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        game_state: Optional[GameState] = None,
+        journal: Optional[EventJournal] = None,
+        clock: Optional[Clock] = None,
+        store: Optional[GameStateStore] = None,
+        game_id: str = DEFAULT_GAME_ID,
+    ):
         from ..services.service_factory import ServiceFactory
         from ..services.strategy_service import StrategyService
         from ..services.game_commands import GameCommandManager
         
-        self.game_state = GameState()
+        self.game_state = game_state or GameState()
         # Ensure timer lists are properly initialized
         self.game_state.ensure_timer_lists()
-        self.service_factory = ServiceFactory()
+        # Live play reads a monotonic clock so wall-clock jumps cannot skew timers
+        self.clock = clock or LIVE_CLOCK
+        self.service_factory = ServiceFactory(self.clock)
         
         # Create services using factory with proper dependency injection
         services = self.service_factory.create_complete_service_suite(self.game_state)
         self.timer_service = services['timer']
         self.analytics_service = services['analytics']
+        self.assignment_service = services['assignment']
         self.player_service = services['player']
         self.persistence_service = services['persistence']
         
         # Additional services not in factory yet
         self.strategy_service = StrategyService(self.game_state)
-        self.command_manager = GameCommandManager()
+        self.command_manager = GameCommandManager(game_state=self.game_state)
         
         # Formation validation service for edge case handling
-        self.formation_validator = FormationValidationService(
-            self.game_state.roster,
-            self.strategy_service._formations
+        self._create_formation_validator()
+        self.change_tracker = StateChangeTracker(self.game_state)
+        self.notifier = StateNotifier(self.game_state.state_version)
+        self.journal = journal
+        # Where the game is kept between requests; a shared store lets other
+        # worker processes serve the same game
+        self.store: GameStateStore = store or InMemoryStateStore()
+        self.game_id = game_id
+        # Identity of this game in the response cache, unique per process
+        self.cache_key = next(_CACHE_KEYS)
+        # Stored version the in-memory game matches (None until it is stored)
+        self.stored_version: Optional[int] = (
+            self.game_state.state_version if self.store.version(game_id) is not None else None
         )
-        self.lineup_edge_handler = LineupEdgeCaseHandler(self.formation_validator)
+        # State version at which the game was stored in the season archive
+        self.archived_version: Optional[int] = None
+        # Game lock, shared with the registry so scheduled events fire safely;
+        # reads share it, writes and background timers take it exclusively
+        self.lock = ReaderWriterLock()
+        # Re-plan request repeated after every substitution, if enabled
+        self.auto_replan: Optional[Dict[str, Any]] = None
+        self._replan_target: Optional[Tuple[ReplanWorkerPool, str]] = None
+        self._create_scheduler()
         
+    def now(self) -> float:
+        """Get the current timestamp from the game's clock."""
+        return self.clock.now()
+
+    def clock_second(self) -> Optional[int]:
+        """
+        Whole second of the running clock, for caching time-dependent payloads.
+        
+        Returns:
+            The current second while the game clock runs, None while it is
+            stopped (nothing then changes between state versions)
+        """
+        if self.game_state.game_start_ts is None or self.game_state.paused:
+            return None
+        return int(self.now())
+
     def reset_services(self):
         """Reset all services after state change using clean architecture."""
         services = self.service_factory.create_complete_service_suite(self.game_state)
         self.timer_service = services['timer']
         self.analytics_service = services['analytics']
+        self.assignment_service = services['assignment']
         self.strategy_service = StrategyService(self.game_state)
+        self._create_formation_validator()
+        if hasattr(self, "scheduler"):
+            self.scheduler.timer_service = self.timer_service
+            self.scheduler.resync()
         # Keep command history across resets for consistency
 
+    def _create_scheduler(self) -> None:
+        """Start firing period-end, break-end and planned events for this game."""
+        self.scheduler = GameEventScheduler(
+            self.timer_service, listener=self._scheduled_event, lock=self.lock
+        )
+        self.scheduler.resync()
+        self.scheduler.start()
+
+    def _scheduled_event(self, event: ScheduledEvent) -> None:
+        """Push a fired scheduler event to clients as a state change."""
+        try:
+            self.mark_changed(f"scheduled_{event.kind.value}", **event.data)
+        except StaleStateError:
+            # Another worker's scheduler announced the same event first
+            pass
+
+    def _create_formation_validator(self) -> None:
+        """Bind formation validation to the current roster and formations."""
+        self.formation_validator = FormationValidationService(
+            self.game_state.roster,
+            self.strategy_service._formations
+        )
+        self.lineup_edge_handler = LineupEdgeCaseHandler(self.formation_validator)
+
+    def replace_game_state(self, game_state: GameState) -> None:
+        """
+        Swap in a new game state while keeping the state version monotonic.
+        
+        Args:
+            game_state: Replacement game state (e.g. a new roster or a load)
+        """
+        game_state.state_version = max(game_state.state_version, self.game_state.state_version)
+        self.game_state = game_state
+        self.archived_version = None
+        self.scheduler.stop()
+        self.reset_services()
+        # Undo history travels with the game it belongs to
+        self.command_manager.bind(game_state)
+        # Events planned for the previous game do not carry over
+        self._create_scheduler()
+
+    def mark_changed(
+        self, cause: str = "state", touched_players: Iterable[str] = (), **event_data: Any
+    ) -> int:
+        """
+        Bump the state version, record which entries changed, append the
+        change to the event journal and notify clients waiting on the push
+        channels.
+        
+        Args:
+            cause: Short name of what changed (usually the API endpoint)
+            touched_players: Players edited in ways the change tracker does
+                not compare (contact details, statistics, skills)
+            **event_data: Extra descriptive payload for the journal event
+        
+        Returns:
+            The new state version
+        """
+        version = self.game_state.bump_version()
+        self.change_tracker.record(self.game_state)
+        players, removed_players = self._changed_players(version, touched_players)
+        if self.store.shared:
+            self._store_change(version, players, removed_players)
+        if self.journal is not None:
+            self._journal_change(cause, version, players, removed_players, event_data)
+        self.notifier.publish(version, cause, **event_data)
+        return version
+
+    def is_stale(self) -> bool:
+        """Whether another worker has stored a newer version of the game."""
+        return self.store.shared and self.store.version(self.game_id) != self.stored_version
+
+    def refresh(self) -> bool:
+        """
+        Load the changes other workers stored since this worker last saw the game.
+        
+        The caller must hold the game lock exclusively. Only the players
+        written since the in-memory version are read from the store.
+        
+        Returns:
+            True if a newer version was loaded
+        """
+        if not self.is_stale():
+            return False
+        in_sync = self.stored_version == self.game_state.state_version
+        loaded = self.store.load(self.game_id, base=self.game_state if in_sync else None)
+        if loaded is None:
+            return False
+        version = loaded.state_version
+        self.replace_game_state(loaded)
+        # The store is authoritative; its version is what the next save expects
+        self.game_state.state_version = self.stored_version = version
+        self.change_tracker.record(self.game_state)
+        self.notifier.publish(version, "refreshed")
+        return True
+
+    def _store_change(self, version: int, players: List[str], removed_players: List[str]) -> None:
+        """
+        Save the changed rows to the shared store.
+        
+        Raises:
+            StaleStateError: If another worker saved the game first; the
+                game has been reloaded from the store and the change is lost
+        """
+        try:
+            self.store.save(
+                self.game_id,
+                self.game_state,
+                self.stored_version,
+                # A first save, or one following a lost change, writes every row
+                players=players if self.stored_version == version - 1 else None,
+                removed_players=removed_players,
+            )
+        except StaleStateError:
+            self.stored_version = None
+            self.refresh()
+            raise
+        self.stored_version = version
+
+    def _changed_players(
+        self, version: int, touched_players: Iterable[str]
+    ) -> Tuple[List[str], List[str]]:
+        """Players changed and removed by the change that produced ``version``."""
+        delta = self.change_tracker.changes_since(version - 1, version)
+        if delta is None:
+            players, removed_players = set(self.game_state.roster), []
+        else:
+            players, removed_players = set(delta.players), delta.removed_players
+        players.update(touched_players)
+        return sorted(players), removed_players
+
+    def request_replan(self, pool: ReplanWorkerPool, key: str, data: Dict[str, Any]) -> ReplanJob:
+        """
+        Re-plan the rotation in the background.
+        
+        The plan is stored and clients are notified when the job finishes;
+        the caller never waits for the planner.
+        
+        Args:
+            pool: Worker pool running the planner
+            key: Game id the request belongs to
+            data: Rotation request fields (see :func:`parse_rotation_request`)
+        
+        Returns:
+            The pending job
+        """
+        name, config, player_names = parse_rotation_request(data)
+        self._replan_target = (pool, key)
+        return self.strategy_service.request_rotation_replan(
+            pool, key, self.timer_service, name=name, config=config,
+            player_names=player_names, callback=self._replan_finished
+        )
+
+    def _replan_finished(self, job: ReplanJob) -> None:
+        """Store a finished re-plan and push it to clients."""
+        with self.lock:
+            if job.status is ReplanStatus.DONE:
+                self.strategy_service.adopt_rotation_plan(job.result)
+            try:
+                self.mark_changed("rotation_replanned", job_id=job.job_id, status=job.status.value)
+            except StaleStateError:
+                # The game moved on in another worker, which reloaded it; drop the plan
+                pass
+
+    def close(self) -> None:
+        """Stop background work, release push clients, then snapshot and close the event journal."""
+        self.scheduler.stop()
+        self.notifier.close()
+        if self._replan_target is not None:
+            pool, key = self._replan_target
+            pool.cancel(key)
+        if self.journal is None:
+            return
+        if self.journal.events_since_snapshot:
+            self.journal.write_snapshot(self.game_state)
+        self.journal.close()
+
+    def _journal_change(
+        self,
+        cause: str,
+        version: int,
+        players: List[str],
+        removed_players: List[str],
+        event_data: Dict[str, Any],
+    ) -> None:
+        self.journal.record(
+            self.game_state,
+            JOURNAL_EVENT_TYPES.get(cause, GameEventType.UPDATE),
+            players=players,
+            removed_players=removed_players,
+            **event_data,
+        )
+
+    def build_clock_data(self) -> Dict[str, Any]:
+        """
+        Build the small clock-sync payload clients use to run the clock locally.
+        
+        Returns:
+            Dictionary with version, server time and timer position
+        """
+        period_number, in_break = self.timer_service.get_half_info()
+        return {
+            "version": self.game_state.state_version,
+            "server_ts": self.now(),
+            "game_started": self.game_state.game_start_ts is not None,
+            "paused": self.game_state.paused,
+            "elapsed_seconds": self.timer_service.get_game_elapsed_seconds(),
+            "remaining_seconds": self.timer_service.get_remaining_seconds(),
+            "period_number": period_number,
+            "in_break": in_break,
+            "halftime_remaining_seconds": self.timer_service.get_halftime_remaining_seconds(),
+        }
+
+
+# Journal event type recorded for each mutating API endpoint
+JOURNAL_EVENT_TYPES = {
+    "start_timer": GameEventType.START,
+    "pause_timer": GameEventType.PAUSE,
+    "start_halftime": GameEventType.HALFTIME,
+    "add_stoppage_time": GameEventType.STOPPAGE,
+    "add_time_adjustment": GameEventType.ADJUSTMENT,
+    "configure_timer": GameEventType.CONFIGURE,
+    "make_substitution": GameEventType.SUBSTITUTION,
+    "assign_players_to_formation": GameEventType.FORMATION_CHANGE,
+    "update_roster": GameEventType.ROSTER,
+    "import_players": GameEventType.ROSTER,
+    "load_game": GameEventType.LOAD,
+    "undo_action": GameEventType.UNDO,
+    "redo_action": GameEventType.REDO,
+    "execute_batch": GameEventType.BATCH,
+}
+
+
+def parse_rotation_request(data: Dict[str, Any]) -> Tuple[str, RotationConfig, Optional[List[str]]]:
+    """
+    Read a rotation planning request body.
+    
+    Args:
+        data: Request JSON with optional ``name``, ``max_windows``,
+            ``goalkeeper_changes_at_breaks_only``, ``time_budget_ms`` and
+            ``players``
+    
+    Returns:
+        Plan name, planner config and available players (None for all)
+    """
+    config = RotationConfig()
+    if "max_windows" in data:
+        config.max_windows = int(data["max_windows"])
+    if "goalkeeper_changes_at_breaks_only" in data:
+        config.goalkeeper_changes_at_breaks_only = bool(data["goalkeeper_changes_at_breaks_only"])
+    if "time_budget_ms" in data:
+        config.time_budget_seconds = min(float(data["time_budget_ms"]), 1000.0) / 1000
+    return data.get("name") or "Rotation Plan", config, data.get("players")
+
+
+def parse_batch_actions(
+    game_state: GameState, strategy_service: StrategyService, actions: List[Dict[str, Any]]
+) -> List[Command]:
+    """
+    Turn the actions of a batch request into commands.
+    
+    Supported actions (``type`` field):
+        ``substitution``: ``out_name`` and ``in_name``
+        ``formation``: saved formation ``name`` with optional
+            ``assignments`` of slot index to player name
+        ``start`` / ``pause``: timer actions
+        ``stoppage``: ``seconds`` and optional ``period_index``
+    
+    Only the request itself is checked here; whether each action fits the
+    game (e.g. the player is on the field) is checked when it executes.
+    
+    Args:
+        game_state: Game the commands will act on
+        strategy_service: Source of saved formations
+        actions: Action objects in execution order
+    
+    Returns:
+        One command per action
+    
+    Raises:
+        ValueError: If an action is malformed or refers to unknown players or formations
+    """
+    if not isinstance(actions, list) or not actions:
+        raise ValueError("actions must be a non-empty list")
+    
+    commands: List[Command] = []
+    for idx, action in enumerate(actions):
+        kind = action.get("type") if isinstance(action, dict) else None
+        if kind == "substitution":
+            out_name, in_name = action.get("out_name"), action.get("in_name")
+            if not out_name or not in_name:
+                raise ValueError(f"Action {idx}: both out_name and in_name required")
+            unknown = [name for name in (out_name, in_name) if name not in game_state.roster]
+            if unknown:
+                raise ValueError(f"Action {idx}: player not found: {', '.join(unknown)}")
+            commands.append(SubstitutePlayerCommand(game_state, out_name, in_name))
+        elif kind == "formation":
+            saved = strategy_service.get_formation(action.get("name", ""))
+            if saved is None:
+                raise ValueError(f"Action {idx}: formation not found: {action.get('name')}")
+            # Work on a copy so a rejected batch leaves the saved formation alone
+            formation = Formation.from_dict(saved.to_dict())
+            assignments = action.get("assignments")
+            if assignments is not None and not isinstance(assignments, dict):
+                raise ValueError(f"Action {idx}: assignments must map position indexes to players")
+            if assignments:
+                slots = {int(slot): name for slot, name in assignments.items() if name}
+                if any(not 0 <= slot < len(formation.positions) for slot in slots):
+                    raise ValueError(f"Action {idx}: invalid position index")
+                if any(name not in game_state.roster for name in slots.values()):
+                    raise ValueError(f"Action {idx}: player not found in roster")
+                if len(set(slots.values())) != len(slots):
+                    raise ValueError(f"Action {idx}: a player is assigned to several positions")
+                formation = strategy_service.assign_players_to_formation(formation, slots)
+            commands.append(FormationChangeCommand(game_state, formation))
+        elif kind == "start":
+            commands.append(StartGameCommand(game_state))
+        elif kind == "pause":
+            commands.append(PauseGameCommand(game_state))
+        elif kind == "stoppage":
+            commands.append(AddStoppageCommand(
+                game_state, int(action.get("seconds", 0)), action.get("period_index")
+            ))
+        else:
+            raise ValueError(f"Action {idx}: unknown action type {kind!r}")
+    return commands
+
+
+# Shared state database, in a subdirectory of the registry's storage directory
+STATE_DB_FILENAME = "games.sqlite3"
+
+
+def _create_web_app_state(game_id: str, game_state: Optional[GameState]) -> WebAppState:
+    """Session factory used by the game registry."""
+    return WebAppState(game_state, game_id=game_id)
+
 
-# Global state instance
-app_state = WebAppState()
+def create_game_registry(
+    storage_dir: Optional[str] = None, journal: bool = True, backend: Optional[str] = None
+) -> GameRegistry:
+    """
+    Create a game registry holding one :class:`WebAppState` per game.
+
+    The ``memory`` backend keeps each game in this process. With journaling
+    enabled every mutation is appended to the game's event journal in the
+    storage directory, and games are recovered from it first (falling back
+    to an evicted JSON save).
+
+    The ``sqlite`` backend keeps every game in a shared SQLite database so
+    several worker processes can serve the same games. The database records
+    each change, so no per-process journal is written.
+
+    Args:
+        storage_dir: Directory for evicted games (defaults to SIDELINE_DATA_DIR
+            or ``game_data``)
+        journal: Whether to record game events for crash recovery
+        backend: ``memory`` or ``sqlite`` (defaults to SIDELINE_STATE_BACKEND
+            or ``memory``)
+
+    Returns:
+        Configured GameRegistry instance
+    """
+    if storage_dir is None:
+        storage_dir = os.environ.get("SIDELINE_DATA_DIR", "game_data")
+    backend = backend or os.environ.get("SIDELINE_STATE_BACKEND", "memory")
+    if backend == "sqlite":
+        store = SQLiteStateStore(os.path.join(storage_dir, "state", STATE_DB_FILENAME))
+
+        def create_shared_session(game_id: str, game_state: Optional[GameState]) -> WebAppState:
+            return WebAppState(game_state, store=store, game_id=game_id)
+
+        return GameRegistry(create_shared_session, storage_dir=storage_dir, store=store)
+    if backend != "memory":
+        raise ValueError(f"Unknown state backend: {backend!r} (expected 'memory' or 'sqlite')")
+    if not journal:
+        return GameRegistry(_create_web_app_state, storage_dir=storage_dir)
+
+    def create_session(game_id: str, game_state: Optional[GameState]) -> WebAppState:
+        return WebAppState(
+            game_state, journal=EventJournal.for_game(storage_dir, game_id), game_id=game_id
+        )
+
+    def load_state(game_id: str) -> Optional[GameState]:
+        recovered = EventJournal.for_game(storage_dir, game_id).recover()
+        if recovered is not None:
+            return recovered
+        path = os.path.join(storage_dir, f"{game_id}.json")
+        return PersistenceService.load_game_from_file(path) if os.path.exists(path) else None
+
+    return GameRegistry(create_session, storage_dir=storage_dir, state_loader=load_state)
+
+
+def create_season_archive(storage_dir: Optional[str]) -> Optional[SeasonArchive]:
+    """
+    Open the season archive kept next to the stored games.
+
+    Args:
+        storage_dir: Registry storage directory (archiving is disabled when None)
+
+    Returns:
+        SeasonArchive at ``<storage_dir>/archive/season.sqlite3``, or None
+    """
+    if not storage_dir:
+        return None
+    return SeasonArchive(os.path.join(storage_dir, "archive", "season.sqlite3"))
+
+
+# Request methods that may mutate a game, and POST endpoints that never do
+MUTATING_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+READ_ONLY_ENDPOINTS = frozenset({
+    "save_game",
+    "archive_game",
+    "get_position_recommendations",
+    "suggest_formation",
+    "schedule_substitution_plan",
+    "optimize_formation_assignment",
+    "request_rotation_replan",
+})
+
+# Endpoints after which an enabled automatic re-plan is requested again
+REPLAN_TRIGGER_ENDPOINTS = frozenset({"make_substitution", "execute_batch"})
+
+# Push endpoints wait on the notifier and must not hold the game lock
+UNLOCKED_ENDPOINTS = frozenset({"stream_state", "wait_for_state"})
+# Reads that update the scheduler's queue need the game lock exclusively
+EXCLUSIVE_READ_ENDPOINTS = frozenset({"get_schedule"})
+CLOCK_SYNC_INTERVAL_SECONDS = 15
+MAX_LONG_POLL_SECONDS = 60
+# Streams end after this long so their server thread is recycled; the
+# client's EventSource reconnects after STREAM_RETRY_MILLISECONDS
+STREAM_LIFETIME_SECONDS = 300
+STREAM_RETRY_MILLISECONDS = 2000
+# How often waiting push channels check a shared store for other workers' writes
+SHARED_STORE_POLL_SECONDS = 1.0
+
+# Registry used when no application-specific registry is configured
+default_registry = create_game_registry()
+# Worker pool used when no application-specific pool is configured
+default_replan_pool = ReplanWorkerPool()
+
+
+def _get_registry() -> GameRegistry:
+    if has_app_context():
+        return current_app.extensions.get("game_registry", default_registry)
+    return default_registry
 
 
-def create_app(static_folder: str = ".") -> Flask:
+def _current_app_state() -> WebAppState:
+    """Resolve the game state holder for the game addressed by the request."""
+    if has_request_context() and "game_entry" in g:
+        return g.game_entry.session
+    return _get_registry().get(DEFAULT_GAME_ID).session
+
+
+# Proxy to the active game's state; the default game outside of /api/games/<id>
+app_state = LocalProxy(_current_app_state)
+
+
+def create_app(
+    static_folder: str = ".",
+    registry: Optional[GameRegistry] = None,
+    archive: Optional[SeasonArchive] = None,
+    replan_pool: Optional[ReplanWorkerPool] = None,
+    response_cache: Optional[ResponseCache] = None,
+    max_push_clients: Optional[int] = None,
+) -> Flask:
     """
     Create and configure the Flask application with API endpoints.
     
+    Every game endpoint is served twice: under ``/api/...`` for the default
+    game and under ``/api/games/<game_id>/...`` for any other game.
+    
     Args:
         static_folder: Directory to serve static files from
+        registry: Optional game registry (defaults to the module registry)
+        archive: Optional season archive (defaults to one in the registry's
+            storage directory)
+        replan_pool: Optional worker pool for background rotation planning
+            (defaults to the module pool)
+        response_cache: Optional cache of encoded poll responses shared by
+            every game the app serves (defaults to a new one)
+        max_push_clients: Most streams and long-polls open at once; keep it
+            below the server's thread count (None for no bound, as under the
+            development server's thread per connection)
         
     Returns:
         Configured Flask application instance
     """
     app = Flask(__name__, static_folder=static_folder, static_url_path="")
+    registry = registry or default_registry
+    app.extensions["game_registry"] = registry
+    app.extensions["season_archive"] = archive or create_season_archive(registry.storage_dir)
+    app.extensions["replan_pool"] = replan_pool or default_replan_pool
+    # An empty cache is falsy, so test for None explicitly
+    app.extensions["response_cache"] = ResponseCache() if response_cache is None else response_cache
+    app.extensions["push_clients"] = PushClientLimit(max_push_clients)
+    api = Blueprint("api", __name__)
 
     @app.route("/")
     def index():
@@ -101,36 +655,266 @@ def create_app(static_folder: str = ".") -> Flask:
         response.headers['Expires'] = '0'
         return response
 
+    # ==================== Game Registry ==================== #
+
+    @api.url_value_preprocessor
+    def pull_game_id(endpoint, values):
+        """Strip the game id from the URL so handlers stay game-agnostic."""
+        g.game_id = (values or {}).pop("game_id", DEFAULT_GAME_ID)
+
+    @api.before_request
+    def acquire_game():
+        """
+        Resolve the addressed game and hold its lock for the request.
+
+        Reads share the game lock so concurrent polls do not queue behind
+        each other; writes hold it exclusively. With a shared state store the
+        game is first brought up to date with changes from other workers.
+        Only the default game is created on first use; any other game must
+        be created through ``POST /api/games``.
+        """
+        try:
+            entry = _get_registry().get(g.game_id, create=g.game_id == DEFAULT_GAME_ID)
+        except ValueError as e:
+            return jsonify({"success": False, "error": str(e)}), 400
+        except GameNotFoundError:
+            return jsonify({"success": False, "error": f"Game '{g.game_id}' not found"}), 404
+        g.game_entry = entry
+        endpoint = (request.endpoint or "").rsplit(".", 1)[-1]
+        if endpoint in UNLOCKED_ENDPOINTS:
+            return
+        session = entry.session
+        if (
+            request.method not in MUTATING_METHODS
+            and endpoint not in EXCLUSIVE_READ_ENDPOINTS
+            and hasattr(entry.lock, "acquire_read")
+        ):
+            if session.is_stale():
+                with entry.lock:
+                    session.refresh()
+            entry.lock.acquire_read()
+            g.game_locked = "read"
+        else:
+            entry.lock.acquire()
+            g.game_locked = "write"
+            session.refresh()
+
+    @api.after_request
+    def bump_state_version(response):
+        """Advance the state version after every successful mutating request."""
+        endpoint = (request.endpoint or "").rsplit(".", 1)[-1]
+        if (
+            request.method in MUTATING_METHODS
+            and response.status_code < 400
+            and endpoint not in READ_ONLY_ENDPOINTS
+            and "game_entry" in g
+        ):
+            view_args = request.view_args or {}
+            touched_players = [view_args["player_name"]] if "player_name" in view_args else []
+            try:
+                version = app_state.mark_changed(endpoint, touched_players, **g.pop("event_data", {}))
+            except StaleStateError as e:
+                # Another worker changed the game mid-request; it has been reloaded
+                conflict = jsonify({"success": False, "error": str(e), "retry": True})
+                conflict.status_code = 409
+                conflict.headers["X-State-Version"] = str(app_state.game_state.state_version)
+                return conflict
+            # Any write may move the clock or its targets; re-key the deadlines
+            app_state.scheduler.resync()
+            if endpoint in REPLAN_TRIGGER_ENDPOINTS and app_state.auto_replan is not None:
+                app_state.request_replan(
+                    current_app.extensions["replan_pool"], g.game_id, app_state.auto_replan
+                )
+            response.headers["X-State-Version"] = str(version)
+            if _is_full_time():
+                try:
+                    _archive_current_game()
+                except Exception:
+                    # Archiving must never fail the request that ended the game
+                    current_app.logger.exception("Failed to archive game %s", g.game_id)
+        return response
+
+    def _is_full_time() -> bool:
+        game_state = app_state.game_state
+        return (
+            current_app.extensions.get("season_archive") is not None
+            and app_state.archived_version is None
+            and game_state.is_active()
+            and game_state.paused
+            and app_state.timer_service.is_game_over()
+        )
+
+    def _archive_current_game(opponent: str = "", played_on: Optional[date] = None) -> int:
+        """Store the addressed game, with its full event history, in the season archive."""
+        archive = current_app.extensions["season_archive"]
+        events = app_state.journal.read_history() if app_state.journal is not None else ()
+        archive_id = archive.ingest_game(
+            app_state.game_state,
+            g.game_id,
+            played_on=played_on,
+            opponent=opponent,
+            events=events,
+            current_time=app_state.now(),
+        )
+        app_state.archived_version = app_state.game_state.state_version
+        return archive_id
+
+    @api.teardown_request
+    def release_game(exc=None):
+        """Release the per-game lock taken in :func:`acquire_game`."""
+        entry = g.pop("game_entry", None)
+        mode = g.pop("game_locked", None)
+        if entry is None or mode is None:
+            return
+        if mode == "read":
+            entry.lock.release_read()
+        else:
+            entry.lock.release()
+
+    @app.route("/api/games", methods=["GET"])
+    def list_games():
+        """List every game known to this server."""
+        try:
+            return jsonify({"success": True, "games": _get_registry().list_games()})
+        except Exception as e:
+            return jsonify({"success": False, "error": str(e)}), 500
+
+    @app.route("/api/games", methods=["POST"])
+    def create_game():
+        """Create a new game with the given id."""
+        try:
+            data = request.get_json(silent=True) or {}
+            game_id = str(data.get("game_id", "")).strip()
+            if not is_valid_game_id(game_id):
+                return jsonify({
+                    "success": False,
+                    "error": "game_id must be 1-64 letters, digits, '-' or '_'"
+                }), 400
+
+            registry = _get_registry()
+            if registry.exists(game_id):
+                return jsonify({"success": False, "error": f"Game '{game_id}' already exists"}), 409
+
+            registry.get(game_id)
+            return jsonify({"success": True, "game_id": game_id}), 201
+        except Exception as e:
+            return jsonify({"success": False, "error": str(e)}), 500
+
+    @app.route("/api/games/<game_id>", methods=["DELETE"])
+    def delete_game(game_id: str):
+        """Remove a game from memory and storage."""
+        try:
+            if not _get_registry().remove(game_id):
+                return jsonify({"success": False, "error": "Game not found"}), 404
+            return jsonify({"success": True, "message": f"Game '{game_id}' deleted"})
+        except Exception as e:
+            return jsonify({"success": False, "error": str(e)}), 500
+
+    # ==================== Season Archive ==================== #
+
+    def _season_archive() -> Optional[SeasonArchive]:
+        return current_app.extensions.get("season_archive")
+
+    @api.route("/archive", methods=["POST"])
+    def archive_game():
+        """Store the game in the season archive now (e.g. a game ended early)."""
+        try:
+            if _season_archive() is None:
+                return jsonify({"success": False, "error": "Season archive is not configured"}), 503
+            data = request.get_json(silent=True) or {}
+            played_on = date.fromisoformat(data["played_on"]) if data.get("played_on") else None
+            archive_id = _archive_current_game(str(data.get("opponent", "")), played_on)
+            return jsonify({"success": True, "archive_id": archive_id})
+        except ValueError as e:
+            return jsonify({"success": False, "error": str(e)}), 400
+        except Exception as e:
+            return jsonify({"success": False, "error": str(e)}), 500
+
+    @app.route("/api/season/games", methods=["GET"])
+    def list_archived_games():
+        """List archived games, optionally filtered by opponent."""
+        archive = _season_archive()
+        if archive is None:
+            return jsonify({"success": False, "error": "Season archive is not configured"}), 503
+        limit = request.args.get("limit", type=int)
+        games = archive.list_games(limit=limit, opponent=request.args.get("opponent"))
+        return jsonify({"success": True, "games": games})
+
+    @app.route("/api/season/minutes", methods=["GET"])
+    def get_season_minutes():
+        """Minutes per player over the last N archived games."""
+        archive = _season_archive()
+        if archive is None:
+            return jsonify({"success": False, "error": "Season archive is not configured"}), 503
+        last_games = request.args.get("last", type=int)
+        return jsonify({"success": True, "players": archive.minutes_per_player(last_games)})
+
+    @app.route("/api/season/players/<player_name>", methods=["GET"])
+    def get_season_player_history(player_name: str):
+        """Per-game playing time of one player."""
+        archive = _season_archive()
+        if archive is None:
+            return jsonify({"success": False, "error": "Season archive is not configured"}), 503
+        limit = request.args.get("limit", type=int)
+        return jsonify({"success": True, "games": archive.player_history(player_name, limit)})
+
     # ==================== API Endpoints ==================== #
 
-    def _build_timer_data(config: dict) -> dict:
-        """Build timer information following SRP."""
-        elapsed_seconds = app_state.timer_service.get_game_elapsed_seconds()
-        remaining_seconds = app_state.timer_service.get_remaining_seconds()
-        period_number, in_break = app_state.timer_service.get_half_info()
+    def _cached_body(section: str, build, variant: Any = None) -> bytes:
+        """
+        Encoded payload of the addressed game at its current state version.
         
+        Args:
+            section: Endpoint, or part of one, being cached
+            build: Returns the payload to encode when it is not cached
+            variant: Anything else the payload depends on
+        """
+        return current_app.extensions["response_cache"].get(
+            app_state.cache_key, section, app_state.game_state.state_version, build, variant
+        )
+
+    def _json_body(body: bytes) -> Response:
+        """Wrap already encoded JSON in a response."""
+        return current_app.response_class(body, mimetype="application/json")
+
+    def _build_timer_data() -> dict:
+        """Build the timer information that only changes with the state version."""
+        config = app_state.timer_service.get_timer_configuration()
         return {
             "game_started": app_state.game_state.game_start_ts is not None,
             "paused": app_state.game_state.paused,
-            "elapsed_seconds": elapsed_seconds,
-            "remaining_seconds": remaining_seconds,
             "target_seconds": config["game_length_seconds"] + config["total_stoppage_seconds"],
-            "period_number": period_number,
             "period_count": config["period_count"],
-            "in_break": in_break,
             "total_stoppage_seconds": config["total_stoppage_seconds"],
             "total_adjustment_seconds": config["total_adjustment_seconds"],
             "field_size": app_state.game_state.field_size,
         }
+
+    def _build_clock_fields() -> dict:
+        """Build the timer information that moves with the running clock."""
+        period_number, in_break = app_state.timer_service.get_half_info()
+        return {
+            "elapsed_seconds": app_state.timer_service.get_game_elapsed_seconds(),
+            "remaining_seconds": app_state.timer_service.get_remaining_seconds(),
+            "period_number": period_number,
+            "in_break": in_break,
+        }
     
-    def _build_player_data(report) -> List[dict]:
+    def _build_player_data(report, names: Optional[List[str]] = None) -> List[dict]:
         """Build player information following SRP."""
         players_data = []
-        current_time = now_ts()
+        current_time = app_state.now()
+        summaries = {summary.name: summary for summary in report.players}
+        roster = app_state.game_state.roster
+        if names is None:
+            names = list(roster)
         
-        for name, player in app_state.game_state.roster.items():
+        for name in names:
+            player = roster.get(name)
+            if player is None:
+                continue
             total_seconds = player.total_seconds + player.current_stint_seconds(current_time)
-            player_summary = next((p for p in report.players if p.name == name), None)
+            player_summary = summaries.get(name)
             
             players_data.append({
                 "name": player.name,
@@ -162,25 +946,210 @@ def create_app(static_folder: str = ".") -> Flask:
             "max_seconds": report.max_seconds,
         }
 
-    @app.route("/api/state", methods=["GET"])
+    @api.route("/state", methods=["GET"])
     def get_state():
-        """Get current game state and analytics - clean, focused method."""
+        """
+        Get current game state and analytics - clean, focused method.
+        
+        Supports conditional polling: a matching ``If-None-Match`` ETag or a
+        ``since`` query parameter equal to the current state version returns
+        304. An older ``since`` returns only the players and periods that
+        changed after it. Clients extrapolate the running clock between
+        versions from ``server_ts``.
+        
+        The body is served from the response cache. Only the clock fields
+        are encoded per request; while the clock runs, player minutes and
+        analytics are re-encoded once per second.
+        """
         try:
-            config = app_state.timer_service.get_timer_configuration()
-            report = app_state.analytics_service.generate_game_report()
-            summaries = app_state.timer_service.get_period_summaries()
-            
+            version = app_state.game_state.state_version
+            etag = f"v{version}"
+            since = request.args.get("since", type=int)
+            
+            if etag in request.if_none_match or since == version:
+                response = current_app.response_class(status=304)
+                response.set_etag(etag)
+                return response
+            
+            def build_state() -> dict:
+                delta = None
+                if since is not None:
+                    delta = app_state.change_tracker.changes_since(since, version)
+                
+                report = app_state.analytics_service.generate_game_report()
+                summaries = app_state.timer_service.get_period_summaries()
+                
+                payload = {
+                    "success": True,
+                    "version": version,
+                    "delta": delta is not None,
+                    "analytics": _build_analytics_data(report),
+                }
+                if delta is None:
+                    payload["periods"] = summaries
+                    payload["players"] = _build_player_data(report)
+                else:
+                    payload["since"] = delta.since_version
+                    payload["periods"] = [summaries[idx] for idx in delta.periods if idx < len(summaries)]
+                    payload["players"] = _build_player_data(report, delta.players)
+                    payload["removed_players"] = delta.removed_players
+                return payload
+            
+            body = _cached_body("state", build_state, (since, app_state.clock_second()))
+            timer = join_objects(_cached_body("state.timer", _build_timer_data), encode_json(_build_clock_fields()))
+            clock = b'{"server_ts":' + encode_json(app_state.now()) + b',"game_state":' + timer + b"}"
+            response = _json_body(join_objects(body, clock))
+            response.set_etag(etag)
+            return response
+        except Exception as e:
+            return jsonify({"success": False, "error": str(e)}), 500
+
+    def _push_clients_busy() -> Response:
+        """Turn away a push client while every push slot is taken."""
+        response = jsonify({"success": False, "error": "Too many live connections; retry shortly"})
+        response.status_code = 503
+        response.headers["Retry-After"] = str(STREAM_RETRY_MILLISECONDS // 1000)
+        return response
+
+    def _wait_for_change(entry, version: Optional[int], timeout: float):
+        """
+        Wait until the game's state version moves past ``version``.
+        
+        Writes saved by other workers never reach this worker's notifier, so
+        with a shared store the wait checks the store every
+        ``SHARED_STORE_POLL_SECONDS`` and loads newer versions, which
+        publishes them.
+        
+        Returns:
+            The latest event, or None on timeout or once the game is closed
+        """
+        session = entry.session
+        notifier = session.notifier
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = max(0.0, deadline - time.monotonic())
+            step = min(remaining, SHARED_STORE_POLL_SECONDS) if session.store.shared else remaining
+            event = notifier.wait_for_change(version, step)
+            if event is not None or notifier.closed:
+                return event
+            if session.is_stale():
+                with entry.lock:
+                    if not notifier.closed:
+                        session.refresh()
+                event = notifier.wait_for_change(version, 0)
+                if event is not None:
+                    return event
+            if time.monotonic() >= deadline:
+                return None
+
+    def _read_clock(entry) -> Dict[str, Any]:
+        """Read clock data while briefly sharing the game lock."""
+        with entry.lock.read_lock():
+            return entry.session.build_clock_data()
+
+    @api.route("/stream", methods=["GET"])
+    def stream_state():
+        """
+        Server-Sent Events channel for live game state.
+        
+        Emits a ``state`` event whenever the state version changes and a
+        ``clock`` event at least every ``clock_interval`` seconds so clients
+        can render the running clock locally and only fetch on real changes.
+        An open stream keeps the game resident; if the game leaves memory
+        anyway (e.g. it is deleted) the stream ends so the client reconnects.
+        
+        Each stream holds a server thread, so streams end after
+        ``STREAM_LIFETIME_SECONDS`` (the first event sets the client's
+        reconnect delay) and are refused with 503 while every push slot is
+        taken.
+        """
+        entry = g.game_entry
+        interval = request.args.get("clock_interval", CLOCK_SYNC_INTERVAL_SECONDS, type=float)
+        interval = max(1.0, min(interval, MAX_LONG_POLL_SECONDS))
+        known_version = request.args.get("version", type=int)
+        push_clients = current_app.extensions["push_clients"]
+        if not push_clients.try_acquire():
+            return _push_clients_busy()
+
+        def format_event(event_type: str, data: Dict[str, Any], retry: Optional[int] = None) -> str:
+            retry_field = f"retry: {retry}\n" if retry is not None else ""
+            return (
+                f"event: {event_type}\nid: {data.get('version', '')}\n{retry_field}"
+                f"data: {json.dumps(data)}\n\n"
+            )
+
+        def generate():
+            deadline = time.monotonic() + STREAM_LIFETIME_SECONDS
+            version = known_version
+            latest = entry.session.notifier.latest
+            if version is None or version != latest.version:
+                yield format_event("state", latest.to_dict(), retry=STREAM_RETRY_MILLISECONDS)
+                yield format_event("clock", _read_clock(entry))
+            else:
+                yield format_event("clock", _read_clock(entry), retry=STREAM_RETRY_MILLISECONDS)
+            version = latest.version
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+                entry.touch()
+                event = _wait_for_change(entry, version, min(interval, remaining))
+                if entry.session.notifier.closed:
+                    return
+                if event is not None:
+                    version = event.version
+                    yield format_event("state", event.to_dict())
+                yield format_event("clock", _read_clock(entry))
+
+        response = Response(
+            generate(),
+            mimetype="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+        # Runs when the server is done with the body, even if it never started
+        response.call_on_close(push_clients.release)
+        return response
+
+    @api.route("/state/wait", methods=["GET"])
+    def wait_for_state():
+        """
+        Long-poll until the state version differs from ``version``.
+        
+        Returns immediately when the client is behind, otherwise after the
+        next change or ``timeout`` seconds. The response always carries the
+        current clock so clients can resync without a full state fetch.
+        Waits share the push slots with streams and get 503 when none is free.
+        """
+        try:
+            entry = g.game_entry
+            version = request.args.get("version", type=int)
+            timeout = request.args.get("timeout", 25, type=float)
+            timeout = max(0.0, min(timeout, MAX_LONG_POLL_SECONDS))
+
+            event = None
+            if version is not None:
+                push_clients = current_app.extensions["push_clients"]
+                if not push_clients.try_acquire():
+                    return _push_clients_busy()
+                try:
+                    event = _wait_for_change(entry, version, timeout)
+                finally:
+                    push_clients.release()
+                # A watched game counts as in use for idle eviction
+                entry.touch()
+            else:
+                event = entry.session.notifier.latest
+
             return jsonify({
                 "success": True,
-                "game_state": _build_timer_data(config),
-                "periods": summaries,
-                "players": _build_player_data(report),
-                "analytics": _build_analytics_data(report)
+                "changed": event is not None,
+                "event": event.to_dict() if event else None,
+                "clock": _read_clock(entry),
             })
         except Exception as e:
             return jsonify({"success": False, "error": str(e)}), 500
 
-    @app.route("/api/timer/start", methods=["POST"])
+    @api.route("/timer/start", methods=["POST"])
     def start_timer():
         """Start the game timer with comprehensive lineup validation."""
         try:
@@ -313,7 +1282,7 @@ def create_app(static_folder: str = ".") -> Flask:
             # Start the game using Command pattern
             try:
                 from ..services.game_commands import StartGameCommand
-                command = StartGameCommand(app_state.game_state)
+                command = StartGameCommand(app_state.game_state, clock=app_state.clock)
                 
                 success = app_state.command_manager.execute_command(command)
                 if success:
@@ -356,12 +1325,12 @@ def create_app(static_folder: str = ".") -> Flask:
                 "suggestions": ["Please try again or contact support if the problem persists"]
             }), 500
 
-    @app.route("/api/timer/pause", methods=["POST"])
+    @api.route("/timer/pause", methods=["POST"])
     def pause_timer():
         """Pause the game timer using Command pattern."""
         try:
             from ..services.game_commands import PauseGameCommand
-            command = PauseGameCommand(app_state.game_state)
+            command = PauseGameCommand(app_state.game_state, clock=app_state.clock)
             
             success = app_state.command_manager.execute_command(command)
             if success:
@@ -371,7 +1340,7 @@ def create_app(static_folder: str = ".") -> Flask:
         except Exception as e:
             return jsonify({"success": False, "error": str(e)}), 400
 
-    @app.route("/api/undo", methods=["POST"])
+    @api.route("/undo", methods=["POST"])
     def undo_action():
         """Undo the last action using Command pattern."""
         try:
@@ -383,7 +1352,7 @@ def create_app(static_folder: str = ".") -> Flask:
         except Exception as e:
             return jsonify({"success": False, "error": str(e)}), 400
 
-    @app.route("/api/redo", methods=["POST"])
+    @api.route("/redo", methods=["POST"])
     def redo_action():
         """Redo the next action using Command pattern."""
         try:
@@ -395,7 +1364,50 @@ def create_app(static_folder: str = ".") -> Flask:
         except Exception as e:
             return jsonify({"success": False, "error": str(e)}), 400
 
-    @app.route("/api/command-history", methods=["GET"])
+    @api.route("/batch", methods=["POST"])
+    def execute_batch():
+        """
+        Apply several actions atomically, e.g. all swaps of a substitution window.
+        
+        Every action runs at the same timestamp; if any of them is rejected
+        nothing is applied. The batch is one undo entry and one state version.
+        """
+        try:
+            try:
+                data = request.get_json(silent=True)
+                if not isinstance(data, dict):
+                    raise ValueError("Request body must be a JSON object with an actions list")
+                commands = parse_batch_actions(
+                    app_state.game_state, app_state.strategy_service, data.get("actions")
+                )
+            except (TypeError, ValueError) as e:
+                return jsonify({"success": False, "error": str(e)}), 400
+            
+            batch = MacroCommand(
+                app_state.game_state, commands, clock=app_state.clock, description=data.get("description")
+            )
+            if not app_state.command_manager.execute_command(batch):
+                return jsonify({
+                    "success": False,
+                    "error": f"Action {batch.failed_index} failed: {batch.failed_command.description}",
+                    "failed_index": batch.failed_index,
+                }), 400
+            
+            substitutions = [
+                {"out_name": command.player_out_name, "in_name": command.player_in_name}
+                for command in commands if isinstance(command, SubstitutePlayerCommand)
+            ]
+            g.event_data = {"actions": len(commands), "substitutions": substitutions}
+            return jsonify({
+                "success": True,
+                "message": batch.description,
+                "applied": len(commands),
+                "timestamp": batch.record.timestamp,
+            })
+        except Exception as e:
+            return jsonify({"success": False, "error": str(e)}), 500
+
+    @api.route("/command-history", methods=["GET"])
     def get_command_history():
         """Get command history for UI display."""
         try:
@@ -409,7 +1421,7 @@ def create_app(static_folder: str = ".") -> Flask:
         except Exception as e:
             return jsonify({"success": False, "error": str(e)}), 500
 
-    @app.route("/api/timer/halftime", methods=["POST"])
+    @api.route("/timer/halftime", methods=["POST"])
     def start_halftime():
         """Start halftime break."""
         try:
@@ -418,7 +1430,7 @@ def create_app(static_folder: str = ".") -> Flask:
         except Exception as e:
             return jsonify({"success": False, "error": str(e)}), 400
 
-    @app.route("/api/timer/configure", methods=["POST"])
+    @api.route("/timer/configure", methods=["POST"])
     def configure_timer():
         """Configure game length and period count."""
         try:
@@ -434,7 +1446,7 @@ def create_app(static_folder: str = ".") -> Flask:
         except Exception as e:
             return jsonify({"success": False, "error": str(e)}), 400
 
-    @app.route("/api/timer/stoppage", methods=["POST"])
+    @api.route("/timer/stoppage", methods=["POST"])
     def add_stoppage_time():
         """Add stoppage time to current or specified period."""
         try:
@@ -449,7 +1461,7 @@ def create_app(static_folder: str = ".") -> Flask:
         except Exception as e:
             return jsonify({"success": False, "error": str(e)}), 400
 
-    @app.route("/api/timer/adjustment", methods=["POST"])
+    @api.route("/timer/adjustment", methods=["POST"])
     def add_time_adjustment():
         """Add time adjustment to current or specified period."""
         try:
@@ -467,7 +1479,32 @@ def create_app(static_folder: str = ".") -> Flask:
         except Exception as e:
             return jsonify({"success": False, "error": str(e)}), 400
 
-    @app.route("/api/roster", methods=["POST"])
+    @api.route("/timer/timeline", methods=["GET"])
+    def get_timeline():
+        """
+        Get the run segments, optionally converting between wall and game time.
+
+        Query parameters ``wall_ts`` and ``game_seconds`` are converted to the
+        other clock when given.
+        """
+        try:
+            timer_service = app_state.timer_service
+            wall_ts = request.args.get("wall_ts", type=float)
+            game_seconds = request.args.get("game_seconds", type=float)
+
+            result = {
+                "success": True,
+                "timeline": app_state.game_state.timeline.to_dict()
+            }
+            if wall_ts is not None:
+                result["game_seconds"] = timer_service.game_seconds_at(wall_ts)
+            if game_seconds is not None:
+                result["wall_ts"] = timer_service.wall_time_at(game_seconds)
+            return jsonify(result)
+        except Exception as e:
+            return jsonify({"success": False, "error": str(e)}), 500
+
+    @api.route("/roster", methods=["POST"])
     def update_roster():
         """Update the roster with new players."""
         try:
@@ -503,8 +1540,7 @@ def create_app(static_folder: str = ".") -> Flask:
                 
                 roster[player.name] = player
             
-            app_state.game_state = GameState(roster=roster, field_size=field_size)
-            app_state.reset_services()
+            app_state.replace_game_state(GameState(roster=roster, field_size=field_size))
             
             return jsonify({"success": True, "message": f"Roster updated with {len(roster)} players"})
         except Exception as e:
@@ -512,10 +1548,10 @@ def create_app(static_folder: str = ".") -> Flask:
 
     # ==================== Player Management Endpoints ==================== #
 
-    @app.route("/api/players", methods=["GET"])
+    @api.route("/players", methods=["GET"])
     def get_players():
         """Get all players with enhanced information."""
-        try:
+        def build_players() -> dict:
             players_data = []
             roster = app_state.game_state.roster if app_state.game_state else {}
             
@@ -539,16 +1575,19 @@ def create_app(static_folder: str = ".") -> Flask:
                     print(f"Error processing player: {player_error}")
                     continue
             
-            return jsonify({
+            return {
                 "success": True,
                 "players": players_data,
                 "count": len(players_data)
-            })
+            }
+        
+        try:
+            return _json_body(_cached_body("players", build_players))
         except Exception as e:
             print(f"Error in get_players: {e}")
             return jsonify({"success": False, "error": str(e)}), 500
 
-    @app.route("/api/players", methods=["POST"])
+    @api.route("/players", methods=["POST"])
     def create_player():
         """Create a new player."""
         try:
@@ -599,7 +1638,7 @@ def create_app(static_folder: str = ".") -> Flask:
         except Exception as e:
             return jsonify({"success": False, "error": str(e)}), 500
 
-    @app.route("/api/players/<player_name>", methods=["GET"])
+    @api.route("/players/<player_name>", methods=["GET"])
     def get_player(player_name: str):
         """Get detailed information for a specific player."""
         try:
@@ -621,7 +1660,7 @@ def create_app(static_folder: str = ".") -> Flask:
         except Exception as e:
             return jsonify({"success": False, "error": str(e)}), 500
 
-    @app.route("/api/players/<player_name>", methods=["PUT"])
+    @api.route("/players/<player_name>", methods=["PUT"])
     def update_player(player_name: str):
         """Update an existing player."""
         try:
@@ -662,7 +1701,7 @@ def create_app(static_folder: str = ".") -> Flask:
         except Exception as e:
             return jsonify({"success": False, "error": str(e)}), 500
 
-    @app.route("/api/players/<player_name>", methods=["DELETE"])
+    @api.route("/players/<player_name>", methods=["DELETE"])
     def delete_player(player_name: str):
         """Delete a player from the roster."""
         try:
@@ -684,7 +1723,7 @@ def create_app(static_folder: str = ".") -> Flask:
         except Exception as e:
             return jsonify({"success": False, "error": str(e)}), 500
 
-    @app.route("/api/players/<player_name>/stats", methods=["POST"])
+    @api.route("/players/<player_name>/stats", methods=["POST"])
     def update_player_stats(player_name: str):
         """Update player statistics for a game."""
         try:
@@ -723,7 +1762,7 @@ def create_app(static_folder: str = ".") -> Flask:
         except Exception as e:
             return jsonify({"success": False, "error": str(e)}), 500
 
-    @app.route("/api/players/<player_name>/attendance", methods=["POST"])
+    @api.route("/players/<player_name>/attendance", methods=["POST"])
     def mark_player_attendance(player_name: str):
         """Mark attendance for a player."""
         try:
@@ -754,7 +1793,7 @@ def create_app(static_folder: str = ".") -> Flask:
         except Exception as e:
             return jsonify({"success": False, "error": str(e)}), 500
 
-    @app.route("/api/players/<player_name>/skills", methods=["POST"])
+    @api.route("/players/<player_name>/skills", methods=["POST"])
     def update_player_skills(player_name: str):
         """Update player skill ratings."""
         try:
@@ -780,7 +1819,7 @@ def create_app(static_folder: str = ".") -> Flask:
         except Exception as e:
             return jsonify({"success": False, "error": str(e)}), 500
 
-    @app.route("/api/players/import", methods=["POST"])
+    @api.route("/players/import", methods=["POST"])
     def import_players():
         """Import players from JSON data."""
         try:
@@ -817,6 +1856,7 @@ def create_app(static_folder: str = ".") -> Flask:
                             player.on_field = current.on_field
                             player.position = current.position
                             player.stint_start_ts = current.stint_start_ts
+                            player.stint_ledger = current.stint_ledger
                             app_state.game_state.roster[player.name] = player
                             added.append(player.name)
                         elif merge_strategy == "error":
@@ -844,7 +1884,7 @@ def create_app(static_folder: str = ".") -> Flask:
         except Exception as e:
             return jsonify({"success": False, "error": str(e)}), 500
 
-    @app.route("/api/players/export", methods=["GET"])
+    @api.route("/players/export", methods=["GET"])
     def export_players():
         """Export all players to JSON format."""
         try:
@@ -863,7 +1903,7 @@ def create_app(static_folder: str = ".") -> Flask:
         except Exception as e:
             return jsonify({"success": False, "error": str(e)}), 500
 
-    @app.route("/api/players/recommendations", methods=["POST"])
+    @api.route("/players/recommendations", methods=["POST"])
     def get_position_recommendations():
         """Get position recommendations for players."""
         try:
@@ -892,7 +1932,7 @@ def create_app(static_folder: str = ".") -> Flask:
 
     # ==================== End Player Management Endpoints ==================== #
 
-    @app.route("/api/substitution", methods=["POST"])
+    @api.route("/substitution", methods=["POST"])
     def make_substitution():
         """Make a player substitution."""
         try:
@@ -914,34 +1954,28 @@ def create_app(static_folder: str = ".") -> Flask:
             if in_player.on_field:
                 return jsonify({"success": False, "error": f"{in_name} is already on field"}), 400
             
-            # Perform substitution
-            current_time = now_ts()
-            
-            # Save the position before ending the stint
+            # Perform substitution as an undoable command; the incoming player takes the vacated position
             position_to_fill = out_player.position
-            
-            # End the outgoing player's stint
-            out_player.end_stint(current_time)
-            
-            # Start the incoming player's stint in the vacated position
-            in_player.position = position_to_fill
-            in_player.start_stint(current_time)
+            command = SubstitutePlayerCommand(app_state.game_state, out_name, in_name, clock=app_state.clock)
+            if not app_state.command_manager.execute_command(command):
+                return jsonify({"success": False, "error": "Substitution failed"}), 400
+            g.event_data = {"out_name": out_name, "in_name": in_name, "position": position_to_fill}
             
             return jsonify({"success": True, "message": f"Substituted {out_name} for {in_name}"})
         except Exception as e:
             return jsonify({"success": False, "error": str(e)}), 500
 
-    @app.route("/api/save", methods=["POST"])
+    @api.route("/save", methods=["POST"])
     def save_game():
         """Save current game state."""
         try:
             # For web version, we'll return the JSON data for client-side saving
-            game_data = PersistenceService.serialize_game_state(app_state.game_state)
+            game_data = PersistenceService.serialize_game_state(app_state.game_state, app_state.now())
             return jsonify({"success": True, "data": game_data})
         except Exception as e:
             return jsonify({"success": False, "error": str(e)}), 500
 
-    @app.route("/api/load", methods=["POST"])
+    @api.route("/load", methods=["POST"])
     def load_game():
         """Load game state from uploaded JSON."""
         try:
@@ -951,20 +1985,19 @@ def create_app(static_folder: str = ".") -> Flask:
             if not game_data:
                 return jsonify({"success": False, "error": "No game data provided"}), 400
             
-            app_state.game_state = PersistenceService.deserialize_game_state(game_data)
-            app_state.reset_services()
+            app_state.replace_game_state(PersistenceService.deserialize_game_state(game_data))
             
             return jsonify({"success": True, "message": "Game state loaded successfully"})
         except Exception as e:
             return jsonify({"success": False, "error": str(e)}), 400
 
-    @app.route("/api/analytics/report", methods=["GET"])
+    @api.route("/analytics/report", methods=["GET"])
     def get_analytics_report():
-        """Get detailed analytics report."""
-        try:
+        """Get detailed analytics report (re-encoded once per second while the clock runs)."""
+        def build_report() -> dict:
             report = app_state.analytics_service.generate_game_report()
             
-            return jsonify({
+            return {
                 "success": True,
                 "report": {
                     "roster_size": report.roster_size,
@@ -994,11 +2027,39 @@ def create_app(static_folder: str = ".") -> Flask:
                         for p in report.players
                     ]
                 }
+            }
+        
+        try:
+            return _json_body(_cached_body("analytics/report", build_report, app_state.clock_second()))
+        except Exception as e:
+            return jsonify({"success": False, "error": str(e)}), 500
+
+    @api.route("/analytics/stints", methods=["GET"])
+    def get_stint_report():
+        """Get per-player stint, period, position and rest breakdowns."""
+        try:
+            summaries = app_state.analytics_service.generate_stint_report()
+            return jsonify({
+                "success": True,
+                "players": [
+                    {
+                        "name": s.name,
+                        "stint_count": s.stint_count,
+                        "total_seconds": s.total_seconds,
+                        "longest_stint_seconds": s.longest_stint_seconds,
+                        "period_seconds": {str(k): v for k, v in s.period_seconds.items()},
+                        "position_seconds": s.position_seconds,
+                        "rest_count": s.rest_count,
+                        "longest_rest_seconds": s.longest_rest_seconds,
+                        "average_rest_seconds": s.average_rest_seconds,
+                    }
+                    for s in summaries
+                ]
             })
         except Exception as e:
             return jsonify({"success": False, "error": str(e)}), 500
 
-    @app.route("/api/analytics/export", methods=["GET"])
+    @api.route("/analytics/export", methods=["GET"])
     def export_analytics_report():
         """Export detailed analytics report as CSV."""
         try:
@@ -1018,19 +2079,22 @@ def create_app(static_folder: str = ".") -> Flask:
 
     # ---------- Formation/Strategy API ---------- #
     
-    @app.route("/api/formations", methods=["GET"])
+    @api.route("/formations", methods=["GET"])
     def get_formations():
         """Get all formations."""
-        try:
+        def build_formations() -> dict:
             formations = app_state.strategy_service.list_formations()
-            return jsonify({
+            return {
                 "success": True,
                 "formations": [formation.to_dict() for formation in formations]
-            })
+            }
+        
+        try:
+            return _json_body(_cached_body("formations", build_formations))
         except Exception as e:
             return jsonify({"success": False, "error": str(e)}), 500
 
-    @app.route("/api/formations/templates", methods=["GET"])
+    @api.route("/formations/templates", methods=["GET"])
     def get_formation_templates():
         """Get formation templates."""
         try:
@@ -1042,7 +2106,7 @@ def create_app(static_folder: str = ".") -> Flask:
         except Exception as e:
             return jsonify({"success": False, "error": str(e)}), 500
 
-    @app.route("/api/formations", methods=["POST"])
+    @api.route("/formations", methods=["POST"])
     def create_formation():
         """Create a new formation with comprehensive validation."""
         try:
@@ -1174,7 +2238,7 @@ def create_app(static_folder: str = ".") -> Flask:
                 "suggestions": ["Please try again or contact support if the problem persists"]
             }), 500
 
-    @app.route("/api/formations/<formation_name>", methods=["GET"])
+    @api.route("/formations/<formation_name>", methods=["GET"])
     def get_formation(formation_name):
         """Get a specific formation."""
         try:
@@ -1189,7 +2253,7 @@ def create_app(static_folder: str = ".") -> Flask:
         except Exception as e:
             return jsonify({"success": False, "error": str(e)}), 500
 
-    @app.route("/api/formations/<formation_name>", methods=["DELETE"])
+    @api.route("/formations/<formation_name>", methods=["DELETE"])
     def delete_formation(formation_name):
         """Delete a formation."""
         try:
@@ -1201,7 +2265,7 @@ def create_app(static_folder: str = ".") -> Flask:
         except Exception as e:
             return jsonify({"success": False, "error": str(e)}), 500
 
-    @app.route("/api/formations/from-template", methods=["POST"])
+    @api.route("/formations/from-template", methods=["POST"])
     def create_from_template():
         """Create formation from template."""
         try:
@@ -1230,7 +2294,7 @@ def create_app(static_folder: str = ".") -> Flask:
         except Exception as e:
             return jsonify({"success": False, "error": str(e)}), 500
 
-    @app.route("/api/formations/suggest", methods=["POST"])
+    @api.route("/formations/suggest", methods=["POST"])
     def suggest_formation():
         """Suggest optimal formation based on available players."""
         try:
@@ -1253,7 +2317,7 @@ def create_app(static_folder: str = ".") -> Flask:
         except Exception as e:
             return jsonify({"success": False, "error": str(e)}), 500
 
-    @app.route("/api/formations/<formation_name>/assign", methods=["POST"])
+    @api.route("/formations/<formation_name>/assign", methods=["POST"])
     def assign_players_to_formation(formation_name):
         """Assign players to formation positions with comprehensive validation."""
         try:
@@ -1378,7 +2442,32 @@ def create_app(static_folder: str = ".") -> Flask:
                 "suggestions": ["Please try again or contact support if the problem persists"]
             }), 500
 
-    @app.route("/api/formations/<formation_name>/validate", methods=["GET"])
+    @api.route("/formations/<formation_name>/optimal-assignment", methods=["POST"])
+    def optimize_formation_assignment(formation_name):
+        """
+        Suggest the minimum-cost lineup for a formation.
+
+        Optional ``players`` limits the pool to the available players. The
+        ``mapping`` in the response can be posted to the assign endpoint.
+        """
+        try:
+            formation = app_state.strategy_service.get_formation(formation_name)
+            if not formation:
+                return jsonify({"success": False, "error": "Formation not found"}), 404
+
+            data = request.get_json(silent=True) or {}
+            result = app_state.assignment_service.solve(formation, data.get("players"))
+            return jsonify({
+                "success": True,
+                "result": result.to_dict(),
+                "mapping": {str(slot): name for slot, name in result.as_mapping().items()}
+            })
+        except ValueError as e:
+            return jsonify({"success": False, "error": str(e)}), 400
+        except Exception as e:
+            return jsonify({"success": False, "error": str(e)}), 500
+
+    @api.route("/formations/<formation_name>/validate", methods=["GET"])
     def validate_formation_for_game(formation_name):
         """Validate formation readiness for starting a game."""
         try:
@@ -1465,7 +2554,7 @@ def create_app(static_folder: str = ".") -> Flask:
                 "can_start_game": False
             }), 500
 
-    @app.route("/api/formations/<formation_name>/suggestions", methods=["GET"])
+    @api.route("/formations/<formation_name>/suggestions", methods=["GET"])
     def get_rotation_suggestions(formation_name):
         """Get position rotation suggestions for a formation."""
         try:
@@ -1490,7 +2579,7 @@ def create_app(static_folder: str = ".") -> Flask:
         except Exception as e:
             return jsonify({"success": False, "error": str(e)}), 500
 
-    @app.route("/api/strategy/substitution-plans", methods=["GET"])
+    @api.route("/strategy/substitution-plans", methods=["GET"])
     def get_substitution_plans():
         """Get all substitution plans."""
         try:
@@ -1502,7 +2591,7 @@ def create_app(static_folder: str = ".") -> Flask:
         except Exception as e:
             return jsonify({"success": False, "error": str(e)}), 500
 
-    @app.route("/api/strategy/substitution-plans", methods=["POST"])
+    @api.route("/strategy/substitution-plans", methods=["POST"])
     def create_substitution_plan():
         """Create a substitution plan."""
         try:
@@ -1530,7 +2619,85 @@ def create_app(static_folder: str = ".") -> Flask:
         except Exception as e:
             return jsonify({"success": False, "error": str(e)}), 500
 
-    @app.route("/api/strategy/opponent-notes", methods=["GET"])
+    @api.route("/strategy/rotation-plan", methods=["POST"])
+    def generate_rotation_plan():
+        """Plan equal-time substitutions for the rest of the game."""
+        try:
+            name, config, player_names = parse_rotation_request(request.get_json(silent=True) or {})
+            rotation = app_state.strategy_service.generate_rotation_plan(
+                app_state.timer_service, name=name, config=config, player_names=player_names
+            )
+            return jsonify({"success": True, "rotation": rotation.to_dict()})
+        except ValueError as e:
+            return jsonify({"success": False, "error": str(e)}), 400
+        except Exception as e:
+            return jsonify({"success": False, "error": str(e)}), 500
+
+    @api.route("/strategy/rotation-plan/replan", methods=["POST"])
+    def request_rotation_replan():
+        """
+        Queue a background re-plan of the rotation.
+        
+        Returns 202 at once; the plan is stored and a ``rotation_replanned``
+        change is pushed when it is ready. With ``auto`` set, every later
+        substitution queues another (debounced) re-plan.
+        """
+        try:
+            data = request.get_json(silent=True) or {}
+            unknown = [name for name in data.get("players") or [] if name not in app_state.game_state.roster]
+            if unknown:
+                return jsonify({"success": False, "error": f"Players not found in roster: {', '.join(unknown)}"}), 400
+
+            if "auto" in data:
+                app_state.auto_replan = dict(data) if data["auto"] else None
+            job = app_state.request_replan(current_app.extensions["replan_pool"], g.game_id, data)
+            return jsonify({"success": True, "job": job.to_dict()}), 202
+        except ValueError as e:
+            return jsonify({"success": False, "error": str(e)}), 400
+        except Exception as e:
+            return jsonify({"success": False, "error": str(e)}), 500
+
+    @api.route("/strategy/rotation-plan/latest", methods=["GET"])
+    def get_latest_rotation_replan():
+        """Get the newest background re-plan job of the game and its result."""
+        try:
+            job = current_app.extensions["replan_pool"].latest(g.game_id)
+            if job is None:
+                return jsonify({"success": False, "error": "No re-plan requested"}), 404
+            return jsonify({"success": True, "job": job.to_dict()})
+        except Exception as e:
+            return jsonify({"success": False, "error": str(e)}), 500
+
+    @api.route("/strategy/substitution-plans/<plan_name>/schedule", methods=["POST"])
+    def schedule_substitution_plan(plan_name):
+        """Fire the plan's substitutions as scheduled events at their minutes."""
+        try:
+            plan = app_state.strategy_service.get_substitution_plan(plan_name)
+            if plan is None:
+                return jsonify({"success": False, "error": f"Plan '{plan_name}' not found"}), 404
+
+            events = app_state.scheduler.schedule_plan(plan)
+            return jsonify({
+                "success": True,
+                "scheduled": [event.to_dict() for event in events]
+            })
+        except Exception as e:
+            return jsonify({"success": False, "error": str(e)}), 500
+
+    @api.route("/schedule", methods=["GET"])
+    def get_schedule():
+        """Get pending scheduled events and when the next one is due."""
+        try:
+            scheduler = app_state.scheduler
+            return jsonify({
+                "success": True,
+                "events": [event.to_dict() for event in scheduler.pending()],
+                "next_due_ts": scheduler.next_due_ts()
+            })
+        except Exception as e:
+            return jsonify({"success": False, "error": str(e)}), 500
+
+    @api.route("/strategy/opponent-notes", methods=["GET"])
     def get_opponent_notes():
         """Get all opponent notes."""
         try:
@@ -1542,7 +2709,7 @@ def create_app(static_folder: str = ".") -> Flask:
         except Exception as e:
             return jsonify({"success": False, "error": str(e)}), 500
 
-    @app.route("/api/strategy/opponent-notes", methods=["POST"])
+    @api.route("/strategy/opponent-notes", methods=["POST"])
     def create_opponent_notes():
         """Create opponent scouting notes."""
         try:
@@ -1566,10 +2733,20 @@ def create_app(static_folder: str = ".") -> Flask:
         except Exception as e:
             return jsonify({"success": False, "error": str(e)}), 500
 
+    app.register_blueprint(api, url_prefix="/api")
+    app.register_blueprint(api, url_prefix="/api/games/<game_id>", name="game_api")
+
     return app
 
 
-def run_web_app(host: str = "127.0.0.1", port: int = 7122, static_folder: str = ".") -> None:
+def run_web_app(
+    host: str = "127.0.0.1",
+    port: int = 7122,
+    static_folder: str = ".",
+    production: bool = False,
+    threads: int = DEFAULT_SERVER_THREADS,
+    workers: int = 1,
+) -> None:
     """
     Run the web application.
     
@@ -1577,10 +2754,34 @@ def run_web_app(host: str = "127.0.0.1", port: int = 7122, static_folder: str =
         host: Host address to bind to (default: localhost only)
         port: Port number to listen on
         static_folder: Directory containing static files (HTML, CSS, JS)
+        production: Serve from a pool of worker threads instead of Flask's
+            development server
+        threads: Worker threads per process in production mode
+        workers: Worker processes in production mode; more than one keeps
+            games in the shared SQLite state store
     """
-    app = create_app(static_folder)
     # Bind only to localhost; Cloudflare Tunnel will connect locally if needed
-    app.run(host=host, port=port, debug=False)
+    if production and workers > 1:
+        def create_worker_app() -> Flask:
+            registry = create_game_registry(backend="sqlite")
+            replan_pool = ReplanWorkerPool()
+            replan_pool.start()
+            return create_app(
+                static_folder,
+                registry=registry,
+                replan_pool=replan_pool,
+                max_push_clients=push_client_limit(threads),
+            )
+
+        serve_workers(create_worker_app, host=host, port=port, workers=workers, threads=threads)
+        return
+
+    default_replan_pool.start()
+    app = create_app(static_folder, max_push_clients=push_client_limit(threads) if production else None)
+    if production:
+        serve_production(app, host=host, port=port, threads=threads)
+    else:
+        app.run(host=host, port=port, debug=False)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,235 @@
+"""
+Production WSGI server for the Soccer Coach Sideline Timekeeper web API.
+
+Flask's ``app.run()`` is a development server. This module serves the app
+from a fixed pool of worker threads instead, so a sideline full of tablets
+is handled concurrently without a thread per connection. Requests for one
+game are serialized by its reader-writer lock (see ``acquire_game`` in
+:mod:`.web_app`): polls share it, writes hold it alone. Streams and
+long-polls hold a thread while open, so the app should bound them below the
+pool size (see :func:`push_client_limit`).
+
+One process is still bound by the GIL, so :func:`serve_workers` forks
+several worker processes that accept connections on one shared socket. Each
+worker only sees its own memory, so games must then live in the shared
+SQLite state store (``SIDELINE_STATE_BACKEND=sqlite``).
+
+Any other WSGI server (e.g. ``waitress-serve --threads 16``) can host the
+app returned by :func:`~.web_app.create_app` in the same way.
+"""
+import multiprocessing
+import os
+import socket
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, Tuple
+
+from werkzeug.serving import BaseWSGIServer, WSGIRequestHandler
+
+# Worker threads; every open /api/stream connection occupies one
+DEFAULT_SERVER_THREADS = 16
+# Share of the pool kept free of streams and long-polls for other requests
+RESERVED_THREAD_FRACTION = 0.25
+# Pending connections queued on the shared socket
+LISTEN_BACKLOG = 128
+
+
+def push_client_limit(threads: int) -> int:
+    """
+    Streams and long-polls a pool can hold while still answering requests.
+
+    Args:
+        threads: Worker threads in the pool
+
+    Returns:
+        The bound, leaving at least one thread for ordinary requests
+    """
+    reserved = max(1, int(threads * RESERVED_THREAD_FRACTION))
+    return max(0, threads - reserved)
+
+
+class QuietRequestHandler(WSGIRequestHandler):
+    """Request handler that skips the per-request access log line."""
+
+    def log_request(self, code: Any = "-", size: Any = "-") -> None:
+        pass
+
+
+class PooledWSGIServer(BaseWSGIServer):
+    """
+    WSGI server dispatching each connection to a bounded thread pool.
+
+    The accepting thread only hands sockets to the pool, so a slow client
+    cannot stall the others, and the thread count stays fixed under load.
+    """
+
+    multithread = True
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        app: Any,
+        threads: int = DEFAULT_SERVER_THREADS,
+        handler: Optional[type] = None,
+        fd: Optional[int] = None,
+    ):
+        """
+        Args:
+            host: Host address to bind to
+            port: Port number to listen on (0 picks a free port)
+            app: WSGI application
+            threads: Worker threads serving requests
+            handler: Request handler class (defaults to Werkzeug's, which
+                logs every request)
+            fd: Already listening socket to accept on instead of binding
+        """
+        if threads < 1:
+            raise ValueError("threads must be at least 1")
+        super().__init__(host, port, app, handler=handler, fd=fd)
+        self.threads = threads
+        self._pool = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="sideline-http")
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        """Bound (host, port), e.g. to find the port picked for port 0."""
+        return self.server_address[0], self.server_address[1]
+
+    def process_request(self, request: socket.socket, client_address: Any) -> None:
+        self._pool.submit(self._process_request_worker, request, client_address)
+
+    def _process_request_worker(self, request: socket.socket, client_address: Any) -> None:
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self) -> None:
+        """Stop accepting connections and wait for in-flight requests."""
+        super().server_close()
+        # Werkzeug also closes its placeholder socket before the pool exists
+        pool = getattr(self, "_pool", None)
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+
+def create_production_server(
+    app: Any,
+    host: str = "127.0.0.1",
+    port: int = 7122,
+    threads: int = DEFAULT_SERVER_THREADS,
+    access_log: bool = True,
+) -> PooledWSGIServer:
+    """
+    Bind a pooled WSGI server for the app without starting it.
+
+    Call ``serve_forever()`` on the result (and ``shutdown()`` and
+    ``server_close()`` from another thread to stop it).
+
+    Args:
+        app: WSGI application
+        host: Host address to bind to
+        port: Port number to listen on (0 picks a free port)
+        threads: Worker threads serving requests
+        access_log: Whether to log every request
+
+    Returns:
+        The bound server
+    """
+    handler = WSGIRequestHandler if access_log else QuietRequestHandler
+    return PooledWSGIServer(host, port, app, threads=threads, handler=handler)
+
+
+def serve_production(
+    app: Any,
+    host: str = "127.0.0.1",
+    port: int = 7122,
+    threads: int = DEFAULT_SERVER_THREADS,
+) -> None:
+    """
+    Serve the app from a thread pool until interrupted.
+
+    Args:
+        app: WSGI application
+        host: Host address to bind to
+        port: Port number to listen on
+        threads: Worker threads serving requests
+    """
+    server = create_production_server(app, host, port, threads)
+    print(f" * Serving on http://{host}:{server.address[1]} with {threads} threads")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def serve_workers(
+    app_factory: Callable[[], Any],
+    host: str = "127.0.0.1",
+    port: int = 7122,
+    workers: int = 2,
+    threads: int = DEFAULT_SERVER_THREADS,
+) -> None:
+    """
+    Serve from several worker processes sharing one port until interrupted.
+
+    The socket is bound once and inherited by forked workers, which each
+    build their own app so no database connection, lock or thread crosses
+    a process boundary.
+
+    Args:
+        app_factory: Builds the WSGI application inside each worker; its
+            games must live in a shared state store
+        host: Host address to bind to
+        port: Port number to listen on
+        workers: Worker processes
+        threads: Worker threads per process
+
+    Raises:
+        RuntimeError: If the platform cannot fork
+    """
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    if not hasattr(os, "fork"):
+        raise RuntimeError("Multiple worker processes need a platform with fork()")
+
+    listener = socket.create_server((host, port), backlog=LISTEN_BACKLOG)
+    context = multiprocessing.get_context("fork")
+    processes = [
+        context.Process(
+            target=_run_worker,
+            args=(app_factory, listener.fileno(), host, port, threads),
+            name=f"sideline-worker-{index}",
+            daemon=True,
+        )
+        for index in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    address = f"http://{host}:{listener.getsockname()[1]}"
+    print(f" * Serving on {address} with {workers} workers x {threads} threads")
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        for process in processes:
+            process.join()
+        listener.close()
+
+
+def _run_worker(app_factory: Callable[[], Any], fd: int, host: str, port: int, threads: int) -> None:
+    server = PooledWSGIServer(host, port, app_factory(), threads=threads, fd=fd)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -4,6 +4,16 @@ Utilities package for the Soccer Coach Sideline Timekeeper.
 This package contains utility functions used throughout the application.
 """
 from .time_utils import fmt_mmss, now_ts
+from .clock import (
+    Clock,
+    SystemClock,
+    MonotonicClock,
+    VirtualClock,
+    RecordingClock,
+    RecordedClock,
+    LIVE_CLOCK,
+)
+from .rwlock import ReaderWriterLock
 from .constants import (
     APP_TITLE,
     GAME_LENGTH_MIN,
@@ -23,6 +33,14 @@ from .constants import (
 __all__ = [
     "fmt_mmss",
     "now_ts",
+    "Clock",
+    "SystemClock",
+    "MonotonicClock",
+    "VirtualClock",
+    "RecordingClock",
+    "RecordedClock",
+    "LIVE_CLOCK",
+    "ReaderWriterLock",
     "APP_TITLE",
     "GAME_LENGTH_MIN",
     "EQUAL_TIME_TARGET_MIN",
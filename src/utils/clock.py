@@ -0,0 +1,123 @@
+"""
+Clock sources for the Soccer Coach Sideline Timekeeper application.
+
+Timers read time through a clock object instead of calling ``time.time()``
+directly, so live play can be protected from wall-clock jumps while
+simulations and tests drive time explicitly. Every clock returns epoch-like
+seconds, so timestamps stay compatible with saved games.
+"""
+import time
+from typing import Iterable, List, Optional, Protocol
+
+
+class Clock(Protocol):
+    """Source of the current timestamp in epoch seconds."""
+
+    def now(self) -> float:
+        """Get the current timestamp."""
+        ...
+
+
+class SystemClock:
+    """Wall clock; follows every adjustment made to the system time."""
+
+    def now(self) -> float:
+        return time.time()
+
+
+class MonotonicClock:
+    """
+    Epoch-anchored monotonic clock for live play.
+
+    Reads the wall clock once, then advances with ``time.monotonic()`` so
+    NTP corrections or a tablet clock change cannot make game time jump.
+    """
+
+    def __init__(self, anchor_ts: Optional[float] = None):
+        self._anchor_ts = time.time() if anchor_ts is None else anchor_ts
+        self._anchor_monotonic = time.monotonic()
+
+    def now(self) -> float:
+        return self._anchor_ts + (time.monotonic() - self._anchor_monotonic)
+
+
+class VirtualClock:
+    """Manually driven clock for simulations and tests."""
+
+    def __init__(self, start_ts: float = 0.0):
+        self._now = float(start_ts)
+
+    def now(self) -> float:
+        return self._now
+
+    def advance(self, seconds: float) -> float:
+        """
+        Move the clock forward.
+
+        Args:
+            seconds: Non-negative number of seconds to advance
+
+        Returns:
+            The new current timestamp
+
+        Raises:
+            ValueError: If seconds is negative
+        """
+        if seconds < 0:
+            raise ValueError("A virtual clock cannot move backwards")
+        self._now += seconds
+        return self._now
+
+    def set(self, timestamp: float) -> None:
+        """
+        Jump to an absolute timestamp that is not in the past.
+
+        Raises:
+            ValueError: If the timestamp is earlier than the current time
+        """
+        if timestamp < self._now:
+            raise ValueError("A virtual clock cannot move backwards")
+        self._now = float(timestamp)
+
+
+class RecordingClock:
+    """Clock wrapper that remembers every reading for later replay."""
+
+    def __init__(self, source: Clock):
+        self.source = source
+        self.readings: List[float] = []
+
+    def now(self) -> float:
+        reading = self.source.now()
+        self.readings.append(reading)
+        return reading
+
+
+class RecordedClock:
+    """
+    Clock replaying readings captured by a :class:`RecordingClock`.
+
+    Once the recording is exhausted the last reading is repeated.
+    """
+
+    def __init__(self, readings: Iterable[float]):
+        self._readings = list(readings)
+        if not self._readings:
+            raise ValueError("A recorded clock needs at least one reading")
+        self._position = 0
+
+    @property
+    def exhausted(self) -> bool:
+        """Whether every recorded reading has been replayed."""
+        return self._position >= len(self._readings)
+
+    def now(self) -> float:
+        if self.exhausted:
+            return self._readings[-1]
+        reading = self._readings[self._position]
+        self._position += 1
+        return reading
+
+
+# Process-wide live clock so every game shares one monotonic anchor
+LIVE_CLOCK = MonotonicClock()
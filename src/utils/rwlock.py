@@ -0,0 +1,183 @@
+"""
+Reader-writer lock for the Soccer Coach Sideline Timekeeper application.
+
+Sideline tablets poll the game state far more often than the coach changes
+it. A reader-writer lock lets those reads run side by side while every
+mutation still gets the game to itself. The plain ``acquire``/``release``
+API takes the lock exclusively, so it is a drop-in replacement for the
+``threading.RLock`` shared between request handlers and background timers.
+"""
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+
+class ReaderWriterLock:
+    """
+    Writer-preferring reader-writer lock.
+
+    Any number of threads may hold the lock for reading at once; a writer
+    holds it alone. Once a writer is waiting, new readers queue behind it so
+    a steady stream of polls cannot starve a substitution.
+
+    Both modes are reentrant: a thread may read again while reading, and the
+    writing thread may take either mode again (a nested read counts as a
+    write). Upgrading a read to a write raises ``RuntimeError``, since two
+    upgrading readers would wait on each other forever.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers: Dict[int, int] = {}
+        self._writer: Optional[int] = None
+        self._writer_depth = 0
+        self._writers_waiting = 0
+
+    # ---------- Exclusive (RLock-compatible) API ---------- #
+
+    def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        """
+        Take the lock for writing.
+
+        Args:
+            blocking: Whether to wait for the lock
+            timeout: Maximum seconds to wait (-1 waits forever)
+
+        Returns:
+            True if the lock was taken
+        """
+        me = threading.get_ident()
+        with self._cond:
+            if self._writer == me:
+                self._writer_depth += 1
+                return True
+            if me in self._readers:
+                raise RuntimeError("cannot upgrade a read lock to a write lock")
+            free = lambda: self._writer is None and not self._readers
+            if not self._wait(free, blocking, timeout, writer=True):
+                return False
+            self._writer = me
+            self._writer_depth = 1
+            return True
+
+    def release(self) -> None:
+        """Release one level of the write lock."""
+        with self._cond:
+            if self._writer != threading.get_ident():
+                raise RuntimeError("cannot release a write lock held by another thread")
+            self._writer_depth -= 1
+            if self._writer_depth == 0:
+                self._writer = None
+                self._cond.notify_all()
+
+    def __enter__(self) -> "ReaderWriterLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.release()
+
+    # ---------- Shared API ---------- #
+
+    def acquire_read(self, blocking: bool = True, timeout: float = -1) -> bool:
+        """
+        Take the lock for reading.
+
+        Args:
+            blocking: Whether to wait for the lock
+            timeout: Maximum seconds to wait (-1 waits forever)
+
+        Returns:
+            True if the lock was taken
+        """
+        me = threading.get_ident()
+        with self._cond:
+            if self._writer == me:
+                self._writer_depth += 1
+                return True
+            if me in self._readers:
+                # Queuing behind a waiting writer here would deadlock with it
+                self._readers[me] += 1
+                return True
+            open_to_readers = lambda: self._writer is None and not self._writers_waiting
+            if not self._wait(open_to_readers, blocking, timeout):
+                return False
+            self._readers[me] = 1
+            return True
+
+    def release_read(self) -> None:
+        """Release one level of the read lock."""
+        me = threading.get_ident()
+        with self._cond:
+            if self._writer == me:
+                self._writer_depth -= 1
+                if self._writer_depth == 0:
+                    self._writer = None
+                    self._cond.notify_all()
+                return
+            depth = self._readers.get(me)
+            if depth is None:
+                raise RuntimeError("cannot release a read lock that is not held")
+            if depth > 1:
+                self._readers[me] = depth - 1
+            else:
+                del self._readers[me]
+                if not self._readers:
+                    self._cond.notify_all()
+
+    @contextmanager
+    def read_lock(self) -> Iterator[None]:
+        """Hold the lock for reading inside a ``with`` block."""
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write_lock(self) -> Iterator[None]:
+        """Hold the lock for writing inside a ``with`` block."""
+        self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    # ---------- Introspection ---------- #
+
+    @property
+    def reader_count(self) -> int:
+        """Number of threads currently holding the lock for reading."""
+        with self._cond:
+            return len(self._readers)
+
+    @property
+    def write_locked(self) -> bool:
+        """Whether a thread currently holds the lock for writing."""
+        with self._cond:
+            return self._writer is not None
+
+    # ---------- Internal helpers ---------- #
+
+    def _wait(self, ready, blocking: bool, timeout: float, writer: bool = False) -> bool:
+        """Wait on the condition until ``ready()``; the caller holds it."""
+        if ready():
+            return True
+        if not blocking:
+            return False
+        deadline = None if timeout is None or timeout < 0 else time.monotonic() + timeout
+        if writer:
+            self._writers_waiting += 1
+        try:
+            while not ready():
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return True
+        finally:
+            if writer:
+                self._writers_waiting -= 1
+                # Readers held back by this writer may proceed if it gave up
+                self._cond.notify_all()
@@ -0,0 +1,54 @@
+"""Report latency benchmark for the columnar analytics path.
+
+Run with ``pytest -s tests/test_analytics_benchmark.py`` to see the table;
+set ``SIDELINE_ASSERT_BENCHMARKS=1`` to also assert the speedup.
+"""
+
+import os
+import time
+
+import pytest
+
+from src.models import GameState, Player
+from src.services.analytics_service import AnalyticsService
+
+ASSERT_TIMINGS = os.environ.get("SIDELINE_ASSERT_BENCHMARKS") == "1"
+ROSTER_SIZES = (20, 200, 2000, 20000)
+
+
+def _roster_state(size: int) -> GameState:
+    roster = {
+        f"Player {idx:05d}": Player(
+            name=f"Player {idx:05d}",
+            total_seconds=idx * 7 % 3600,
+            on_field=idx % 3 == 0,
+            stint_start_ts=1000.0 if idx % 3 == 0 else None,
+        )
+        for idx in range(size)
+    }
+    state = GameState(roster=roster)
+    state.ensure_timer_lists()
+    return state
+
+
+def _best_of(runs: int, func, *args) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@pytest.mark.parametrize("size", ROSTER_SIZES)
+def test_columnar_report_latency(size):
+    analytics = AnalyticsService(_roster_state(size))
+
+    objects_s = _best_of(3, analytics.generate_game_report)
+    columnar_s = _best_of(3, analytics.generate_columnar_report)
+    print(
+        f"\nroster={size:5d}  objects={objects_s * 1000:8.2f} ms  "
+        f"columnar={columnar_s * 1000:8.2f} ms  speedup={objects_s / columnar_s:5.1f}x"
+    )
+    if ASSERT_TIMINGS and size >= 2000:
+        assert columnar_s < objects_s
@@ -161,3 +161,111 @@ def test_generate_report_csv_requires_players():
     report = analytics.generate_game_report()
     with pytest.raises(ValueError):
         analytics.generate_report_csv(report)
+
+
+def _columnar_state():
+    roster = {
+        f"P{idx:02d}": Player(
+            name=f"P{idx:02d}",
+            total_seconds=idx * 95,
+            on_field=idx % 2 == 0,
+            stint_start_ts=1000.0 + idx if idx % 2 == 0 else None,
+        )
+        for idx in range(15)
+    }
+    state = GameState(roster=roster, game_length_seconds=3600, period_count=2)
+    state.ensure_timer_lists()
+    return state
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+def test_columnar_report_matches_object_report(monkeypatch, use_numpy):
+    from src.services import analytics_service
+
+    if use_numpy and analytics_service._np is None:
+        pytest.skip("NumPy is not installed")
+    if not use_numpy:
+        monkeypatch.setattr(analytics_service, "_np", None)
+    monkeypatch.setattr(analytics_service, "now_ts", lambda: 1300.5)
+
+    state = _columnar_state()
+    analytics = AnalyticsService(state)
+    report = analytics.generate_game_report()
+    columnar = analytics.generate_columnar_report()
+
+    by_name = {summary.name: summary for summary in report.players}
+    for idx, name in enumerate(columnar.names):
+        summary = by_name[name]
+        assert columnar.cumulative_seconds[idx] == summary.cumulative_seconds
+        assert columnar.delta_seconds[idx] == summary.delta_seconds
+        assert analytics_service.FAIRNESS_LABELS[columnar.fairness_codes[idx]] == summary.fairness
+    assert columnar.target_seconds_per_player == report.target_seconds_per_player
+    assert columnar.average_seconds == pytest.approx(report.average_seconds)
+    assert columnar.median_seconds == pytest.approx(report.median_seconds)
+    assert (columnar.min_seconds, columnar.max_seconds) == (report.min_seconds, report.max_seconds)
+    assert columnar.fairness_counts == report.fairness_counts
+
+
+def test_roster_columns_follow_roster_changes():
+    state = _columnar_state()
+    columns = state.roster_columns()
+    assert len(columns) == 15
+
+    state.roster["P00"].end_stint(1100.0)
+    del state.roster["P01"]
+    state.roster["New"] = Player(name="New", total_seconds=5)
+    columns = state.roster_columns()
+
+    assert len(columns) == 15
+    assert columns.totals[columns.slot("P00")] == 100
+    assert columns.on_field[columns.slot("P00")] == 0
+    assert columns.totals[columns.slot("New")] == 5
+    with pytest.raises(KeyError):
+        columns.slot("P01")
+
+
+def test_roster_columns_rewrite_only_changed_players(monkeypatch):
+    from src.models.roster_columns import RosterColumns
+
+    state = _columnar_state()
+    state.roster_columns()
+    full_syncs = []
+    original_sync = RosterColumns.sync
+    monkeypatch.setattr(RosterColumns, "sync", lambda self, roster: full_syncs.append(1) or original_sync(self, roster))
+    updated = []
+    original_update = RosterColumns.update
+    monkeypatch.setattr(
+        RosterColumns, "update", lambda self, roster, names: updated.extend(names) or original_update(self, roster, names)
+    )
+
+    # Players report writes themselves, however they are made
+    state.roster["P02"].end_stint(1100.0)
+    state.roster["P03"].total_seconds = 999
+    columns = state.roster_columns()
+    assert full_syncs == []
+    assert sorted(updated) == ["P02", "P03"]
+    assert (columns.totals[columns.slot("P02")], columns.on_field[columns.slot("P02")]) == (288, 0)
+    assert columns.totals[columns.slot("P03")] == 999
+
+    # Replacing a player object re-syncs the view
+    state.roster["P04"] = Player(name="P04", total_seconds=7)
+    assert state.roster_columns().totals[columns.slot("P04")] == 7
+    assert full_syncs == [1]
+
+
+def test_columnar_report_sees_direct_stint_changes(monkeypatch):
+    from src.services import analytics_service
+
+    monkeypatch.setattr(analytics_service, "now_ts", lambda: 1600.0)
+    state = _columnar_state()
+    analytics = AnalyticsService(state)
+    analytics.generate_columnar_report()
+    player = next(player for player in state.roster.values() if player.on_field)
+
+    player.end_stint(1500.0)
+    columnar = analytics.generate_columnar_report()
+    report = analytics.generate_game_report()
+
+    idx = columnar.names.index(player.name)
+    summary = next(summary for summary in report.players if summary.name == player.name)
+    assert columnar.cumulative_seconds[idx] == summary.cumulative_seconds
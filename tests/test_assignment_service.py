@@ -0,0 +1,122 @@
+"""Tests for the optimal position assignment engine."""
+
+import itertools
+import random
+import time
+
+import pytest
+
+from src.models import GameState, Player
+from src.models.formation import FormationTemplates, FormationType
+from src.services.assignment_service import AssignmentService, solve_assignment
+from src.ui.web_app import create_app, create_game_registry
+
+
+def _squad(size: int) -> GameState:
+    codes = ["GK", "DF", "MF", "ST"]
+    roster = {}
+    for idx in range(size):
+        player = Player(name=f"Player {idx:02d}", number=str(idx + 1), preferred=codes[idx % 4])
+        player.skill_ratings = {codes[idx % 4]: 1 + idx % 5}
+        roster[player.name] = player
+    return GameState(roster=roster, field_size=11)
+
+
+@pytest.mark.parametrize("rows,cols", [(3, 3), (4, 6), (5, 7)])
+def test_solver_matches_brute_force(rows, cols):
+    rng = random.Random(rows * cols)
+    for _ in range(20):
+        cost = [[rng.randint(0, 50) for _ in range(cols)] for _ in range(rows)]
+        solution = solve_assignment(cost)
+
+        best = min(
+            sum(cost[row][col] for row, col in enumerate(perm))
+            for perm in itertools.permutations(range(cols), rows)
+        )
+        assert len(set(solution)) == rows
+        assert sum(cost[row][col] for row, col in enumerate(solution)) == best
+
+
+def test_solver_rejects_more_rows_than_columns():
+    with pytest.raises(ValueError):
+        solve_assignment([[1], [2]])
+
+
+def test_goalkeeper_and_preferences_are_honoured():
+    state = GameState(roster={
+        "Keeper": Player(name="Keeper", preferred="GK"),
+        "Back": Player(name="Back", preferred="CB"),
+        "Striker": Player(name="Striker", preferred="ST"),
+    })
+    formation = FormationTemplates.get_template_by_type(FormationType.F_4_4_2)
+    by_code = {position.position_code.value: position for position in formation.positions}
+    formation.positions = [by_code["ST"], by_code["CB"], by_code["GK"]]
+
+    result = AssignmentService(state).solve(formation, now=0.0)
+    placed = {assignment.position: assignment.player_name for assignment in result.assignments}
+
+    assert placed == {"GK": "Keeper", "CB": "Back", "ST": "Striker"}
+    assert result.bench == []
+
+
+def test_tired_players_go_to_the_bench():
+    state = GameState(roster={name: Player(name=name, preferred="ST") for name in ("A", "B", "C")})
+    state.roster["A"].start_stint(0.0)
+    state.roster["B"].total_seconds = 600
+    formation = FormationTemplates.get_template_by_type(FormationType.F_4_4_2)
+    formation.positions = formation.get_positions_by_role(formation.positions[-1].position_code)[:1]
+
+    result = AssignmentService(state).solve(formation, now=1200.0)
+
+    assert result.as_mapping() == {0: "C"}
+    assert result.bench == ["A", "B"]
+
+
+def test_short_squad_leaves_slots_unfilled():
+    state = _squad(8)
+    formation = FormationTemplates.get_template_by_type(FormationType.F_4_4_2)
+
+    result = AssignmentService(state).solve(formation, now=0.0)
+
+    assert len(result.assignments) == 8
+    assert len(result.unfilled_slots) == 3
+    with pytest.raises(ValueError):
+        AssignmentService(state).solve(formation, ["Nobody"])
+
+
+def test_full_squad_solves_within_milliseconds():
+    state = _squad(25)
+    formation = FormationTemplates.get_template_by_type(FormationType.F_4_4_2)
+    service = AssignmentService(state)
+
+    timings = []
+    for _ in range(5):
+        start = time.perf_counter()
+        result = service.solve(formation, now=0.0)
+        timings.append(time.perf_counter() - start)
+
+    assert len(result.assignments) == 11
+    assert min(timings) < 0.005
+
+
+def test_optimal_assignment_endpoint(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    client = create_app(registry=create_game_registry(str(tmp_path))).test_client()
+    client.post("/api/roster", json={
+        "players": [{"name": f"P{idx}", "number": str(idx + 1)} for idx in range(12)],
+        "field_size": 11,
+    })
+    client.post("/api/formations/from-template", json={"template_type": "4-4-2", "name": "Base"})
+    version = client.get("/api/state").get_json()["version"]
+
+    response = client.post("/api/formations/Base/optimal-assignment", json={})
+    body = response.get_json()
+    assert response.status_code == 200
+    assert len(body["mapping"]) == 11
+    assert len(body["result"]["bench"]) == 1
+    # Suggestions do not change the game
+    assert client.get("/api/state").get_json()["version"] == version
+
+    assert client.post("/api/formations/Missing/optimal-assignment", json={}).status_code == 404
+    limited = client.post("/api/formations/Base/optimal-assignment", json={"players": ["P0", "Ghost"]})
+    assert limited.status_code == 400
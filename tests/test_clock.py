@@ -0,0 +1,83 @@
+"""Tests for the pluggable clock sources and their use by the timer services."""
+
+import time
+
+import pytest
+
+from src.models import GameState, Player
+from src.services import AnalyticsService, TimerService
+from src.services.game_commands import PauseGameCommand, StartGameCommand
+from src.utils import MonotonicClock, RecordedClock, RecordingClock, VirtualClock
+
+
+def _play_full_game(clock: VirtualClock) -> GameState:
+    state = GameState(roster={
+        "Alice": Player(name="Alice"),
+        "Bob": Player(name="Bob"),
+    })
+    timer = TimerService(state, clock=clock)
+    timer.configure_game(game_length_minutes=60, period_count=2)
+    state.roster["Alice"].start_stint(clock.now(), period_index=0)
+
+    StartGameCommand(state, clock=clock).execute()
+    for period in range(2):
+        if period:
+            timer.start_halftime()
+            timer.end_halftime()
+        # One display refresh per simulated second
+        for _ in range(30 * 60):
+            clock.advance(1)
+            timer.get_game_elapsed_seconds()
+    PauseGameCommand(state, clock=clock).execute()
+    state.roster["Alice"].end_stint(clock.now())
+    return state
+
+
+def test_virtual_clock_simulates_a_full_game_in_milliseconds():
+    clock = VirtualClock(start_ts=10_000.0)
+    started = time.perf_counter()
+    state = _play_full_game(clock)
+
+    assert time.perf_counter() - started < 1.0
+    assert TimerService(state, clock=clock).get_game_elapsed_seconds() == 3600
+    assert state.roster["Alice"].total_seconds == 3600
+    assert state.roster["Alice"].stint_ledger.period_seconds() == {0: 1800, 1: 1800}
+
+
+def test_virtual_clock_refuses_to_move_backwards():
+    clock = VirtualClock(start_ts=50.0)
+    with pytest.raises(ValueError):
+        clock.advance(-1)
+    with pytest.raises(ValueError):
+        clock.set(10.0)
+
+
+def test_monotonic_clock_ignores_wall_clock_jumps(monkeypatch):
+    clock = MonotonicClock(anchor_ts=1000.0)
+    before = clock.now()
+    monkeypatch.setattr(time, "time", lambda: 0.0)
+
+    assert 1000.0 <= before <= clock.now() < 1000.0 + 60
+
+
+def test_recorded_clock_replays_recorded_readings():
+    recording = RecordingClock(VirtualClock(start_ts=500.0))
+    state = GameState(roster={"Alice": Player(name="Alice")})
+    timer = TimerService(state, clock=recording)
+    analytics = AnalyticsService(state, timer, clock=recording)
+
+    StartGameCommand(state, clock=recording).execute()
+    recording.source.advance(42)
+    live_elapsed = timer.get_game_elapsed_seconds()
+    live_report = analytics.generate_game_report()
+
+    replay = RecordedClock(recording.readings)
+    replayed = GameState(roster={"Alice": Player(name="Alice")})
+    replay_timer = TimerService(replayed, clock=replay)
+    StartGameCommand(replayed, clock=replay).execute()
+
+    assert replay_timer.get_game_elapsed_seconds() == live_elapsed == 42
+    assert AnalyticsService(replayed, replay_timer, clock=replay).generate_game_report().generated_ts == (
+        live_report.generated_ts
+    )
+    assert replay.exhausted
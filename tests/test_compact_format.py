@@ -0,0 +1,69 @@
+"""Tests for the compact binary save format."""
+
+from datetime import date
+
+import pytest
+
+from src.models import ContactInfo, GameState, Player
+from src.services.compact_format import CompactFormatError, decode_compact, encode_compact
+from src.services.persistence_service import PersistenceService
+from src.services.player_service import PlayerService
+
+
+def _state() -> GameState:
+    state = GameState(
+        roster={
+            "Alice": Player(name="Alice", number="7", preferred="ST", total_seconds=300,
+                            date_of_birth=date(2012, 3, 4), contact_info=ContactInfo(email="a@example.com")),
+            "Bob": Player(name="Bob", skill_ratings={"GK": 4}),
+        },
+        opponent_notes="Strong left wing",
+        field_size=9,
+    )
+    state.ensure_timer_lists()
+    state.period_stoppage[0] = 45
+    return state
+
+
+def test_compact_save_round_trips_like_json(tmp_path):
+    state = _state()
+    json_path = tmp_path / "game.json"
+    compact_path = tmp_path / "game.sltk"
+    PersistenceService.save_game_to_file(state, str(json_path))
+    PersistenceService.save_game_to_file(state, str(compact_path))
+
+    assert compact_path.read_bytes()[:4] == b"SLTK"
+    from_json = PersistenceService.load_game_from_file(str(json_path))
+    from_compact = PersistenceService.load_game_from_file(str(compact_path))
+    assert from_compact.to_json() == from_json.to_json()
+    assert from_compact.roster["Alice"].date_of_birth == date(2012, 3, 4)
+
+
+def test_format_is_detected_from_contents(tmp_path):
+    path = tmp_path / "game.json"
+    PersistenceService.save_game_to_file(_state(), str(path), compact=True)
+
+    assert PersistenceService.load_game_from_file(str(path)).field_size == 9
+    assert [name for name, _ in PersistenceService.get_recent_saves(str(tmp_path))] == ["game.json"]
+
+
+def test_corrupted_compact_data_is_rejected():
+    blob = encode_compact({"players": {}})
+
+    with pytest.raises(CompactFormatError):
+        decode_compact(blob[:-1])
+    with pytest.raises(CompactFormatError):
+        decode_compact(blob[:-1] + bytes([blob[-1] ^ 0xFF]))
+    with pytest.raises(CompactFormatError):
+        decode_compact(b'{"players": {}}')
+
+
+def test_player_export_supports_compact_format(tmp_path):
+    service = PlayerService()
+    players = list(_state().roster.values())
+    path = tmp_path / "players.sltk"
+    service.export_player_data(players, str(path))
+
+    assert path.read_bytes()[:4] == b"SLTK"
+    imported = service.import_player_data(str(path))
+    assert [player.name for player in imported] == ["Alice", "Bob"]
@@ -0,0 +1,170 @@
+"""Stress tests for per-game locking and the pooled production server."""
+
+import http.client
+import json
+import random
+import sys
+import threading
+import urllib.error
+import urllib.request
+
+from src.ui.web_app import create_app, create_game_registry
+from src.ui.wsgi_server import create_production_server, push_client_limit
+
+FIELD_SIZE = 7
+ROSTER_SIZE = 12
+NAMES = [f"P{idx:02d}" for idx in range(ROSTER_SIZE)]
+POSITIONS = [f"S{slot}" for slot in range(FIELD_SIZE)]
+
+
+def _set_up_game(tmp_path):
+    app = create_app(registry=create_game_registry(str(tmp_path)))
+    app.test_client().post(
+        "/api/roster", json={"players": [{"name": name} for name in NAMES], "field_size": FIELD_SIZE}
+    )
+    game_state = app.extensions["game_registry"].get().session.game_state
+    for name, position in zip(NAMES, POSITIONS):
+        game_state.roster[name].position = position
+        game_state.roster[name].start_stint(0.0)
+    return app, game_state
+
+
+def _random_write(rng: random.Random):
+    """An uncoordinated write; many are rejected because another tablet got there first."""
+    roll = rng.random()
+    if roll < 0.5:
+        out_name, in_name = rng.sample(NAMES, 2)
+        return "/api/substitution", {"out_name": out_name, "in_name": in_name}
+    if roll < 0.7:
+        out_name, in_name, other_out, other_in = rng.sample(NAMES, 4)
+        return "/api/batch", {"actions": [
+            {"type": "substitution", "out_name": out_name, "in_name": in_name},
+            {"type": "substitution", "out_name": other_out, "in_name": other_in},
+        ]}
+    return rng.choice(["/api/timer/start", "/api/timer/pause"]), {}
+
+
+def _assert_consistent(game_state, start_version: int, accepted_writes: int) -> None:
+    # Every accepted write is exactly one state version
+    assert game_state.state_version == start_version + accepted_writes
+    on_field = [player for player in game_state.roster.values() if player.on_field]
+    assert sorted(player.position for player in on_field) == POSITIONS
+    for player in game_state.roster.values():
+        assert player.stint_ledger.is_open == player.on_field
+        assert player.total_seconds == player.stint_ledger.closed_seconds >= 0
+    assert min(game_state.period_elapsed) >= 0
+
+
+def test_concurrent_writes_and_polls_stay_consistent(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    app, game_state = _set_up_game(tmp_path)
+    start_version = game_state.state_version
+    statuses, bad_polls, lock = [], [], threading.Lock()
+
+    def writer(seed: int) -> None:
+        client, rng = app.test_client(), random.Random(seed)
+        for _ in range(200):
+            path, body = _random_write(rng)
+            status = client.post(path, json=body).status_code
+            with lock:
+                statuses.append(status)
+
+    def reader() -> None:
+        client = app.test_client()
+        for _ in range(50):
+            response = client.get("/api/state")
+            players = response.get_json()["players"]
+            if response.status_code != 200 or sum(player["on_field"] for player in players) != FIELD_SIZE:
+                with lock:
+                    bad_polls.append(response.status_code)
+
+    # Switch threads far more often than usual so unguarded races show up
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=writer, args=(seed,)) for seed in range(8)]
+        threads += [threading.Thread(target=reader) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    assert not bad_polls
+    assert not [status for status in statuses if status >= 500]
+    _assert_consistent(game_state, start_version, sum(status < 400 for status in statuses))
+
+
+def _http(base_url: str, method: str, path: str, body=None):
+    data = None if body is None else json.dumps(body).encode()
+    request = urllib.request.Request(
+        base_url + path, data=data, method=method, headers={"Content-Type": "application/json"}
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return response.status, json.loads(response.read() or b"null")
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read() or b"null")
+
+
+def test_pooled_server_handles_concurrent_tablets(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    app, game_state = _set_up_game(tmp_path)
+    start_version = game_state.state_version
+    server = create_production_server(app, port=0, threads=4, access_log=False)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = "http://127.0.0.1:%d" % server.address[1]
+    statuses, lock = [], threading.Lock()
+
+    def tablet(seed: int) -> None:
+        rng = random.Random(seed)
+        for _ in range(15):
+            path, body = _random_write(rng)
+            write_status, _ = _http(base_url, "POST", path, body)
+            read_status, _ = _http(base_url, "GET", "/api/state")
+            with lock:
+                statuses.append((write_status, read_status))
+
+    try:
+        threads = [threading.Thread(target=tablet, args=(seed,)) for seed in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert len(statuses) == 8 * 15
+    assert all(read_status == 200 and write_status < 500 for write_status, read_status in statuses)
+    _assert_consistent(game_state, start_version, sum(status < 400 for status, _ in statuses))
+
+
+def test_open_streams_leave_threads_for_other_requests(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    threads = 2
+    app = create_app(
+        registry=create_game_registry(str(tmp_path)), max_push_clients=push_client_limit(threads)
+    )
+    server = create_production_server(app, port=0, threads=threads, access_log=False)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    streams = [http.client.HTTPConnection("127.0.0.1", server.address[1], timeout=5) for _ in range(threads)]
+
+    responses = []
+    try:
+        # Keep every response alive: dropping one closes its socket and frees its slot
+        for connection in streams:
+            connection.request("GET", "/api/stream?clock_interval=1")
+            responses.append(connection.getresponse())
+        assert [response.status for response in responses] == [200, 503]
+
+        status, body = _http("http://127.0.0.1:%d" % server.address[1], "GET", "/api/games")
+        assert status == 200 and body["success"]
+    finally:
+        for response in responses:
+            response.close()
+        for connection in streams:
+            connection.close()
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,110 @@
+"""Tests for the append-only game event journal and crash recovery."""
+
+import json
+from datetime import date
+
+from src.models import GameState, Player
+from src.services.event_journal import EventJournal, GameEventType
+from src.ui.web_app import create_app, create_game_registry
+
+
+def _state() -> GameState:
+    state = GameState(
+        roster={
+            "Alice": Player(name="Alice", on_field=True, position="ST", stint_start_ts=100.0),
+            "Bob": Player(name="Bob", date_of_birth=date(2012, 5, 1)),
+        }
+    )
+    state.ensure_timer_lists()
+    return state
+
+
+def test_recover_replays_events_after_snapshot(tmp_path):
+    journal = EventJournal.for_game(str(tmp_path), "field-1")
+    state = _state()
+    journal.record(state, GameEventType.ROSTER, players=list(state.roster))
+
+    state.game_start_ts = state.period_start_ts = 100.0
+    state.paused = False
+    state.bump_version()
+    journal.record(state, GameEventType.START)
+
+    alice, bob = state.roster["Alice"], state.roster["Bob"]
+    alice.end_stint(160.0)
+    bob.position = "ST"
+    bob.start_stint(160.0)
+    state.bump_version()
+    event = journal.record(
+        state, GameEventType.SUBSTITUTION, players=["Alice", "Bob"], out_name="Alice", in_name="Bob"
+    )
+    journal.close()
+
+    assert event.seq == 3
+    assert sorted(event.players) == ["Alice", "Bob"]
+    assert journal.events_since_snapshot == 2
+
+    recovered = EventJournal.for_game(str(tmp_path), "field-1").recover()
+    assert recovered.game_start_ts == 100.0
+    assert recovered.paused is False
+    assert recovered.state_version == 2
+    assert recovered.roster["Alice"].total_seconds == 60
+    assert recovered.roster["Alice"].on_field is False
+    assert recovered.roster["Bob"].stint_start_ts == 160.0
+    assert recovered.roster["Bob"].date_of_birth == date(2012, 5, 1)
+
+
+def test_snapshot_compacts_journal(tmp_path):
+    journal = EventJournal.for_game(str(tmp_path), "field-2", snapshot_interval=3)
+    state = _state()
+    for seconds in (10, 20, 30, 40):
+        state.period_stoppage[0] += seconds
+        state.bump_version()
+        journal.record(state, GameEventType.STOPPAGE, seconds=seconds)
+    journal.close()
+
+    lines = (tmp_path / "field-2.events.jsonl").read_text().splitlines()
+    assert [json.loads(line)["seq"] for line in lines] == [4]
+
+    reopened = EventJournal.for_game(str(tmp_path), "field-2")
+    assert reopened.seq == 4
+    assert reopened.recover().period_stoppage[0] == 100
+
+
+def test_torn_trailing_line_is_discarded(tmp_path):
+    journal = EventJournal.for_game(str(tmp_path), "field-3")
+    state = _state()
+    state.paused = False
+    state.bump_version()
+    journal.record(state, GameEventType.START)
+    journal.close()
+
+    path = tmp_path / "field-3.events.jsonl"
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"seq": 2, "type": "pau')
+
+    reopened = EventJournal.for_game(str(tmp_path), "field-3")
+    assert reopened.seq == 1
+    assert path.read_text().endswith("\n")
+
+    state.paused = True
+    state.bump_version()
+    reopened.record(state, GameEventType.PAUSE)
+    reopened.close()
+    assert EventJournal.for_game(str(tmp_path), "field-3").recover().paused is True
+
+
+def test_web_game_recovers_after_restart(tmp_path):
+    client = create_app(registry=create_game_registry(str(tmp_path))).test_client()
+    client.post("/api/games", json={"game_id": "field-4"})
+    client.post("/api/games/field-4/roster", json={"players": [{"name": "Alice"}, {"name": "Bob"}]})
+    client.post("/api/games/field-4/timer/stoppage", json={"seconds": 45})
+    client.post("/api/games/field-4/players/Bob/stats", json={"goals": 2})
+    version = client.get("/api/games/field-4/state").get_json()["version"]
+
+    # A new registry on the same directory simulates a server restart without eviction
+    restarted = create_app(registry=create_game_registry(str(tmp_path))).test_client()
+    state = restarted.get("/api/games/field-4/state").get_json()
+    assert state["version"] == version
+    assert [period["stoppage_seconds"] for period in state["periods"]][0] == 45
+    assert restarted.get("/api/games/field-4/players/Bob").get_json()["player"]["statistics"]["goals"] == 2
+    assert {game["game_id"] for game in restarted.get("/api/games").get_json()["games"]} >= {"field-4"}
@@ -0,0 +1,108 @@
+"""Tests for the heap-based game event scheduler."""
+
+import threading
+import time
+
+from src.models import GameState, Player
+from src.models.formation import SubstitutionPlan
+from src.services import TimerService
+from src.services.event_scheduler import GameEventScheduler, ScheduledEventKind
+from src.ui.web_app import create_app, create_game_registry
+from src.utils import VirtualClock
+
+
+def _started_game(clock: VirtualClock):
+    state = GameState(roster={"Alice": Player(name="Alice"), "Bob": Player(name="Bob")})
+    timer = TimerService(state, clock=clock)
+    timer.configure_game(game_length_minutes=20, period_count=2)
+    timer.start_game()
+    fired = []
+    scheduler = GameEventScheduler(timer, listener=fired.append)
+    scheduler.resync()
+    return timer, scheduler, fired
+
+
+def test_period_end_and_planned_substitutions_fire_in_order():
+    clock = VirtualClock(1000.0)
+    timer, scheduler, fired = _started_game(clock)
+    plan = SubstitutionPlan(
+        name="Rotation",
+        substitutions=[("Bob", "Alice", 8), ("Alice", "Bob", 3)],
+        formation_changes=[],
+    )
+    scheduler.schedule_plan(plan)
+
+    assert scheduler.next_due_ts() == 1000.0 + 180
+    assert scheduler.poll() == []
+
+    clock.advance(600)
+    kinds = [(event.kind, event.data.get("minute")) for event in scheduler.poll()]
+    assert kinds == [
+        (ScheduledEventKind.PLANNED_SUBSTITUTION, 3),
+        (ScheduledEventKind.PLANNED_SUBSTITUTION, 8),
+        (ScheduledEventKind.PERIOD_END, None),
+    ]
+    assert fired[-1].data == {"period_index": 0, "final": False}
+    # A period end fires once, even when re-keyed afterwards
+    scheduler.resync()
+    assert scheduler.pending() == []
+
+
+def test_pause_and_adjustments_re_key_the_period_end():
+    clock = VirtualClock(0.0)
+    timer, scheduler, fired = _started_game(clock)
+
+    clock.advance(300)
+    timer.pause_game()
+    scheduler.resync()
+    assert scheduler.next_due_ts() is None
+
+    clock.advance(1000)
+    timer.resume_game()
+    timer.add_stoppage_time(30)
+    scheduler.resync()
+    # 300 seconds of the period and 30 of stoppage remain
+    assert scheduler.next_due_ts() == clock.now() + 330
+
+    clock.advance(329)
+    assert scheduler.poll() == []
+    clock.advance(1)
+    assert [event.kind for event in scheduler.poll()] == [ScheduledEventKind.PERIOD_END]
+
+
+def test_background_timer_fires_break_end():
+    state = GameState(roster={"Alice": Player(name="Alice")})
+    timer = TimerService(state)
+    timer.start_game()
+    timer.start_halftime()
+    state.halftime_end_ts = time.time() + 0.05
+
+    done = threading.Event()
+    scheduler = GameEventScheduler(timer, listener=lambda event: done.set())
+    scheduler.resync()
+    scheduler.start()
+    try:
+        assert done.wait(5)
+        assert scheduler.pending() == []
+    finally:
+        scheduler.stop()
+
+
+def test_scheduled_event_is_pushed_to_clients(tmp_path):
+    app = create_app(registry=create_game_registry(str(tmp_path)))
+    client = app.test_client()
+    client.post("/api/roster", json={"players": [{"name": "Alice"}]})
+    version = client.get("/api/state").get_json()["version"]
+
+    session = app.extensions["game_registry"].get("default").session
+    session.scheduler.schedule(ScheduledEventKind.PLANNED_SUBSTITUTION, 0, plan="Now")
+    schedule = client.get("/api/schedule").get_json()
+    assert schedule["events"][0]["plan"] == "Now"
+
+    # The clock is stopped, so the event only fires when polled
+    session.scheduler.poll()
+    changed = client.get(f"/api/state/wait?version={version}&timeout=5").get_json()
+    assert changed["event"]["cause"] == "scheduled_planned_substitution"
+    assert changed["event"]["data"] == {"plan": "Now"}
+    assert client.get("/api/schedule").get_json()["events"] == []
+    assert client.post("/api/strategy/substitution-plans/Missing/schedule").status_code == 404
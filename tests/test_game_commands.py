@@ -0,0 +1,221 @@
+"""Tests for delta-recording game commands, batches and the persistent undo history."""
+
+from src.models import GameState, Player
+from src.services.event_journal import EventJournal, GameEventType
+from src.services.game_commands import (
+    AddStoppageCommand, GameCommandManager, MacroCommand, PauseGameCommand, StartGameCommand,
+    SubstitutePlayerCommand
+)
+from src.ui.web_app import create_app, create_game_registry
+from src.utils import VirtualClock
+
+
+def _game(roster_size: int = 4) -> GameState:
+    state = GameState(roster={f"P{idx:02d}": Player(name=f"P{idx:02d}") for idx in range(roster_size)})
+    state.ensure_timer_lists()
+    starter = state.roster["P00"]
+    starter.position = "ST"
+    starter.start_stint(0.0, period_index=0)
+    return state
+
+
+def test_substitution_undo_and_redo_restore_players():
+    clock = VirtualClock(0.0)
+    state = _game()
+    manager = GameCommandManager(game_state=state)
+    manager.execute_command(StartGameCommand(state, clock=clock))
+    clock.advance(300)
+
+    assert manager.execute_command(SubstitutePlayerCommand(state, "P00", "P01", clock=clock))
+    out_player, in_player = state.roster["P00"], state.roster["P01"]
+    assert (out_player.on_field, out_player.total_seconds) == (False, 300)
+    assert (in_player.on_field, in_player.position, in_player.stint_start_ts) == (True, "ST", 300.0)
+
+    assert manager.undo()
+    assert (out_player.on_field, out_player.position, out_player.total_seconds) == (True, "ST", 0)
+    assert out_player.stint_ledger.stints() == [(0.0, None, 0, "ST")]
+    assert (in_player.on_field, in_player.position, len(in_player.stint_ledger)) == (False, None, 0)
+
+    assert manager.redo()
+    assert in_player.stint_ledger.stints() == [(300.0, None, 0, "ST")]
+    assert out_player.stint_ledger.stints() == [(0.0, 300.0, 0, "ST")]
+    assert manager.get_command_history() == ["Start Game", "Substitute P00 → P01"]
+
+
+def test_records_only_hold_changed_fields():
+    clock = VirtualClock(0.0)
+    state = _game(roster_size=40)
+    StartGameCommand(state, clock=clock).execute()
+    clock.advance(60)
+
+    pause = PauseGameCommand(state, clock=clock)
+    substitution = SubstitutePlayerCommand(state, "P00", "P39", clock=clock)
+    assert pause.execute() and substitution.execute()
+
+    assert {change.field for change in pause.record.changes} == {"period_elapsed", "period_start_ts", "paused"}
+    assert {change.target for change in substitution.record.changes} == {"P00", "P39"}
+
+
+def test_history_is_bounded_and_new_command_drops_redo():
+    clock = VirtualClock(0.0)
+    state = _game()
+    manager = GameCommandManager(max_history=3, game_state=state)
+    for _ in range(3):
+        manager.execute_command(StartGameCommand(state, clock=clock))
+        manager.execute_command(PauseGameCommand(state, clock=clock))
+
+    assert len(manager.get_command_history()) == 3
+    manager.undo()
+    assert manager.can_redo()
+    manager.execute_command(StartGameCommand(state, clock=clock))
+    assert not manager.can_redo()
+    assert manager.get_command_history() == ["Pause Game", "Start Game", "Start Game"]
+
+
+def test_undo_history_survives_a_reload():
+    clock = VirtualClock(0.0)
+    state = _game()
+    manager = GameCommandManager(game_state=state)
+    manager.execute_command(StartGameCommand(state, clock=clock))
+    clock.advance(120)
+    manager.execute_command(SubstitutePlayerCommand(state, "P00", "P02", clock=clock))
+
+    restored = GameState.from_json(state.to_json())
+    reloaded = GameCommandManager(game_state=restored)
+
+    assert reloaded.get_command_history() == ["Start Game", "Substitute P00 → P02"]
+    assert reloaded.undo()
+    assert restored.roster["P00"].on_field and not restored.roster["P02"].on_field
+    assert reloaded.undo()
+    assert restored.game_start_ts is None and restored.paused
+    assert not reloaded.can_undo()
+
+
+def test_journal_recovery_keeps_undo_history(tmp_path):
+    clock = VirtualClock(0.0)
+    state = _game()
+    manager = GameCommandManager(game_state=state)
+    journal = EventJournal.for_game(str(tmp_path), "field-1")
+    journal.record(state, GameEventType.ROSTER, players=list(state.roster))
+
+    manager.execute_command(StartGameCommand(state, clock=clock))
+    state.bump_version()
+    journal.record(state, GameEventType.START)
+    clock.advance(90)
+    manager.execute_command(SubstitutePlayerCommand(state, "P00", "P01", clock=clock))
+    state.bump_version()
+    journal.record(state, GameEventType.SUBSTITUTION, players=["P00", "P01"])
+    manager.undo()
+    state.bump_version()
+    journal.record(state, GameEventType.UNDO, players=["P00", "P01"])
+    journal.close()
+
+    recovered = EventJournal.for_game(str(tmp_path), "field-1").recover()
+    assert recovered.command_log.to_dict() == state.command_log.to_dict()
+    assert GameCommandManager(game_state=recovered).redo()
+    assert recovered.roster["P01"].on_field
+
+
+def test_substitution_endpoint_is_undoable(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    app = create_app(registry=create_game_registry(str(tmp_path)))
+    client = app.test_client()
+    client.post("/api/roster", json={"players": [{"name": "A"}, {"name": "B"}], "field_size": 7})
+    game_state = app.extensions["game_registry"].get().session.game_state
+    game_state.roster["A"].position = "ST"
+    game_state.roster["A"].start_stint(0.0)
+    columns = game_state.roster_columns()
+
+    assert client.post("/api/substitution", json={"out_name": "A", "in_name": "B"}).status_code == 200
+    # Changes recorded by the API reach the columnar view
+    assert list(game_state.roster_columns().on_field) == [0, 1]
+    assert client.post("/api/undo").status_code == 200
+    assert game_state.roster["A"].on_field and game_state.roster["A"].position == "ST"
+    assert not game_state.roster["B"].on_field
+    assert game_state.roster_columns() is columns and list(columns.on_field) == [1, 0]
+    assert client.post("/api/undo").status_code == 400
+
+
+def _window_game() -> GameState:
+    state = _game(roster_size=6)
+    for name, position in (("P01", "CB"), ("P02", "GK")):
+        state.roster[name].position = position
+        state.roster[name].start_stint(0.0, period_index=0)
+    return state
+
+
+def test_macro_applies_all_at_one_timestamp_and_undoes_as_one():
+    clock = VirtualClock(0.0)
+    state = _window_game()
+    manager = GameCommandManager(game_state=state)
+    clock.advance(600)
+    batch = MacroCommand(state, [
+        SubstitutePlayerCommand(state, "P00", "P03"),
+        SubstitutePlayerCommand(state, "P01", "P04"),
+        AddStoppageCommand(state, 30),
+    ], clock=clock)
+
+    assert manager.execute_command(batch)
+    assert {state.roster[name].stint_start_ts for name in ("P03", "P04")} == {600.0}
+    assert state.period_stoppage[0] == 30
+    assert manager.get_command_history() == [batch.description]
+
+    assert manager.undo()
+    assert state.roster["P00"].on_field and state.roster["P01"].on_field
+    assert not state.roster["P03"].on_field and not state.roster["P04"].on_field
+    assert state.period_stoppage[0] == 0
+    assert not manager.can_undo()
+
+
+def test_macro_rolls_back_when_an_action_fails():
+    clock = VirtualClock(0.0)
+    state = _window_game()
+    before = state.to_json()
+    batch = MacroCommand(state, [
+        SubstitutePlayerCommand(state, "P00", "P03"),
+        SubstitutePlayerCommand(state, "P05", "P04"),  # P05 is on the bench
+    ], clock=clock)
+
+    assert not batch.execute()
+    assert batch.failed_index == 1
+    assert state.to_json() == before
+
+
+def test_batch_endpoint_is_one_version_and_one_undo(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    app = create_app(registry=create_game_registry(str(tmp_path)))
+    client = app.test_client()
+    client.post("/api/roster", json={"players": [{"name": f"P{idx:02d}"} for idx in range(6)], "field_size": 7})
+    client.post("/api/formations/from-template", json={"template_type": "4-4-2", "name": "Base"})
+    game_state = app.extensions["game_registry"].get().session.game_state
+    for name, position in (("P00", "ST"), ("P01", "CB")):
+        game_state.roster[name].position = position
+        game_state.roster[name].start_stint(0.0)
+    version = client.get("/api/state").get_json()["version"]
+
+    rejected = client.post("/api/batch", json={"actions": [
+        {"type": "substitution", "out_name": "P00", "in_name": "P02"},
+        {"type": "substitution", "out_name": "P05", "in_name": "P03"},
+    ]})
+    assert rejected.status_code == 400 and rejected.get_json()["failed_index"] == 1
+    assert client.post("/api/batch", json={"actions": [{"type": "dance"}]}).status_code == 400
+    not_an_object = client.post("/api/batch", json=[1, 2])
+    assert not_an_object.status_code == 400 and not not_an_object.get_json()["success"]
+    malformed = {"actions": [{"type": "formation", "name": "Base", "assignments": ["P00"]}]}
+    assert client.post("/api/batch", json=malformed).status_code == 400
+    assert client.get("/api/state").get_json()["version"] == version
+    assert game_state.roster["P00"].on_field
+
+    response = client.post("/api/batch", json={"actions": [
+        {"type": "substitution", "out_name": "P00", "in_name": "P02"},
+        {"type": "substitution", "out_name": "P01", "in_name": "P03"},
+        {"type": "formation", "name": "Base", "assignments": {"0": "P02"}},
+    ]})
+    assert response.status_code == 200
+    assert response.headers["X-State-Version"] == str(version + 1)
+    assert game_state.roster["P02"].position == "GK"
+    assert game_state.current_formation.positions[0].player_name == "P02"
+
+    assert client.post("/api/undo").status_code == 200
+    assert game_state.roster["P00"].on_field and game_state.roster["P01"].on_field
+    assert game_state.current_formation is None
@@ -0,0 +1,185 @@
+"""Tests for multi-game tenancy in the registry and web API."""
+
+import threading
+
+import pytest
+
+from src.models import GameState, Player
+from src.services.game_registry import GameNotFoundError, GameRegistry
+from src.services.persistence_service import PersistenceService
+from src.ui.web_app import WebAppState, create_app, create_game_registry
+
+
+class _Session:
+    def __init__(self, game_id, game_state):
+        self.game_id = game_id
+        self.game_state = game_state or GameState()
+
+
+def test_registry_creates_isolated_games(tmp_path):
+    registry = GameRegistry(_Session, storage_dir=str(tmp_path))
+
+    field_1 = registry.get("field-1")
+    field_2 = registry.get("field-2")
+    field_1.session.game_state.roster["Alice"] = Player(name="Alice")
+
+    assert registry.get("field-1") is field_1
+    assert field_1.lock is not field_2.lock
+    assert "Alice" not in field_2.session.game_state.roster
+    assert [game["game_id"] for game in registry.list_games()] == ["field-1", "field-2"]
+
+
+def test_registry_rejects_unsafe_ids_and_missing_games(tmp_path):
+    registry = GameRegistry(_Session, storage_dir=str(tmp_path))
+
+    with pytest.raises(ValueError):
+        registry.get("../etc")
+    with pytest.raises(GameNotFoundError):
+        registry.get("unknown", create=False)
+
+
+def test_idle_stopped_games_are_evicted_and_reloaded(tmp_path):
+    registry = GameRegistry(_Session, storage_dir=str(tmp_path), idle_timeout_seconds=10)
+
+    stopped = registry.get("stopped")
+    stopped.session.game_state.roster["Alice"] = Player(name="Alice", total_seconds=300)
+    running = registry.get("running")
+    running.session.game_state.game_start_ts = 1.0
+    running.session.game_state.paused = False
+
+    evicted = registry.evict_idle(now=stopped.last_access_ts + 60)
+
+    assert evicted == ["stopped"]
+    assert (tmp_path / "stopped.json").exists()
+    listing = {game["game_id"]: game for game in registry.list_games()}
+    assert listing["stopped"]["resident"] is False
+    assert listing["running"]["resident"] is True
+
+    reloaded = registry.get("stopped", create=False)
+    assert reloaded is not stopped
+    assert reloaded.session.game_state.roster["Alice"].total_seconds == 300
+
+
+def test_eviction_counts_running_stints_on_the_game_clock(tmp_path):
+    class _ClockedSession(_Session):
+        def now(self):
+            return 1600.0
+
+    registry = GameRegistry(_ClockedSession, storage_dir=str(tmp_path))
+    registry.get("field-1").session.game_state.roster["Alice"] = Player(name="Alice")
+    registry.get("field-1").session.game_state.roster["Alice"].start_stint(1000.0)
+
+    assert registry.evict("field-1") is True
+    reloaded = registry.get("field-1", create=False).session.game_state
+    assert reloaded.roster["Alice"].total_seconds == 600
+
+
+def test_locked_games_are_not_evicted(tmp_path):
+    registry = GameRegistry(_Session, storage_dir=str(tmp_path), idle_timeout_seconds=0)
+    entry = registry.get("busy")
+    locked = threading.Event()
+    release = threading.Event()
+
+    def hold_lock():
+        with entry.lock:
+            locked.set()
+            release.wait(5)
+
+    holder = threading.Thread(target=hold_lock)
+    holder.start()
+    locked.wait(5)
+    try:
+        assert registry.evict("busy") is False
+    finally:
+        release.set()
+        holder.join()
+    assert registry.evict("busy") is True
+
+
+def test_eviction_saves_outside_the_registry_lock(tmp_path, monkeypatch):
+    registry = GameRegistry(_Session, storage_dir=str(tmp_path))
+    slow = registry.get("slow")
+    slow.session.game_state.roster["Alice"] = Player(name="Alice", total_seconds=300)
+    saving = threading.Event()
+    finish = threading.Event()
+    save = PersistenceService.save_game_to_file
+
+    def slow_save(game_state, path, **kwargs):
+        saving.set()
+        finish.wait(5)
+        return save(game_state, path, **kwargs)
+
+    monkeypatch.setattr(PersistenceService, "save_game_to_file", slow_save)
+    evictor = threading.Thread(target=registry.evict, args=("slow",))
+    evictor.start()
+    try:
+        assert saving.wait(5)
+        # Other games stay reachable while one is written out
+        registry.get("other")
+        assert registry.exists("slow")
+
+        reloaded = []
+        loader = threading.Thread(target=lambda: reloaded.append(registry.get("slow", create=False)))
+        loader.start()
+        loader.join(0.2)
+        assert loader.is_alive()
+    finally:
+        finish.set()
+        evictor.join()
+    loader.join(5)
+
+    assert reloaded[0] is not slow
+    assert reloaded[0].session.game_state.roster["Alice"].total_seconds == 300
+
+
+def test_remove_waits_for_the_game_lock(tmp_path):
+    closed = []
+
+    class _ClosingSession(_Session):
+        def close(self):
+            closed.append(self.game_id)
+
+    registry = GameRegistry(_ClosingSession, storage_dir=str(tmp_path))
+    entry = registry.get("busy")
+    remover = threading.Thread(target=registry.remove, args=("busy",))
+    with entry.lock:
+        remover.start()
+        remover.join(0.2)
+        assert closed == []
+    remover.join(5)
+    assert closed == ["busy"]
+    assert not registry.exists("busy")
+
+
+def test_web_routes_are_scoped_per_game(tmp_path):
+    app = create_app(registry=create_game_registry(str(tmp_path)))
+    client = app.test_client()
+
+    response = client.post("/api/games", json={"game_id": "field-7"})
+    assert response.status_code == 201
+    assert client.post("/api/games", json={"game_id": "field-7"}).status_code == 409
+
+    roster = {"players": [{"name": "Alice"}, {"name": "Bob"}], "field_size": 7}
+    assert client.post("/api/games/field-7/roster", json=roster).status_code == 200
+
+    field_players = client.get("/api/games/field-7/players").get_json()
+    default_players = client.get("/api/players").get_json()
+    assert field_players["count"] == 2
+    assert default_players["count"] == 0
+
+    games = client.get("/api/games").get_json()["games"]
+    assert {game["game_id"] for game in games} == {"default", "field-7"}
+
+    assert client.get("/api/games/bad id/state").status_code == 400
+    assert client.get("/api/games/tpyo-field/state").status_code == 404
+    assert client.post("/api/games", json={"game_id": "tpyo-field"}).status_code == 201
+    assert client.delete("/api/games/field-7").status_code == 200
+    assert client.delete("/api/games/field-7").status_code == 404
+
+
+def test_web_app_state_accepts_existing_game_state():
+    state = GameState(roster={"Alice": Player(name="Alice")})
+    app_state = WebAppState(state)
+
+    assert app_state.game_state is state
+    assert app_state.timer_service.game_state is state
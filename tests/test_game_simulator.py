@@ -0,0 +1,59 @@
+"""Tests and benchmark for the fast-forward game simulator.
+
+Run with ``pytest -s tests/test_game_simulator.py`` to see the latency tables.
+"""
+
+import pytest
+
+from src.services.game_simulator import (
+    GameSimulator,
+    SimulationConfig,
+    summarize_latencies,
+)
+from src.utils import HALFTIME_PAUSE_MIN, VirtualClock
+
+
+def test_simulated_game_covers_full_time_with_full_field():
+    config = SimulationConfig(games=1, roster_size=10, field_size=7, max_stoppage_seconds=0)
+    simulator = GameSimulator(config)
+    state = simulator.play_game(VirtualClock(0.0))
+
+    assert state.period_elapsed == [1800, 1800]
+    # Seven players on the field for the whole game; like the apps, stints
+    # keep running through the halftime break
+    game_seconds = 3600 + int(HALFTIME_PAUSE_MIN * 60)
+    assert sum(p.total_seconds for p in state.roster.values()) == 7 * game_seconds
+    assert all(p.total_seconds > 0 for p in state.roster.values())
+
+
+def test_runs_are_reproducible_and_report_every_operation():
+    config = SimulationConfig(games=2, game_length_minutes=10, track_memory=True, seed=7)
+    first = GameSimulator(config).run()
+    second = GameSimulator(config).run()
+
+    assert first.simulated_seconds == second.simulated_seconds
+    assert first.operations["substitution"].count == second.operations["substitution"].count
+    assert {"start_game", "elapsed_seconds", "game_report", "final_report"} <= set(first.operations)
+    assert first.peak_memory_bytes > 0
+
+
+def test_latency_percentiles_use_nearest_rank():
+    stats = summarize_latencies([float(value) for value in range(1, 101)])
+
+    assert (stats.count, stats.p50, stats.p95, stats.p99, stats.max) == (100, 51.0, 96.0, 100.0, 100.0)
+
+
+def test_field_larger_than_roster_is_rejected():
+    with pytest.raises(ValueError):
+        GameSimulator(SimulationConfig(roster_size=5, field_size=7))
+
+
+@pytest.mark.parametrize("roster_size,field_size", [(10, 7), (14, 9), (18, 11)])
+def test_simulator_benchmark(roster_size, field_size):
+    config = SimulationConfig(
+        games=3, roster_size=roster_size, field_size=field_size, track_memory=False
+    )
+    report = GameSimulator(config).run()
+
+    print("\n" + report.format_table())
+    assert report.games == 3
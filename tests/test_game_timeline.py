@@ -0,0 +1,87 @@
+"""Tests for the wall-time/game-time timeline index."""
+
+from src.models import GameState, GameTimeline, Player
+from src.services import TimerService
+from src.services.game_commands import PauseGameCommand
+from src.utils import HALFTIME_PAUSE_MIN, VirtualClock
+
+
+def _played_game(clock: VirtualClock) -> TimerService:
+    """Kick off at 1000, pause 300-400, halftime at 1800 played seconds."""
+    state = GameState(roster={"Alice": Player(name="Alice")})
+    timer = TimerService(state, clock=clock)
+    timer.configure_game(game_length_minutes=60, period_count=2)
+    timer.start_game()
+    clock.advance(300)
+    timer.pause_game()
+    clock.advance(100)
+    timer.resume_game()
+    clock.advance(1500)
+    timer.start_halftime()
+    clock.advance(int(HALFTIME_PAUSE_MIN * 60))
+    timer.end_halftime()
+    clock.advance(600)
+    return timer
+
+
+def test_conversions_skip_pauses_and_breaks():
+    clock = VirtualClock(1000.0)
+    timer = _played_game(clock)
+    second_half_ts = 1000.0 + 1900 + HALFTIME_PAUSE_MIN * 60
+
+    assert timer.game_seconds_at(900.0) == 0
+    assert timer.game_seconds_at(1150.0) == 150
+    # The clock stands still during the pause and the break
+    assert timer.game_seconds_at(1350.0) == 300
+    assert timer.game_seconds_at(1450.0) == 350
+    assert timer.game_seconds_at(second_half_ts - 1) == 1800
+    assert timer.game_seconds_at(clock.now()) == 2400
+
+    assert timer.wall_time_at(150) == 1150.0
+    # A reading held through a pause maps to the moment it was first shown
+    assert timer.wall_time_at(300) == 1300.0
+    assert timer.wall_time_at(1800) == 1000.0 + 1900
+    assert timer.wall_time_at(1801) == second_half_ts + 1
+    assert timer.game_state.timeline.period_at(clock.now()) == 1
+
+
+def test_timeline_survives_persistence():
+    clock = VirtualClock(1000.0)
+    state = _played_game(clock).game_state
+    restored = GameState.from_json(state.to_json())
+
+    assert restored.timeline == state.timeline
+    assert restored.timeline.is_open
+    assert TimerService(restored, clock=clock).wall_time_at(2000) == clock.now() - 400
+
+
+def test_commands_and_undo_keep_segments_sorted():
+    clock = VirtualClock(0.0)
+    timer = _played_game(clock)
+    command = PauseGameCommand(timer.game_state, clock=clock)
+    command.execute()
+    timer.get_game_elapsed_seconds()
+    assert not timer.game_state.timeline.is_open
+
+    clock.advance(50)
+    command.undo()
+    clock.advance(10)
+    timer.get_game_elapsed_seconds()
+    timeline = timer.game_state.timeline
+    assert list(timeline.game_starts) == sorted(timeline.game_starts)
+    # Undo rolls period_elapsed back to before the pause; the timeline follows the timer
+    assert timer.game_seconds_at(clock.now()) == timer.get_game_elapsed_seconds()
+
+    timer.reset_game()
+    timer.get_game_elapsed_seconds()
+    assert len(timer.game_state.timeline) == 0
+
+
+def test_wall_time_of_unreached_reading_is_unknown():
+    timeline = GameTimeline()
+    assert timeline.wall_ts_at(10) is None
+
+    timeline.open(100.0, 0, 0)
+    timeline.close(160.0)
+    assert timeline.wall_ts_at(60) == 160.0
+    assert timeline.wall_ts_at(61) is None
@@ -0,0 +1,99 @@
+"""Save latency benchmark for the single-pass snapshot serializer.
+
+Run with ``pytest -s tests/test_persistence_benchmark.py`` to see the table;
+set ``SIDELINE_ASSERT_BENCHMARKS=1`` to also assert the speedup.
+"""
+
+import os
+import time
+from datetime import date
+
+import pytest
+
+from src.models import ContactInfo, GameAttendance, GameState, MedicalInfo, Player
+from src.services.persistence_service import PersistenceService
+
+# Timing assertions flap on shared CI machines, so they are opt-in
+ASSERT_TIMINGS = os.environ.get("SIDELINE_ASSERT_BENCHMARKS") == "1"
+ROSTER_SIZES = (20, 200, 2000)
+
+
+def _roster_state(size: int) -> GameState:
+    roster = {}
+    for idx in range(size):
+        name = f"Player {idx:04d}"
+        roster[name] = Player(
+            name=name,
+            number=str(idx % 99),
+            preferred="ST,MF",
+            total_seconds=idx * 7,
+            on_field=idx % 3 == 0,
+            position="ST" if idx % 3 == 0 else None,
+            stint_start_ts=1000.0 if idx % 3 == 0 else None,
+            date_of_birth=date(2010, 1 + idx % 12, 1),
+            contact_info=ContactInfo(phone="555-0100", email=f"p{idx}@example.com"),
+            medical_info=MedicalInfo(allergies=["pollen"], notes="none"),
+            skill_ratings={"ST": 3, "MF": 4},
+            attendance_history=[GameAttendance(date=date(2024, 9, day), present=True) for day in range(1, 6)],
+        )
+    state = GameState(roster=roster)
+    state.ensure_timer_lists()
+    return state
+
+
+def _legacy_snapshot(game_state: GameState, current_time: float) -> dict:
+    """Previous implementation: JSON round-trip copy, patch totals, serialize again."""
+    temp = GameState.from_json(game_state.to_json())
+    for player in temp.roster.values():
+        if player.on_field and player.stint_start_ts is not None:
+            player.total_seconds += player.current_stint_seconds(current_time)
+    return temp.to_json()
+
+
+def _best_of(runs: int, func, *args) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@pytest.mark.parametrize("size", ROSTER_SIZES)
+def test_single_pass_snapshot_latency(size):
+    state = _roster_state(size)
+    current_time = 1600.0
+
+    single_pass = PersistenceService.serialize_game_state(state, current_time)
+    legacy = _legacy_snapshot(state, current_time)
+    assert {name: p["total_seconds"] for name, p in single_pass["players"].items()} == {
+        name: p["total_seconds"] for name, p in legacy["players"].items()
+    }
+
+    single_pass_s = _best_of(3, PersistenceService.serialize_game_state, state, current_time)
+    legacy_s = _best_of(3, _legacy_snapshot, state, current_time)
+    print(
+        f"\nroster={size:5d}  single-pass={single_pass_s * 1000:8.2f} ms  "
+        f"round-trip={legacy_s * 1000:8.2f} ms  speedup={legacy_s / single_pass_s:5.1f}x"
+    )
+    if ASSERT_TIMINGS and size >= 2000:
+        assert single_pass_s < legacy_s
+
+
+@pytest.mark.parametrize("size", ROSTER_SIZES)
+def test_compact_format_size_and_parse_time(size, tmp_path):
+    state = _roster_state(size)
+    json_path = tmp_path / "game.json"
+    compact_path = tmp_path / "game.sltk"
+    PersistenceService.save_game_to_file(state, str(json_path))
+    PersistenceService.save_game_to_file(state, str(compact_path))
+
+    json_bytes = json_path.stat().st_size
+    compact_bytes = compact_path.stat().st_size
+    json_s = _best_of(3, PersistenceService.read_document, str(json_path))
+    compact_s = _best_of(3, PersistenceService.read_document, str(compact_path))
+    print(
+        f"\nroster={size:5d}  json={json_bytes / 1024:9.1f} KiB {json_s * 1000:7.2f} ms  "
+        f"compact={compact_bytes / 1024:8.1f} KiB {compact_s * 1000:7.2f} ms"
+    )
+    assert compact_bytes < json_bytes / 4
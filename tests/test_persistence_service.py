@@ -0,0 +1,136 @@
+"""Tests for atomic saves, the autosave ring and the background autosave engine."""
+
+import json
+import time
+
+from src.models import GameState, Player
+from src.services import persistence_service
+from src.services.persistence_service import (
+    SAVE_INDEX_FILENAME,
+    AutosaveEngine,
+    PersistenceService,
+)
+from src.ui.web_app import create_app, create_game_registry
+from src.utils import VirtualClock
+
+
+def _state() -> GameState:
+    return GameState(roster={"Alice": Player(name="Alice", total_seconds=90)})
+
+
+def test_save_is_atomic_and_loadable(tmp_path):
+    path = tmp_path / "games" / "match.json"
+    PersistenceService.save_game_to_file(_state(), str(path))
+    PersistenceService.save_game_to_file(_state(), str(path))
+
+    assert [p.name for p in path.parent.iterdir()] == ["match.json"]
+    assert PersistenceService.load_game_from_file(str(path)).roster["Alice"].total_seconds == 90
+
+
+def test_auto_save_rotates_a_bounded_ring(tmp_path):
+    paths = [PersistenceService.auto_save(_state(), str(tmp_path), generations=3) for _ in range(5)]
+
+    assert paths[0] == paths[3]
+    assert sorted(p.name for p in tmp_path.glob("game_autosave_*.json")) == [
+        "game_autosave_0.json", "game_autosave_1.json", "game_autosave_2.json",
+    ]
+    index = json.loads((tmp_path / SAVE_INDEX_FILENAME).read_text())
+    assert index["next_generation"] == 5
+    assert [entry["filename"] for entry in index["saves"]] == [
+        "game_autosave_1.json", "game_autosave_0.json", "game_autosave_2.json",
+    ]
+
+
+def test_recent_saves_use_index_without_scanning(tmp_path, monkeypatch):
+    PersistenceService.auto_save(_state(), str(tmp_path))
+    PersistenceService.save_game_to_file(_state(), str(tmp_path / "manual.json"))
+
+    def fail_listdir(path):
+        raise AssertionError("directory scanned")
+
+    monkeypatch.setattr(persistence_service.os, "listdir", fail_listdir)
+    recent = PersistenceService.get_recent_saves(str(tmp_path), limit=5)
+
+    assert [name for name, _ in recent] == ["manual.json", "game_autosave_0.json"]
+
+
+def test_recent_saves_scan_directories_without_index(tmp_path):
+    PersistenceService.save_game_to_file(_state(), str(tmp_path / "a.json"))
+
+    assert [name for name, _ in PersistenceService.get_recent_saves(str(tmp_path))] == ["a.json"]
+
+
+def test_engine_counts_running_stints_on_the_game_clock(tmp_path):
+    state = _state()
+    state.roster["Alice"].start_stint(1000.0)
+    engine = AutosaveEngine(lambda: state, save_dir=str(tmp_path), clock=VirtualClock(1030.0))
+    engine.request_save()
+    path = engine.flush()
+
+    with open(path, encoding="utf-8") as f:
+        assert json.load(f)["players"]["Alice"]["total_seconds"] == 120
+
+
+def test_engine_coalesces_bursts_into_one_write_per_interval(tmp_path):
+    state = _state()
+    engine = AutosaveEngine(lambda: state, save_dir=str(tmp_path), interval_seconds=60)
+    engine.start()
+    try:
+        engine.request_save()
+        deadline = time.monotonic() + 5
+        while engine.save_count == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert engine.save_count == 1
+
+        for _ in range(10):
+            engine.request_save()
+        time.sleep(0.05)
+        assert engine.save_count == 1
+    finally:
+        engine.stop(flush=True)
+
+    assert engine.save_count == 2
+    assert engine.flush() is None
+    assert engine.last_saved_path.endswith("game_autosave_1.json")
+
+
+def test_snapshot_folds_live_stint_without_double_counting():
+    state = GameState(roster={
+        "Alice": Player(name="Alice", total_seconds=100, on_field=True, position="ST", stint_start_ts=1000.0),
+        "Bob": Player(name="Bob", total_seconds=50),
+    })
+
+    data = PersistenceService.serialize_game_state(state, current_time=1030.5)
+    loaded = PersistenceService.deserialize_game_state(data)
+    alice = loaded.roster["Alice"]
+
+    assert alice.total_seconds == 130
+    assert alice.total_seconds + alice.current_stint_seconds(1060.5) == 160
+    assert loaded.roster["Bob"].total_seconds == 50
+    # The live game state is left untouched
+    assert state.roster["Alice"].total_seconds == 100
+    assert state.roster["Alice"].stint_start_ts == 1000.0
+
+
+def test_web_save_and_load_round_trip(tmp_path):
+    client = create_app(registry=create_game_registry(str(tmp_path))).test_client()
+    client.post("/api/roster", json={"players": [{"name": "Alice"}, {"name": "Bob"}]})
+    saved = client.post("/api/save").get_json()
+    assert saved["success"] is True
+
+    client.post("/api/roster", json={"players": [{"name": "Cara"}]})
+    assert client.post("/api/load", json={"game_data": saved["data"]}).status_code == 200
+    names = [player["name"] for player in client.get("/api/players").get_json()["players"]]
+    assert sorted(names) == ["Alice", "Bob"]
+
+
+def test_web_save_counts_running_stints_on_the_game_clock(tmp_path):
+    registry = create_game_registry(str(tmp_path))
+    client = create_app(registry=registry).test_client()
+    client.post("/api/roster", json={"players": [{"name": "Alice"}]})
+    session = registry.get().session
+    session.clock = VirtualClock(1600.0)
+    session.game_state.roster["Alice"].start_stint(1000.0)
+
+    saved = client.post("/api/save").get_json()
+    assert saved["data"]["players"]["Alice"]["total_seconds"] == 600
@@ -0,0 +1,73 @@
+"""Tests for the canonical position taxonomy."""
+
+import pytest
+
+from src.models import POSITION_TAXONOMY, GameState, Player
+from src.models.formation import FormationTemplates, FormationType, Position
+from src.services.formation_validator import PlayerAssignmentValidator
+from src.services.strategy_service import StrategyService
+
+
+def test_aliases_resolve_to_canonical_ids():
+    taxonomy = POSITION_TAXONOMY
+    assert taxonomy.id_of("DF") == taxonomy.id_of("def") == taxonomy.id_of("Defender")
+    assert taxonomy.canonical("DM") == "CDM"
+    assert taxonomy.canonical("am") == "CAM"
+    assert taxonomy.canonical("Striker") == "ST"
+    assert taxonomy.id_of("SWEEPER") is None
+    assert taxonomy.id_of(taxonomy.id_of("GK")) == taxonomy.id_of("GK")
+
+
+def test_every_formation_position_is_registered():
+    for position in Position:
+        assert position.value in POSITION_TAXONOMY
+    assert {POSITION_TAXONOMY.family_of(position.value) for position in Position} == {"GK", "DEF", "MID", "FOR"}
+
+
+@pytest.mark.parametrize("preferred,assigned,expected", [
+    ("CB", "CB", 1.0),
+    ("DF", "CB", 0.8),
+    ("LB", "WB", 0.8),
+    ("LM", "LW", 0.8),
+    ("CB", "LB", 0.5),
+    ("CDM", "CAM", 0.5),
+    ("GK", "ST", 0.0),
+    ("MF", "CF", 0.0),
+])
+def test_affinity_matrix(preferred, assigned, expected):
+    assert POSITION_TAXONOMY.affinity(preferred, assigned) == expected
+    assert POSITION_TAXONOMY.affinity(assigned, preferred) == expected
+    assert POSITION_TAXONOMY.compatible(preferred, assigned) == (expected >= 0.8)
+
+
+def test_unknown_codes_only_match_themselves():
+    assert POSITION_TAXONOMY.compatible("sweeper", "SWEEPER")
+    assert not POSITION_TAXONOMY.compatible("SWEEPER", "CB")
+    assert POSITION_TAXONOMY.affinity("SWEEPER", "CB") == 0.0
+
+
+def test_validator_accepts_legacy_codes():
+    formation = FormationTemplates.get_template_by_type(FormationType.F_4_4_2)
+    back = next(position for position in formation.positions if position.position_code is Position.CENTER_BACK)
+    keeper = next(position for position in formation.positions if position.position_code is Position.GOALKEEPER)
+    back.player_name, keeper.player_name = "Back", "Keeper"
+    roster = {
+        "Back": Player(name="Back", number="4", preferred="DF"),
+        "Keeper": Player(name="Keeper", number="1", preferred="MF"),
+    }
+
+    errors = PlayerAssignmentValidator(roster).validate(formation).errors
+
+    assert not any("'Back'" in error for error in errors)
+    assert any("'Keeper' assigned to GK" in error for error in errors)
+
+
+def test_strategy_counts_legacy_codes_by_family(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    players = [Player(name=f"D{idx}", preferred="DF") for idx in range(5)]
+    players += [Player(name=f"M{idx}", preferred="MF") for idx in range(3)]
+    players += [Player(name=f"S{idx}", preferred="ST") for idx in range(3)]
+
+    formation = StrategyService(GameState()).suggest_optimal_formation(players)
+
+    assert formation.get_formation_shape() == (1, 4, 3, 3)
@@ -0,0 +1,92 @@
+"""Tests for background rotation re-planning."""
+
+import threading
+
+from src.models import GameState, Player
+from src.services import TimerService
+from src.services.replan_worker import ReplanStatus, ReplanWorkerPool
+from src.services.rotation_planner import RotationConfig
+from src.ui.web_app import create_app, create_game_registry
+from src.utils import VirtualClock
+
+FAST = RotationConfig(time_budget_seconds=0.01)
+
+
+def _snapshot() -> dict:
+    roster = {f"P{idx}": Player(name=f"P{idx}", preferred="GK" if idx == 0 else "MF") for idx in range(10)}
+    state = GameState(roster=roster, field_size=7)
+    TimerService(state, clock=VirtualClock(0.0)).configure_game(game_length_minutes=40, period_count=2)
+    return state.to_json()
+
+
+def test_requests_are_debounced_per_game_in_worker_processes():
+    pool = ReplanWorkerPool(debounce_seconds=0.05)
+    pool.start()
+    finished = []
+    done = threading.Event()
+
+    def callback(job):
+        finished.append(job)
+        done.set()
+
+    try:
+        executor = pool._executor
+        if pool.use_processes:
+            # Workers must not be forked from the multithreaded server process
+            assert executor._mp_context.get_start_method() in ("forkserver", "spawn")
+        jobs = [pool.submit("field-1", _snapshot(), f"Plan {idx}", FAST, now=0.0, callback=callback)
+                for idx in range(3)]
+        assert done.wait(30)
+        assert pool._executor is executor
+    finally:
+        pool.shutdown()
+
+    assert [job.status for job in jobs[:2]] == [ReplanStatus.SUPERSEDED] * 2
+    assert finished == [jobs[2]]
+    assert jobs[2].status is ReplanStatus.DONE
+    assert jobs[2].result["plan"]["name"] == "Plan 2"
+    assert pool.latest("field-1") is jobs[2]
+
+
+def test_cancel_drops_pending_job_and_failures_are_reported():
+    pool = ReplanWorkerPool(debounce_seconds=0.05, use_processes=False)
+    done = threading.Event()
+    try:
+        cancelled = pool.submit("a", _snapshot(), "Plan", FAST, now=0.0, callback=lambda job: done.set())
+        pool.cancel("a")
+        assert not done.wait(0.2)
+        assert cancelled.status is ReplanStatus.SUPERSEDED
+
+        failed = pool.submit("b", _snapshot(), "Plan", FAST, player_names=["Ghost"], now=0.0,
+                             callback=lambda job: done.set())
+        assert done.wait(5)
+    finally:
+        pool.shutdown()
+    assert failed.status is ReplanStatus.FAILED
+    assert "Ghost" in failed.error
+
+
+def test_replan_endpoint_returns_at_once_and_pushes_result(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    pool = ReplanWorkerPool(debounce_seconds=0.01, use_processes=False)
+    app = create_app(registry=create_game_registry(str(tmp_path)), replan_pool=pool)
+    client = app.test_client()
+    client.post("/api/roster", json={
+        "players": [{"name": f"P{idx}", "preferred": "GK" if idx == 0 else "MF"} for idx in range(10)],
+        "field_size": 7,
+    })
+    version = client.get("/api/state").get_json()["version"]
+
+    try:
+        response = client.post("/api/strategy/rotation-plan/replan", json={"name": "Live", "time_budget_ms": 10})
+        assert response.status_code == 202
+        assert response.get_json()["job"]["status"] == "pending"
+
+        changed = client.get(f"/api/state/wait?version={version}&timeout=10").get_json()
+        assert changed["event"]["cause"] == "rotation_replanned"
+        latest = client.get("/api/strategy/rotation-plan/latest").get_json()["job"]
+        assert latest["status"] == "done"
+        plans = client.get("/api/strategy/substitution-plans").get_json()["plans"]
+        assert [plan["name"] for plan in plans] == ["Live"]
+    finally:
+        pool.shutdown()
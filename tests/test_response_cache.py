@@ -0,0 +1,68 @@
+"""Tests for the encoded response cache and the cached poll endpoints."""
+
+import json
+
+from src.services.response_cache import ResponseCache, encode_json, join_objects
+from src.ui.web_app import create_app, create_game_registry
+from src.utils import VirtualClock
+
+
+def test_cache_evicts_least_recently_used_across_games():
+    cache = ResponseCache(max_entries=2)
+    builds = []
+
+    def build(game):
+        return lambda: builds.append(game) or {"game": game}
+
+    cache.get("g1", "state", 1, build("g1"))
+    cache.get("g2", "state", 1, build("g2"))
+    assert cache.get("g1", "state", 1, build("g1")) == b'{"game":"g1"}'
+    cache.get("g3", "state", 1, build("g3"))
+    cache.get("g1", "state", 1, build("g1"))
+    cache.get("g2", "state", 1, build("g2"))
+    assert builds == ["g1", "g2", "g3", "g2"]
+    assert cache.stats()["hits"] == 2 and len(cache) == 2
+
+    assert cache.invalidate("g2") == 1 and len(cache) == 1
+    small = ResponseCache(max_bytes=8)
+    small.get("g1", "state", 1, lambda: {"players": ["A", "B"]})
+    assert len(small) == 0
+
+
+def test_join_objects_merges_encoded_members():
+    joined = join_objects(encode_json({"a": 1}), b"{}", b' {"b":[2]} ')
+    assert json.loads(joined) == {"a": 1, "b": [2]}
+
+
+def test_polls_reuse_encoded_bodies_until_the_state_changes(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    cache = ResponseCache()
+    app = create_app(registry=create_game_registry(str(tmp_path)), response_cache=cache)
+    client = app.test_client()
+    client.post("/api/roster", json={"players": [{"name": "A"}, {"name": "B"}], "field_size": 7})
+
+    first = client.get("/api/state")
+    second = client.get("/api/state")
+    assert cache.stats()["hits"] == 2
+    state = second.get_json()
+    assert state["players"] == first.get_json()["players"] and "server_ts" in state
+    assert {"elapsed_seconds", "remaining_seconds", "field_size"} <= set(state["game_state"])
+    assert second.headers["ETag"] == f'"v{state["version"]}"'
+
+    assert client.get("/api/players").get_data() == client.get("/api/players").get_data()
+    client.post("/api/roster", json={"players": [{"name": "A"}, {"name": "C"}], "field_size": 7})
+    assert [player["name"] for player in client.get("/api/players").get_json()["players"]] == ["A", "C"]
+
+    # A running clock re-encodes time-dependent payloads once per second
+    session = app.extensions["game_registry"].get().session
+    session.clock = clock = VirtualClock(1000.0)
+    session.game_state.game_start_ts = clock.now()
+    session.game_state.paused = False
+    session.mark_changed("start_timer")
+    misses = cache.misses
+    client.get("/api/analytics/report")
+    client.get("/api/analytics/report")
+    assert cache.misses == misses + 1
+    clock.advance(1)
+    assert client.get("/api/analytics/report").get_json()["success"]
+    assert cache.misses == misses + 2
@@ -0,0 +1,101 @@
+"""Tests for the equal-playing-time rotation planner."""
+
+import pytest
+
+from src.models import GameState, Player
+from src.services import TimerService
+from src.services.rotation_planner import RotationConfig, RotationPlanner
+from src.ui.web_app import create_app, create_game_registry
+from src.utils import VirtualClock
+
+
+def _game(roster_size: int, field_size: int, keepers: int = 1, clock=None):
+    roster = {}
+    for idx in range(roster_size):
+        preferred = "GK" if idx < keepers else ("DF", "MF", "ST")[idx % 3]
+        roster[f"P{idx:02d}"] = Player(name=f"P{idx:02d}", preferred=preferred)
+    state = GameState(roster=roster, field_size=field_size)
+    timer = TimerService(state, clock=clock or VirtualClock(0.0))
+    timer.configure_game(game_length_minutes=60, period_count=2)
+    return state, timer
+
+
+def _config(**overrides) -> RotationConfig:
+    # Iteration-bound rather than time-bound, so runs are reproducible
+    return RotationConfig(time_budget_seconds=10.0, max_iterations=3000, **overrides)
+
+
+def _outfield_spread(rotation, keeper: str) -> float:
+    minutes = [seconds for name, seconds in rotation.projected_seconds.items() if name != keeper]
+    return (max(minutes) - min(minutes)) / 60
+
+
+def test_pre_game_plan_balances_outfield_minutes():
+    state, timer = _game(roster_size=10, field_size=7)
+    rotation = RotationPlanner(state, timer, _config(max_windows=5)).plan()
+
+    assert len(rotation.starters) == 7
+    assert 30 in rotation.windows and len(rotation.windows) <= 5
+    # One keeper plays the whole game; nine outfielders share six slots
+    assert rotation.projected_seconds["P00"] == 3600
+    assert _outfield_spread(rotation, "P00") <= 12
+    assert sum(rotation.projected_seconds.values()) == 7 * 3600
+    # Substitutions only happen at the windows
+    assert {minute for _, _, minute in rotation.plan.substitutions} <= set(rotation.windows)
+
+
+def test_keepers_only_change_at_breaks():
+    state, timer = _game(roster_size=12, field_size=9, keepers=2)
+    rotation = RotationPlanner(state, timer, _config(max_windows=4)).plan()
+
+    keeper_changes = [
+        (out_name, in_name, minute) for out_name, in_name, minute in rotation.plan.substitutions
+        if "GK" in state.roster[in_name].preferred_list() and "GK" in state.roster[out_name].preferred_list()
+    ]
+    assert all(minute == 30 for _, _, minute in keeper_changes)
+    # The keepers share the goal instead of one of them playing the whole game
+    assert max(rotation.projected_seconds["P00"], rotation.projected_seconds["P01"]) < 3600
+    assert rotation.minutes_spread <= 10
+
+
+def test_mid_game_replan_uses_actual_minutes():
+    clock = VirtualClock(0.0)
+    state, timer = _game(roster_size=10, field_size=7, clock=clock)
+    names = sorted(state.roster)
+    on_field = names[:7]
+    for name in on_field:
+        state.roster[name].position = "GK" if name == "P00" else "MF"
+        state.roster[name].start_stint(clock.now(), period_index=0)
+    timer.start_game()
+    clock.advance(20 * 60)
+
+    rotation = RotationPlanner(state, timer, _config(max_windows=4)).plan()
+
+    assert all(window > 20 for window in rotation.windows)
+    # The three rested players are owed the most minutes, so all of them come on
+    incoming = {in_name for _, in_name, _ in rotation.plan.substitutions}
+    assert set(names[7:]) <= incoming
+    assert _outfield_spread(rotation, "P00") <= 12
+    assert sorted(rotation.starters) == on_field
+
+
+def test_unknown_players_are_rejected():
+    state, timer = _game(roster_size=8, field_size=7)
+    with pytest.raises(ValueError):
+        RotationPlanner(state, timer).plan(player_names=["Ghost"])
+
+
+def test_rotation_plan_endpoint_stores_plan(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    client = create_app(registry=create_game_registry(str(tmp_path))).test_client()
+    client.post("/api/roster", json={
+        "players": [{"name": f"P{idx}", "preferred": "GK" if idx == 0 else "MF"} for idx in range(10)],
+        "field_size": 7,
+    })
+
+    response = client.post("/api/strategy/rotation-plan", json={"name": "Equal", "max_windows": 3})
+    body = response.get_json()
+    assert response.status_code == 200
+    assert len(body["rotation"]["windows"]) <= 3
+    plans = client.get("/api/strategy/substitution-plans").get_json()["plans"]
+    assert [plan["name"] for plan in plans] == ["Equal"]
@@ -0,0 +1,74 @@
+"""Tests for the reader-writer game lock."""
+
+import threading
+import time
+
+import pytest
+
+from src.utils import ReaderWriterLock
+
+
+def test_readers_share_and_writers_exclude():
+    lock = ReaderWriterLock()
+    inside = threading.Barrier(3, timeout=2)
+
+    def reader():
+        with lock.read_lock():
+            inside.wait()  # only passes if all three readers hold the lock at once
+
+    threads = [threading.Thread(target=reader) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    with lock.read_lock():
+        assert lock.reader_count == 1
+        blocked = []
+        writer = threading.Thread(target=lambda: blocked.append(lock.acquire(timeout=0.05)))
+        writer.start()
+        writer.join()
+        assert blocked == [False]
+    assert lock.acquire(blocking=False)
+    assert lock.acquire_read(blocking=False)  # the writer may read as well
+    lock.release_read()
+    assert lock.write_locked
+    lock.release()
+
+
+def test_waiting_writer_holds_back_new_readers():
+    lock = ReaderWriterLock()
+    order = []
+    lock.acquire_read()
+
+    writer = threading.Thread(target=lambda: (lock.acquire(), order.append("writer"), lock.release()))
+    writer.start()
+    while not lock._writers_waiting:
+        time.sleep(0.001)
+
+    reader = threading.Thread(target=lambda: (lock.acquire_read(), order.append("reader"), lock.release_read()))
+    reader.start()
+    time.sleep(0.02)
+    assert order == []
+
+    lock.release_read()
+    writer.join()
+    reader.join()
+    assert order == ["writer", "reader"]
+
+
+def test_reentrancy_and_upgrade():
+    lock = ReaderWriterLock()
+    with lock:
+        with lock:
+            with lock.read_lock():
+                assert lock.write_locked
+    assert not lock.write_locked
+
+    with lock.read_lock():
+        with lock.read_lock():
+            with pytest.raises(RuntimeError):
+                lock.acquire()
+    assert lock.reader_count == 0
+    with pytest.raises(RuntimeError):
+        lock.release()
@@ -0,0 +1,148 @@
+"""Tests for the SQLite season archive and full-time ingestion."""
+
+import sqlite3
+from datetime import date, datetime
+
+from src.models import GameState, Player
+from src.services.event_journal import EventJournal, GameEventType
+from src.services.season_archive import SeasonArchive, stints_from_events
+from src.ui.web_app import create_app, create_game_registry
+
+
+def _finished_game(minutes: dict) -> GameState:
+    state = GameState(roster={
+        name: Player(name=name, total_seconds=int(value * 60)) for name, value in minutes.items()
+    })
+    state.ensure_timer_lists()
+    state.period_elapsed = [1800, 1800]
+    return state
+
+
+def test_minutes_per_player_over_recent_games():
+    archive = SeasonArchive()
+    archive.ingest_game(_finished_game({"Alice": 60, "Bob": 10}), "g1", date(2024, 9, 1), "Rovers")
+    archive.ingest_game(_finished_game({"Alice": 30, "Bob": 40}), "g2", date(2024, 9, 8), "United")
+    archive.ingest_game(_finished_game({"Alice": 20, "Cara": 50}), "g3", date(2024, 9, 15), "Rovers")
+    # Re-ingesting a game replaces the earlier copy
+    archive.ingest_game(_finished_game({"Alice": 25, "Cara": 50}), "g3", date(2024, 9, 15), "Rovers")
+
+    recent = {row["player"]: row["minutes"] for row in archive.minutes_per_player(last_games=2)}
+    assert recent == {"Alice": 55.0, "Bob": 40.0, "Cara": 50.0}
+    assert len(archive.list_games()) == 3
+    assert [game["game_key"] for game in archive.list_games(opponent="Rovers")] == ["g3", "g1"]
+    assert [game["seconds"] for game in archive.player_history("Bob")] == [2400, 600]
+
+
+def test_matches_on_one_field_and_day_are_kept_apart():
+    archive = SeasonArchive()
+    morning = _finished_game({"Alice": 40})
+    morning.game_start_ts = datetime(2024, 9, 1, 9, 0).timestamp()
+    afternoon = _finished_game({"Alice": 30})
+    afternoon.game_start_ts = datetime(2024, 9, 1, 14, 0).timestamp()
+
+    first = archive.ingest_game(morning, "field-1", opponent="Rovers")
+    archive.ingest_game(afternoon, "field-1", opponent="United")
+    # Re-archiving the morning match replaces only that match
+    morning.roster["Alice"].total_seconds = 45 * 60
+    archive.ingest_game(morning, "field-1", opponent="Rovers")
+
+    games = archive.list_games()
+    assert [(game["opponent"], game["played_on"]) for game in games] == [
+        ("United", "2024-09-01"), ("Rovers", "2024-09-01"),
+    ]
+    assert first not in [game["id"] for game in games]
+    assert [game["seconds"] for game in archive.player_history("Alice")] == [1800, 2700]
+
+
+def test_version_1_archive_is_migrated(tmp_path):
+    path = str(tmp_path / "season.db")
+    conn = sqlite3.connect(path)
+    conn.executescript(
+        "CREATE TABLE games (id INTEGER PRIMARY KEY, game_key TEXT NOT NULL, played_on TEXT NOT NULL,"
+        " opponent TEXT NOT NULL DEFAULT '', field_size INTEGER NOT NULL, period_count INTEGER NOT NULL,"
+        " game_length_seconds INTEGER NOT NULL, archived_ts REAL NOT NULL, UNIQUE (game_key, played_on));"
+        "CREATE TABLE appearances (game_id INTEGER NOT NULL REFERENCES games(id) ON DELETE CASCADE,"
+        " player TEXT NOT NULL, number TEXT, total_seconds INTEGER NOT NULL, PRIMARY KEY (game_id, player));"
+        "INSERT INTO games VALUES (1, 'g1', '2024-09-01', 'Rovers', 7, 2, 2400, 0);"
+        "INSERT INTO appearances VALUES (1, 'Alice', NULL, 600);"
+        "PRAGMA user_version = 1;"
+    )
+    conn.close()
+
+    archive = SeasonArchive(path)
+    # Re-ingesting the unstarted version 1 game still replaces it
+    archive.ingest_game(_finished_game({"Alice": 20}), "g2", date(2024, 9, 8))
+    assert [row["seconds"] for row in archive.minutes_per_player()] == [1800]
+    archive.ingest_game(_finished_game({"Alice": 15}), "g1", date(2024, 9, 1))
+
+    assert [game["game_key"] for game in archive.list_games()] == ["g2", "g1"]
+    assert [row["seconds"] for row in archive.minutes_per_player()] == [2100]
+    assert archive._query("PRAGMA user_version", [])[0]["user_version"] == 2
+
+
+def test_player_queries_use_indexes():
+    archive = SeasonArchive()
+    plan = archive._query(
+        "EXPLAIN QUERY PLAN SELECT * FROM appearances WHERE player = ?", ["Alice"]
+    )
+    assert any("idx_appearances_player" in row["detail"] for row in plan)
+
+
+def test_stints_are_rebuilt_from_journal_events(tmp_path):
+    journal = EventJournal.for_game(str(tmp_path), "g1", snapshot_interval=2)
+    state = _finished_game({"Alice": 0, "Bob": 0})
+    alice, bob = state.roster["Alice"], state.roster["Bob"]
+
+    alice.position = "ST"
+    alice.start_stint(100.0)
+    state.bump_version()
+    journal.record(state, GameEventType.START, players=["Alice"])
+
+    alice.end_stint(400.0)
+    bob.position = "ST"
+    bob.start_stint(400.0)
+    state.bump_version()
+    journal.record(state, GameEventType.SUBSTITUTION, players=["Alice", "Bob"])
+
+    # Both events were compacted into a rotated segment and stay in the history
+    events = list(journal.read_history())
+    assert [event.seq for event in events] == [1, 2]
+    events[-1].timestamp = 400.0
+    stints = stints_from_events(events, end_ts=1000.0)
+
+    assert [(s.player, s.start_ts, s.end_ts, s.position) for s in stints] == [
+        ("Alice", 100.0, 400.0, "ST"),
+        ("Bob", 400.0, 1000.0, "ST"),
+    ]
+
+
+def test_game_is_archived_at_full_time(tmp_path):
+    registry = create_game_registry(str(tmp_path))
+    client = create_app(registry=registry).test_client()
+    names = ["Alice", "Bob", "Cara", "Dan", "Eve", "Finn", "Gus", "Hana"]
+    client.post("/api/roster", json={"players": [{"name": name} for name in names], "field_size": 7})
+    client.post("/api/timer/configure", json={"minutes": 40, "periods": 2})
+    game_state = registry.get("default").session.game_state
+    game_state.roster["Alice"].position = "GK"
+    game_state.roster["Alice"].start_stint(1.0)
+    assert client.post("/api/timer/start", json={}).status_code == 200
+    assert client.post("/api/substitution", json={"out_name": "Alice", "in_name": "Bob"}).status_code == 200
+
+    game_state.period_elapsed = [1200, 1200]
+    game_state.current_period_index = 1
+    client.post("/api/timer/pause", json={})
+
+    games = client.get("/api/season/games").get_json()["games"]
+    assert [game["game_key"] for game in games] == ["default"]
+    players = {row["player"] for row in client.get("/api/season/minutes?last=10").get_json()["players"]}
+    assert players == set(names)
+    history = client.get("/api/season/players/Bob").get_json()["games"]
+    assert history[0]["stints"] == 1
+
+    # Further edits do not archive the game twice
+    client.post("/api/timer/stoppage", json={"seconds": 0})
+    assert len(client.get("/api/season/games").get_json()["games"]) == 1
+
+    response = client.post("/api/archive", json={"opponent": "Rovers", "played_on": "2024-09-01"})
+    assert response.status_code == 200
+    assert client.get("/api/season/games?opponent=Rovers").get_json()["games"][0]["played_on"] == "2024-09-01"
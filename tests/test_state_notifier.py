@@ -0,0 +1,110 @@
+"""Tests for the push channels: notifier, long-poll and Server-Sent Events."""
+
+import json
+import threading
+
+import pytest
+
+from src.services.state_notifier import StateNotifier
+from src.ui import web_app
+from src.ui.web_app import create_app, create_game_registry
+
+
+def test_wait_for_change_returns_latest_event():
+    notifier = StateNotifier()
+
+    assert notifier.wait_for_change(0, timeout=0) is None
+
+    waiter_result = {}
+
+    def waiter():
+        waiter_result["event"] = notifier.wait_for_change(0, timeout=5)
+
+    thread = threading.Thread(target=waiter)
+    thread.start()
+    notifier.publish(1, "substitution", players=["Alice"])
+    thread.join(5)
+
+    event = waiter_result["event"]
+    assert event.version == 1
+    assert event.cause == "substitution"
+    assert event.to_dict()["data"] == {"players": ["Alice"]}
+    # A caller that is already behind does not block
+    assert notifier.wait_for_change(0, timeout=None).version == 1
+
+
+def test_long_poll_reports_changes_and_clock(tmp_path):
+    client = create_app(registry=create_game_registry(str(tmp_path))).test_client()
+    client.post("/api/roster", json={"players": [{"name": "Alice"}]})
+    version = client.get("/api/state").get_json()["version"]
+
+    idle = client.get(f"/api/state/wait?version={version}&timeout=0").get_json()
+    assert idle["changed"] is False
+    assert idle["clock"]["version"] == version
+    assert idle["clock"]["paused"] is True
+
+    client.post("/api/timer/stoppage", json={"seconds": 15})
+    changed = client.get(f"/api/state/wait?version={version}&timeout=5").get_json()
+    assert changed["changed"] is True
+    assert changed["event"]["version"] == version + 1
+    assert changed["event"]["cause"] == "add_stoppage_time"
+
+
+def test_stream_emits_state_then_clock_events(tmp_path):
+    client = create_app(registry=create_game_registry(str(tmp_path))).test_client()
+    client.post("/api/games", json={"game_id": "field-3"})
+    client.post("/api/games/field-3/roster", json={"players": [{"name": "Alice"}]})
+
+    response = client.get("/api/games/field-3/stream?clock_interval=1", buffered=False)
+    assert response.mimetype == "text/event-stream"
+    chunks = iter(response.response)
+
+    first = next(chunks).decode()
+    second = next(chunks).decode()
+    assert first.startswith("event: state")
+    assert second.startswith("event: clock")
+    state_data = json.loads(first.split("data: ", 1)[1])
+    assert state_data["cause"] == "update_roster"
+
+    # The stream holds no game lock, so writes proceed while it is open
+    assert client.post("/api/games/field-3/timer/stoppage", json={"seconds": 5}).status_code == 200
+    pushed = next(chunks).decode()
+    assert pushed.startswith("event: state")
+    assert json.loads(pushed.split("data: ", 1)[1])["version"] == state_data["version"] + 1
+    response.close()
+
+
+def test_stream_keeps_its_game_resident_until_it_leaves_memory(tmp_path):
+    registry = create_game_registry(str(tmp_path))
+    client = create_app(registry=registry).test_client()
+    client.post("/api/roster", json={"players": [{"name": "Alice"}]})
+
+    response = client.get("/api/stream?clock_interval=1", buffered=False)
+    chunks = iter(response.response)
+    next(chunks), next(chunks)
+    entry = registry.get()
+    entry.last_access_ts = 0.0
+    assert next(chunks).decode().startswith("event: clock")
+    assert entry.last_access_ts > 0.0
+
+    # Eviction closes the session; the stream ends so the client reconnects
+    assert registry.evict("default")
+    with pytest.raises(StopIteration):
+        next(chunks)
+    response.close()
+
+
+def test_streams_end_after_their_lifetime_and_free_their_slot(tmp_path, monkeypatch):
+    monkeypatch.setattr(web_app, "STREAM_LIFETIME_SECONDS", 1)
+    app = create_app(registry=create_game_registry(str(tmp_path)), max_push_clients=1)
+    client = app.test_client()
+
+    response = client.get("/api/stream?clock_interval=1", buffered=False)
+    assert f"retry: {web_app.STREAM_RETRY_MILLISECONDS}" in next(iter(response.response)).decode()
+    assert client.get("/api/stream").status_code == 503
+    assert client.get("/api/state/wait?version=0&timeout=0").status_code == 503
+    assert len(list(response.response)) == 2  # the clock event, then one more tick before the end
+    response.close()
+
+    assert app.extensions["push_clients"].active == 0
+    assert client.get("/api/state/wait?version=0&timeout=0").status_code == 200
@@ -0,0 +1,147 @@
+"""Tests for the shared SQLite game state store."""
+
+import json
+
+import pytest
+
+from src.models import GameState, Player
+from src.services.state_store import SQLiteStateStore, StaleStateError
+from src.ui.web_app import create_app, create_game_registry
+
+
+def _game(names=("A", "B", "C")) -> GameState:
+    state = GameState(roster={name: Player(name=name) for name in names})
+    state.state_version = 1
+    return state
+
+
+def test_saves_only_changed_player_rows(tmp_path):
+    store = SQLiteStateStore(str(tmp_path / "games.sqlite3"))
+    assert store.journal_mode == "wal"
+    state = _game()
+    store.save("field-1", state, expected_version=None)
+
+    state.roster["B"].total_seconds = 90
+    state.opponent_notes = "press high"
+    state.state_version = 2
+    store.save("field-1", state, expected_version=1, players=["B"])
+
+    rows = dict(store._connection().execute("SELECT name, version FROM players WHERE game_id = 'field-1'"))
+    assert rows == {"A": 1, "B": 2, "C": 1}
+
+    base = _game()
+    loaded = store.load("field-1", base=base)
+    assert loaded.state_version == 2 and loaded.opponent_notes == "press high"
+    assert loaded.roster["B"].total_seconds == 90
+    assert loaded.roster["A"] is base.roster["A"]
+    assert list(loaded.roster) == ["A", "B", "C"]
+
+
+def test_stale_save_is_rejected(tmp_path):
+    store = SQLiteStateStore(str(tmp_path / "games.sqlite3"))
+    state = _game()
+    store.save("field-1", state, expected_version=None)
+    with pytest.raises(StaleStateError):
+        store.save("field-1", state, expected_version=None)
+
+    state.state_version = 2
+    store.save("field-1", state, expected_version=1, players=[])
+    state.state_version = 3
+    with pytest.raises(StaleStateError) as error:
+        store.save("field-1", state, expected_version=1, players=[])
+    assert error.value.stored_version == 2
+    assert store.version("field-1") == 2
+
+    state.roster.pop("C")
+    state.state_version = 3
+    store.save("field-1", state, expected_version=2, players=[], removed_players=["C"])
+    assert list(store.load("field-1").roster) == ["A", "B"]
+    assert store.delete("field-1") and store.load("field-1") is None
+
+
+def _worker(tmp_path):
+    app = create_app(registry=create_game_registry(str(tmp_path), backend="sqlite"))
+    return app, app.test_client()
+
+
+def test_workers_share_games_and_reject_stale_writes(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    app_a, client_a = _worker(tmp_path)
+    app_b, client_b = _worker(tmp_path)
+
+    names = [f"P{idx:02d}" for idx in range(4)]
+    client_a.post("/api/roster", json={"players": [{"name": name} for name in names], "field_size": 7})
+    session_a = app_a.extensions["game_registry"].get().session
+    with session_a.lock:
+        session_a.game_state.roster["P00"].position = "ST"
+        session_a.game_state.roster["P00"].start_stint(0.0)
+        session_a.mark_changed("lineup")
+
+    players = {player["name"]: player for player in client_b.get("/api/state").get_json()["players"]}
+    assert list(players) == names and players["P00"]["on_field"]
+    assert client_b.post("/api/substitution", json={"out_name": "P00", "in_name": "P01"}).status_code == 200
+    players = {player["name"]: player for player in client_a.get("/api/state").get_json()["players"]}
+    assert players["P01"]["on_field"] and not players["P00"]["on_field"]
+
+    # Worker A saves a change after worker B loaded the game but before B saves its own
+    session_b = app_b.extensions["game_registry"].get().session
+    substitution = app_b.view_functions["api.make_substitution"]
+
+    def racing_substitution(*args, **kwargs):
+        with session_a.lock:
+            session_a.refresh()
+            session_a.game_state.opponent_notes = "press high"
+            session_a.mark_changed("update_opponent_notes")
+        return substitution(*args, **kwargs)
+
+    app_b.view_functions["api.make_substitution"] = racing_substitution
+    conflict = client_b.post("/api/substitution", json={"out_name": "P01", "in_name": "P02"})
+    app_b.view_functions["api.make_substitution"] = substitution
+
+    assert conflict.status_code == 409 and conflict.get_json()["retry"]
+    assert conflict.headers["X-State-Version"] == str(session_a.game_state.state_version)
+    assert session_b.game_state.opponent_notes == "press high"
+    assert session_b.game_state.roster["P01"].on_field
+
+    retry = client_b.post("/api/substitution", json={"out_name": "P01", "in_name": "P02"})
+    assert retry.status_code == 200
+    assert app_a.extensions["game_registry"].list_games()[0]["game_id"] == "default"
+    client_a.get("/api/state")
+    assert session_a.game_state.roster["P02"].on_field
+
+
+def test_registry_finds_games_stored_by_another_worker(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    app_a, client_a = _worker(tmp_path)
+    client_a.post("/api/games", json={"game_id": "field-2"})
+    client_a.post("/api/games/field-2/roster", json={"players": [{"name": "A"}], "field_size": 7})
+
+    registry_b = create_game_registry(str(tmp_path), backend="sqlite")
+    assert registry_b.exists("field-2")
+    assert "field-2" in [game["game_id"] for game in registry_b.list_games()]
+    assert list(registry_b.get("field-2").session.game_state.roster) == ["A"]
+    assert registry_b.remove("field-2") and not registry_b.exists("field-2")
+
+
+def test_push_channels_see_writes_from_other_workers(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    app_a, client_a = _worker(tmp_path)
+    app_b, client_b = _worker(tmp_path)
+    client_a.post("/api/roster", json={"players": [{"name": "A"}, {"name": "B"}], "field_size": 7})
+    version = client_b.get("/api/state").get_json()["version"]
+
+    stream = client_b.get("/api/stream?clock_interval=1", buffered=False)
+    chunks = iter(stream.response)
+    assert next(chunks).decode().startswith("event: state")
+    assert next(chunks).decode().startswith("event: clock")
+
+    client_a.post("/api/timer/stoppage", json={"seconds": 30})
+    pushed = next(chunks).decode()
+    assert pushed.startswith("event: state")
+    assert json.loads(pushed.split("data: ", 1)[1])["version"] == version + 1
+    stream.close()
+
+    client_a.post("/api/timer/stoppage", json={"seconds": 15})
+    waited = client_b.get(f"/api/state/wait?version={version + 1}&timeout=5").get_json()
+    assert waited["changed"] and waited["event"]["cause"] == "refreshed"
+    assert waited["clock"]["version"] == version + 2
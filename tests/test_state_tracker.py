@@ -0,0 +1,99 @@
+"""Tests for state versioning, change tracking and conditional /api/state."""
+
+from src.models import GameState, Player
+from src.services.state_tracker import StateChangeTracker
+from src.ui.web_app import create_app, create_game_registry
+
+
+def _state() -> GameState:
+    state = GameState(
+        roster={
+            "Alice": Player(name="Alice", total_seconds=60),
+            "Bob": Player(name="Bob"),
+            "Cara": Player(name="Cara"),
+        }
+    )
+    state.ensure_timer_lists()
+    return state
+
+
+def test_tracker_reports_only_changed_entries():
+    state = _state()
+    tracker = StateChangeTracker(state)
+
+    state.roster["Alice"].on_field = True
+    state.roster["Alice"].position = "ST"
+    state.bump_version()
+    tracker.record(state)
+
+    del state.roster["Cara"]
+    state.period_stoppage[1] = 30
+    state.bump_version()
+    tracker.record(state)
+
+    delta = tracker.changes_since(0, state.state_version)
+    assert delta.players == ["Alice"]
+    assert delta.removed_players == ["Cara"]
+    assert delta.periods == [1]
+
+    latest = tracker.changes_since(1, state.state_version)
+    assert latest.players == []
+    assert latest.removed_players == ["Cara"]
+
+
+def test_tracker_requires_full_payload_before_baseline():
+    state = _state()
+    state.state_version = 5
+    tracker = StateChangeTracker(state)
+
+    assert tracker.changes_since(4, 5) is None
+    assert tracker.changes_since(6, 5) is None
+    assert tracker.changes_since(5, 5).players == []
+
+
+def test_state_version_round_trips_through_json():
+    state = _state()
+    state.bump_version()
+    state.bump_version()
+
+    assert GameState.from_json(state.to_json()).state_version == 2
+
+
+def test_state_endpoint_supports_etag_and_deltas(tmp_path):
+    client = create_app(registry=create_game_registry(str(tmp_path))).test_client()
+    roster = {"players": [{"name": "Alice"}, {"name": "Bob"}]}
+    client.post("/api/roster", json=roster)
+
+    full = client.get("/api/state")
+    version = full.get_json()["version"]
+    assert full.get_json()["delta"] is False
+    assert len(full.get_json()["players"]) == 2
+
+    assert client.get("/api/state", headers={"If-None-Match": full.headers["ETag"]}).status_code == 304
+    assert client.get(f"/api/state?since={version}").status_code == 304
+
+    response = client.post("/api/timer/stoppage", json={"seconds": 30})
+    assert int(response.headers["X-State-Version"]) == version + 1
+
+    delta = client.get(f"/api/state?since={version}").get_json()
+    assert delta["delta"] is True
+    assert delta["players"] == []
+    assert [period["index"] for period in delta["periods"]] == [0]
+
+    # Read-only POST endpoints leave the version untouched
+    response = client.post("/api/players/recommendations", json={"available_positions": ["GK"]})
+    assert response.status_code == 200
+    assert client.get("/api/state").get_json()["version"] == version + 1
+
+
+def test_roster_replacement_keeps_version_monotonic(tmp_path):
+    client = create_app(registry=create_game_registry(str(tmp_path))).test_client()
+    client.post("/api/roster", json={"players": [{"name": "Alice"}]})
+    first = client.get("/api/state").get_json()["version"]
+
+    client.post("/api/roster", json={"players": [{"name": "Bob"}]})
+    delta = client.get(f"/api/state?since={first}").get_json()
+
+    assert delta["version"] == first + 1
+    assert [player["name"] for player in delta["players"]] == ["Bob"]
+    assert delta["removed_players"] == ["Alice"]
@@ -0,0 +1,67 @@
+"""Tests for the per-player stint ledger and the stint report built on it."""
+
+from src.models import GameState, Player, StintLedger
+from src.services.analytics_service import AnalyticsService
+
+
+def test_aggregates_track_stints_and_rests():
+    ledger = StintLedger()
+    ledger.open(0, 0, "ST")
+    ledger.close(300)
+    ledger.open(420, 0, "LW")
+    ledger.close(520)
+    ledger.open(600, 1, "ST")
+
+    assert len(ledger) == 3
+    assert ledger.total_seconds() == 400
+    assert ledger.total_seconds(now=650) == 450
+    assert ledger.longest_stint() == 300
+    assert ledger.period_seconds(now=650) == {0: 400, 1: 50}
+    assert ledger.position_seconds(now=650) == {"ST": 350, "LW": 100}
+    assert (ledger.rest_count, ledger.longest_rest_seconds) == (2, 120)
+    assert ledger.average_rest_seconds() == 100.0
+
+
+def test_split_attributes_time_to_new_period_without_a_rest():
+    ledger = StintLedger()
+    ledger.open(0, 0, "CB")
+    ledger.split(1500, 1)
+    ledger.close(2000)
+
+    assert ledger.period_seconds() == {0: 1500, 1: 500}
+    assert ledger.position_seconds() == {"CB": 2000}
+    assert ledger.rest_count == 0
+    assert ledger.longest_stint() == 1500
+
+
+def test_round_trip_rebuilds_aggregates():
+    player = Player(name="Alice")
+    player.position = "GK"
+    player.start_stint(100.0, period_index=0)
+    player.end_stint(400.0)
+    player.start_stint(500.0, period_index=1)
+
+    restored = Player.from_dict({"name": "Alice", **player.to_dict()})
+    ledger = restored.stint_ledger
+
+    assert ledger == player.stint_ledger
+    assert ledger.is_open
+    assert ledger.total_seconds(now=600.0) == 400
+    assert ledger.rest_seconds == 100
+
+
+def test_stint_report_reads_ledger_aggregates():
+    alice = Player(name="Alice")
+    alice.start_stint(0.0, period_index=0)
+    alice.end_stint(600.0)
+    alice.start_stint(900.0, period_index=1)
+    state = GameState(roster={"Bob": Player(name="Bob"), "Alice": alice})
+
+    report = AnalyticsService(state).generate_stint_report(now=1200.0)
+
+    assert [s.name for s in report] == ["Alice", "Bob"]
+    first = report[0]
+    assert (first.stint_count, first.total_seconds, first.longest_stint_seconds) == (2, 900, 600)
+    assert first.period_seconds == {0: 600, 1: 300}
+    assert first.average_rest_seconds == 300.0
+    assert report[1].stint_count == 0
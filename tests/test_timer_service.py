@@ -93,6 +93,30 @@ class TimerServiceTests(unittest.TestCase):
         self.assertEqual(refreshed_config["period_count"], 2)
         self.assertEqual(refreshed_config["total_stoppage_seconds"], sum(self.state.period_stoppage))
 
+    def test_derived_values_are_cached_between_changes(self) -> None:
+        self.service.configure_game(game_length_minutes=60, period_count=2)
+        with patch("src.services.timer_service.now_ts", return_value=1000):
+            self.service.start_game()
+
+        with patch.object(GameState, "ensure_timer_lists", autospec=True) as ensure:
+            with patch("src.services.timer_service.now_ts", return_value=1300):
+                for _ in range(5):
+                    self.assertEqual(self.service.get_game_elapsed_seconds(), 300)
+                    self.assertEqual(self.service.get_remaining_seconds(), 3300)
+            # Recomputed once after starting, then served from the cache
+            self.assertEqual(ensure.call_count, 1)
+
+        # Pause state, configuration and in-place list edits all invalidate
+        with patch("src.services.timer_service.now_ts", return_value=1400):
+            self.service.pause_game()
+        self.assertEqual(self.service.get_game_elapsed_seconds(), 400)
+        self.service.add_stoppage_time(20)
+        self.assertEqual(self.service.get_timer_configuration()["total_stoppage_seconds"], 20)
+        self.state.period_adjustments[1] = 10
+        self.assertEqual(self.service.get_game_elapsed_seconds(), 430)
+        self.state.game_length_seconds = 80 * 60
+        self.assertEqual(self.service.get_timer_configuration()["period_lengths"], [2400, 2400])
+
 
 if __name__ == "__main__":
     unittest.main()
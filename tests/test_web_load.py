@@ -0,0 +1,57 @@
+"""Tests for the in-process web API load test."""
+
+import os
+
+from src.ui.load_test import LoadTestConfig, SidelineLoadTest
+from src.ui.web_app import create_app, create_game_registry
+
+
+def test_load_test_reports_every_endpoint(tmp_path):
+    cwd = os.getcwd()
+    config = LoadTestConfig(
+        readers=3,
+        writers=2,
+        duration_seconds=0.5,
+        poll_interval_seconds=0.01,
+        write_interval_seconds=0.005,
+        storage_dir=str(tmp_path),
+    )
+    report = SidelineLoadTest(config).run()
+
+    assert os.getcwd() == cwd
+    assert (tmp_path / "formations.json").exists()
+    state = report.endpoints["GET /api/state"]
+    assert state.requests > 0 and state.error_rate == 0.0
+    assert report.endpoints["POST /api/substitution"].error_rate == 0.0
+    assert report.throughput > 0
+    assert "GET /api/state" in report.format_table()
+
+
+def test_formation_assignment_uses_replaced_roster(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    client = create_app(registry=create_game_registry(str(tmp_path))).test_client()
+    names = [f"P{idx}" for idx in range(9)]
+    client.post("/api/roster", json={
+        "players": [{"name": name, "number": str(idx + 1)} for idx, name in enumerate(names)],
+        "field_size": 9,
+    })
+    client.post("/api/formations/from-template", json={"template_type": "3-2-3", "name": "Nine"})
+
+    response = client.post(
+        "/api/formations/Nine/assign",
+        json={"assignments": {str(idx): name for idx, name in enumerate(names)}},
+    )
+    assert response.status_code == 200
+    assert response.get_json()["completeness"]["assigned"] == 9
+
+
+def test_seeded_starters_start_on_the_game_clock(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    config = LoadTestConfig(storage_dir=str(tmp_path))
+    app = create_app(registry=create_game_registry(str(tmp_path)))
+    SidelineLoadTest(config)._set_up_game(app)
+
+    session = app.extensions["game_registry"].get().session
+    starters = [player for player in session.game_state.roster.values() if player.on_field]
+    assert len(starters) == config.field_size
+    assert session.analytics_service.generate_game_report().max_seconds < 60